@@ -0,0 +1,164 @@
+"""
+This module contains code used for benchmarking how many points the
+adaptive sweeps need to sample synthetic functions to a given interpolation
+error, compared to a uniform grid.
+"""
+from __future__ import annotations
+
+from typing import Callable, ClassVar
+
+import numpy as np
+
+from qcodes.dataset import AdaptiveSweep, AdaptiveSweep1D, AdaptiveSweep2D
+from qcodes.parameters import ManualParameter
+
+
+def _step(x: np.ndarray) -> np.ndarray:
+    return np.tanh((x - 0.3) / 0.01)
+
+
+def _lorentzian(x: np.ndarray) -> np.ndarray:
+    return 1 / (1 + ((x - 0.6) / 0.005) ** 2)
+
+
+def _ring(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    return np.exp(-(((np.hypot(x, y) - 0.5) / 0.05) ** 2))
+
+
+def _charge_transitions(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    # sharp diagonal transition lines as in a charge stability diagram
+    return np.tanh(np.sin(8 * (x + 0.3 * y)) / 0.05)
+
+
+_FUNCTIONS_1D: dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "step": _step,
+    "lorentzian": _lorentzian,
+}
+_FUNCTIONS_2D: dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "ring": _ring,
+    "charge_transitions": _charge_transitions,
+}
+
+# the mean absolute interpolation error to reach, relative to the range of
+# the functions of about 1
+_TOLERANCE_1D = 1e-4
+_TOLERANCE_2D = 1e-2
+_MAX_POINTS = 50_000
+
+
+def _error_1d(
+    function: Callable[[np.ndarray], np.ndarray], x: np.ndarray, values: np.ndarray
+) -> float:
+    """Mean absolute error of linear interpolation between the points"""
+    x_fine = np.linspace(0, 1, 10_000)
+    order = np.argsort(x)
+    interpolated = np.interp(x_fine, x[order], values[order])
+    return float(np.mean(np.abs(interpolated - function(x_fine))))
+
+
+def _error_2d(
+    function: Callable[[np.ndarray, np.ndarray], np.ndarray],
+    x: np.ndarray,
+    y: np.ndarray,
+    values: np.ndarray,
+) -> float:
+    """Mean absolute error of linear interpolation over a triangulation"""
+    from matplotlib.tri import LinearTriInterpolator, Triangulation
+
+    x_fine, y_fine = np.meshgrid(np.linspace(-1, 1, 300), np.linspace(-1, 1, 300))
+    interpolator = LinearTriInterpolator(Triangulation(x, y), values)
+    interpolated = interpolator(x_fine, y_fine)
+    return float(np.mean(np.abs(interpolated - function(x_fine, y_fine))))
+
+
+def _adaptive_points(
+    sweep: AdaptiveSweep,
+    function: Callable[..., np.ndarray],
+    error: Callable[[np.ndarray, np.ndarray], float],
+    tolerance: float,
+) -> int:
+    """
+    Run the sweep on the function until the interpolation error is below
+    tolerance and return the number of points needed.
+    """
+    n_points = 0
+    next_check = 32
+    while n_points < _MAX_POINTS:
+        setpoints = sweep.ask()
+        if setpoints is None:
+            break
+        sweep.tell(setpoints, float(function(*np.array(setpoints))))
+        n_points += 1
+        if n_points >= next_check:
+            if error(*sweep.setpoints_and_values()) < tolerance:
+                break
+            next_check = int(next_check * 1.1) + 1
+    return n_points
+
+
+class AdaptiveSweepPoints1D:
+    """
+    This benchmark tracks the number of points needed to sample a function
+    of one variable to a mean interpolation error of 0.01 %.
+    """
+
+    params: ClassVar[list[str]] = list(_FUNCTIONS_1D)
+    param_names: ClassVar[list[str]] = ["function"]
+    unit = "points"
+
+    def track_adaptive(self, function: str) -> int:
+        func = _FUNCTIONS_1D[function]
+        sweep = AdaptiveSweep1D(ManualParameter("x"), 0, 1, _MAX_POINTS)
+        return _adaptive_points(
+            sweep,
+            func,
+            lambda setpoints, values: _error_1d(func, setpoints[:, 0], values),
+            _TOLERANCE_1D,
+        )
+
+    def track_uniform(self, function: str) -> int:
+        func = _FUNCTIONS_1D[function]
+        n_points = 32
+        while n_points < _MAX_POINTS:
+            x = np.linspace(0, 1, n_points)
+            if _error_1d(func, x, func(x)) < _TOLERANCE_1D:
+                break
+            n_points = int(n_points * 1.1) + 1
+        return n_points
+
+
+class AdaptiveSweepPoints2D:
+    """
+    This benchmark tracks the number of points needed to sample a function
+    of two variables to a mean interpolation error of 1 %.
+    """
+
+    params: ClassVar[list[str]] = list(_FUNCTIONS_2D)
+    param_names: ClassVar[list[str]] = ["function"]
+    unit = "points"
+    timeout = 600
+
+    def track_adaptive(self, function: str) -> int:
+        func = _FUNCTIONS_2D[function]
+        sweep = AdaptiveSweep2D(
+            ManualParameter("x"), -1, 1, ManualParameter("y"), -1, 1, _MAX_POINTS
+        )
+        return _adaptive_points(
+            sweep,
+            func,
+            lambda setpoints, values: _error_2d(
+                func, setpoints[:, 0], setpoints[:, 1], values
+            ),
+            _TOLERANCE_2D,
+        )
+
+    def track_uniform(self, function: str) -> int:
+        func = _FUNCTIONS_2D[function]
+        n_side = 8
+        while n_side**2 < _MAX_POINTS:
+            x, y = np.meshgrid(np.linspace(-1, 1, n_side), np.linspace(-1, 1, n_side))
+            x, y = x.ravel(), y.ravel()
+            if _error_2d(func, x, y, func(x, y)) < _TOLERANCE_2D:
+                break
+            n_side = int(n_side * 1.05) + 1
+        return n_side**2
@@ -0,0 +1,83 @@
+"""
+This module contains code used for benchmarking the detection of the
+structure of 2D data that is performed before plotting datasets.
+"""
+from typing import ClassVar
+
+import numpy as np
+
+from qcodes.dataset.data_export import datatype_from_setpoints_2d, reshape_2D_data
+
+
+def _make_setpoints(kind: str, n_points: int) -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(seed=0)
+    n_side = int(np.sqrt(n_points))
+    if kind == "grid":
+        # a rectangular sweep on a non equidistant grid
+        xs = np.cumsum(rng.uniform(0.5, 1.5, n_side))
+        ys = np.cumsum(rng.uniform(0.5, 1.5, n_side))
+    elif kind == "equidistant":
+        # an equidistant grid where random points have not been measured
+        xs = np.arange(n_side) * 0.5
+        ys = np.arange(n_side) * 0.1
+    elif kind == "ragged":
+        # a rectangular sweep that was interrupted half way through a row
+        xs = np.linspace(0, 1, n_side)
+        ys = np.linspace(0, 1, n_side)
+    elif kind == "unknown":
+        x = rng.uniform(size=n_points)
+        y = rng.uniform(size=n_points)
+        return x, y
+    else:
+        raise ValueError(f"Unknown kind of setpoints {kind}")
+
+    x, y = np.meshgrid(xs, ys, indexing="ij")
+    x = x.ravel()
+    y = y.ravel()
+    if kind == "equidistant":
+        keep = rng.uniform(size=x.shape) > 0.1
+        x = x[keep]
+        y = y[keep]
+    elif kind == "ragged":
+        x = x[: -(n_side // 2)]
+        y = y[: -(n_side // 2)]
+    return x, y
+
+
+class DetectPlotType2D:
+    """
+    This benchmark measures how much time it takes to detect whether 2D data
+    is on a grid, which is done when plotting data that does not have a shape.
+    """
+
+    params: ClassVar[list[list[object]]] = [
+        ["grid", "equidistant", "ragged", "unknown"],
+        [10_000, 1_000_000],
+    ]
+    param_names: ClassVar[list[str]] = ["kind", "n_points"]
+
+    def setup(self, kind: str, n_points: int) -> None:
+        self.x, self.y = _make_setpoints(kind, n_points)
+
+    def time_datatype_from_setpoints_2d(self, kind: str, n_points: int) -> None:
+        datatype_from_setpoints_2d(self.x, self.y)
+
+
+class Reshape2DData:
+    """
+    This benchmark measures how much time it takes to sort 2D data onto a
+    grid before it is plotted as a heatmap.
+    """
+
+    params: ClassVar[list[list[object]]] = [
+        ["grid", "equidistant", "ragged"],
+        [10_000, 1_000_000],
+    ]
+    param_names: ClassVar[list[str]] = ["kind", "n_points"]
+
+    def setup(self, kind: str, n_points: int) -> None:
+        self.x, self.y = _make_setpoints(kind, n_points)
+        self.z = np.random.default_rng(seed=1).uniform(size=self.x.shape)
+
+    def time_reshape_2D_data(self, kind: str, n_points: int) -> None:
+        reshape_2D_data(self.x, self.y, self.z)
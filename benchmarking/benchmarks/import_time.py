@@ -0,0 +1,29 @@
+"""
+This module contains code used for benchmarking the time it takes to import
+QCoDeS. Each benchmark imports QCoDeS in a fresh interpreter.
+"""
+
+
+class ImportTime:
+    """
+    This benchmark measures how much time it takes to import QCoDeS and
+    some commonly used parts of it. Importing qcodes should not import
+    the submodules, which are only imported when their names are first
+    used.
+    """
+
+    # importing is slow compared to the default sample time, so keep
+    # the number of repeats low
+    repeat = 5
+
+    def timeraw_import_qcodes(self) -> str:
+        return "import qcodes"
+
+    def timeraw_import_qcodes_dataset(self) -> str:
+        return "import qcodes.dataset"
+
+    def timeraw_import_load_by_id(self) -> str:
+        return "from qcodes.dataset import load_by_id"
+
+    def timeraw_import_instrument(self) -> str:
+        return "from qcodes.instrument import Instrument"
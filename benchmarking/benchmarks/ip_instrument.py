@@ -0,0 +1,64 @@
+"""
+This module contains code used for benchmarking the throughput of the
+socket communication of IPInstrument against an echo server on the local
+machine.
+"""
+from __future__ import annotations
+
+import socketserver
+import threading
+from typing import ClassVar
+
+from qcodes.instrument import IPInstrument
+
+
+class _EchoHandler(socketserver.StreamRequestHandler):
+    """Answers each line with the line, or with 1 MB for ``BIG?``"""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if line.strip() == b"BIG?":
+                self.wfile.write(b"x" * 1_000_000 + b"\n")
+            else:
+                self.wfile.write(line)
+
+
+class IPInstrumentThroughput:
+    """
+    This benchmark measures how long it takes to query an instrument over
+    a persistent connection, a connection per query, and a connection that
+    is kept open while the instrument is in use.
+    """
+
+    params: ClassVar[list[str]] = ["persistent", "non_persistent", "idle_timeout"]
+    param_names: ClassVar[list[str]] = ["connection"]
+
+    def setup(self, connection: str) -> None:
+        self.server = socketserver.ThreadingTCPServer(
+            ("127.0.0.1", 0), _EchoHandler
+        )
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        address, port = self.server.server_address[:2]
+        self.instrument = IPInstrument(
+            "ip_instrument",
+            address=str(address),
+            port=port,
+            read_terminator="\n",
+            persistent=connection == "persistent",
+            idle_timeout=1.0 if connection == "idle_timeout" else None,
+        )
+
+    def teardown(self, connection: str) -> None:
+        self.instrument.close()
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def time_ask(self, connection: str) -> None:
+        for _ in range(100):
+            self.instrument.ask("A?")
+
+    def time_ask_large_response(self, connection: str) -> None:
+        self.instrument.ask("BIG?")
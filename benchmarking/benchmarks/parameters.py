@@ -0,0 +1,72 @@
+"""
+This module contains code used for benchmarking the overhead of getting and
+setting parameters, i.e. the time spent in QCoDeS for each call rather than
+in communication with an instrument.
+"""
+from typing import ClassVar
+
+from qcodes.parameters import DelegateParameter, ManualParameter, Parameter
+from qcodes.validators import Numbers
+
+
+class _Raw:
+    """A stand in for an instrument that stores the value set"""
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def get(self) -> float:
+        return self.value
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class ParameterGetSet:
+    """
+    This benchmark measures the time it takes to get and set a parameter
+    for a number of parameter types and configurations.
+    """
+
+    params: ClassVar[list[str]] = [
+        "manual",
+        "get_set_cmd",
+        "validator",
+        "scaled",
+        "step",
+        "post_delay",
+        "delegate",
+    ]
+    param_names: ClassVar[list[str]] = ["parameter_type"]
+
+    def setup(self, parameter_type: str) -> None:
+        raw = _Raw()
+        if parameter_type == "manual":
+            param: Parameter = ManualParameter("p", initial_value=0.0)
+        elif parameter_type == "delegate":
+            source = ManualParameter("source", initial_value=0.0)
+            param = DelegateParameter("p", source=source)
+        else:
+            param = Parameter("p", get_cmd=raw.get, set_cmd=raw.set)
+            if parameter_type == "validator":
+                param.vals = Numbers(-1e6, 1e6)
+            elif parameter_type == "scaled":
+                param.scale = 2.0
+                param.offset = 1.0
+            elif parameter_type == "step":
+                # a step larger than any set below such that no ramp happens
+                param.step = 1e9
+            elif parameter_type == "post_delay":
+                # a delay shorter than the timer resolution
+                param.post_delay = 1e-12
+        param.set(0.0)
+        self.parameter = param
+
+    def time_get(self, parameter_type: str) -> None:
+        self.parameter.get()
+
+    def time_set(self, parameter_type: str) -> None:
+        self.parameter.set(1.0)
+
+    def time_get_latest(self, parameter_type: str) -> None:
+        self.parameter.get_latest()
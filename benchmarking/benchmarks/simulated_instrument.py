@@ -0,0 +1,85 @@
+"""
+This module contains code used for benchmarking the communication with
+instruments through the in-process simulated VISA resource, i.e. the time
+spent in QCoDeS and pyvisa-like handling of each command, compared to the
+pyvisa-sim yaml simulations.
+"""
+from typing import ClassVar
+
+from qcodes.instrument.sims.dummy import Dummy
+from qcodes.instrument_drivers.mock_instruments import MockSimulatedScope
+
+
+class SimulatedQueries:
+    """
+    This benchmark measures how long it takes to query a parameter of a
+    simulated instrument.
+    """
+
+    params: ClassVar[list[str]] = ["simulated_resource", "pyvisa_sim"]
+    param_names: ClassVar[list[str]] = ["backend"]
+
+    def setup(self, backend: str) -> None:
+        if backend == "simulated_resource":
+            scope = MockSimulatedScope("instrument")
+            self.instrument = scope
+            self.parameter = scope.voltage
+        else:
+            dummy = Dummy(
+                "instrument",
+                "GPIB::8::INSTR",
+                pyvisa_sim_file="dummy.yaml",
+                terminator="\n",
+                device_clear=False,
+            )
+            self.instrument = dummy
+            self.parameter = dummy.frequency
+
+    def teardown(self, backend: str) -> None:
+        self.instrument.close()
+
+    def time_get(self, backend: str) -> None:
+        for _ in range(100):
+            self.parameter.get()
+
+
+class SimulatedTrace:
+    """
+    This benchmark measures how long it takes to transfer a trace from the
+    simulated scope as a binary block.
+    """
+
+    params: ClassVar[list[int]] = [1_000, 100_000, 1_000_000]
+    param_names: ClassVar[list[str]] = ["n_points"]
+
+    def setup(self, n_points: int) -> None:
+        self.scope = MockSimulatedScope("scope")
+        self.scope.n_points(n_points)
+
+    def teardown(self, n_points: int) -> None:
+        self.scope.close()
+
+    def time_get_trace(self, n_points: int) -> None:
+        self.scope.trace.get()
+
+
+class SimulatedQueriesIOStats:
+    """
+    This benchmark measures the overhead of recording the statistics of
+    the communication with an instrument.
+    """
+
+    params: ClassVar[list[bool]] = [False, True]
+    param_names: ClassVar[list[str]] = ["io_stats"]
+
+    def setup(self, io_stats: bool) -> None:
+        self.scope = MockSimulatedScope("scope")
+        if io_stats:
+            self.scope.enable_io_stats()
+
+    def teardown(self, io_stats: bool) -> None:
+        self.scope.close()
+
+    def time_ask(self, io_stats: bool) -> None:
+        for _ in range(100):
+            self.scope.ask("VOLT?")
@@ -31,57 +31,147 @@ add_to_spyder_UMR_excludelist('qcodes')
 
 
 import atexit
+import importlib
+import importlib.util
+import sys
+from typing import TYPE_CHECKING
 
-import qcodes.validators
-from qcodes.dataset import (
-    Measurement,
-    ParamSpec,
-    SQLiteSettings,
-    experiments,
-    get_guids_by_run_spec,
-    initialise_database,
-    initialise_or_create_database_at,
-    initialised_database_at,
-    load_by_counter,
-    load_by_guid,
-    load_by_id,
-    load_by_run_spec,
-    load_experiment,
-    load_experiment_by_name,
-    load_last_experiment,
-    load_or_create_experiment,
-    new_data_set,
-    new_experiment,
-)
-from qcodes.instrument import (
-    ChannelList,
-    ChannelTuple,
-    Instrument,
-    InstrumentChannel,
-    IPInstrument,
-    VisaInstrument,
-    find_or_create_instrument,
-)
-from qcodes.monitor import Monitor
-from qcodes.parameters import (
-    ArrayParameter,
-    CombinedParameter,
-    DelegateParameter,
-    Function,
-    ManualParameter,
-    MultiParameter,
-    Parameter,
-    ParameterWithSetpoints,
-    ScaledParameter,
-    SweepFixedValues,
-    SweepValues,
-    combine,
-)
-from qcodes.station import Station
 from qcodes.utils import deprecate
 
+if TYPE_CHECKING:
+    import qcodes.validators
+    from qcodes.dataset import (
+        Measurement,
+        ParamSpec,
+        SQLiteSettings,
+        experiments,
+        get_guids_by_run_spec,
+        initialise_database,
+        initialise_or_create_database_at,
+        initialised_database_at,
+        load_by_counter,
+        load_by_guid,
+        load_by_id,
+        load_by_run_spec,
+        load_experiment,
+        load_experiment_by_name,
+        load_last_experiment,
+        load_or_create_experiment,
+        new_data_set,
+        new_experiment,
+    )
+    from qcodes.instrument import (
+        ChannelList,
+        ChannelTuple,
+        Instrument,
+        InstrumentChannel,
+        IPInstrument,
+        VisaInstrument,
+        find_or_create_instrument,
+    )
+    from qcodes.monitor import Monitor
+    from qcodes.parameters import (
+        ArrayParameter,
+        CombinedParameter,
+        DelegateParameter,
+        Function,
+        ManualParameter,
+        MultiParameter,
+        Parameter,
+        ParameterWithSetpoints,
+        ScaledParameter,
+        SweepFixedValues,
+        SweepValues,
+        combine,
+    )
+    from qcodes.station import Station
+
+# The short hand names below are imported from their submodules on first
+# access rather than when qcodes is imported. This keeps ``import qcodes``
+# fast since most of these submodules pull in heavy dependencies.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "Measurement",
+            "ParamSpec",
+            "SQLiteSettings",
+            "experiments",
+            "get_guids_by_run_spec",
+            "initialise_database",
+            "initialise_or_create_database_at",
+            "initialised_database_at",
+            "load_by_counter",
+            "load_by_guid",
+            "load_by_id",
+            "load_by_run_spec",
+            "load_experiment",
+            "load_experiment_by_name",
+            "load_last_experiment",
+            "load_or_create_experiment",
+            "new_data_set",
+            "new_experiment",
+        ),
+        "qcodes.dataset",
+    ),
+    **dict.fromkeys(
+        (
+            "ChannelList",
+            "ChannelTuple",
+            "Instrument",
+            "InstrumentChannel",
+            "IPInstrument",
+            "VisaInstrument",
+            "find_or_create_instrument",
+        ),
+        "qcodes.instrument",
+    ),
+    "Monitor": "qcodes.monitor",
+    **dict.fromkeys(
+        (
+            "ArrayParameter",
+            "CombinedParameter",
+            "DelegateParameter",
+            "Function",
+            "ManualParameter",
+            "MultiParameter",
+            "Parameter",
+            "ParameterWithSetpoints",
+            "ScaledParameter",
+            "SweepFixedValues",
+            "SweepValues",
+            "combine",
+        ),
+        "qcodes.parameters",
+    ),
+    "Station": "qcodes.station",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    if not name.startswith("__") and importlib.util.find_spec(f"{__name__}.{name}"):
+        # submodules that are accessed as attributes before being imported
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+def _close_all_instruments() -> None:
+    # only close instruments if the instrument module has been imported,
+    # otherwise no instruments can have been created
+    instrument_module = sys.modules.get("qcodes.instrument.instrument")
+    if instrument_module is not None:
+        instrument_module.Instrument.close_all()
+
+
 # ensure to close all instruments when interpreter is closed
-atexit.register(Instrument.close_all)
+atexit.register(_close_all_instruments)
 
 if config.core.import_legacy_api:
 
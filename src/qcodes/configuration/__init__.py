@@ -1,3 +1,3 @@
-from .config import Config, DotDict, logger
+from .config import Config, DotDict, FrozenDotDict, logger
 
-__all__ = ["Config", "DotDict", "logger"]
+__all__ = ["Config", "DotDict", "FrozenDotDict", "logger"]
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import json
 import logging
 import os
-from collections.abc import Mapping
+import stat
+import tempfile
+import time
+from collections.abc import Iterator, Mapping
+from functools import cache
 from importlib.resources import files
 from os.path import expanduser
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, cast
 
-import jsonschema
+if TYPE_CHECKING:
+    import jsonschema.protocols
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +36,18 @@ BASE_SCHEMA = {
 # https://github.com/python/mypy/issues/4182
 _PARENT_MODULE = ".".join(__loader__.name.split(".")[:-1])  # type: ignore[name-defined]
 
+# Parsed config files keyed on their path. A cached entry is reused as long as
+# the modification time and size of the file are unchanged.
+_FILE_CACHE: dict[str, tuple[tuple[int, int], dict[str, Any]]] = {}
+# Validators compiled from a schema keyed on the hash of that schema.
+_VALIDATOR_CACHE: dict[str, jsonschema.protocols.Validator] = {}
+# Hashes of (config, schema) pairs that are known to be valid.
+_VALIDATED: set[tuple[str, str]] = set()
+
+# Version of the format of the files in Config.cache_directory. Files of
+# another version are ignored.
+_CACHE_VERSION = 1
+
 
 class Config:
     """
@@ -73,6 +92,20 @@ class Config:
                                                  schema_file_name)
     """Filename of cwd schema"""
 
+    cache_directory: str | None = os.environ.get("QCODES_CONFIG_CACHE") or None
+    """
+    Directory that the validated config is cached in, such that a new
+    process does not load and validate the config files again as long as
+    they are unchanged. If None (default), the config is not cached. Can be
+    set with the ``QCODES_CONFIG_CACHE`` environment variable.
+    """
+    cache_max_files: int = 8
+    """
+    Maximum number of cached configs kept in :attr:`cache_directory`. One
+    config is cached per set of config files that it is loaded from, and
+    the least recently written ones are removed beyond this number.
+    """
+
     current_schema: DotDict | None = None
     """Validators and descriptions of config values"""
     current_config: DotDict | None = None
@@ -94,8 +127,14 @@ class Config:
         self._diff_schema: dict[str, Any] = {}
 
         self.config_file_path = path
-        self.defaults, self.defaults_schema = self.load_default()
-        self.update_config()
+        cached = self._load_cached_config()
+        if cached is not None:
+            self.defaults = DotDict(cached["defaults"])
+            self.defaults_schema = DotDict(cached["defaults_schema"])
+            self._use_cached_config(cached)
+        else:
+            self.defaults, self.defaults_schema = self.load_default()
+            self.update_config()
 
     def load_default(self) -> tuple[DotDict, DotDict]:
         defaults = self.load_config(self.default_file_name)
@@ -125,10 +164,28 @@ class Config:
         Validation is also performed against a user provided schema if it's
         found in the directory.
 
+        The validated config is cached in :attr:`cache_directory` and
+        reused as long as none of the config and schema files have changed.
+
         Args:
             path: Optional path to directory containing a `qcodesrc.json`
                config file
         """
+        if path is not None:
+            self.config_file_path = path
+        cached = self._load_cached_config()
+        if cached is not None:
+            self._use_cached_config(cached)
+            assert self.current_config is not None
+            return self.current_config
+        # the files are fingerprinted before they are loaded, such that a
+        # file that changes while loading invalidates the cache
+        fingerprints = (
+            None
+            if self.cache_directory is None
+            else [_fingerprint(file) for file in self._config_files()]
+        )
+
         config = copy.deepcopy(self.defaults)
         self.current_schema = copy.deepcopy(self.defaults_schema)
 
@@ -143,8 +200,6 @@ class Config:
         self._update_config_from_file(self.cwd_file_name,
                                       self.schema_cwd_file_name,
                                       config)
-        if path is not None:
-            self.config_file_path = path
         if self.config_file_path is not None:
             config_file = os.path.join(self.config_file_path,
                                        self.config_file_name)
@@ -156,9 +211,124 @@ class Config:
                                "expected locations.")
         self.current_config = config
         self.current_config_path = self._loaded_config_files[-1]
+        self._store_cached_config(fingerprints)
 
         return config
 
+    def _config_files(self) -> list[str]:
+        """The config and schema files that the config is loaded from."""
+        config_files = [
+            self.default_file_name,
+            self.schema_default_file_name,
+            self.home_file_name,
+            self.schema_home_file_name,
+            self.env_file_name,
+            self.schema_env_file_name,
+            self.cwd_file_name,
+            self.schema_cwd_file_name,
+        ]
+        if self.config_file_path is not None:
+            config_files += [
+                os.path.join(self.config_file_path, self.config_file_name),
+                os.path.join(self.config_file_path, self.schema_file_name),
+            ]
+        return config_files
+
+    def _cache_file(self) -> str | None:
+        if self.cache_directory is None:
+            return None
+        # configs loaded from different files are cached separately
+        key = hashlib.sha1("\n".join(self._config_files()).encode()).hexdigest()
+        return os.path.join(self.cache_directory, f"{key}.json")
+
+    def _load_cached_config(self) -> dict[str, Any] | None:
+        cache_file = self._cache_file()
+        if cache_file is None:
+            return None
+        try:
+            with open(cache_file) as fp:
+                cached = json.load(fp)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("version") != _CACHE_VERSION:
+            return None
+        config_files = self._config_files()
+        fingerprints = cached.get("fingerprints", [])
+        if len(fingerprints) != len(config_files) or not all(
+            _unchanged(file, fingerprint)
+            for file, fingerprint in zip(config_files, fingerprints)
+        ):
+            return None
+        logger.debug(f"Loading validated config from {cache_file}")
+        return cached
+
+    def _use_cached_config(self, cached: Mapping[str, Any]) -> None:
+        self.current_config = DotDict(cached["config"])
+        self.current_schema = DotDict(cached["schema"])
+        self._loaded_config_files = list(cached["loaded_config_files"])
+        self.current_config_path = self._loaded_config_files[-1]
+
+    def _store_cached_config(
+        self, fingerprints: list[list[Any] | None] | None
+    ) -> None:
+        cache_file = self._cache_file()
+        if cache_file is None or fingerprints is None:
+            return
+        try:
+            serialized = json.dumps(
+                {
+                    "version": _CACHE_VERSION,
+                    "fingerprints": fingerprints,
+                    "defaults": self.defaults,
+                    "defaults_schema": self.defaults_schema,
+                    "config": self.current_config,
+                    "schema": self.current_schema,
+                    "loaded_config_files": self._loaded_config_files,
+                }
+            )
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            # write to a temporary file first such that other processes
+            # never read a partially written cache
+            with tempfile.NamedTemporaryFile(
+                "w", dir=os.path.dirname(cache_file), suffix=".tmp", delete=False
+            ) as fp:
+                fp.write(serialized)
+            os.replace(fp.name, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not cache the config in {cache_file}: {e}")
+            return
+        self._prune_cache_directory()
+
+    def _prune_cache_directory(self) -> None:
+        """
+        Remove the least recently written cached configs beyond
+        :attr:`cache_max_files` and temporary files left behind.
+        """
+        if self.cache_directory is None:
+            return
+        try:
+            entries = list(os.scandir(self.cache_directory))
+        except OSError:
+            return
+        cached: list[tuple[int, str]] = []
+        for entry in entries:
+            try:
+                if entry.name.endswith(".json"):
+                    cached.append((entry.stat().st_mtime_ns, entry.path))
+                elif entry.name.endswith(".tmp"):
+                    # a file that is still being written by another process
+                    # is at most a few seconds old
+                    if time.time() - entry.stat().st_mtime > 60:
+                        os.remove(entry.path)
+            except OSError:
+                pass
+        cached.sort(reverse=True)
+        for _, path in cached[self.cache_max_files :]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
     def _update_config_from_file(
         self, file_path: str, schema: str, config: dict[str, Any]
     ) -> None:
@@ -217,7 +387,7 @@ class Config:
             else:
                 logger.warning(EMPTY_USER_SCHEMA.format(extra_schema_path))
 
-        jsonschema.validate(json_config, schema)
+        _validate_cached(json_config, schema)
 
     def add(
         self,
@@ -329,10 +499,16 @@ class Config:
         Raises:
             FileNotFoundError: if config is missing
         """
-        with open(path) as fp:
-            config = json.load(fp)
-
-        logger.debug(f'Loading config from {path}')
+        file_stat = os.stat(path)
+        key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            config = copy.deepcopy(cached[1])
+        else:
+            with open(path) as fp:
+                config = json.load(fp)
+            logger.debug(f'Loading config from {path}')
+            _FILE_CACHE[path] = (key, copy.deepcopy(config))
 
         config_dot_dict = DotDict(config)
         return config_dot_dict
@@ -406,6 +582,22 @@ class Config:
 
         return doc
 
+    def freeze(self) -> FrozenDotDict:
+        """
+        Return an immutable snapshot of the current config.
+
+        Values of the snapshot are stored in slots, so looking them up is
+        considerably cheaper than looking them up on the config itself.
+        Changes to the config made after the snapshot was taken are not
+        reflected in the snapshot, so it should be taken once, e.g. at the
+        start of a measurement, and then used for its duration. Taking a
+        snapshot copies the whole config, so to read a few values once they
+        should be read from the config directly instead.
+        """
+        if self.current_config is None:
+            raise RuntimeError("Cannot freeze an empty config")
+        return freeze(self.current_config)
+
     def __getitem__(self, name: str) -> Any:
         val = self.current_config
         for key in name.split('.'):
@@ -481,6 +673,172 @@ class DotDict(dict[str, Any]):
         self.__setitem__(key, value)
 
 
+class FrozenDotDict:
+    """
+    Immutable counterpart of :class:`DotDict` as returned by
+    :meth:`Config.freeze`.
+
+    Each key that is a valid identifier is stored in a slot of its own, and
+    all keys are available with (dotted) item access. Nested mappings are
+    frozen as well, and lists are converted to tuples.
+    """
+
+    __slots__ = ("_items",)
+    _items: MappingProxyType[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        if "." not in key:
+            return self._items[key]
+        my_key, rest_of_key = key.split(".", 1)
+        return self._items[my_key][rest_of_key]
+
+    def __getattr__(self, name: str) -> Any:
+        # values are normally found in the slots of the subclass built by
+        # _frozen_dot_dict_type, this is the fallback for any other key
+        try:
+            return object.__getattribute__(self, "_items")[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        try:
+            self[key]
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDotDict):
+            return self._items == other._items
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self._items.items()))
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._items)!r})"
+
+
+@cache
+def _frozen_dot_dict_type(keys: tuple[str, ...]) -> type[FrozenDotDict]:
+    slots = tuple(key for key in keys if key.isidentifier() and key != "_items")
+    return cast(
+        type[FrozenDotDict],
+        type("FrozenDotDict", (FrozenDotDict,), {"__slots__": slots}),
+    )
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert mappings into :class:`FrozenDotDict` and lists into
+    tuples.
+    """
+    if isinstance(value, Mapping):
+        items = {key: freeze(val) for key, val in value.items()}
+        frozen_type = _frozen_dot_dict_type(tuple(items))
+        frozen = object.__new__(frozen_type)
+        object.__setattr__(frozen, "_items", MappingProxyType(items))
+        for key in frozen_type.__slots__:
+            object.__setattr__(frozen, key, items[key])
+        return frozen
+    if isinstance(value, list):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+def _fingerprint(path: str) -> list[Any] | None:
+    """
+    Return the modification time, size and hash of a config file, or None
+    if it is not a regular file, in which case it is not loaded either.
+    """
+    try:
+        file_stat = os.stat(path)
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        with open(path, "rb") as fp:
+            digest = hashlib.sha1(fp.read()).hexdigest()
+    except OSError:
+        return None
+    return [file_stat.st_mtime_ns, file_stat.st_size, digest]
+
+
+def _unchanged(path: str, fingerprint: list[Any] | None) -> bool:
+    """
+    Check whether a config file matches its fingerprint. The file is only
+    hashed if its modification time or size have changed.
+    """
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return fingerprint is None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return fingerprint is None
+    if fingerprint is None:
+        return False
+    if [file_stat.st_mtime_ns, file_stat.st_size] == fingerprint[:2]:
+        return True
+    current = _fingerprint(path)
+    return current is not None and current[1:] == fingerprint[1:]
+
+
+def _hash_json(value: Any) -> str:
+    serialized = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+
+def _validate_cached(json_config: Any, schema: Mapping[str, Any]) -> None:
+    """
+    Validate ``json_config`` against ``schema`` like :func:`jsonschema.validate`
+    does, but compile a validator only once per schema and skip validation
+    of a config that has already been validated against the same schema.
+    """
+    # jsonschema is imported here since it is slow to import and not needed
+    # when the config is loaded from the cache
+    import jsonschema
+    import jsonschema.exceptions
+    import jsonschema.validators
+
+    try:
+        config_hash = _hash_json(json_config)
+        schema_hash = _hash_json(schema)
+    except (TypeError, ValueError):
+        # not json serializable so it cannot be cached
+        jsonschema.validate(json_config, schema)
+        return
+
+    if (config_hash, schema_hash) in _VALIDATED:
+        return
+
+    validator = _VALIDATOR_CACHE.get(schema_hash)
+    if validator is None:
+        schema_dict = copy.deepcopy(dict(schema))
+        validator_cls = jsonschema.validators.validator_for(schema_dict)
+        validator_cls.check_schema(schema_dict)
+        validator = validator_cls(schema_dict)
+        _VALIDATOR_CACHE[schema_hash] = validator
+
+    error = jsonschema.exceptions.best_match(validator.iter_errors(json_config))
+    if error is not None:
+        raise error
+    _VALIDATED.add((config_hash, schema_hash))
+
+
 def update(d: dict[Any, Any], u: Mapping[Any, Any]) -> dict[Any, Any]:
     for k, v in u.items():
         if isinstance(v, Mapping):
@@ -2,74 +2,172 @@
 The dataset module contains code related to storage and retrieval of data to
 and from disk
 """
-from .data_set import (
-    get_guids_by_run_spec,
-    load_by_counter,
-    load_by_guid,
-    load_by_id,
-    load_by_run_spec,
-    new_data_set,
-)
-from .data_set_in_memory import load_from_file, load_from_netcdf
-from .data_set_protocol import DataSetProtocol, DataSetType
-from .database_extract_runs import extract_runs_into_db
-from .descriptions.dependencies import InterDependencies_, ParamSpecTree
-from .descriptions.param_spec import ParamSpec
-from .descriptions.rundescriber import RunDescriber
-from .descriptions.versioning.serialization import rundescriber_from_json
-from .dond.do_0d import do0d
-from .dond.do_1d import do1d
-from .dond.do_2d import do2d
-from .dond.do_nd import dond
-from .dond.do_nd_utils import BreakConditionInterrupt
-from .dond.sweeps import AbstractSweep, ArraySweep, LinSweep, LogSweep, TogetherSweep
-from .experiment_container import (
-    experiments,
-    load_experiment,
-    load_experiment_by_name,
-    load_last_experiment,
-    load_or_create_experiment,
-    new_experiment,
-)
-from .experiment_settings import get_default_experiment_id, reset_default_experiment_id
-from .export_config import get_data_export_path
-from .guid_helpers import guids_from_dbs, guids_from_dir, guids_from_list_str
-from .legacy_import import import_dat_file
-from .measurement_extensions import (
-    DataSetDefinition,
-    LinSweeper,
-    datasaver_builder,
-    dond_into,
-)
-from .measurements import Measurement
-from .plotting import plot_by_id, plot_dataset
-from .sqlite.connection import ConnectionPlus
-from .sqlite.database import (
-    connect,
-    initialise_database,
-    initialise_or_create_database_at,
-    initialised_database_at,
-)
-from .sqlite.settings import SQLiteSettings
-from .threading import (
-    SequentialParamsCaller,
-    ThreadPoolParamsCaller,
-    call_params_threaded,
-)
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .data_set import (
+        get_guids_by_run_spec,
+        load_by_counter,
+        load_by_guid,
+        load_by_id,
+        load_by_run_spec,
+        new_data_set,
+    )
+    from .data_set_in_memory import load_from_file, load_from_netcdf
+    from .data_set_protocol import DataSetProtocol, DataSetType
+    from .database_extract_runs import extract_runs_into_db
+    from .descriptions.dependencies import InterDependencies_, ParamSpecTree
+    from .descriptions.param_spec import ParamSpec
+    from .descriptions.rundescriber import RunDescriber
+    from .descriptions.versioning.serialization import rundescriber_from_json
+    from .dond.adaptive_sweeps import AdaptiveSweep, AdaptiveSweep1D, AdaptiveSweep2D
+    from .dond.do_0d import do0d
+    from .dond.do_1d import do1d
+    from .dond.do_2d import do2d
+    from .dond.do_nd import dond
+    from .dond.do_nd_utils import BreakConditionInterrupt
+    from .dond.sweeps import (
+        AbstractSweep,
+        ArraySweep,
+        BufferedSweep,
+        LinSweep,
+        LogSweep,
+        TogetherSweep,
+    )
+    from .experiment_container import (
+        experiments,
+        load_experiment,
+        load_experiment_by_name,
+        load_last_experiment,
+        load_or_create_experiment,
+        new_experiment,
+    )
+    from .experiment_settings import (
+        get_default_experiment_id,
+        reset_default_experiment_id,
+    )
+    from .export_config import get_data_export_path
+    from .guid_helpers import guids_from_dbs, guids_from_dir, guids_from_list_str
+    from .legacy_import import import_dat_file
+    from .measurement_extensions import (
+        DataSetDefinition,
+        LinSweeper,
+        datasaver_builder,
+        dond_into,
+    )
+    from .measurements import Measurement
+    from .plotting import plot_by_id, plot_dataset
+    from .sqlite.connection import ConnectionPlus
+    from .sqlite.database import (
+        connect,
+        initialise_database,
+        initialise_or_create_database_at,
+        initialised_database_at,
+    )
+    from .sqlite.settings import SQLiteSettings
+    from .threading import (
+        AsyncParamsCaller,
+        InstrumentWorkersParamsCaller,
+        SequentialParamsCaller,
+        ThreadPoolParamsCaller,
+        call_params_threaded,
+    )
+    from .timing_profiler import PointTimingProfiler
+
+# The public names of the dataset module are imported from their submodules
+# on first access such that importing a single submodule does not require
+# importing all of the dataset module.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "get_guids_by_run_spec": ".data_set",
+    "load_by_counter": ".data_set",
+    "load_by_guid": ".data_set",
+    "load_by_id": ".data_set",
+    "load_by_run_spec": ".data_set",
+    "new_data_set": ".data_set",
+    "load_from_file": ".data_set_in_memory",
+    "load_from_netcdf": ".data_set_in_memory",
+    "DataSetProtocol": ".data_set_protocol",
+    "DataSetType": ".data_set_protocol",
+    "extract_runs_into_db": ".database_extract_runs",
+    "InterDependencies_": ".descriptions.dependencies",
+    "ParamSpecTree": ".descriptions.dependencies",
+    "ParamSpec": ".descriptions.param_spec",
+    "RunDescriber": ".descriptions.rundescriber",
+    "rundescriber_from_json": ".descriptions.versioning.serialization",
+    "AdaptiveSweep": ".dond.adaptive_sweeps",
+    "AdaptiveSweep1D": ".dond.adaptive_sweeps",
+    "AdaptiveSweep2D": ".dond.adaptive_sweeps",
+    "do0d": ".dond.do_0d",
+    "do1d": ".dond.do_1d",
+    "do2d": ".dond.do_2d",
+    "dond": ".dond.do_nd",
+    "BreakConditionInterrupt": ".dond.do_nd_utils",
+    "AbstractSweep": ".dond.sweeps",
+    "ArraySweep": ".dond.sweeps",
+    "BufferedSweep": ".dond.sweeps",
+    "LinSweep": ".dond.sweeps",
+    "LogSweep": ".dond.sweeps",
+    "TogetherSweep": ".dond.sweeps",
+    "experiments": ".experiment_container",
+    "load_experiment": ".experiment_container",
+    "load_experiment_by_name": ".experiment_container",
+    "load_last_experiment": ".experiment_container",
+    "load_or_create_experiment": ".experiment_container",
+    "new_experiment": ".experiment_container",
+    "get_default_experiment_id": ".experiment_settings",
+    "reset_default_experiment_id": ".experiment_settings",
+    "get_data_export_path": ".export_config",
+    "guids_from_dbs": ".guid_helpers",
+    "guids_from_dir": ".guid_helpers",
+    "guids_from_list_str": ".guid_helpers",
+    "import_dat_file": ".legacy_import",
+    "DataSetDefinition": ".measurement_extensions",
+    "LinSweeper": ".measurement_extensions",
+    "datasaver_builder": ".measurement_extensions",
+    "dond_into": ".measurement_extensions",
+    "Measurement": ".measurements",
+    "plot_by_id": ".plotting",
+    "plot_dataset": ".plotting",
+    "ConnectionPlus": ".sqlite.connection",
+    "connect": ".sqlite.database",
+    "initialise_database": ".sqlite.database",
+    "initialise_or_create_database_at": ".sqlite.database",
+    "initialised_database_at": ".sqlite.database",
+    "SQLiteSettings": ".sqlite.settings",
+    "AsyncParamsCaller": ".threading",
+    "SequentialParamsCaller": ".threading",
+    "InstrumentWorkersParamsCaller": ".threading",
+    "ThreadPoolParamsCaller": ".threading",
+    "PointTimingProfiler": ".timing_profiler",
+    "call_params_threaded": ".threading",
+}
 
 __all__ = [
     "AbstractSweep",
+    "AdaptiveSweep",
+    "AdaptiveSweep1D",
+    "AdaptiveSweep2D",
     "ArraySweep",
+    "AsyncParamsCaller",
     "BreakConditionInterrupt",
+    "BufferedSweep",
     "ConnectionPlus",
     "DataSetProtocol",
     "DataSetType",
+    "InstrumentWorkersParamsCaller",
     "InterDependencies_",
     "LinSweep",
     "LogSweep",
     "Measurement",
     "ParamSpec",
     "ParamSpecTree",
+    "PointTimingProfiler",
     "RunDescriber",
     "SQLiteSettings",
     "SequentialParamsCaller",
@@ -114,3 +212,32 @@ __all__ = [
     "reset_default_experiment_id",
     "rundescriber_from_json",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    if not name.startswith("__") and importlib.util.find_spec(f"{__name__}.{name}"):
+        # submodules that are accessed as attributes before being imported
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
+
+class _DatasetModule(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it as an attribute of its parent. The
+        # dond subpackage would thus shadow the dond function, which used to
+        # be bound after all submodules had been imported.
+        if name in _LAZY_ATTRIBUTES and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _DatasetModule
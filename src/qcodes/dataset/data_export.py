@@ -4,11 +4,11 @@ import logging
 from typing import TYPE_CHECKING
 
 import numpy as np
-from typing_extensions import TypedDict
-
-from qcodes.utils import list_of_data_to_maybe_ragged_nd_array
+from typing_extensions import NotRequired, TypedDict
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from qcodes.dataset.data_set_protocol import DataSetProtocol
     from qcodes.dataset.descriptions.param_spec import ParamSpecBase
 
@@ -17,21 +17,34 @@ log = logging.getLogger(__name__)
 
 class DSPlotData(TypedDict):
     """
-    The dictionary used to represent data for use within `plot_dataset`
+    The dictionary used to represent data for use within `plot_dataset`.
+    ``data_min`` and ``data_max`` are only present for data that has been
+    decimated and hold the extrema of the data that each point represents.
     """
     name: str
     unit: str
     label: str
     data: np.ndarray
     shape: tuple[int, ...] | None
+    data_min: NotRequired[np.ndarray]
+    data_max: NotRequired[np.ndarray]
 
 
-def _get_data_from_ds(ds: DataSetProtocol) -> list[list[DSPlotData]]:
+def _get_data_from_ds(
+    ds: DataSetProtocol, parameters: Sequence[str] | None = None
+) -> list[list[DSPlotData]]:
     dependent_parameters: tuple[ParamSpecBase, ...] = tuple(
         ds.description.interdeps.dependencies.keys()
     )
 
-    all_data = ds.cache.data()
+    if parameters is None:
+        all_data = ds.cache.data()
+    else:
+        # only load the data of the requested dependent parameters
+        dependent_parameters = tuple(
+            ps for ps in dependent_parameters if ps.name in parameters
+        )
+        all_data = ds.get_parameter_data(*(ps.name for ps in dependent_parameters))
 
     parameter_data = {ps.name: all_data[ps.name] for ps in dependent_parameters}
 
@@ -61,25 +74,50 @@ def _get_data_from_ds(ds: DataSetProtocol) -> list[list[DSPlotData]]:
     return output
 
 
-def _all_steps_multiples_of_min_step(rows: np.ndarray) -> bool:
+def _unique_values_and_counts(setpoints: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the sorted unique values of the setpoints along with the number
+    of times each of them occurs.
+
+    The setpoints can be thought of as a number of rows of sorted unique
+    values, where row number n holds the values that occur more than n times.
+    For a rectangular sweep all rows are identical and for an interrupted
+    sweep the rows form two groups, one being contained in the other. Since
+    row n is given by ``values[counts > n]`` the analysis of the rows can be
+    done on the counts alone.
+
+    Args:
+        setpoints: The raw setpoints as a one-dimensional array
+
+    Returns:
+        A tuple of the unique values and their counts
+    """
+    return np.unique(setpoints, return_counts=True)
+
+
+def _all_steps_multiples_of_min_step(values: np.ndarray, counts: np.ndarray) -> bool:
     """
     Are all steps integer multiples of the smallest step?
     This is used in determining whether the setpoints correspond
     to a regular grid
 
     Args:
-        rows: the output of _rows_from_datapoints
+        values: The unique setpoint values as returned by
+            _unique_values_and_counts
+        counts: The number of occurrences of each of the values
 
     Returns:
         The answer to the question
     """
-
+    # every row of setpoints is of the form values[counts >= c] for one of
+    # the distinct counts c, so only the distinct rows need to be inspected
     steps_list: list[np.ndarray] = []
-    for row in rows:
+    for count in np.unique(counts):
+        row = values[counts >= count]
         # TODO: What is an appropriate precision?
-        steps_list += list(np.unique(np.diff(row).round(decimals=15)))
+        steps_list.append(np.unique(np.diff(row).round(decimals=15)))
 
-    steps = np.unique(steps_list)
+    steps = np.unique(np.concatenate(steps_list))
     remainders = np.mod(steps[1:]/steps[0], 1)
 
     # TODO: What are reasonable tolerances for allclose?
@@ -88,43 +126,7 @@ def _all_steps_multiples_of_min_step(rows: np.ndarray) -> bool:
     return asmoms
 
 
-def _rows_from_datapoints(inputsetpoints: np.ndarray) -> np.ndarray:
-    """
-    Cast the (potentially) unordered setpoints into rows
-    of sorted, unique setpoint values. Because of the way they are ordered,
-    these rows do not necessarily correspond to actual rows of the scan,
-    but they can nonetheless be used to identify certain scan types
-
-    Args:
-        inputsetpoints: The raw setpoints as a one-dimensional array
-
-    Returns:
-        A ndarray of the rows
-    """
-
-    rows = []
-    setpoints = inputsetpoints.copy()
-
-    # first check if there is only one unique array in which case we can avoid the
-    # potentially slow loop below
-    temp, inds, count = np.unique(setpoints, return_index=True,
-                                  return_counts=True)
-    num_repeats_array = np.unique(count)
-    if len(num_repeats_array) == 1 and count.sum() == len(inputsetpoints):
-        return np.tile(temp, (num_repeats_array[0], 1))
-    else:
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
-
-    while len(setpoints) > 0:
-        temp, inds = np.unique(setpoints, return_index=True)
-        rows.append(temp)
-        setpoints = np.delete(setpoints, inds)
-
-    return list_of_data_to_maybe_ragged_nd_array(rows)
-
-
-def _all_in_group_or_subgroup(rows: np.ndarray) -> bool:
+def _all_in_group_or_subgroup(counts: np.ndarray) -> bool:
     """
     Detects whether the setpoints correspond to two groups of
     of identical rows, one being contained in the other.
@@ -135,39 +137,16 @@ def _all_in_group_or_subgroup(rows: np.ndarray) -> bool:
     Note that each axis needs NOT be equidistantly spaced.
 
     Args:
-        rows: The output from _rows_from_datapoints
+        counts: The number of occurrences of each unique setpoint value
+            as returned by _unique_values_and_counts
 
     Returns:
         A boolean indicating whether the setpoints meet the
             criterion
     """
-
-    groups = 1
-    comp_to = rows[0]
-
-    aigos = True
-    switchindex = 0
-
-    for rowind, row in enumerate(rows[1:]):
-        if np.array_equal(row, comp_to):
-            continue
-        else:
-            groups += 1
-            comp_to = row
-            switchindex = rowind
-            if groups > 2:
-                aigos = False
-                break
-
-    # if there are two groups, check that the rows of one group
-    # are all contained in the rows of the other
-    if aigos and switchindex > 0:
-        for row in rows[1+switchindex:]:
-            if sum(r in rows[0] for r in row) != len(row):
-                aigos = False
-                break
-
-    return aigos
+    # the rows change whenever the row number passes one of the counts, so
+    # the number of groups of identical rows is the number of distinct counts
+    return len(np.unique(counts)) <= 2
 
 
 def _strings_as_ints(inputarray: np.ndarray) -> np.ndarray:
@@ -179,10 +158,8 @@ def _strings_as_ints(inputarray: np.ndarray) -> np.ndarray:
     Args:
         inputarray: A 1D array of strings
     """
-    newdata = np.zeros(len(inputarray))
-    for n, word in enumerate(np.unique(inputarray)):
-        newdata += ((inputarray == word).astype(int)*n)
-    return newdata
+    _, inverse = np.unique(inputarray, return_inverse=True)
+    return inverse.reshape(np.shape(inputarray)).astype(np.float64)
 
 
 def get_1D_plottype(xpoints: np.ndarray, ypoints: np.ndarray) -> str:
@@ -299,21 +276,24 @@ def datatype_from_setpoints_2d(xpoints: np.ndarray,
     # Now check if this is a simple rectangular sweep,
     # possibly interrupted in the middle of one row
 
-    xrows = _rows_from_datapoints(xpoints)
-    yrows = _rows_from_datapoints(ypoints)
+    xvalues, xcounts = _unique_values_and_counts(xpoints)
+    yvalues, ycounts = _unique_values_and_counts(ypoints)
 
-    x_check = _all_in_group_or_subgroup(xrows)
-    y_check = _all_in_group_or_subgroup(yrows)
+    # the number of rows of one setpoint is the largest number of times
+    # any of its values occurs and must match the length of the first
+    # (longest) row of the other setpoint
+    x_check = _all_in_group_or_subgroup(xcounts)
+    y_check = _all_in_group_or_subgroup(ycounts)
 
-    x_check = x_check and (len(xrows[0]) == len(yrows))
-    y_check = y_check and (len(yrows[0]) == len(xrows))
+    x_check = x_check and (len(xvalues) == ycounts.max())
+    y_check = y_check and (len(yvalues) == xcounts.max())
 
     # this is the check that we are on a "simple" grid
     if y_check and x_check:
         return '2D_grid'
 
-    x_check = _all_steps_multiples_of_min_step(xrows)
-    y_check = _all_steps_multiples_of_min_step(yrows)
+    x_check = _all_steps_multiples_of_min_step(xvalues, xcounts)
+    y_check = _all_steps_multiples_of_min_step(yvalues, ycounts)
 
     # this is the check that we are on an equidistant grid
     if y_check and x_check:
@@ -325,25 +305,18 @@ def datatype_from_setpoints_2d(xpoints: np.ndarray,
 def reshape_2D_data(
     x: np.ndarray, y: np.ndarray, z: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    xrow = np.array(_rows_from_datapoints(x)[0])
-    yrow = np.array(_rows_from_datapoints(y)[0])
+    log.debug('Sorting 2D data onto grid')
+
+    xrow, x_index = np.unique(x, return_inverse=True)
+    yrow, y_index = np.unique(y, return_inverse=True)
     nx = len(xrow)
     ny = len(yrow)
 
-    # potentially slow method of filling in the data, should be optimised
-    log.debug('Sorting 2D data onto grid')
-
     if isinstance(z[0], str):
         z_to_plot = np.full((ny, nx), '', dtype=z.dtype)
     else:
         z_to_plot = np.full((ny, nx), np.nan)
-    x_index = np.zeros_like(x, dtype=np.dtype(np.int_))
-    y_index = np.zeros_like(y, dtype=np.dtype(np.int_))
-    for i, xval in enumerate(xrow):
-        x_index[np.where(x == xval)[0]] = i
-    for i, yval in enumerate(yrow):
-        y_index[np.where(y == yval)[0]] = i
-
-    z_to_plot[y_index, x_index] = z
+
+    z_to_plot[y_index.ravel(), x_index.ravel()] = z
 
     return xrow, yrow, z_to_plot
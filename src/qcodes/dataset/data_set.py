@@ -49,11 +49,13 @@ from qcodes.dataset.sqlite.queries import (
     add_parameter,
     completed,
     create_run,
+    delete_results_after,
     get_completed_timestamp_from_run_id,
     get_data_by_tag_and_table_name,
     get_experiment_name_from_experiment_id,
     get_guid_from_expid_and_counter,
     get_guid_from_run_id,
+    get_last_result_id,
     get_metadata_from_run_id,
     get_parameter_data,
     get_parent_dataset_links,
@@ -62,6 +64,7 @@ from qcodes.dataset.sqlite.queries import (
     get_runid_from_guid,
     get_sample_name_from_experiment_id,
     mark_run_complete,
+    mark_run_incomplete,
     remove_trigger,
     run_exists,
     set_run_timestamp,
@@ -85,6 +88,7 @@ from .data_set_in_memory import DataSetInMem, load_from_file
 from .descriptions.versioning import serialization as serial
 from .exporters.export_info import ExportInfo
 from .exporters.export_to_csv import dataframe_to_csv
+from .exporters.export_to_h5netcdf import _try_dataset_to_h5netcdf_direct
 from .exporters.export_to_pandas import (
     load_to_concatenated_dataframe,
     load_to_dataframe_dict,
@@ -146,6 +150,11 @@ class _BackgroundWriter(Thread):
                 self.conn.close()
             elif item['keys'] == 'finalize':
                 _WRITERS[self.path].active_datasets.remove(item['values'])
+            elif item['keys'] == 'callback':
+                try:
+                    item['values'](self.conn)
+                except Exception:
+                    log.exception("Exception in callback of background writer")
             else:
                 self.write_results(
                     item['keys'], item['values'], item['table_name'])
@@ -661,6 +670,13 @@ class DataSet(BaseDataSet):
         pdl_str = links_to_str(self._parent_dataset_links)
         update_parent_datasets(self.conn, self.run_id, pdl_str)
 
+        self._start_writing(start_bg_writer)
+        self.cache.prepare()
+
+    def _start_writing(self, start_bg_writer: bool) -> None:
+        """
+        Register this dataset with the writer of its database
+        """
         writer_status = self._writer_status
 
         write_in_background_status = writer_status.write_in_background
@@ -679,7 +695,64 @@ class DataSet(BaseDataSet):
             writer_status.write_in_background = False
 
         writer_status.active_datasets.add(self.run_id)
-        self.cache.prepare()
+
+    def _resume(self, start_bg_writer: bool = False) -> None:
+        """
+        Reopen a started dataset, marking it as not completed if it was,
+        such that results can be added to it again, e.g. to continue an
+        interrupted measurement.
+
+        Args:
+            start_bg_writer: If True, the add_results method will write to the
+                database in a separate thread.
+        """
+        if self.pristine:
+            raise RuntimeError("Can not resume a DataSet that has not been started.")
+        if self._completed:
+            mark_run_incomplete(self.conn, self.run_id)
+            self._completed = False
+        self._start_writing(start_bg_writer)
+        self._cache = DataSetCacheWithDBBackend(self)
+        if self._in_memory_cache:
+            # the cache holds the results stored so far and is then appended
+            # to as results are added
+            self._cache.load_data_from_db()
+            self._cache._live = True
+
+    def _add_metadata_after_write(
+        self, tag: str, metadata: Callable[[int], str]
+    ) -> None:
+        """
+        Add metadata once the results that have been flushed so far are
+        written to the database. The metadata is created by calling
+        ``metadata`` with the id of the last row of results written. When
+        writing in the background this happens on the background thread
+        after it has written the results, such that adding results is not
+        blocked while waiting for the writes.
+        """
+
+        def add_metadata(conn: ConnectionPlus) -> None:
+            value = metadata(get_last_result_id(conn, self.table_name))
+            # `add_data_to_dynamic_columns` is not atomic by itself, hence using `atomic`
+            with atomic(conn) as atomic_conn:
+                add_data_to_dynamic_columns(atomic_conn, self.run_id, {tag: value})
+            self._metadata[tag] = value
+
+        writer_status = self._writer_status
+        if writer_status.write_in_background:
+            writer_status.data_write_queue.put(
+                {"keys": "callback", "values": add_metadata}
+            )
+        else:
+            add_metadata(self.conn)
+
+    def _delete_results_after(self, result_id: int) -> None:
+        """
+        Delete the results written to the database after the row with the
+        given id, e.g. to discard results written after the last checkpoint
+        of an interrupted measurement before resuming it.
+        """
+        delete_results_after(self.conn, self.table_name, result_id)
 
     def mark_completed(self) -> None:
         """
@@ -1430,6 +1503,10 @@ class DataSet(BaseDataSet):
         import xarray as xr
 
         file_path = path / file_name
+        if qcodes.config.dataset.export_direct_h5netcdf_enabled and (
+            _try_dataset_to_h5netcdf_direct(self, file_path)
+        ):
+            return file_path
         if (
             qcodes.config.dataset.export_chunked_export_of_large_files_enabled
             and self._estimate_ds_size()
@@ -1492,8 +1569,9 @@ class DataSet(BaseDataSet):
                 "Writing netcdf file directly.",
                 extra={"file_name": str(file_path)},
             )
-
-            file_path = super()._export_as_netcdf(path=path, file_name=file_name)
+            xarray_to_h5netcdf_with_complex_numbers(
+                self.to_xarray_dataset(), file_path
+            )
         return file_path
 
     def _estimate_ds_size(self) -> float:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 import numpy as np
 
+import qcodes
 from qcodes.dataset.exporters.export_info import ExportInfo
 from qcodes.dataset.sqlite.queries import completed, load_new_data_for_rundescriber
 
@@ -19,7 +21,7 @@ from .exporters.export_to_xarray import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator
 
     import pandas as pd
     import xarray as xr
@@ -458,16 +460,135 @@ class DataSetCacheInMem(DataSetCache["DataSetInMem"]):
 
 
 class DataSetCacheDeferred(DataSetCacheInMem):
+    """
+    A cache for a dataset that has been exported to a netcdf file.
+    The data of each parameter tree is read from the file and converted
+    to the format returned by :py:meth:`data` when it is first accessed,
+    see :py:meth:`lazy_data`.
+
+    If ``qcodes.config.dataset.deferred_cache_memory_limit`` is set, the
+    least recently used parameter trees are released from the cache once
+    the data loaded through :py:meth:`lazy_data` or
+    :py:meth:`load_parameter_data` exceeds this size. Released trees are
+    loaded again from file when accessed. :py:meth:`data` and
+    :py:meth:`load_data_from_db` load all parameter trees and keep them in
+    the cache regardless of the limit, since all of the data is held by the
+    result anyway.
+    """
+
     def __init__(self, dataset: DataSetInMem, loaded_data: Path | str):
         super().__init__(dataset)
         self._xr_dataset_path = Path(loaded_data)
+        self._parameter_names: tuple[str, ...] | None = None
+        self._data_nbytes: dict[str, int] = {}
+
+    def data(self) -> ParameterData:
+        """
+        Loads the data of all parameter trees from file if needed and
+        returns the cached data. All parameter trees are kept in the cache,
+        even if they exceed ``deferred_cache_memory_limit``. Use
+        :py:meth:`lazy_data` to only load the parameter trees that are
+        accessed.
+
+        Returns:
+            The cached dataset.
+        """
+        return {
+            name: self._get_parameter_tree(name, release=False)
+            for name in self._get_parameter_names()
+        }
+
+    def lazy_data(self) -> Mapping[str, dict[str, np.ndarray]]:
+        """
+        Returns a read only mapping of the cached data in the same format as
+        :py:meth:`data`. The data of a parameter tree is only loaded from
+        file when it is accessed, e.g. ``cache.lazy_data()["z"]``.
+
+        Returns:
+            The cached dataset.
+        """
+        return _DeferredParameterData(self)
 
     def load_data_from_db(self) -> None:
-        if self._data == {}:
-            loaded_data = self._load_xr_dataset()
-            self._data = self._dataset._from_xarray_dataset_to_qcodes_raw_data(
-                loaded_data
-            )
+        for name in self._get_parameter_names():
+            self._get_parameter_tree(name, release=False)
+
+    def load_parameter_data(
+        self, name: str, isel: Mapping[str, Any] | None = None
+    ) -> dict[str, np.ndarray]:
+        """
+        Load the data of a single parameter tree from file. If ``isel``
+        is given only the selected part of the data is read from the file
+        and the result is not stored in the cache.
+
+        Args:
+            name: Name of the dependent or standalone parameter.
+            isel: Indexers for the dimensions of the parameter in the
+                exported file, following :py:meth:`xarray.DataArray.isel`.
+                For data on a grid the dimensions are the names of the
+                setpoints.
+
+        Returns:
+            Dict from the name of the parameter and its setpoints to
+            numpy arrays of the (selected) data.
+        """
+        if isel is None:
+            return self._get_parameter_tree(name)
+        return self._read_parameter_tree(name, isel)
+
+    def _get_parameter_names(self) -> tuple[str, ...]:
+        if self._parameter_names is None:
+            import xarray as xr
+
+            with xr.open_dataset(self._xr_dataset_path, engine="h5netcdf") as xr_ds:
+                self._parameter_names = tuple(str(var) for var in xr_ds.data_vars)
+        return self._parameter_names
+
+    def _get_parameter_tree(
+        self, name: str, release: bool = True
+    ) -> dict[str, np.ndarray]:
+        tree = self._data.get(name)
+        if tree is None:
+            if name not in self._get_parameter_names():
+                raise KeyError(name)
+            tree = self._read_parameter_tree(name)
+            self._data[name] = tree
+            self._data_nbytes[name] = sum(array.nbytes for array in tree.values())
+        else:
+            # move to the end to mark as most recently used
+            self._data[name] = self._data.pop(name)
+        if release:
+            self._release_to_memory_limit(keep=name)
+        return tree
+
+    def _read_parameter_tree(
+        self, name: str, isel: Mapping[str, Any] | None = None
+    ) -> dict[str, np.ndarray]:
+        import cf_xarray as cfxr
+        import xarray as xr
+
+        with xr.open_dataset(self._xr_dataset_path, engine="h5netcdf") as xr_ds:
+            xr_ds = cfxr.coding.decode_compress_to_multi_index(xr_ds)
+            dataarray = xr_ds[name]
+            if isel is not None:
+                dataarray = dataarray.isel(isel)
+            dataarray = dataarray.load()
+        return self._dataset._from_xarray_dataarray_to_qcodes_raw_data(dataarray)
+
+    def _release_to_memory_limit(self, keep: str) -> None:
+        memory_limit = qcodes.config.dataset.deferred_cache_memory_limit
+        if memory_limit is None:
+            return
+        max_nbytes = memory_limit * 1024 * 1024
+        # dicts preserve insertion order so the first tree is the least recently used
+        for name in list(self._data):
+            if sum(self._data_nbytes.values()) <= max_nbytes:
+                break
+            if name == keep:
+                continue
+            log.debug("Releasing parameter tree %s from deferred cache", name)
+            del self._data[name]
+            del self._data_nbytes[name]
 
     def _load_xr_dataset(self) -> xr.Dataset:
         import cf_xarray as cfxr
@@ -538,3 +659,29 @@ class DataSetCacheWithDBBackend(DataSetCache["DataSet"]):
         )
         if not data_not_read:
             self._live = False
+
+
+class _DeferredParameterData(Mapping[str, dict[str, np.ndarray]]):
+    """
+    A read only mapping view of the data in a :class:`DataSetCacheDeferred`
+    that loads the data of a parameter tree when it is accessed. Use
+    ``dict(data.items())`` to load all the data into a dict.
+    """
+
+    def __init__(self, cache: DataSetCacheDeferred):
+        self._cache = cache
+
+    def __getitem__(self, key: str) -> dict[str, np.ndarray]:
+        return self._cache._get_parameter_tree(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._cache._get_parameter_names())
+
+    def __len__(self) -> int:
+        return len(self._cache._get_parameter_names())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache._get_parameter_names()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)})"
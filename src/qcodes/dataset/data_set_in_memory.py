@@ -49,7 +49,7 @@ from .exporters.export_info import ExportInfo
 from .linked_datasets.links import str_to_links
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Iterator, Mapping, Sequence
 
     import pandas as pd
     import xarray as xr
@@ -382,32 +382,40 @@ class DataSetInMem(BaseDataSet):
     ) -> dict[str, dict[str, np.ndarray]]:
         output: dict[str, dict[str, np.ndarray]] = {}
         for datavar in xr_data.data_vars:
-            output[str(datavar)] = {}
-            data = xr_data[datavar]
-            output[str(datavar)][str(datavar)] = data.data
-
-            all_coords = []
-            for index_name in data.dims:
-                index = data.indexes[index_name]
-
-                coords = {name: data.coords[name] for name in index.names}
-                all_coords.append(coords)
-
-            if len(all_coords) > 1:
-                # if there are more than on index this cannot be a multiindex dataset
-                # so we can expand the data
-                coords_unexpanded = []
-                for coord_name in data.dims:
-                    coords_unexpanded.append(xr_data[coord_name].data)
-                coords_arrays = np.meshgrid(*coords_unexpanded, indexing="ij")
-                for coord_name, coord_array in zip(data.dims, coords_arrays):
-                    output[str(datavar)][str(coord_name)] = coord_array
-            elif len(all_coords) == 1:
-                # this is either a multiindex or a single regular index
-                # in both cases we do not need to reshape the data
-                coords = all_coords[0]
-                for coord_name, coord in coords.items():
-                    output[str(datavar)][str(coord_name)] = coord.data
+            output[str(datavar)] = DataSetInMem._from_xarray_dataarray_to_qcodes_raw_data(
+                xr_data[datavar]
+            )
+        return output
+
+    @staticmethod
+    def _from_xarray_dataarray_to_qcodes_raw_data(
+        data: xr.DataArray,
+    ) -> dict[str, np.ndarray]:
+        output: dict[str, np.ndarray] = {}
+        output[str(data.name)] = data.data
+
+        all_coords = []
+        for index_name in data.dims:
+            index = data.indexes[index_name]
+
+            coords = {name: data.coords[name] for name in index.names}
+            all_coords.append(coords)
+
+        if len(all_coords) > 1:
+            # if there are more than on index this cannot be a multiindex dataset
+            # so we can expand the data
+            coords_unexpanded = []
+            for coord_name in data.dims:
+                coords_unexpanded.append(data[coord_name].data)
+            coords_arrays = np.meshgrid(*coords_unexpanded, indexing="ij")
+            for coord_name, coord_array in zip(data.dims, coords_arrays):
+                output[str(coord_name)] = coord_array
+        elif len(all_coords) == 1:
+            # this is either a multiindex or a single regular index
+            # in both cases we do not need to reshape the data
+            coords = all_coords[0]
+            for coord_name, coord in coords.items():
+                output[str(coord_name)] = coord.data
 
         return output
 
@@ -689,6 +697,14 @@ class DataSetInMem(BaseDataSet):
     def _flush_data_to_database(self, block: bool = False) -> None:
         pass
 
+    def _get_parameter_data_chunks(
+        self, chunk_size: int
+    ) -> dict[str, Iterator[dict[str, np.ndarray]]]:
+        return {
+            name: _iterate_cached_parameter_data(param_data, chunk_size)
+            for name, param_data in self.cache.data().items()
+        }
+
     # not part of the protocol specified api
 
     def _set_parent_dataset_links(self, links: list[Link]) -> None:
@@ -883,6 +899,19 @@ class DataSetInMem(BaseDataSet):
             )
 
 
+def _iterate_cached_parameter_data(
+    param_data: Mapping[str, np.ndarray], chunk_size: int
+) -> Iterator[dict[str, np.ndarray]]:
+    # all arrays in the cache for one parameter tree have the same shape
+    # so the raveled arrays can be sliced into matching chunks
+    raveled = {name: np.ravel(array) for name, array in param_data.items()}
+    n_results = max((len(array) for array in raveled.values()), default=0)
+    for start in range(0, n_results, chunk_size):
+        yield {
+            name: array[start : start + chunk_size] for name, array in raveled.items()
+        }
+
+
 def load_from_netcdf(
     path: Path | str, path_to_db: Path | str | None = None
 ) -> DataSetInMem:
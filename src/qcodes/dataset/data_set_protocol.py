@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import sys
@@ -19,6 +20,7 @@ from typing import (
 
 import numpy as np
 
+import qcodes
 from qcodes.dataset.descriptions.dependencies import InterDependencies_
 from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
 from qcodes.dataset.export_config import (
@@ -30,9 +32,11 @@ from qcodes.dataset.export_config import (
 )
 
 from .descriptions.versioning.converters import new_to_old
-from .exporters.export_to_csv import dataframe_to_csv
+from .exporters.export_to_csv import dataset_to_csv_streaming
+from .exporters.export_to_h5netcdf import _try_dataset_to_h5netcdf_direct
 from .exporters.export_to_xarray import xarray_to_h5netcdf_with_complex_numbers
 from .sqlite.queries import raw_time_to_str_time
+from .timing_profiler import TIMING_PROFILE_KEY, format_timing_report
 
 if sys.version_info >= (3, 10):
     # new entrypoints api was added in 3.10
@@ -42,6 +46,8 @@ else:
     from importlib_metadata import entry_points
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import pandas as pd
     import xarray as xr
     from typing_extensions import TypeAlias
@@ -299,6 +305,11 @@ class DataSetProtocol(Protocol):
     def _enqueue_results(self, result_dict: Mapping[ParamSpecBase, np.ndarray]) -> None:
         ...
 
+    def _get_parameter_data_chunks(
+        self, chunk_size: int
+    ) -> dict[str, Iterator[dict[str, np.ndarray]]]:
+        ...
+
     def _flush_data_to_database(self, block: bool = False) -> None:
         ...
 
@@ -356,6 +367,21 @@ class BaseDataSet(DataSetProtocol, Protocol):
         old_interdeps = new_to_old(self.description.interdeps)
         return list(old_interdeps.paramspecs)
 
+    def timing_report(self) -> str:
+        """
+        Return a table of the time spent in each stage of the points of the
+        run, as recorded when the run was started with
+        ``profile_timing=True``.
+
+        Raises:
+            RuntimeError: If the timing of the run was not profiled.
+        """
+        if TIMING_PROFILE_KEY not in self.metadata:
+            raise RuntimeError(
+                f"The timing of the run with guid {self.guid} was not profiled."
+            )
+        return format_timing_report(json.loads(self.metadata[TIMING_PROFILE_KEY]))
+
     def export(
         self,
         export_type: DataExportType | str | None = None,
@@ -478,21 +504,56 @@ class BaseDataSet(DataSetProtocol, Protocol):
     def _export_as_netcdf(self, path: Path, file_name: str) -> Path:
         """Export data as netcdf to a given path with file prefix"""
         file_path = path / file_name
+        if qcodes.config.dataset.export_direct_h5netcdf_enabled and (
+            _try_dataset_to_h5netcdf_direct(self, file_path)
+        ):
+            return file_path
         xarr_dataset = self.to_xarray_dataset()
         xarray_to_h5netcdf_with_complex_numbers(xarr_dataset, file_path)
         return file_path
 
     def _export_as_csv(self, path: Path, file_name: str) -> Path:
         """Export data as csv to a given path with file prefix."""
-        dfdict = self.to_pandas_dataframe_dict()
-        dataframe_to_csv(
-            dfdict=dfdict,
+        dataset_to_csv_streaming(
+            self,
             path=path,
-            single_file=True,
             single_file_name=file_name,
+            chunk_size=qcodes.config.dataset.export_csv_chunk_size,
+            float_format=qcodes.config.dataset.export_csv_float_format,
         )
         return path / file_name
 
+    def _get_parameter_data_chunks(
+        self, chunk_size: int
+    ) -> dict[str, Iterator[dict[str, np.ndarray]]]:
+        """
+        Return an iterator for each top level parameter that yields the data
+        of the parameter and its dependencies in chunks of at most
+        ``chunk_size`` results in the format of ``get_parameter_data``.
+        Taken in order the chunks contain the same data as returned by
+        ``get_parameter_data`` for the parameter.
+        """
+        return {
+            paramspec.name: self._iterate_parameter_data(paramspec.name, chunk_size)
+            for paramspec in self.description.interdeps.non_dependencies
+        }
+
+    def _iterate_parameter_data(
+        self, name: str, chunk_size: int
+    ) -> Iterator[dict[str, np.ndarray]]:
+        start = 1
+        while True:
+            chunk = self.get_parameter_data(
+                name, start=start, end=start + chunk_size - 1
+            )[name]
+            n_results = len(chunk[name])
+            if n_results == 0:
+                return
+            yield chunk
+            if n_results < chunk_size:
+                return
+            start += chunk_size
+
     def _add_metadata_to_netcdf_if_nc_exported(self, tag: str, data: Any) -> None:
         export_paths = self.export_info.export_paths
         nc_file = export_paths.get(DataExportType.NETCDF.value, None)
@@ -0,0 +1,422 @@
+"""
+Multi-resolution decimation pyramids for plotting large datasets.
+
+A decimation pyramid holds, for each dependent parameter of a dataset, a
+sequence of increasingly coarse representations of its data. Each level
+stores the minimum, maximum and mean of the data in blocks of ``factor``
+(1D data) or ``factor x factor`` (gridded 2D data) points of the previous
+level together with the mean setpoints of each block. The pyramid is stored
+in a file next to the database of the run, with a small reference in the
+metadata of the run, such that :func:`~qcodes.dataset.plot_dataset` can
+plot a level that matches the resolution of the axes without loading the
+full data of the run. Since the pyramid is not part of the database, it is
+not copied along with the run, e.g. by
+:func:`~qcodes.dataset.extract_runs_into_db`, in which case the full data
+is plotted.
+
+Pyramids are only built for real valued numeric data. 1D data is sorted by
+its setpoint before being decimated. 2D data is only decimated if it is
+stored on a complete grid with known shape.
+"""
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+from typing_extensions import TypedDict
+
+from qcodes.dataset.data_export import DSPlotData, _get_data_from_ds
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from qcodes.dataset.data_set_protocol import DataSetProtocol
+
+_LOG = logging.getLogger(__name__)
+
+DECIMATION_PYRAMID_METADATA_TAG = "decimation_pyramid"
+"""
+Name of the metadata tag that records that a decimation pyramid has been
+stored for a run, and its size in bytes.
+"""
+
+
+class DecimationLevel(TypedDict):
+    """
+    A single level of a decimation pyramid of a dependent parameter.
+    ``setpoints`` holds the mean value of each setpoint in a block, in the
+    order of the dependencies of the parameter, while ``min``, ``max`` and
+    ``mean`` hold the corresponding reductions of the dependent parameter.
+    """
+
+    block_size: int
+    setpoints: list[np.ndarray]
+    min: np.ndarray
+    max: np.ndarray
+    mean: np.ndarray
+
+
+def build_decimation_pyramid(
+    dataset: DataSetProtocol,
+    *,
+    factor: int = 4,
+    max_points: int = 250_000,
+    min_points: int = 64,
+    store: bool = True,
+) -> dict[str, list[DecimationLevel]]:
+    """
+    Build a min/max/mean decimation pyramid of the dependent parameters of a
+    completed dataset and optionally store it next to the database of the
+    run.
+
+    Levels are computed by reducing the previous level in blocks of
+    ``factor`` points along each axis. Levels with more than ``max_points``
+    points are computed but not kept, since they are close enough to the
+    full resolution data to plot that directly. Parameters that cannot be
+    decimated (complex or string valued data, data that depends on more than
+    two parameters or 2D data that is not on a complete grid) are skipped.
+
+    Args:
+        dataset: The dataset to build the pyramid for. Must be completed.
+        factor: The number of points along each axis that are reduced into
+            one point of the next level.
+        max_points: The maximal number of points in a level that is kept.
+        min_points: Levels with fewer points than this are not computed.
+        store: Whether to store the pyramid in a file next to the database
+            of the dataset.
+
+    Returns:
+        A dict mapping the name of each decimated dependent parameter to its
+        levels ordered from the finest to the coarsest level.
+
+    Raises:
+        RuntimeError: If the dataset is not completed.
+        ValueError: If the factor is smaller than 2.
+    """
+    if not dataset.completed:
+        raise RuntimeError(
+            "Can only build a decimation pyramid for a completed dataset."
+        )
+    if factor < 2:
+        raise ValueError(f"Decimation factor must be at least 2, got {factor}.")
+
+    pyramid: dict[str, list[DecimationLevel]] = {}
+    for group in _get_data_from_ds(dataset):
+        name = group[-1]["name"]
+        if not all(_is_real_numeric(param["data"]) for param in group):
+            continue
+        if len(group) == 2:
+            levels = _decimate_1d(group, factor, max_points, min_points)
+        elif len(group) == 3 and group[-1]["shape"] is not None:
+            levels = _decimate_2d(group, factor, max_points, min_points)
+        else:
+            levels = []
+        if levels:
+            pyramid[name] = levels
+
+    if store:
+        _store_pyramid(dataset, pyramid)
+    return pyramid
+
+
+def load_decimation_pyramid(
+    dataset: DataSetProtocol,
+) -> dict[str, list[DecimationLevel]] | None:
+    """
+    Load the decimation pyramid stored for a dataset.
+
+    Args:
+        dataset: The dataset to load the pyramid of.
+
+    Returns:
+        The pyramid as returned by :func:`build_decimation_pyramid` or None
+        if no pyramid has been stored for the dataset.
+    """
+    if DECIMATION_PYRAMID_METADATA_TAG not in dataset.metadata:
+        return None
+    pyramid_file = _pyramid_file(dataset)
+    if pyramid_file is None or not pyramid_file.is_file():
+        # e.g. a run that has been copied into another database
+        return None
+    return _deserialize_pyramid(pyramid_file.read_bytes())
+
+
+def _pyramid_file(dataset: DataSetProtocol) -> Path | None:
+    """
+    The file that the pyramid of a dataset is stored in. Pyramids are stored
+    in a directory next to the database file, with one file per run.
+    """
+    path_to_db = dataset.path_to_db
+    if not path_to_db or path_to_db == ":memory:":
+        return None
+    db_file = Path(path_to_db)
+    return db_file.parent / f"{db_file.stem}_decimation" / f"{dataset.guid}.npz"
+
+
+def _store_pyramid(
+    dataset: DataSetProtocol, pyramid: dict[str, list[DecimationLevel]]
+) -> None:
+    pyramid_file = _pyramid_file(dataset)
+    if pyramid_file is None:
+        _LOG.warning(
+            f"Cannot store the decimation pyramid of {dataset.guid} since the "
+            "dataset is not stored in a database file."
+        )
+        return
+    serialized = _serialize_pyramid(pyramid)
+    pyramid_file.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first such that a reader never sees a
+    # partially written pyramid
+    with tempfile.NamedTemporaryFile(
+        dir=pyramid_file.parent, suffix=".tmp", delete=False
+    ) as fp:
+        fp.write(serialized)
+    os.replace(fp.name, pyramid_file)
+    dataset.add_metadata(
+        DECIMATION_PYRAMID_METADATA_TAG, json.dumps({"n_bytes": len(serialized)})
+    )
+
+
+def select_decimation_level(
+    levels: Sequence[DecimationLevel], n_pixels: int
+) -> DecimationLevel | None:
+    """
+    Select the coarsest level that still has at least ``n_pixels`` points
+    along each axis.
+
+    Args:
+        levels: The levels of a parameter ordered from finest to coarsest.
+        n_pixels: The number of pixels along each axis of the plot.
+
+    Returns:
+        The selected level or None if even the finest level is too coarse,
+        in which case the full resolution data should be plotted.
+    """
+    for level in reversed(levels):
+        if min(level["mean"].shape) >= n_pixels:
+            return level
+    return None
+
+
+def _get_decimated_data_from_ds(
+    dataset: DataSetProtocol, axes_size: tuple[float, float]
+) -> list[list[DSPlotData]] | None:
+    """
+    Get the plot data of a dataset from its decimation pyramid. For each
+    parameter the level matching the width (1D data) or the smallest side
+    (2D data) of axes of the given size in pixels is chosen. The full data
+    is used for parameters that are not in the pyramid or that do not have a
+    suitable level. Returns None if the dataset has no pyramid or if none of
+    its dependent parameters have a suitable level.
+    """
+    pyramid = load_decimation_pyramid(dataset)
+    if pyramid is None:
+        return None
+
+    width, height = axes_size
+    interdeps = dataset.description.interdeps
+    decimated: dict[str, list[DSPlotData]] = {}
+    for dependent, dependencies in interdeps.dependencies.items():
+        levels = pyramid.get(dependent.name)
+        if levels is None:
+            continue
+        n_pixels = int(width) if len(dependencies) == 1 else int(min(width, height))
+        level = select_decimation_level(levels, n_pixels)
+        if level is None:
+            continue
+
+        group: list[DSPlotData] = []
+        for param_spec, setpoints in zip(dependencies, level["setpoints"]):
+            group.append(
+                {
+                    "name": param_spec.name,
+                    "unit": param_spec.unit,
+                    "label": param_spec.label,
+                    "data": setpoints,
+                    "shape": None,
+                }
+            )
+        group.append(
+            {
+                "name": dependent.name,
+                "unit": dependent.unit,
+                "label": dependent.label,
+                "data": level["mean"],
+                "shape": level["mean"].shape if level["mean"].ndim == 2 else None,
+                "data_min": level["min"],
+                "data_max": level["max"],
+            }
+        )
+        decimated[dependent.name] = group
+    if not decimated:
+        return None
+
+    not_decimated = [
+        dependent.name
+        for dependent in interdeps.dependencies
+        if dependent.name not in decimated
+    ]
+    full: dict[str, list[DSPlotData]] = {}
+    if not_decimated:
+        full = {
+            group[-1]["name"]: group
+            for group in _get_data_from_ds(dataset, not_decimated)
+        }
+    # keep the order in which the parameters are plotted without a pyramid
+    return [
+        decimated[dependent.name]
+        if dependent.name in decimated
+        else full[dependent.name]
+        for dependent in interdeps.dependencies
+    ]
+
+
+def _is_real_numeric(data: np.ndarray) -> bool:
+    return data.dtype.kind in "fiu"
+
+
+def _decimate_1d(
+    group: Sequence[DSPlotData], factor: int, max_points: int, min_points: int
+) -> list[DecimationLevel]:
+    setpoints = np.ravel(group[0]["data"]).astype(np.float64)
+    values = np.ravel(group[1]["data"]).astype(np.float64)
+    valid = ~np.isnan(setpoints)
+    setpoints = setpoints[valid]
+    values = values[valid]
+    order = np.argsort(setpoints, kind="stable")
+    setpoints = setpoints[order]
+    values = values[order]
+
+    finite = ~np.isnan(values)
+    setpoint_sums = setpoints
+    value_sums = np.where(finite, values, 0.0)
+    point_counts = np.ones_like(setpoints)
+    value_counts = finite.astype(np.float64)
+    mins = np.where(finite, values, np.nan)
+    maxs = mins
+
+    levels: list[DecimationLevel] = []
+    block_size = 1
+    while len(mins) // factor >= min_points:
+        starts = np.arange(0, len(mins), factor)
+        mins = np.fmin.reduceat(mins, starts)
+        maxs = np.fmax.reduceat(maxs, starts)
+        setpoint_sums = np.add.reduceat(setpoint_sums, starts)
+        value_sums = np.add.reduceat(value_sums, starts)
+        point_counts = np.add.reduceat(point_counts, starts)
+        value_counts = np.add.reduceat(value_counts, starts)
+        block_size *= factor
+        if len(mins) > max_points:
+            continue
+        with np.errstate(invalid="ignore", divide="ignore"):
+            levels.append(
+                {
+                    "block_size": block_size,
+                    "setpoints": [setpoint_sums / point_counts],
+                    "min": mins,
+                    "max": maxs,
+                    "mean": value_sums / value_counts,
+                }
+            )
+    return levels
+
+
+def _decimate_2d(
+    group: Sequence[DSPlotData], factor: int, max_points: int, min_points: int
+) -> list[DecimationLevel]:
+    setpoints = [np.asarray(param["data"], dtype=np.float64) for param in group[:2]]
+    values = np.asarray(group[2]["data"], dtype=np.float64)
+    if values.ndim != 2 or any(sp.shape != values.shape for sp in setpoints):
+        return []
+    if any(np.isnan(sp).any() for sp in setpoints):
+        # the grid is incomplete
+        return []
+
+    finite = ~np.isnan(values)
+    sums = [*setpoints, np.where(finite, values, 0.0)]
+    point_counts = np.ones_like(values)
+    value_counts = finite.astype(np.float64)
+    mins = np.where(finite, values, np.nan)
+    maxs = mins
+
+    levels: list[DecimationLevel] = []
+    block_size = 1
+    while (
+        min(mins.shape) // factor >= 2
+        and (mins.shape[0] // factor) * (mins.shape[1] // factor) >= min_points
+    ):
+
+        def reduce(ufunc: np.ufunc, array: np.ndarray) -> np.ndarray:
+            rows = np.arange(0, array.shape[0], factor)
+            cols = np.arange(0, array.shape[1], factor)
+            return ufunc.reduceat(ufunc.reduceat(array, rows, axis=0), cols, axis=1)
+
+        mins = reduce(np.fmin, mins)
+        maxs = reduce(np.fmax, maxs)
+        sums = [reduce(np.add, array) for array in sums]
+        point_counts = reduce(np.add, point_counts)
+        value_counts = reduce(np.add, value_counts)
+        block_size *= factor
+        if mins.size > max_points:
+            continue
+        with np.errstate(invalid="ignore", divide="ignore"):
+            levels.append(
+                {
+                    "block_size": block_size,
+                    "setpoints": [array / point_counts for array in sums[:2]],
+                    "min": mins,
+                    "max": maxs,
+                    "mean": sums[2] / value_counts,
+                }
+            )
+    return levels
+
+
+def _serialize_pyramid(pyramid: dict[str, list[DecimationLevel]]) -> bytes:
+    # the pyramid is stored as an npz archive since this is much more
+    # compact than a json representation of the arrays
+    arrays: dict[str, np.ndarray] = {}
+    for name, levels in pyramid.items():
+        for index, level in enumerate(levels):
+            prefix = f"{name}/{index}/"
+            arrays[prefix + "block_size"] = np.array(level["block_size"])
+            for sp_index, setpoints in enumerate(level["setpoints"]):
+                arrays[f"{prefix}setpoints_{sp_index}"] = setpoints
+            arrays[prefix + "min"] = level["min"]
+            arrays[prefix + "max"] = level["max"]
+            arrays[prefix + "mean"] = level["mean"]
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def _deserialize_pyramid(serialized: bytes) -> dict[str, list[DecimationLevel]]:
+    raw: dict[str, dict[int, dict[str, np.ndarray]]] = {}
+    with np.load(io.BytesIO(serialized), allow_pickle=False) as archive:
+        for key in archive.files:
+            name, index, field = key.split("/")
+            raw.setdefault(name, {}).setdefault(int(index), {})[field] = archive[key]
+
+    pyramid: dict[str, list[DecimationLevel]] = {}
+    for name, indexed_levels in raw.items():
+        levels: list[DecimationLevel] = []
+        for index in sorted(indexed_levels):
+            fields = indexed_levels[index]
+            n_setpoints = sum(field.startswith("setpoints_") for field in fields)
+            levels.append(
+                {
+                    "block_size": int(fields["block_size"]),
+                    "setpoints": [fields[f"setpoints_{i}"] for i in range(n_setpoints)],
+                    "min": fields["min"],
+                    "max": fields["max"],
+                    "mean": fields["mean"],
+                }
+            )
+        pyramid[name] = levels
+    return pyramid
@@ -0,0 +1,400 @@
+"""
+Sweeps that choose their setpoints based on the values measured so far,
+such that most points are spent where the measured signal changes rather
+than in featureless regions.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from qcodes.dataset.dond.do_nd_utils import ActionsT
+    from qcodes.parameters import ParameterBase
+
+_Point = tuple[int, ...]
+_Cell = tuple[_Point, int]
+
+# the number of lattice units along the side of a cell of the initial grid.
+# Cells are halved when refined, so this limits the depth of the refinement.
+_UNIT = 2**20
+
+
+class AdaptiveSweep(ABC):
+    """
+    Abstract class of sweeps that choose the next setpoints based on the
+    values measured at the previous setpoints.
+
+    An adaptive sweep can be passed to :func:`.dond` in place of the regular
+    sweeps, in which case the value of its ``target`` parameter is told to
+    the sweep after each point, and the data is stored in an unshaped
+    dataset. With a :class:`.Measurement`, the sweep is iterated and the
+    measured values told to it explicitly:
+
+    .. code-block:: python
+
+        with meas.run() as datasaver:
+            for x, y in sweep:
+                gate_x(x)
+                gate_y(y)
+                value = current()
+                sweep.tell((x, y), value)
+                datasaver.add_result((gate_x, x), (gate_y, y), (current, value))
+
+    Args:
+        params: The parameters to sweep.
+        num_points: The number of points after which the sweep ends.
+        delay: Time in seconds to wait after setting the parameters.
+        post_actions: Actions to do after setting the parameters.
+        target: The measured parameter whose value determines the next
+            setpoints when used with :func:`.dond`. Defaults to the first
+            measured parameter.
+    """
+
+    def __init__(
+        self,
+        params: Sequence[ParameterBase],
+        num_points: int,
+        delay: float = 0,
+        post_actions: ActionsT = (),
+        target: ParameterBase | None = None,
+    ):
+        self._params = tuple(params)
+        self._num_points = num_points
+        self._delay = delay
+        self._post_actions = post_actions
+        self._target = target
+
+    @property
+    def params(self) -> tuple[ParameterBase, ...]:
+        """The parameters that are swept."""
+        return self._params
+
+    @property
+    def num_points(self) -> int:
+        """The maximal number of points of the sweep."""
+        return self._num_points
+
+    @property
+    def delay(self) -> float:
+        """Delay after setting the parameters."""
+        return self._delay
+
+    @property
+    def post_actions(self) -> ActionsT:
+        """Actions to be performed after setting the parameters."""
+        return self._post_actions
+
+    @property
+    def target(self) -> ParameterBase | None:
+        """The measured parameter whose values are told to the sweep."""
+        return self._target
+
+    @abstractmethod
+    def ask(self) -> tuple[float, ...] | None:
+        """
+        Return the setpoints of the next point, one for each parameter, or
+        None if the sweep is done.
+        """
+
+    @abstractmethod
+    def tell(self, setpoints: tuple[float, ...], value: float) -> None:
+        """
+        Tell the sweep the value measured at setpoints returned by
+        :meth:`ask`.
+        """
+
+    @abstractmethod
+    def setpoints_and_values(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the setpoints that have been told to the sweep as an array of
+        shape ``(number of points, number of parameters)`` and the values
+        measured at them.
+        """
+
+    def __iter__(self) -> Iterator[tuple[float, ...]]:
+        while (setpoints := self.ask()) is not None:
+            yield setpoints
+
+
+class _TreeSweep(AdaptiveSweep):
+    """
+    An adaptive sweep that refines a regular grid of cells by halving the
+    cells along every axis, i.e. a binary tree in 1D and a quadtree in 2D.
+
+    The cell with the largest loss is refined first. The loss of a cell of
+    side ``s``, relative to the swept ranges, is
+    ``s**(d-1) * hypot(s, dv)`` where ``d`` is the number of parameters and
+    ``dv`` is the range of the values at the corners of the cell, relative
+    to the range of all values measured so far. That is, the length of the
+    measured curve in an interval in 1D, and about the area of the measured
+    surface in a cell in 2D. Cells where the value changes are thus refined
+    before featureless cells, which are however still refined once the
+    changes are resolved.
+
+    Setpoints and cells are kept on an integer lattice, so that the points
+    shared by neighbouring cells are identified exactly.
+    """
+
+    def __init__(
+        self,
+        params: Sequence[ParameterBase],
+        starts: Sequence[float],
+        stops: Sequence[float],
+        num_points: int,
+        initial_points: int,
+        delay: float,
+        post_actions: ActionsT,
+        target: ParameterBase | None,
+    ):
+        super().__init__(params, num_points, delay, post_actions, target)
+        if initial_points < 2:
+            raise ValueError(
+                f"An adaptive sweep needs at least 2 initial points along "
+                f"each axis, got {initial_points}."
+            )
+        self._starts = tuple(starts)
+        self._stops = tuple(stops)
+        self._ndim = len(self._params)
+        self._extent = (initial_points - 1) * _UNIT
+
+        self._values: dict[_Point, float] = {}
+        self._queue: deque[_Point] = deque()
+        self._requested: set[_Point] = set()
+        self._asked: dict[tuple[float, ...], _Point] = {}
+        self._n_asked = 0
+        self._value_min = math.inf
+        self._value_max = -math.inf
+
+        # heap of the cells whose corners have all been measured, ordered by
+        # their loss at the time they were pushed
+        self._heap: list[tuple[float, int, _Cell]] = []
+        self._counter = itertools.count()
+        # cells that wait for the values at some of their corners
+        self._unresolved: list[_Cell] = []
+
+        lattice = range(0, self._extent + 1, _UNIT)
+        self._request(itertools.product(lattice, repeat=self._ndim))
+        self._unresolved.extend(
+            (origin, _UNIT)
+            for origin in itertools.product(lattice[:-1], repeat=self._ndim)
+        )
+
+    def ask(self) -> tuple[float, ...] | None:
+        if self._n_asked >= self.num_points:
+            return None
+        while not self._queue:
+            cell = self._pop_largest_loss()
+            if cell is None:
+                if self._unresolved:
+                    raise RuntimeError(
+                        "The values at the previous setpoints must be told "
+                        "to the sweep before asking for more setpoints."
+                    )
+                return None
+            self._refine(cell)
+        point = self._queue.popleft()
+        self._n_asked += 1
+        setpoints = tuple(
+            start + (stop - start) * coordinate / self._extent
+            for start, stop, coordinate in zip(self._starts, self._stops, point)
+        )
+        self._asked[setpoints] = point
+        return setpoints
+
+    def tell(self, setpoints: tuple[float, ...], value: float) -> None:
+        try:
+            point = self._asked.pop(tuple(setpoints))
+        except KeyError:
+            raise ValueError(
+                f"The setpoints {setpoints} have not been asked for."
+            ) from None
+        value = float(value)
+        self._values[point] = value
+        if math.isfinite(value):
+            self._value_min = min(self._value_min, value)
+            self._value_max = max(self._value_max, value)
+        self._resolve()
+
+    def setpoints_and_values(self) -> tuple[np.ndarray, np.ndarray]:
+        points = np.array(list(self._values.keys()), dtype=float).reshape(
+            -1, self._ndim
+        )
+        starts = np.array(self._starts)
+        stops = np.array(self._stops)
+        setpoints = starts + (stops - starts) * points / self._extent
+        return setpoints, np.array(list(self._values.values()))
+
+    def _request(self, points: Iterator[_Point]) -> None:
+        for point in points:
+            if point not in self._values and point not in self._requested:
+                self._requested.add(point)
+                self._queue.append(point)
+
+    def _corners(self, cell: _Cell) -> Iterator[_Point]:
+        origin, size = cell
+        return itertools.product(
+            *((coordinate, coordinate + size) for coordinate in origin)
+        )
+
+    def _resolve(self) -> None:
+        unresolved = []
+        for cell in self._unresolved:
+            if all(corner in self._values for corner in self._corners(cell)):
+                heapq.heappush(
+                    self._heap, (-self._loss(cell), next(self._counter), cell)
+                )
+            else:
+                unresolved.append(cell)
+        self._unresolved = unresolved
+
+    def _loss(self, cell: _Cell) -> float:
+        origin, size = cell
+        values = [
+            value
+            for value in (self._values[corner] for corner in self._corners(cell))
+            if math.isfinite(value)
+        ]
+        value_range = self._value_max - self._value_min
+        if len(values) > 1 and value_range > 0:
+            relative_change = (max(values) - min(values)) / value_range
+        else:
+            relative_change = 0.0
+        side = size / self._extent
+        return side ** (self._ndim - 1) * math.hypot(side, relative_change)
+
+    def _pop_largest_loss(self) -> _Cell | None:
+        while self._heap:
+            _, _, cell = heapq.heappop(self._heap)
+            # the losses only decrease as the range of the values grows, so
+            # the loss of a cell is up to date if it is still the largest
+            loss = self._loss(cell)
+            if self._heap and loss < -self._heap[0][0]:
+                heapq.heappush(self._heap, (-loss, next(self._counter), cell))
+                continue
+            return cell
+        return None
+
+    def _refine(self, cell: _Cell) -> None:
+        origin, size = cell
+        if size < 2:
+            # the cell is at the resolution of the lattice
+            return
+        half = size // 2
+        self._request(
+            tuple(
+                coordinate + offset
+                for coordinate, offset in zip(origin, offsets)
+            )
+            for offsets in itertools.product((0, half, size), repeat=self._ndim)
+        )
+        self._unresolved.extend(
+            (
+                tuple(
+                    coordinate + offset
+                    for coordinate, offset in zip(origin, offsets)
+                ),
+                half,
+            )
+            for offsets in itertools.product((0, half), repeat=self._ndim)
+        )
+        self._resolve()
+
+
+class AdaptiveSweep1D(_TreeSweep):
+    """
+    Adaptive sweep of one parameter that refines the intervals between the
+    setpoints where the measured curve is longest, i.e. where the value
+    changes most.
+
+    Args:
+        param: The parameter to sweep.
+        start: Start of the swept range.
+        stop: End of the swept range.
+        num_points: The number of points after which the sweep ends.
+        initial_points: The number of points of the evenly spaced grid that
+            is measured before refining it.
+        delay: Time in seconds to wait after setting the parameter.
+        post_actions: Actions to do after setting the parameter.
+        target: The measured parameter whose value determines the next
+            setpoints when used with :func:`.dond`. Defaults to the first
+            measured parameter.
+    """
+
+    def __init__(
+        self,
+        param: ParameterBase,
+        start: float,
+        stop: float,
+        num_points: int,
+        initial_points: int = 10,
+        delay: float = 0,
+        post_actions: ActionsT = (),
+        target: ParameterBase | None = None,
+    ):
+        super().__init__(
+            (param,),
+            (start,),
+            (stop,),
+            num_points,
+            initial_points,
+            delay,
+            post_actions,
+            target,
+        )
+
+
+class AdaptiveSweep2D(_TreeSweep):
+    """
+    Adaptive sweep of two parameters that refines a quadtree of cells,
+    splitting the cells where the measured value changes most first.
+
+    Args:
+        param_1: The first parameter to sweep.
+        start_1: Start of the swept range of the first parameter.
+        stop_1: End of the swept range of the first parameter.
+        param_2: The second parameter to sweep.
+        start_2: Start of the swept range of the second parameter.
+        stop_2: End of the swept range of the second parameter.
+        num_points: The number of points after which the sweep ends.
+        initial_points: The number of points along each axis of the regular
+            grid that is measured before refining it.
+        delay: Time in seconds to wait after setting the parameters.
+        post_actions: Actions to do after setting the parameters.
+        target: The measured parameter whose value determines the next
+            setpoints when used with :func:`.dond`. Defaults to the first
+            measured parameter.
+    """
+
+    def __init__(
+        self,
+        param_1: ParameterBase,
+        start_1: float,
+        stop_1: float,
+        param_2: ParameterBase,
+        start_2: float,
+        stop_2: float,
+        num_points: int,
+        initial_points: int = 5,
+        delay: float = 0,
+        post_actions: ActionsT = (),
+        target: ParameterBase | None = None,
+    ):
+        super().__init__(
+            (param_1, param_2),
+            (start_1, start_2),
+            (stop_1, stop_2),
+            num_points,
+            initial_points,
+            delay,
+            post_actions,
+            target,
+        )
@@ -21,8 +21,8 @@ from qcodes.dataset.dond.do_nd_utils import (
 )
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
-    ThreadPoolParamsCaller,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
@@ -93,8 +93,9 @@ def do1d(
         do_plot: should png and pdf versions of the images be saved after the
             run. If None the setting will be read from ``qcodesrc.json``
         use_threads: If True measurements from each instrument will be done on
-            separate threads. If you are measuring from several instruments
-            this may give a significant speedup.
+            separate threads, which are kept for the whole measurement. If
+            you are measuring from several instruments this may give a
+            significant speedup.
         show_progress: should a progress bar be displayed during the
             measurement. If None the setting will be read from ``qcodesrc.json``
         log_info: Message that is logged during the measurement. If None a default
@@ -105,10 +106,12 @@ def do1d(
     Returns:
         The QCoDeS dataset.
     """
+    # read the config once per run
+    dataset_config = config.dataset
     if do_plot is None:
-        do_plot = cast(bool, config.dataset.dond_plot)
+        do_plot = cast(bool, dataset_config.dond_plot)
     if show_progress is None:
-        show_progress = config.dataset.dond_show_progress
+        show_progress = dataset_config.dond_show_progress
 
     meas = Measurement(name=measurement_name, exp=exp)
     if log_info is not None:
@@ -139,10 +142,10 @@ def do1d(
     _register_actions(meas, enter_actions, exit_actions)
 
     if use_threads is None:
-        use_threads = config.dataset.use_threads
+        use_threads = dataset_config.use_threads
 
     param_meas_caller = (
-        ThreadPoolParamsCaller(*param_meas)
+        InstrumentWorkersParamsCaller(*param_meas)
         if use_threads
         else SequentialParamsCaller(*param_meas)
     )
@@ -152,7 +155,9 @@ def do1d(
     # reimplemented from scratch
     with catch_interrupts() as interrupted, meas.run() as datasaver, param_meas_caller as call_param_meas:
         dataset = datasaver.dataset
-        additional_setpoints_data = process_params_meas(additional_setpoints)
+        additional_setpoints_data = process_params_meas(
+            additional_setpoints, use_threads=use_threads
+        )
         setpoints = np.linspace(start, stop, num_points)
 
         # flush to prevent unflushed print's to visually interrupt tqdm bar
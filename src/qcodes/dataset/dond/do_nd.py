@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import itertools
+import json
 import logging
+import math
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Union, cast
 
 import numpy as np
@@ -14,6 +18,7 @@ from tqdm.auto import tqdm
 from typing_extensions import TypedDict
 
 from qcodes import config
+from qcodes.dataset.data_set import DataSet, load_by_guid
 from qcodes.dataset.descriptions.detect_shapes import detect_shape_of_measurement
 from qcodes.dataset.dond.do_nd_utils import (
     BreakConditionInterrupt,
@@ -25,17 +30,23 @@ from qcodes.dataset.dond.do_nd_utils import (
 )
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.threading import (
+    AsyncParamsCaller,
+    InstrumentWorkersParamsCaller,
     SequentialParamsCaller,
-    ThreadPoolParamsCaller,
+    _ParamsCallerProtocol,
     process_params_meas,
 )
 from qcodes.parameters import ParameterBase
 
-from .sweeps import AbstractSweep, TogetherSweep
+from .adaptive_sweeps import AdaptiveSweep
+from .sweeps import AbstractSweep, BufferedSweep, TogetherSweep
 
 LOG = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from qcodes.dataset.data_set_protocol import DataSetProtocol
     from qcodes.dataset.descriptions.versioning.rundescribertypes import Shapes
     from qcodes.dataset.dond.do_nd_utils import (
         ActionsT,
@@ -43,8 +54,12 @@ if TYPE_CHECKING:
         BreakConditionT,
         MultiAxesTupleListWithDataSet,
         ParamMeasT,
+        SweepOrderT,
     )
     from qcodes.dataset.experiment_container import Experiment
+    from qcodes.dataset.measurements import DataSaver
+    from qcodes.dataset.sqlite.connection import ConnectionPlus
+    from qcodes.dataset.timing_profiler import PointTimingProfiler
 
 SweepVarType = Any
 
@@ -67,61 +82,244 @@ class ParameterSetEvent:
 
 
 class _Sweeper:
+    """
+    Iterates over the points of the sweeps of a dond. The setpoints of each
+    point, and whether they changed since the previous point, are computed
+    from the index of the point on the fly, so that the memory used does
+    not grow with the number of points.
+    """
+
     def __init__(
         self,
         sweeps: Sequence[AbstractSweep | TogetherSweep],
         additional_setpoints: Sequence[ParameterBase],
+        sweep_order: SweepOrderT = "raster",
     ):
         self._additional_setpoints = additional_setpoints
         self._sweeps = sweeps
-        self._setpoints = self._make_setpoints_tuples()
-        self._setpoints_dict = self._make_setpoints_dict()
         self._shape = self._make_shape(sweeps, additional_setpoints)
+        self._buffered_sweep = self._get_buffered_sweep(sweeps)
+        # the points of a buffered sweep are run by the instrument, so only
+        # the other sweeps are stepped through
+        stepped_sweeps = sweeps[:-1] if self._buffered_sweep is not None else sweeps
+        self._stepped_sweeps = tuple(stepped_sweeps)
+        # the number of points between consecutive setpoints of each dimension
+        strides = [1]
+        for sweep in reversed(stepped_sweeps[1:]):
+            strides.append(strides[-1] * sweep.num_points)
+        self._strides = tuple(reversed(strides))
+        # each individual sweep with the dimension it belongs to and its
+        # setpoints
+        self._sweep_setpoints = tuple(
+            (individual_sweep, dim, individual_sweep.get_setpoints())
+            for dim, sweep in enumerate(stepped_sweeps)
+            for individual_sweep in (
+                sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+            )
+        )
+        self._len = int(np.prod(self._shape[: len(stepped_sweeps)]))
         self._iter_index = 0
 
+        if sweep_order == "raster":
+            nesting: tuple[int, ...] = tuple(range(len(stepped_sweeps)))
+            self._serpentine = False
+        elif sweep_order == "serpentine":
+            nesting = tuple(range(len(stepped_sweeps)))
+            self._serpentine = True
+        elif sweep_order == "min_ramp":
+            nesting = tuple(range(len(stepped_sweeps)))
+            self._serpentine = self._min_ramp_serpentine()
+        else:
+            raise ValueError(
+                f"Unknown sweep order {sweep_order!r}, expected one of "
+                f"'raster', 'serpentine' or 'min_ramp'."
+            )
+        self._set_traversal(nesting)
+
+    def _set_traversal(self, nesting: tuple[int, ...]) -> None:
+        # the dimensions from the outermost to the innermost loop, with the
+        # number of points between consecutive setpoints of each of them
+        # while traversing the sweep
+        self._nesting = nesting
+        traversal_strides = [1]
+        for dim in reversed(nesting[1:]):
+            traversal_strides.append(traversal_strides[-1] * self._shape[dim])
+        self._traversal = tuple(zip(nesting, reversed(traversal_strides)))
+        self._is_raster = not self._serpentine and nesting == tuple(
+            range(len(nesting))
+        )
+
     @property
-    def setpoints_dict(self) -> dict[str, list[Any]]:
-        return self._setpoints_dict
+    def is_raster(self) -> bool:
+        """
+        Whether the points are traversed in the logical order of the grid,
+        i.e. with the last sweep as the innermost loop and always in the
+        same direction.
+        """
+        return self._is_raster
 
-    def _make_setpoints_tuples(
-        self,
-    ) -> tuple[tuple[tuple[SweepVarType, ...] | SweepVarType, ...], ...]:
-        sweeps = tuple(sweep.get_setpoints() for sweep in self._sweeps)
-        return cast(
-            tuple[tuple[Union[tuple[SweepVarType, ...], SweepVarType], ...], ...],
-            tuple(itertools.product(*sweeps)),
+    @property
+    def traversal(self) -> dict[str, Any]:
+        """
+        A description of the order in which the points are traversed: the
+        parameters of the dimensions from the outermost to the innermost
+        loop and whether the direction alternates between passes.
+        """
+        return {
+            "nesting": [
+                [sweep.param.full_name for sweep in self._individual_sweeps(dim)]
+                for dim in self._nesting
+            ],
+            "serpentine": self._serpentine,
+        }
+
+    def _individual_sweeps(self, dim: int) -> tuple[AbstractSweep, ...]:
+        sweep = self._stepped_sweeps[dim]
+        return sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+
+    def _positions(self, index: int) -> list[int]:
+        """The position along each dimension of the point traversed at index"""
+        positions = [0] * len(self._nesting)
+        for dim, stride in self._traversal:
+            num_points = self._shape[dim]
+            passes, position = divmod(index // stride, num_points)
+            if self._serpentine and passes % 2:
+                position = num_points - 1 - position
+            positions[dim] = position
+        return positions
+
+    def logical_index(self, index: int) -> int:
+        """
+        The index in the logical grid of the sweep, i.e. in raster order, of
+        the point that is traversed at index.
+        """
+        if self._is_raster:
+            return index
+        return sum(
+            position * stride
+            for position, stride in zip(self._positions(index), self._strides)
         )
 
-    def _make_single_point_setpoints_dict(self, index: int) -> dict[str, SweepVarType]:
-        setpoint_dict = {}
-        values = self._setpoints[index]
-        for sweep, subvalues in zip(self._sweeps, values):
-            if isinstance(sweep, TogetherSweep):
-                for individual_sweep, value in zip(sweep.sweeps, subvalues):
-                    setpoint_dict[individual_sweep.param.full_name] = value
-            else:
-                setpoint_dict[sweep.param.full_name] = subvalues
-        return setpoint_dict
+    def _min_ramp_serpentine(self) -> bool:
+        """
+        Whether traversing the sweeps as a serpentine reduces the estimated
+        time spent setting the sweep parameters. The nesting of the sweeps
+        is kept, such that the results of at most one pass of the outermost
+        sweep, i.e. one line of a 2D sweep, are held back to store them in
+        raster order. If another nesting is estimated to be faster, this is
+        logged.
+        """
+        # the time of moving along each dimension within one pass, and of
+        # moving back from the last to the first setpoint between passes
+        pass_costs = []
+        flyback_costs = []
+        for dim in range(len(self._stepped_sweeps)):
+            sweeps = self._individual_sweeps(dim)
+            setpoints = [sweep.get_setpoints() for sweep in sweeps]
+            pass_costs.append(
+                sum(
+                    _set_time(sweep, values[i], values[i + 1])
+                    for sweep, values in zip(sweeps, setpoints)
+                    for i in range(len(values) - 1)
+                )
+            )
+            flyback_costs.append(
+                sum(
+                    _set_time(sweep, values[-1], values[0])
+                    for sweep, values in zip(sweeps, setpoints)
+                    if len(values) > 0
+                )
+            )
 
-    def _make_setpoints_dict(self) -> dict[str, list[Any]]:
-        setpoint_dict: dict[str, list[SweepVarType]] = {}
+        def cost(nesting: tuple[int, ...], serpentine: bool) -> float:
+            total = 0.0
+            n_passes = 1
+            for dim in nesting:
+                total += n_passes * pass_costs[dim]
+                if not serpentine:
+                    total += (n_passes - 1) * flyback_costs[dim]
+                n_passes *= self._shape[dim]
+            return total
+
+        nesting = tuple(range(len(pass_costs)))
+        # raster order is kept on ties
+        serpentine = cost(nesting, True) < cost(nesting, False)
+        best_cost, best_nesting = min(
+            (cost(other, serpentine), other)
+            for other in itertools.permutations(nesting)
+        )
+        LOG.info(
+            "Estimated time of setting the sweep parameters is %s s "
+            "with serpentine=%s",
+            cost(nesting, serpentine),
+            serpentine,
+        )
+        if best_cost < cost(nesting, serpentine):
+            LOG.info(
+                "Passing the sweeps in the order %s would reduce the estimated "
+                "time of setting the sweep parameters to %s s",
+                [
+                    [sweep.param.full_name for sweep in self._individual_sweeps(dim)]
+                    for dim in best_nesting
+                ],
+                best_cost,
+            )
+        return serpentine
 
-        for sweep in self._sweeps:
-            if isinstance(sweep, TogetherSweep):
-                for individual_sweep in sweep.sweeps:
-                    setpoint_dict[individual_sweep.param.full_name] = []
-            else:
-                setpoint_dict[sweep.param.full_name] = []
-
-        for setpoint_tuples in self._setpoints:
-            for sweep, values in zip(self._sweeps, setpoint_tuples):
-                if isinstance(sweep, TogetherSweep):
-                    for individual_sweep, individual_value in zip(sweep.sweeps, values):
-                        setpoint_dict[individual_sweep.param.full_name].append(
-                            individual_value
-                        )
-                else:
-                    setpoint_dict[sweep.param.full_name].append(values)
+    @staticmethod
+    def _get_buffered_sweep(
+        sweeps: Sequence[AbstractSweep | TogetherSweep],
+    ) -> BufferedSweep | None:
+        for i, sweep in enumerate(sweeps):
+            individual_sweeps = (
+                sweep.sweeps if isinstance(sweep, TogetherSweep) else (sweep,)
+            )
+            if not any(isinstance(sub, BufferedSweep) for sub in individual_sweeps):
+                continue
+            if not isinstance(sweep, BufferedSweep) or i != len(sweeps) - 1:
+                raise ValueError(
+                    "A buffered sweep must be the last sweep and cannot be "
+                    "part of a TogetherSweep."
+                )
+            return sweep
+        return None
+
+    @property
+    def buffered_sweep(self) -> BufferedSweep | None:
+        """
+        The buffered sweep that is run by an instrument for each point of
+        the other sweeps, if any.
+        """
+        return self._buffered_sweep
+
+    @property
+    def setpoints_dict(self) -> dict[str, list[Any]]:
+        """
+        The setpoints of every point of the sweep, in the order in which the
+        points are traversed, for each stepped parameter, i.e. excluding a
+        buffered sweep. Note that this creates lists of the full length of
+        the sweep.
+        """
+        setpoint_dict: dict[str, list[Any]] = {}
+        if not self._is_raster:
+            all_positions = [self._positions(index) for index in range(self._len)]
+            for sweep, dim, setpoints in self._sweep_setpoints:
+                setpoint_dict[sweep.param.full_name] = [
+                    setpoints[positions[dim]] for positions in all_positions
+                ]
+            return setpoint_dict
+        for sweep, dim, setpoints in self._sweep_setpoints:
+            block_size = self._strides[dim] * self._shape[dim]
+            n_repeats = self._len // block_size if block_size else 0
+            setpoint_dict[sweep.param.full_name] = (
+                list(
+                    itertools.chain.from_iterable(
+                        itertools.repeat(value, self._strides[dim])
+                        for value in setpoints[: self._shape[dim]]
+                    )
+                )
+                * n_repeats
+            )
         return setpoint_dict
 
     @property
@@ -205,24 +403,26 @@ class _Sweeper:
         return self._shape
 
     def __getitem__(self, index: int) -> tuple[ParameterSetEvent, ...]:
-        setpoints = self._make_single_point_setpoints_dict(index)
-
-        if index == 0:
-            previous_setpoints: dict[str, SweepVarType | None] = {}
-            for key in setpoints.keys():
-                previous_setpoints[key] = None
-        else:
-            previous_setpoints = self._make_single_point_setpoints_dict(index - 1)
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f"Index {index} is out of range of the sweep")
 
         parameter_set_events = []
+        positions = self._positions(index)
+        previous_positions = self._positions(index - 1) if index > 0 else None
 
-        for sweep in self.all_sweeps:
-            new_value = setpoints[sweep.param.full_name]
-            old_value = previous_setpoints[sweep.param.full_name]
-            if old_value is None or old_value != new_value:
+        for sweep, dim, setpoints in self._sweep_setpoints:
+            position = positions[dim]
+            new_value = setpoints[position]
+            if previous_positions is None:
                 should_set = True
-            else:
+            elif previous_positions[dim] == position:
+                # only other dimensions changed since the previous point
                 should_set = False
+            else:
+                old_value = setpoints[previous_positions[dim]]
+                should_set = bool(old_value is None or old_value != new_value)
             event = ParameterSetEvent(
                 new_value=new_value,
                 parameter=sweep.param,
@@ -235,7 +435,7 @@ class _Sweeper:
         return tuple(parameter_set_events)
 
     def __len__(self) -> int:
-        return int(np.prod(self.shape))
+        return self._len
 
     def __iter__(self) -> _Sweeper:
         return self
@@ -248,11 +448,333 @@ class _Sweeper:
         else:
             raise StopIteration
 
+    def points(
+        self, start: int = 0
+    ) -> Iterator[tuple[int, tuple[ParameterSetEvent, ...]]]:
+        """
+        Iterate over the index and the set events of the points whose
+        logical index is at least start, e.g. to resume a sweep of which the
+        first start points of the grid have been measured. All parameters
+        are set at the first point.
+        """
+        first = True
+        for index in range(start if self._is_raster else 0, self._len):
+            if self.logical_index(index) < start:
+                continue
+            set_events = self[index]
+            if first:
+                set_events = tuple(
+                    replace(set_event, should_set=True) for set_event in set_events
+                )
+                first = False
+            yield index, set_events
+
+    def tell(self, results: Mapping[ParameterBase, Any]) -> None:
+        """
+        Take the results of the last point. The setpoints of regular sweeps
+        do not depend on the results so this does nothing.
+        """
+
+
+def _set_time(sweep: AbstractSweep, start: Any, stop: Any) -> float:
+    """
+    Estimate the time of setting the parameter of a sweep from start to
+    stop. The parameter is ramped in steps of its ``step``, each followed by
+    its ``inter_delay``, after which its ``post_delay`` and the delay of the
+    sweep are waited.
+    """
+    if start is stop or bool(start == stop):
+        return 0.0
+    param = sweep.param
+    n_sets = 1
+    if param.step:
+        try:
+            n_sets = max(1, math.ceil(abs(stop - start) / param.step))
+        except TypeError:
+            # setpoints that are not numbers are set in one go
+            pass
+    return n_sets * param.inter_delay + param.post_delay + sweep.delay
+
+
+class _ReorderBuffer:
+    """
+    Adds the results of the points of a sweep to the datasets in the logical
+    order of the grid of the sweep, holding back the results of points that
+    are traversed before points that precede them on the grid. This keeps
+    the data of sweeps that are not traversed in raster order consistent
+    with the shapes of the datasets.
+    """
+
+    def __init__(
+        self,
+        add_results: Callable[[Mapping[ParameterBase, Any]], None],
+        start: int = 0,
+    ):
+        self._add_results = add_results
+        self._held_back: dict[int, Mapping[ParameterBase, Any]] = {}
+        self._next_index = start
+
+    @property
+    def n_added(self) -> int:
+        """
+        The number of points of the grid whose results have been added,
+        i.e. the logical index of the first point that is missing.
+        """
+        return self._next_index
+
+    def add(self, logical_index: int, results: Mapping[ParameterBase, Any]) -> None:
+        if logical_index != self._next_index:
+            self._held_back[logical_index] = results
+            return
+        self._add_results(results)
+        self._next_index += 1
+        while self._next_index in self._held_back:
+            self._add_results(self._held_back.pop(self._next_index))
+            self._next_index += 1
+
+    def flush(self) -> None:
+        """
+        Add the results that are held back, in the order of the grid, e.g.
+        when the sweep is interrupted.
+        """
+        for logical_index in sorted(self._held_back):
+            self._add_results(self._held_back.pop(logical_index))
+
+
+_CHECKPOINT_KEY = "dond_checkpoint"
+
+
+class _Checkpointer:
+    """
+    Writes checkpoints of a dond to the metadata of its datasets, such that
+    an interrupted dond can be resumed. A checkpoint holds the number of
+    points of the grid whose results have been written to the database,
+    the id of the last row of results of the dataset, the guids of all
+    datasets of the dond and the number of points of the sweep. Each
+    checkpoint also holds the previous one, in case the process stops
+    after the checkpoints of only some of the datasets have been written.
+
+    A checkpoint is written at most once per write period, after a datasaver
+    has flushed its results to the database. The checkpoint is added to the
+    metadata by the writer of the database once it has written those
+    results, such that writing a checkpoint never waits for the results to
+    be written.
+    """
+
+    def __init__(
+        self,
+        datasavers: Sequence[DataSaver],
+        num_points: int,
+        write_period: float,
+        previous: Sequence[dict[str, int]] | None = None,
+    ):
+        self._datasavers = datasavers
+        self._num_points = num_points
+        self._write_period = write_period
+        self._previous = (
+            list(previous)
+            if previous is not None
+            else [{"points": 0, "last_result_id": 0} for _ in datasavers]
+        )
+        self._last_write = time.perf_counter()
+
+    def maybe_write(self, points: int) -> None:
+        """
+        Write a checkpoint if the write period has passed and a datasaver
+        has flushed its results since the last checkpoint.
+        """
+        if time.perf_counter() - self._last_write > self._write_period and any(
+            datasaver._last_save_time > self._last_write
+            for datasaver in self._datasavers
+        ):
+            self.write(points)
+
+    def write(self, points: int) -> None:
+        """
+        Flush the results of all datasavers and checkpoint that the first
+        points of the grid are stored once the results are written.
+        """
+        guids = [datasaver.dataset.guid for datasaver in self._datasavers]
+        for i, datasaver in enumerate(self._datasavers):
+            datasaver.flush_data_to_database()
+            dataset = datasaver.dataset
+            if not isinstance(dataset, DataSet):
+                continue
+            dataset._add_metadata_after_write(
+                _CHECKPOINT_KEY, partial(self._checkpoint, i, points, guids)
+            )
+        self._last_write = time.perf_counter()
+
+    def _checkpoint(
+        self, index: int, points: int, guids: list[str], last_result_id: int
+    ) -> str:
+        current = {"points": points, "last_result_id": last_result_id}
+        checkpoint = {
+            **current,
+            "previous": self._previous[index],
+            "num_points": self._num_points,
+            "datasets": guids,
+        }
+        self._previous[index] = current
+        return json.dumps(checkpoint)
+
+
+def _load_checkpoints(
+    guid: str, conns: Sequence[ConnectionPlus | None], num_points: int
+) -> tuple[int, list[tuple[str, dict[str, int]]]]:
+    """
+    Load the checkpoints of the datasets of the dond that created the
+    dataset with the given guid. The datasets are loaded using the
+    connections to the databases of the experiments of the datasets of the
+    dond, where a connection of None is to the database set in the config.
+    Return the number of points of the grid that are stored in all
+    datasets, and the guid of each dataset with the checkpoint at that
+    number of points.
+    """
+    n_datasets = len(conns)
+    dataset = _load_by_guid_from_any(guid, conns)
+    if _CHECKPOINT_KEY not in dataset.metadata:
+        raise ValueError(
+            f"The dataset with guid {guid} has no checkpoint to resume from."
+        )
+    guids = json.loads(dataset.metadata[_CHECKPOINT_KEY])["datasets"]
+    if len(guids) != n_datasets:
+        raise ValueError(
+            f"Cannot resume the dond with {n_datasets} datasets from a dond "
+            f"with {len(guids)} datasets."
+        )
+    checkpoints = []
+    for dataset_guid, conn in zip(guids, conns):
+        dataset = load_by_guid(dataset_guid, conn=conn)
+        checkpoint = json.loads(dataset.metadata[_CHECKPOINT_KEY])
+        if checkpoint["num_points"] != num_points:
+            raise ValueError(
+                f"Cannot resume the dond with {num_points} points from a "
+                f"dond with {checkpoint['num_points']} points."
+            )
+        checkpoints.append(checkpoint)
+
+    n_stored = min(checkpoint["points"] for checkpoint in checkpoints)
+    resolved = []
+    for dataset_guid, checkpoint in zip(guids, checkpoints):
+        for candidate in (checkpoint, checkpoint["previous"]):
+            if candidate["points"] == n_stored:
+                resolved.append(
+                    (
+                        dataset_guid,
+                        {
+                            "points": n_stored,
+                            "last_result_id": candidate["last_result_id"],
+                        },
+                    )
+                )
+                break
+        else:
+            raise RuntimeError(
+                f"The checkpoints of the datasets {guids} are inconsistent."
+            )
+    return n_stored, resolved
+
+
+def _load_by_guid_from_any(
+    guid: str, conns: Sequence[ConnectionPlus | None]
+) -> DataSetProtocol:
+    """Load the dataset with the given guid from the first database it is in."""
+    for conn in dict.fromkeys(conns):
+        try:
+            return load_by_guid(guid, conn=conn)
+        except NameError:
+            continue
+    raise NameError(f"No run with GUID: {guid} found in the databases of the dond.")
+
+
+class _AdaptiveSweeper:
+    """
+    Iterates over the points of an adaptive sweep, telling the sweep the
+    value of its target parameter after each point.
+    """
+
+    def __init__(
+        self,
+        sweep: AdaptiveSweep,
+        additional_setpoints: Sequence[ParameterBase],
+    ):
+        self._sweep = sweep
+        self._additional_setpoints = additional_setpoints
+        self._setpoints: tuple[float, ...] | None = None
+
+    @property
+    def all_setpoint_params(self) -> tuple[ParameterBase, ...]:
+        return self._sweep.params + tuple(self._additional_setpoints)
+
+    @property
+    def sweep_groupes(self) -> tuple[tuple[ParameterBase, ...], ...]:
+        # the points of an adaptive sweep are only defined by all of its
+        # parameters together
+        return (self.all_setpoint_params,)
+
+    @property
+    def shape(self) -> None:
+        # the setpoints are not on a grid
+        return None
+
+    @property
+    def buffered_sweep(self) -> None:
+        return None
+
+    def logical_index(self, index: int) -> int:
+        return index
+
+    def __len__(self) -> int:
+        return self._sweep.num_points
+
+    def __iter__(self) -> _AdaptiveSweeper:
+        return self
+
+    def points(
+        self, start: int = 0
+    ) -> Iterator[tuple[int, tuple[ParameterSetEvent, ...]]]:
+        if start:
+            raise ValueError("An adaptive sweep cannot be resumed.")
+        return enumerate(self)
+
+    def __next__(self) -> tuple[ParameterSetEvent, ...]:
+        setpoints = self._sweep.ask()
+        if setpoints is None:
+            raise StopIteration
+        self._setpoints = setpoints
+        n_params = len(self._sweep.params)
+        # wait and run the actions once after setting all parameters
+        return tuple(
+            ParameterSetEvent(
+                new_value=value,
+                parameter=param,
+                should_set=True,
+                delay=self._sweep.delay if i == n_params - 1 else 0,
+                actions=self._sweep.post_actions if i == n_params - 1 else (),
+                get_after_set=False,
+            )
+            for i, (param, value) in enumerate(zip(self._sweep.params, setpoints))
+        )
+
+    def tell(self, results: Mapping[ParameterBase, Any]) -> None:
+        """Tell the sweep the value of its target at the last point."""
+        if self._setpoints is None:
+            return
+        target = self._sweep.target
+        if target is None:
+            # the first measured parameter
+            target = next(
+                param for param in results if param not in self.all_setpoint_params
+            )
+        self._sweep.tell(self._setpoints, results[target])
+        self._setpoints = None
+
 
 class _Measurements:
     def __init__(
         self,
-        sweeper: _Sweeper,
+        sweeper: _Sweeper | _AdaptiveSweeper,
         measurement_name: str | Sequence[str],
         params_meas: Sequence[ParamMeasT | Sequence[ParamMeasT]],
         enter_actions: ActionsT,
@@ -379,6 +901,8 @@ class _Measurements:
         return tuple(measured_all), grouped_parameters, tuple(measured_parameters)
 
     def _get_shapes(self) -> Shapes | None:
+        if self._sweeper.shape is None:
+            return None
         try:
             shapes: Shapes | None = detect_shape_of_measurement(
                 self.measured_parameters, self._sweeper.shape
@@ -569,7 +1093,11 @@ class _SweepMeasGroup:
 
 @TRACER.start_as_current_span("qcodes.dataset.dond")
 def dond(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | AdaptiveSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
     write_period: float | None = None,
     measurement_name: str | Sequence[str] = "",
     exp: Experiment | Sequence[Experiment] | None = None,
@@ -578,11 +1106,18 @@ def dond(
     do_plot: bool | None = None,
     show_progress: bool | None = None,
     use_threads: bool | None = None,
+    use_async: bool | None = None,
     additional_setpoints: Sequence[ParameterBase] = tuple(),
     log_info: str | None = None,
     break_condition: BreakConditionT | None = None,
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None = None,
     in_memory_cache: bool | None = None,
+    pipeline: bool | None = None,
+    setpoint_independent: Sequence[ParameterBase] = (),
+    sweep_order: SweepOrderT = "raster",
+    resume_guid: str | None = None,
+    profile_timing: bool = False,
+    store_timing_trace: bool = False,
 ) -> AxesTupleListWithDataSet | MultiAxesTupleListWithDataSet:
     """
     Perform n-dimentional scan from slowest (first) to the fastest (last), to
@@ -616,6 +1151,29 @@ def dond(
                               LinSweep(param_set_2, start_2, stop_2, num_points, delay_2))
                 param_meas_1, param_meas_2, ..., param_meas_m
 
+            A single adaptive sweep, e.g. :class:`.AdaptiveSweep2D`, can be
+            given instead of the regular sweeps, in which case the setpoints
+            are chosen based on the values measured so far and the data is
+            stored in an unshaped dataset.
+
+            .. code-block::
+
+                AdaptiveSweep2D(param_set_1, start_1, stop_1,
+                                param_set_2, start_2, stop_2, num_points),
+                param_meas_1, param_meas_2, ..., param_meas_m
+
+            The last sweep may be a :class:`.BufferedSweep`, whose points are
+            run by an instrument by itself. It is then triggered once for
+            each point of the other sweeps and each line is added to the
+            dataset at once. The other measured parameters, which must be
+            scalar, are measured once per line.
+
+            .. code-block::
+
+                LinSweep(param_set_1, start_1, stop_1, num_points_1, delay_1),
+                Keithley2600BufferedSweep(smu, start_2, stop_2, num_points_2),
+                smu.curr
+
 
         write_period: The time after which the data is actually written to the
             database.
@@ -635,8 +1193,14 @@ def dond(
         show_progress: should a progress bar be displayed during the
             measurement. If None the setting will be read from ``qcodesrc.json``
         use_threads: If True, measurements from each instrument will be done on
-            separate threads. If you are measuring from several instruments
-            this may give a significant speedup.
+            separate threads, which are kept for the whole measurement. If
+            you are measuring from several instruments this may give a
+            significant speedup.
+        use_async: If True, measurements from different instruments will be
+            done concurrently on an asyncio event loop using
+            ``get_async`` of the parameters. This takes precedence over
+            ``use_threads``. If None the setting will be read from
+            ``qcodesrc.json``.
         additional_setpoints: A list of setpoint parameters to be registered in
             the measurement but not scanned/swept-over.
         log_info: Message that is logged during the measurement. If None a default
@@ -653,6 +1217,54 @@ def dond(
             plotting and exporting. Useful to disable if the data is very large
             in order to save on memory consumption.
             If ``None``, the value for this will be read from ``qcodesrc.json`` config file.
+        pipeline: If True, the sweep parameters of the next point are set,
+            and their delays and post actions run, on a background thread
+            while the results of the current point are added to the
+            datasets. Note that the post actions and the ``get_after_set`` gets then run on
+            the background thread. If None the setting will be read from
+            ``qcodesrc.json``.
+        setpoint_independent: Measured parameters whose values do not depend
+            on the setpoints. When pipelining, these are got on a background
+            thread at the same time as the setpoints of their point are
+            set. They must therefore be safe to get concurrently with
+            setting the sweep parameters.
+        sweep_order: The order in which the points are measured. With
+            ``"raster"`` the last sweep is the innermost loop and every pass
+            runs in the same direction, such that parameters with a ``step``
+            ramp back to the start of the sweep after each pass. With
+            ``"serpentine"`` the direction alternates between passes, which
+            avoids ramping back. With ``"min_ramp"`` the sweeps are
+            traversed as a serpentine if that is estimated to reduce the
+            time of setting the sweep parameters, estimated from their
+            ``step``, ``inter_delay`` and ``post_delay`` and the delays of
+            the sweeps. The nesting of the sweeps is not changed, but an
+            order of the sweeps that is estimated to be faster is logged.
+            The data is always stored in raster order, holding back the
+            results of at most one pass of the outermost sweep, i.e. one
+            line of a 2D sweep. The order
+            used is stored in the metadata of the datasets under
+            ``dond_sweep_order``.
+        resume_guid: The guid of a dataset of an interrupted dond to resume.
+            The dond must be called with the same sweeps and measured
+            parameters as the interrupted one, and the datasets are loaded
+            from the databases of the experiments given by ``exp``. Every
+            time the data is written to the database, the number of points
+            stored is checkpointed in the metadata of the datasets under
+            ``dond_checkpoint``. When resuming, the results stored after the
+            last checkpoint are discarded, the points before it are skipped
+            and the results of the remaining points are appended to the
+            same datasets. Adaptive sweeps cannot be resumed.
+        profile_timing: If True, the time spent setting the sweep parameters,
+            waiting for their delays, getting the measured parameters,
+            adding the results and writing them to the database is recorded
+            for every point, and statistics of these stages are stored in
+            the metadata of the datasets under ``timing_profile``, see
+            :meth:`.DataSet.timing_report`. When pipelining, the stages that
+            run on the background thread are recorded as well, but overlap
+            with adding the results of the previous point.
+        store_timing_trace: If True and profiling, the durations of the
+            stages of each of the last 10000 points are stored in the
+            metadata as well.
 
     Returns:
         A tuple of QCoDeS DataSet, Matplotlib axis, Matplotlib colorbar. If
@@ -662,14 +1274,35 @@ def dond(
         belongs to one group, and the order of elements is the order of
         the supplied groups.
     """
+    # read the config once per run
+    dataset_config = config.dataset
     if do_plot is None:
-        do_plot = cast(bool, config.dataset.dond_plot)
+        do_plot = cast(bool, dataset_config.dond_plot)
     if show_progress is None:
-        show_progress = config.dataset.dond_show_progress
+        show_progress = dataset_config.dond_show_progress
 
     sweep_instances, params_meas = _parse_dond_arguments(*params)
 
-    sweeper = _Sweeper(sweep_instances, additional_setpoints)
+    sweeper: _Sweeper | _AdaptiveSweeper
+    adaptive_sweeps = [
+        sweep for sweep in sweep_instances if isinstance(sweep, AdaptiveSweep)
+    ]
+    if adaptive_sweeps:
+        if len(sweep_instances) > 1:
+            raise ValueError(
+                "An adaptive sweep cannot be combined with other sweeps."
+            )
+        if sweep_order != "raster":
+            raise ValueError("The order of an adaptive sweep cannot be changed.")
+        if resume_guid is not None:
+            raise ValueError("An adaptive sweep cannot be resumed.")
+        sweeper = _AdaptiveSweeper(adaptive_sweeps[0], additional_setpoints)
+    else:
+        sweeper = _Sweeper(
+            cast(list[Union[AbstractSweep, TogetherSweep]], sweep_instances),
+            additional_setpoints,
+            sweep_order,
+        )
 
     measurements = _Measurements(
         sweeper,
@@ -697,13 +1330,55 @@ def dond(
     plots_axes = []
     plots_colorbar = []
     if use_threads is None:
-        use_threads = config.dataset.use_threads
-
-    params_meas_caller = (
-        ThreadPoolParamsCaller(*measurements.measured_all)
-        if use_threads
-        else SequentialParamsCaller(*measurements.measured_all)
-    )
+        use_threads = dataset_config.use_threads
+    if use_async is None:
+        use_async = dataset_config.use_async
+
+    buffered_sweep = sweeper.buffered_sweep
+    if pipeline is None:
+        pipeline = dataset_config.dond_pipeline
+    # the lines of a buffered sweep are run one at a time
+    pipeline = pipeline and buffered_sweep is None
+
+    measured = tuple(measurements.measured_all)
+    if buffered_sweep is not None:
+        measured = tuple(
+            param
+            for param in measured
+            if param not in buffered_sweep.measured_parameters
+        )
+    prefetched: tuple[ParameterBase, ...] = ()
+    if pipeline and setpoint_independent:
+        unknown = [param for param in setpoint_independent if param not in measured]
+        if unknown:
+            raise ValueError(
+                f"Setpoint independent parameters {unknown} are not measured."
+            )
+        prefetched = tuple(setpoint_independent)
+        measured = tuple(param for param in measured if param not in prefetched)
+
+    params_meas_caller: _ParamsCallerProtocol
+    if use_async:
+        params_meas_caller = AsyncParamsCaller(*measured)
+    elif use_threads:
+        params_meas_caller = InstrumentWorkersParamsCaller(*measured)
+    else:
+        params_meas_caller = SequentialParamsCaller(*measured)
+
+    n_stored = 0
+    resumed: list[tuple[str, dict[str, int]]] | None = None
+    if resume_guid is not None:
+        conns = [
+            group.measurement_cxt.experiment.conn
+            if group.measurement_cxt.experiment is not None
+            else None
+            for group in measurements.groups
+        ]
+        n_stored, resumed = _load_checkpoints(resume_guid, conns, len(sweeper))
+        for (guid, checkpoint), conn in zip(resumed, conns):
+            dataset = load_by_guid(guid, conn=conn)
+            assert isinstance(dataset, DataSet)
+            dataset._delete_results_after(checkpoint["last_result_id"])
 
     datasavers = []
     interrupted: Callable[  # noqa E731
@@ -713,46 +1388,122 @@ def dond(
         with catch_interrupts() as interrupted, ExitStack() as stack, params_meas_caller as call_params_meas:
             datasavers = [
                 stack.enter_context(
-                    group.measurement_cxt.run(in_memory_cache=in_memory_cache)
+                    group.measurement_cxt.run(
+                        in_memory_cache=in_memory_cache,
+                        resume_guid=resumed[i][0] if resumed is not None else None,
+                        profile_timing=profile_timing,
+                        store_timing_trace=store_timing_trace,
+                    )
                 )
-                for group in measurements.groups
+                for i, group in enumerate(measurements.groups)
             ]
-            additional_setpoints_data = process_params_meas(additional_setpoints)
-            for set_events in tqdm(sweeper, disable=not show_progress):
-                LOG.debug("Processing set events: %s", set_events)
-                results: dict[ParameterBase, Any] = {}
-                for set_event in set_events:
-                    if set_event.should_set:
-                        set_event.parameter(set_event.new_value)
-                        for act in set_event.actions:
-                            act()
-                        time.sleep(set_event.delay)
-
-                    if set_event.get_after_set:
-                        results[set_event.parameter] = set_event.parameter()
-                    else:
-                        results[set_event.parameter] = set_event.new_value
-
-                meas_value_pair = call_params_meas()
-                for meas_param, value in meas_value_pair:
-                    results[meas_param] = value
-
-                for datasaver, group in zip(datasavers, measurements.groups):
-                    filtered_results_list = [
-                        (param, value)
-                        for param, value in results.items()
-                        if param in group.parameters
-                    ]
-                    datasaver.add_result(
-                        *filtered_results_list,
-                        *additional_setpoints_data,
-                    )
+            additional_setpoints_data = process_params_meas(
+                additional_setpoints, use_threads=use_threads
+            )
+            profilers = [
+                datasaver.timing_profiler
+                for datasaver in datasavers
+                if datasaver.timing_profiler is not None
+            ]
+            record_timing = partial(_record_timing, profilers) if profilers else None
+            # results may be held back by the reorder buffer, so a point of
+            # the profilers ends when it is measured rather than when its
+            # results are added to the datasets
+            for profiler in profilers:
+                profiler.end_points_on_add_result = False
+            reorder_buffer = _ReorderBuffer(
+                lambda results: _add_results(
+                    datasavers,
+                    measurements.groups,
+                    results,
+                    additional_setpoints_data,
+                ),
+                start=n_stored,
+            )
+            checkpointer: _Checkpointer | None = None
+            if isinstance(sweeper, _Sweeper):
+                checkpointer = _Checkpointer(
+                    datasavers,
+                    len(sweeper),
+                    measurements.groups[0].measurement_cxt.write_period,
+                    [checkpoint for _, checkpoint in resumed]
+                    if resumed is not None
+                    else None,
+                )
 
-                if callable(break_condition):
-                    if break_condition():
-                        raise BreakConditionInterrupt("Break condition was met.")
+            def add_results(index: int, results: Mapping[ParameterBase, Any]) -> None:
+                reorder_buffer.add(sweeper.logical_index(index), results)
+                if checkpointer is not None:
+                    checkpointer.maybe_write(reorder_buffer.n_added)
+                for profiler in profilers:
+                    profiler.end_point()
+
+            points = iter(
+                tqdm(
+                    sweeper.points(n_stored),
+                    total=len(sweeper),
+                    initial=n_stored,
+                    disable=not show_progress,
+                )
+            )
+            try:
+                if buffered_sweep is not None:
+                    _run_buffered(
+                        points,
+                        buffered_sweep,
+                        call_params_meas,
+                        add_results,
+                        break_condition,
+                        record_timing,
+                    )
+                elif pipeline:
+                    executor = stack.enter_context(
+                        ThreadPoolExecutor(max_workers=2, thread_name_prefix="dond")
+                    )
+                    _run_pipelined(
+                        points,
+                        sweeper.tell,
+                        executor,
+                        call_params_meas,
+                        prefetched,
+                        add_results,
+                        break_condition,
+                        record_timing,
+                    )
+                else:
+                    for index, set_events in points:
+                        results = _set_point(set_events, record_timing)
+
+                        get_start = time.perf_counter()
+                        meas_value_pair = call_params_meas()
+                        if record_timing is not None:
+                            record_timing("get", time.perf_counter() - get_start)
+                        for meas_param, value in meas_value_pair:
+                            results[meas_param] = value
+                        sweeper.tell(results)
+
+                        add_results(index, results)
+
+                        if callable(break_condition):
+                            if break_condition():
+                                raise BreakConditionInterrupt(
+                                    "Break condition was met."
+                                )
+            finally:
+                # points that are held back are flushed after the last
+                # checkpoint, such that they are measured again on resuming
+                if checkpointer is not None:
+                    try:
+                        checkpointer.write(reorder_buffer.n_added)
+                    except Exception:
+                        LOG.exception("Could not write the checkpoint of the dond")
+                reorder_buffer.flush()
     finally:
         for datasaver in datasavers:
+            if isinstance(sweeper, _Sweeper) and not sweeper.is_raster:
+                datasaver.dataset.add_metadata(
+                    "dond_sweep_order", json.dumps(sweeper.traversal)
+                )
             ds, plot_axis, plot_color = _handle_plotting(
                 datasaver.dataset, do_plot, interrupted()
             )
@@ -766,6 +1517,183 @@ def dond(
         return tuple(datasets), tuple(plots_axes), tuple(plots_colorbar)
 
 
+def _set_point(
+    set_events: tuple[ParameterSetEvent, ...],
+    record_timing: Callable[[str, float], None] | None = None,
+) -> dict[ParameterBase, Any]:
+    """
+    Set the sweep parameters of a point that need to be set, wait for their
+    delays, and return the setpoints of the point.
+    """
+    LOG.debug("Processing set events: %s", set_events)
+    results: dict[ParameterBase, Any] = {}
+    for set_event in set_events:
+        if set_event.should_set:
+            if record_timing is None:
+                set_event.parameter(set_event.new_value)
+                for act in set_event.actions:
+                    act()
+                time.sleep(set_event.delay)
+            else:
+                set_start = time.perf_counter()
+                set_event.parameter(set_event.new_value)
+                for act in set_event.actions:
+                    act()
+                delay_start = time.perf_counter()
+                time.sleep(set_event.delay)
+                record_timing("set", delay_start - set_start)
+                record_timing("delay", time.perf_counter() - delay_start)
+
+        if set_event.get_after_set:
+            results[set_event.parameter] = set_event.parameter()
+        else:
+            results[set_event.parameter] = set_event.new_value
+    return results
+
+
+def _record_timing(
+    profilers: Sequence[PointTimingProfiler], stage: str, duration: float
+) -> None:
+    for profiler in profilers:
+        profiler.record(stage, duration)
+
+
+def _add_results(
+    datasavers: Sequence[DataSaver],
+    groups: Sequence[_SweepMeasGroup],
+    results: Mapping[ParameterBase, Any],
+    additional_setpoints_data: Sequence[tuple[ParameterBase, Any]],
+) -> None:
+    for datasaver, group in zip(datasavers, groups):
+        filtered_results_list = [
+            (param, value)
+            for param, value in results.items()
+            if param in group.parameters
+        ]
+        datasaver.add_result(
+            *filtered_results_list,
+            *additional_setpoints_data,
+        )
+
+
+def _run_buffered(
+    points: Iterator[tuple[int, tuple[ParameterSetEvent, ...]]],
+    buffered_sweep: BufferedSweep,
+    call_params_meas: Callable[[], list[tuple[ParameterBase, Any]]],
+    add_results: Callable[[int, Mapping[ParameterBase, Any]], None],
+    break_condition: BreakConditionT | None,
+    record_timing: Callable[[str, float], None] | None = None,
+) -> None:
+    """
+    Run the points of a dond whose last sweep is a buffered sweep. The
+    buffered sweep is triggered once for each point of the other sweeps, and
+    the whole line is added to the datasets at once. The other measured
+    parameters are measured once per line.
+    """
+    buffered_sweep.arm()
+    setpoints = np.asarray(buffered_sweep.get_setpoints())
+    for index, set_events in points:
+        results = _set_point(set_events, record_timing)
+        get_start = time.perf_counter()
+        line = buffered_sweep.trigger()
+        for meas_param, value in call_params_meas():
+            results[meas_param] = value
+        if record_timing is not None:
+            record_timing("get", time.perf_counter() - get_start)
+
+        # store the values of the other parameters for every point of the line
+        line_results: dict[ParameterBase, Any] = {
+            param: np.full(setpoints.shape, value) if np.ndim(value) == 0 else value
+            for param, value in results.items()
+        }
+        line_results[buffered_sweep.param] = setpoints
+        line_results.update(line)
+        add_results(index, line_results)
+
+        if callable(break_condition):
+            if break_condition():
+                raise BreakConditionInterrupt("Break condition was met.")
+
+
+def _run_pipelined(
+    points: Iterator[tuple[int, tuple[ParameterSetEvent, ...]]],
+    tell: Callable[[Mapping[ParameterBase, Any]], None],
+    executor: ThreadPoolExecutor,
+    call_params_meas: Callable[[], list[tuple[ParameterBase, Any]]],
+    prefetched: Sequence[ParameterBase],
+    add_results: Callable[[int, Mapping[ParameterBase, Any]], None],
+    break_condition: BreakConditionT | None,
+    record_timing: Callable[[str, float], None] | None = None,
+) -> None:
+    """
+    Run the points of a dond such that the sweep parameters of the next
+    point are set on the executor while the results of the current point
+    are added to the datasets. The setpoint independent parameters of a
+    point are got on the executor while its setpoints are set. The stages
+    run on the executor are timed there and recorded with ``record_timing``
+    on the calling thread once their point is measured, such that they are
+    recorded on the point they belong to.
+    """
+
+    def set_point(
+        set_events: tuple[ParameterSetEvent, ...],
+    ) -> tuple[dict[ParameterBase, Any], list[tuple[str, float]]]:
+        stage_timings: list[tuple[str, float]] = []
+        if record_timing is None:
+            return _set_point(set_events), stage_timings
+        results = _set_point(
+            set_events, lambda stage, duration: stage_timings.append((stage, duration))
+        )
+        return results, stage_timings
+
+    def prefetch() -> tuple[list[tuple[ParameterBase, Any]], float]:
+        start = time.perf_counter()
+        values = process_params_meas(prefetched, use_threads=False)
+        return values, time.perf_counter() - start
+
+    def submit(
+        point: tuple[int, tuple[ParameterSetEvent, ...]] | None,
+    ) -> tuple[
+        int,
+        Future[tuple[dict[ParameterBase, Any], list[tuple[str, float]]]] | None,
+        Future[tuple[list[tuple[ParameterBase, Any]], float]] | None,
+    ]:
+        if point is None:
+            return -1, None, None
+        index, set_events = point
+        pending_set = executor.submit(set_point, set_events)
+        pending_prefetch = executor.submit(prefetch) if prefetched else None
+        return index, pending_set, pending_prefetch
+
+    index, pending_set, pending_prefetch = submit(next(points, None))
+    while pending_set is not None:
+        results, stage_timings = pending_set.result()
+        if pending_prefetch is not None:
+            prefetched_values, prefetch_time = pending_prefetch.result()
+            results.update(prefetched_values)
+            stage_timings.append(("get", prefetch_time))
+
+        get_start = time.perf_counter()
+        for meas_param, value in call_params_meas():
+            results[meas_param] = value
+        if record_timing is not None:
+            stage_timings.append(("get", time.perf_counter() - get_start))
+            for stage, duration in stage_timings:
+                record_timing(stage, duration)
+        tell(results)
+        break_condition_met = callable(break_condition) and break_condition()
+
+        # set the next point while the results of this one are saved
+        next_index, pending_set, pending_prefetch = submit(
+            None if break_condition_met else next(points, None)
+        )
+        add_results(index, results)
+        index = next_index
+
+        if break_condition_met:
+            raise BreakConditionInterrupt("Break condition was met.")
+
+
 def _validate_dataset_dependencies_and_names(
     dataset_dependencies: Mapping[str, Sequence[ParamMeasT]] | None,
     measurement_name: str | Sequence[str],
@@ -785,20 +1713,23 @@ def _validate_dataset_dependencies_and_names(
 
 
 def _parse_dond_arguments(
-    *params: AbstractSweep | TogetherSweep | ParamMeasT | Sequence[ParamMeasT],
+    *params: AbstractSweep
+    | TogetherSweep
+    | AdaptiveSweep
+    | ParamMeasT
+    | Sequence[ParamMeasT],
 ) -> tuple[
-    list[AbstractSweep | TogetherSweep], list[ParamMeasT | Sequence[ParamMeasT]]
+    list[AbstractSweep | TogetherSweep | AdaptiveSweep],
+    list[ParamMeasT | Sequence[ParamMeasT]],
 ]:
     """
     Parse supplied arguments into sweep objects and measurement parameters
     and their callables.
     """
-    sweep_instances: list[AbstractSweep | TogetherSweep] = []
+    sweep_instances: list[AbstractSweep | TogetherSweep | AdaptiveSweep] = []
     params_meas: list[ParamMeasT | Sequence[ParamMeasT]] = []
     for par in params:
-        if isinstance(par, AbstractSweep):
-            sweep_instances.append(par)
-        elif isinstance(par, TogetherSweep):
+        if isinstance(par, (AbstractSweep, TogetherSweep, AdaptiveSweep)):
             sweep_instances.append(par)
         else:
             params_meas.append(par)
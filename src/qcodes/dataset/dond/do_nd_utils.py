@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Callable, Optional, Union
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Union
 
 if TYPE_CHECKING:
     import matplotlib.axes
@@ -22,6 +22,7 @@ log = logging.getLogger(__name__)
 
 ActionsT = Sequence[Callable[[], None]]
 BreakConditionT = Callable[[], bool]
+SweepOrderT = Literal["raster", "serpentine", "min_ramp"]
 
 ParamMeasT = Union[ParameterBase, Callable[[], None]]
 
@@ -7,7 +7,7 @@ import numpy as np
 import numpy.typing as npt
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Sequence
+    from collections.abc import Iterable, Mapping, Sequence
 
     from qcodes.dataset.dond.do_nd_utils import ActionsT
     from qcodes.parameters import ParameterBase
@@ -244,6 +244,53 @@ class ArraySweep(AbstractSweep, Generic[T]):
         return self._get_after_set
 
 
+class BufferedSweep(AbstractSweep[np.float64]):
+    """
+    Abstract class of sweeps that an instrument runs by itself from a buffer
+    of setpoints, such as a sweep run by a script on the instrument or a
+    triggered acquisition into a sample buffer.
+
+    A buffered sweep must be the last (fastest) sweep of a :func:`.dond`.
+    The instrument is armed once with the setpoints of the sweep before the
+    measurement starts. For each point of the other sweeps, the sweep is
+    then triggered once, and the returned arrays are added to the dataset
+    in a single call. The other measured parameters are measured once per
+    trigger and stored for every point of the line.
+    """
+
+    @property
+    @abstractmethod
+    def measured_parameters(self) -> tuple[ParameterBase, ...]:
+        """
+        The parameters whose values are returned by :meth:`trigger`.
+        """
+        pass
+
+    @property
+    def post_actions(self) -> ActionsT:
+        """
+        The instrument sets the points of the sweep by itself, so no actions
+        can be performed after setting each point.
+        """
+        return ()
+
+    @abstractmethod
+    def arm(self) -> None:
+        """
+        Prepare the instrument to run the sweep over the setpoints returned
+        by :meth:`get_setpoints`.
+        """
+        pass
+
+    @abstractmethod
+    def trigger(self) -> Mapping[ParameterBase, np.ndarray]:
+        """
+        Run the sweep once and return the value of each measured parameter
+        at each setpoint of the sweep.
+        """
+        pass
+
+
 class TogetherSweep:
     """
     A combination of Multiple sweeps that are to be performed in parallel
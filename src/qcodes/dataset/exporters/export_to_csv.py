@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import logging
 import os
 from typing import TYPE_CHECKING
 
+from .export_to_pandas import _data_to_dataframe, _generate_pandas_index
+
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterator, Mapping
     from pathlib import Path
 
+    import numpy as np
     import pandas as pd
 
+    from qcodes.dataset.data_set_protocol import DataSetProtocol
+
+_LOG = logging.getLogger(__name__)
+
 
 class DataLengthException(Exception):
     pass
@@ -23,6 +31,7 @@ def dataframe_to_csv(
     path: str | Path,
     single_file: bool = False,
     single_file_name: str | None = None,
+    float_format: str | None = None,
 ) -> None:
     import pandas as pd
 
@@ -30,7 +39,9 @@ def dataframe_to_csv(
     for parametername, df in dfdict.items():
         if not single_file:
             dst = os.path.join(path, f"{parametername}.dat")
-            df.to_csv(path_or_buf=dst, header=False, sep="\t")
+            df.to_csv(
+                path_or_buf=dst, header=False, sep="\t", float_format=float_format
+            )
         else:
             dfs_to_save.append(df)
     if single_file:
@@ -50,4 +61,125 @@ def dataframe_to_csv(
                 single_file_name = f"{single_file_name}.dat"
             dst = os.path.join(path, single_file_name)
             df_to_save = pd.concat(dfs_to_save, axis=1)
-            df_to_save.to_csv(path_or_buf=dst, header=False, sep="\t")
+            df_to_save.to_csv(
+                path_or_buf=dst, header=False, sep="\t", float_format=float_format
+            )
+
+
+def dataset_to_csv_streaming(
+    dataset: DataSetProtocol,
+    path: str | Path,
+    single_file_name: str,
+    *,
+    chunk_size: int = 100_000,
+    float_format: str | None = None,
+) -> None:
+    """
+    Export all top level parameters of a dataset to a single csv file
+    reading and writing at most ``chunk_size`` results of each parameter
+    at a time. This keeps the memory footprint of the export constant
+    rather than building a DataFrame of the full dataset.
+
+    The written file is identical to the file written by
+    :func:`dataframe_to_csv` with ``single_file=True``. If the parameters
+    turn out not to share setpoints the function falls back to
+    :func:`dataframe_to_csv` which requires loading the full dataset.
+
+    Args:
+        dataset: Dataset to export.
+        path: Directory to write the file to.
+        single_file_name: Name of the file. If no extension is passed
+            (.dat, .csv or .txt), .dat is automatically appended.
+        chunk_size: Maximum number of results of each parameter to read
+            from the dataset at a time.
+        float_format: Optional format string for floating point numbers
+            e.g. ``"%.6g"``.
+
+    Raises:
+        DataLengthException: If the data of the parameters does not have
+            the same length.
+    """
+    import pandas as pd
+
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+
+    if not single_file_name.lower().endswith((".dat", ".csv", ".txt")):
+        single_file_name = f"{single_file_name}.dat"
+    dst = os.path.join(path, single_file_name)
+
+    tree_chunks = dataset._get_parameter_data_chunks(chunk_size)
+    readers = [_DataFrameChunkReader(chunks) for chunks in tree_chunks.values()]
+
+    streamed = len(readers) > 0
+    with open(dst, "w", encoding="utf-8", newline="") as file:
+        while streamed:
+            for reader in readers:
+                reader.fill()
+            n_rows = min(len(reader) for reader in readers)
+            if n_rows == 0:
+                # either all parameters are exhausted or their
+                # lengths differ which is handled by the fallback.
+                streamed = all(reader.exhausted for reader in readers)
+                break
+            dfs = [reader.take(n_rows) for reader in readers]
+            if not all(df.index.equals(dfs[0].index) for df in dfs[1:]):
+                streamed = False
+                break
+            pd.concat(dfs, axis=1).to_csv(
+                path_or_buf=file, header=False, sep="\t", float_format=float_format
+            )
+
+    if not streamed:
+        _LOG.info(
+            "Parameters of dataset do not share setpoints. "
+            "Falling back to exporting via a full DataFrame.",
+            extra={"file_name": dst, "qcodes_guid": dataset.guid},
+        )
+        dataframe_to_csv(
+            dfdict=dataset.to_pandas_dataframe_dict(),
+            path=path,
+            single_file=True,
+            single_file_name=single_file_name,
+            float_format=float_format,
+        )
+
+
+class _DataFrameChunkReader:
+    """
+    Convert chunks of the data of one parameter tree into DataFrames
+    and hand them out in chunks of a requested number of rows.
+    """
+
+    def __init__(self, chunks: Iterator[Mapping[str, np.ndarray]]):
+        self._chunks = chunks
+        self._pending: pd.DataFrame | None = None
+        self._n_rows_read = 0
+        self.exhausted = False
+
+    def __len__(self) -> int:
+        return 0 if self._pending is None else len(self._pending)
+
+    def fill(self) -> None:
+        import pandas as pd
+
+        while len(self) == 0 and not self.exhausted:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.exhausted = True
+                return
+            index = _generate_pandas_index(chunk)
+            df = _data_to_dataframe(chunk, index)
+            if index is None:
+                # continue the counter used as index across chunks
+                df.index = pd.RangeIndex(
+                    self._n_rows_read, self._n_rows_read + len(df)
+                )
+            self._n_rows_read += len(df)
+            self._pending = df
+
+    def take(self, n_rows: int) -> pd.DataFrame:
+        assert self._pending is not None
+        df = self._pending.iloc[:n_rows]
+        self._pending = self._pending.iloc[n_rows:]
+        return df
@@ -0,0 +1,279 @@
+"""
+Direct export of gridded datasets to netcdf (hdf5) files.
+
+The exporter in this module writes the arrays held by the dataset cache
+straight into chunked and compressed hdf5 datasets without going through
+pandas and xarray. This avoids building a pandas MultiIndex and an xarray
+Dataset of the full data, which for large gridded runs multiplies the peak
+memory usage of the export. The written file uses the same layout,
+coordinates and attributes as the xarray based netcdf exporter such that it
+can be read back using ``load_from_netcdf``.
+
+Only datasets with known shapes whose setpoints form a regular grid can be
+exported this way. Other datasets are exported using the xarray based
+exporter.
+"""
+from __future__ import annotations
+
+import logging
+import warnings
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from .export_to_xarray import (
+    _metadata_attrs,
+    _paramspec_dict_with_extras,
+    xarray_to_h5netcdf_with_complex_numbers,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    import h5netcdf  # type: ignore[import-untyped]
+
+    from qcodes.dataset.data_set_protocol import DataSetProtocol, ParameterData
+
+_LOG = logging.getLogger(__name__)
+
+
+def dataset_to_h5netcdf_direct(
+    dataset: DataSetProtocol,
+    file_path: str | Path,
+    *,
+    chunks: bool | tuple[int, ...] | None = True,
+    compression: Literal["gzip", "lzf"] | None = "gzip",
+    compression_opts: int | None = 4,
+    shuffle: bool = True,
+) -> None:
+    """
+    Export a dataset to a netcdf file by writing the arrays of the dataset
+    cache directly into hdf5 datasets.
+
+    The dimensions of the written variables are taken from the shapes stored
+    in the run description of the dataset. If the dataset does not have
+    shapes or its setpoints do not form a regular grid, the dataset is
+    exported using the regular xarray based exporter instead.
+
+    Args:
+        dataset: The dataset to export.
+        file_path: Path of the file to write.
+        chunks: Chunk shape used for the variables. True lets h5py
+            guess a suitable chunk shape, None disables chunking unless
+            it is required by the filters.
+        compression: Compression filter to apply to the variables.
+        compression_opts: Options for the compression filter. For gzip
+            this is the compression level from 0 to 9.
+        shuffle: Apply the hdf5 byte shuffle filter before compression.
+    """
+    exported = _try_dataset_to_h5netcdf_direct(
+        dataset,
+        file_path,
+        chunks=chunks,
+        compression=compression,
+        compression_opts=compression_opts,
+        shuffle=shuffle,
+    )
+    if not exported:
+        _LOG.info(
+            "Dataset is not on a regular grid with known shapes. "
+            "Falling back to export via xarray.",
+            extra={"file_name": str(file_path), "qcodes_guid": dataset.guid},
+        )
+        xarray_to_h5netcdf_with_complex_numbers(
+            dataset.to_xarray_dataset(), file_path
+        )
+
+
+def _try_dataset_to_h5netcdf_direct(
+    dataset: DataSetProtocol,
+    file_path: str | Path,
+    *,
+    chunks: bool | tuple[int, ...] | None = True,
+    compression: Literal["gzip", "lzf"] | None = "gzip",
+    compression_opts: int | None = 4,
+    shuffle: bool = True,
+) -> bool:
+    """
+    Export the dataset as in :func:`dataset_to_h5netcdf_direct` if it is on
+    a regular grid with known shapes. The shapes are checked before the data
+    is loaded such that datasets without shapes are not read at all.
+
+    Returns:
+        Whether the file was written. If not, the caller should export the
+        dataset in another way.
+    """
+    if not _has_shapes_of_all_parameters(dataset):
+        return False
+    grid = _grid_from_shaped_data(dataset, dataset.cache.data())
+    if grid is None:
+        return False
+
+    coords, data_vars = grid
+    filter_kwargs = {
+        "chunks": chunks,
+        "compression": compression,
+        "compression_opts": compression_opts if compression == "gzip" else None,
+        "shuffle": shuffle,
+    }
+    allow_invalid_netcdf = any(
+        array.dtype.kind == "c"
+        for array in (*coords.values(), *(var[0] for var in data_vars.values()))
+    )
+
+    import h5netcdf  # type: ignore[import-untyped]
+
+    _LOG.info(
+        "Writing netcdf file directly from dataset cache.",
+        extra={"file_name": str(file_path), "qcodes_guid": dataset.guid},
+    )
+    with warnings.catch_warnings():
+        if allow_invalid_netcdf:
+            warnings.filterwarnings(
+                "ignore",
+                module="h5netcdf",
+                message="You are writing invalid netcdf features",
+                category=UserWarning,
+            )
+        with h5netcdf.File(
+            file_path, mode="w", invalid_netcdf=allow_invalid_netcdf
+        ) as h5nc_file:
+            h5nc_file.dimensions = {name: len(coord) for name, coord in coords.items()}
+            for name, coord in coords.items():
+                _write_variable(
+                    h5nc_file,
+                    name,
+                    (name,),
+                    coord,
+                    _paramspec_dict_with_extras(dataset, name),
+                    filter_kwargs=None,
+                )
+            for name, (array, dims) in data_vars.items():
+                _write_variable(
+                    h5nc_file,
+                    name,
+                    dims,
+                    array,
+                    _paramspec_dict_with_extras(dataset, name),
+                    filter_kwargs=filter_kwargs,
+                )
+            h5nc_file.attrs.update(_metadata_attrs(dataset))
+    return True
+
+
+def _write_variable(
+    h5nc_file: h5netcdf.File,
+    name: str,
+    dims: tuple[str, ...],
+    array: np.ndarray,
+    attrs: Mapping[str, object],
+    filter_kwargs: Mapping[str, object] | None,
+) -> None:
+    fillvalue = np.nan if array.dtype.kind == "f" else None
+    kwargs = dict(filter_kwargs) if filter_kwargs is not None and array.ndim else {}
+    if array.dtype.kind not in "fiuc":
+        # filters are only supported for numeric data
+        kwargs = {}
+    variable = h5nc_file.create_variable(
+        name, dims, dtype=array.dtype, fillvalue=fillvalue, **kwargs
+    )
+    variable[...] = array
+    variable.attrs.update(_netcdf_attrs(attrs))
+
+
+def _netcdf_attrs(attrs: Mapping[str, object]) -> dict[str, object]:
+    # match the way xarray stores sequence attributes. Sequences of strings
+    # are stored as arrays of strings and empty sequences as empty float arrays
+    netcdf_attrs: dict[str, object] = {}
+    for key, value in attrs.items():
+        if isinstance(value, (list, tuple)):
+            value = np.array(value, dtype=object if len(value) else np.float64)
+        netcdf_attrs[key] = value
+    return netcdf_attrs
+
+
+def _has_shapes_of_all_parameters(dataset: DataSetProtocol) -> bool:
+    shapes = dataset.description.shapes
+    if shapes is None:
+        return False
+    interdeps = dataset.description.interdeps
+    top_level = (*interdeps.dependencies, *interdeps.standalones)
+    return len(top_level) > 0 and all(ps.name in shapes for ps in top_level)
+
+
+def _grid_from_shaped_data(
+    dataset: DataSetProtocol, data: ParameterData
+) -> tuple[dict[str, np.ndarray], dict[str, tuple[np.ndarray, tuple[str, ...]]]] | None:
+    """
+    Split the shaped cache data into one dimensional coordinates and
+    n-dimensional data variables. Coordinates are sorted in increasing order
+    to match the coordinates generated by the xarray exporter.
+
+    Returns None if the data is not shaped or not on a regular grid.
+    """
+    shapes = dataset.description.shapes
+    if shapes is None or len(data) == 0:
+        return None
+
+    coords: dict[str, np.ndarray] = {}
+    data_vars: dict[str, tuple[np.ndarray, tuple[str, ...]]] = {}
+
+    for name, subdict in data.items():
+        shape = shapes.get(name)
+        if shape is None:
+            return None
+        dep_array = subdict[name]
+        setpoint_names = [key for key in subdict if key != name]
+        if dep_array.shape != tuple(shape) or len(setpoint_names) != len(shape):
+            return None
+
+        dims: list[str] = []
+        orders: list[np.ndarray | None] = []
+        for axis, setpoint_name in enumerate(setpoint_names):
+            setpoints = subdict[setpoint_name]
+            if setpoints.shape != dep_array.shape:
+                return None
+            if setpoints.dtype.kind == "f" and np.isnan(setpoints).any():
+                # incomplete dataset
+                return None
+            axis_values = _axis_values(setpoints, axis)
+            if axis_values is None:
+                return None
+            order: np.ndarray | None = None
+            if len(axis_values) > 1 and not np.all(axis_values[1:] > axis_values[:-1]):
+                order = np.argsort(axis_values, kind="stable")
+                axis_values = axis_values[order]
+                if np.any(axis_values[1:] == axis_values[:-1]):
+                    # non unique coordinates cannot be exported to a grid
+                    return None
+            existing_coord = coords.get(setpoint_name)
+            if existing_coord is None:
+                coords[setpoint_name] = axis_values
+            elif not np.array_equal(existing_coord, axis_values):
+                return None
+            dims.append(setpoint_name)
+            orders.append(order)
+
+        for axis, order in enumerate(orders):
+            if order is not None:
+                dep_array = np.take(dep_array, order, axis=axis)
+        data_vars[name] = (dep_array, tuple(dims))
+
+    if set(coords) & set(data_vars):
+        return None
+
+    return coords, data_vars
+
+
+def _axis_values(setpoints: np.ndarray, axis: int) -> np.ndarray | None:
+    """
+    Return the values of setpoints along the given axis if the setpoints
+    only vary along that axis, otherwise return None.
+    """
+    index = tuple(slice(None) if i == axis else 0 for i in range(setpoints.ndim))
+    axis_values = setpoints[index]
+    expand = tuple(slice(None) if i == axis else np.newaxis for i in range(setpoints.ndim))
+    if not np.all(setpoints == axis_values[expand]):
+        return None
+    return np.ascontiguousarray(axis_values)
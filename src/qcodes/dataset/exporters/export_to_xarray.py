@@ -151,30 +151,38 @@ def load_to_xarray_dataarray_dict(
 def _add_metadata_to_xarray(
     dataset: DataSetProtocol, xrdataset: xr.Dataset | xr.DataArray
 ) -> None:
-    xrdataset.attrs.update(
-        {
-            "ds_name": dataset.name,
-            "sample_name": dataset.sample_name,
-            "exp_name": dataset.exp_name,
-            "snapshot": dataset._snapshot_raw or "null",
-            "guid": dataset.guid,
-            "run_timestamp": dataset.run_timestamp() or "",
-            "completed_timestamp": dataset.completed_timestamp() or "",
-            "captured_run_id": dataset.captured_run_id,
-            "captured_counter": dataset.captured_counter,
-            "run_id": dataset.run_id,
-            "run_description": serial.to_json_for_storage(dataset.description),
-            "parent_dataset_links": links_to_str(dataset.parent_dataset_links),
-        }
-    )
+    xrdataset.attrs.update(_metadata_attrs(dataset))
+
+
+def _metadata_attrs(dataset: DataSetProtocol) -> dict[str, object]:
+    from qcodes.dataset.decimation import DECIMATION_PYRAMID_METADATA_TAG
+
+    attrs: dict[str, object] = {
+        "ds_name": dataset.name,
+        "sample_name": dataset.sample_name,
+        "exp_name": dataset.exp_name,
+        "snapshot": dataset._snapshot_raw or "null",
+        "guid": dataset.guid,
+        "run_timestamp": dataset.run_timestamp() or "",
+        "completed_timestamp": dataset.completed_timestamp() or "",
+        "captured_run_id": dataset.captured_run_id,
+        "captured_counter": dataset.captured_counter,
+        "run_id": dataset.run_id,
+        "run_description": serial.to_json_for_storage(dataset.description),
+        "parent_dataset_links": links_to_str(dataset.parent_dataset_links),
+    }
     if dataset.run_timestamp_raw is not None:
-        xrdataset.attrs["run_timestamp_raw"] = dataset.run_timestamp_raw
+        attrs["run_timestamp_raw"] = dataset.run_timestamp_raw
     if dataset.completed_timestamp_raw is not None:
-        xrdataset.attrs[
-            "completed_timestamp_raw"] = dataset.completed_timestamp_raw
+        attrs["completed_timestamp_raw"] = dataset.completed_timestamp_raw
     if len(dataset.metadata) > 0:
         for metadata_tag, metadata in dataset.metadata.items():
-            xrdataset.attrs[metadata_tag] = metadata
+            # the decimation pyramid is stored in the database of the run and
+            # is not exported along with the data
+            if metadata_tag == DECIMATION_PYRAMID_METADATA_TAG:
+                continue
+            attrs[metadata_tag] = metadata
+    return attrs
 
 
 def load_to_xarray_dataset(
@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
 
+from qcodes import config
 from qcodes.dataset.dond.do_nd import _Sweeper
 from qcodes.dataset.dond.do_nd_utils import ParamMeasT, catch_interrupts
 from qcodes.dataset.dond.sweeps import AbstractSweep, LinSweep, TogetherSweep
@@ -174,9 +175,13 @@ def dond_into(
     with TRACER.start_as_current_span("qcodes.dataset.dond_into", context=context):
         sweep_instances, params_meas = parse_dond_into_args(*params)
         sweeper = _Sweeper(sweep_instances, additional_setpoints)
+        # read the config once rather than for every point
+        use_threads = config.dataset.use_threads
         for set_events in sweeper:
             results: dict[ParameterBase, Any] = {}
-            additional_setpoints_data = process_params_meas(additional_setpoints)
+            additional_setpoints_data = process_params_meas(
+                additional_setpoints, use_threads=use_threads
+            )
             for set_event in set_events:
                 if set_event.should_set:
                     set_event.parameter(set_event.new_value)
@@ -189,7 +194,9 @@ def dond_into(
                 else:
                     results[set_event.parameter] = set_event.new_value
 
-            meas_value_pair = process_params_meas(params_meas)
+            meas_value_pair = process_params_meas(
+                params_meas, use_threads=use_threads
+            )
             for meas_param, value in meas_value_pair:
                 results[meas_param] = value
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import collections
 import io
+import json
 import logging
 import traceback as tb_module
 import warnings
@@ -32,6 +33,7 @@ from qcodes.dataset.data_set_protocol import (
     setpoints_type,
     values_type,
 )
+from qcodes.dataset.decimation import build_decimation_pyramid
 from qcodes.dataset.descriptions.dependencies import (
     DependencyError,
     InferenceError,
@@ -39,6 +41,7 @@ from qcodes.dataset.descriptions.dependencies import (
 )
 from qcodes.dataset.descriptions.param_spec import ParamSpec, ParamSpecBase
 from qcodes.dataset.export_config import get_data_export_automatic
+from qcodes.dataset.timing_profiler import TIMING_PROFILE_KEY, PointTimingProfiler
 from qcodes.parameters import (
     ArrayParameter,
     GroupedParameter,
@@ -86,9 +89,11 @@ class DataSaver:
         write_period: float,
         interdeps: InterDependencies_,
         span: trace.Span | None = None,
+        timing_profiler: PointTimingProfiler | None = None,
     ) -> None:
         self._span = span
         self._dataset = dataset
+        self._timing_profiler = timing_profiler
         if (
             DataSaver.default_callback is not None
             and "run_tables_subscription_callback" in DataSaver.default_callback
@@ -156,6 +161,9 @@ class DataSaver:
                 its type.
         """
 
+        profiler = self._timing_profiler
+        start = perf_counter() if profiler is not None else 0.0
+
         # we iterate through the input twice. First we find any array and
         # multiparameters that need to be unbundled and collect the names
         # of all parameters. This also allows users to call
@@ -221,9 +229,16 @@ class DataSaver:
 
         self.dataset._enqueue_results(results_dict)
 
+        if profiler is not None:
+            flush_start = perf_counter()
+            profiler.record("add_result", flush_start - start)
         if perf_counter() - self._last_save_time > self.write_period:
             self.flush_data_to_database()
             self._last_save_time = perf_counter()
+            if profiler is not None:
+                profiler.record("flush", self._last_save_time - flush_start)
+        if profiler is not None and profiler.end_points_on_add_result:
+            profiler.end_point()
 
     def _conditionally_expand_parameter_with_setpoints(
         self,
@@ -513,6 +528,14 @@ class DataSaver:
     def points_written(self) -> int:
         return self._dataset.number_of_results
 
+    @property
+    def timing_profiler(self) -> PointTimingProfiler | None:
+        """
+        The profiler of the time spent in each stage of the points of the
+        run, if the run was started with ``profile_timing=True``.
+        """
+        return self._timing_profiler
+
     @property
     def dataset(self) -> DataSetProtocol:
         return self._dataset
@@ -547,6 +570,9 @@ class Runner:
         in_memory_cache: bool | None = None,
         dataset_class: DataSetType = DataSetType.DataSet,
         parent_span: trace.Span | None = None,
+        resume_guid: str | None = None,
+        profile_timing: bool = False,
+        store_timing_trace: bool = False,
     ) -> None:
         if in_memory_cache is None:
             in_memory_cache = qc.config.dataset.in_memory_cache
@@ -574,6 +600,9 @@ class Runner:
         self._write_in_background = write_in_background
         self._in_memory_cache = in_memory_cache
         self._parent_span = parent_span
+        self._resume_guid = resume_guid
+        self._timing_profiler = PointTimingProfiler() if profile_timing else None
+        self._store_timing_trace = store_timing_trace
         self.ds: DataSetProtocol
 
     @staticmethod
@@ -631,7 +660,9 @@ class Runner:
             path_to_db = None
             conn = None
 
-        if self._dataset_class is DataSetType.DataSet:
+        if self._resume_guid is not None:
+            self.ds = self._resume_dataset(self._resume_guid, conn)
+        elif self._dataset_class is DataSetType.DataSet:
             self.ds = DataSet(
                 name=self.name,
                 exp_id=exp_id,
@@ -652,24 +683,37 @@ class Runner:
         else:
             raise RuntimeError("Does not support any other dataset classes")
 
-        # .. and give the dataset a snapshot as metadata
-        if self.station is None:
-            station = Station.default
-        else:
-            station = self.station
+        if self._resume_guid is None:
+            # .. and give the dataset a snapshot as metadata
+            if self.station is None:
+                station = Station.default
+            else:
+                station = self.station
 
-        if station is not None:
-            snapshot = station.snapshot()
-        else:
-            snapshot = {}
+            if station is not None:
+                snapshot = station.snapshot()
+            else:
+                snapshot = {}
+
+            self.ds.prepare(
+                snapshot=snapshot,
+                interdeps=self._interdependencies,
+                write_in_background=self._write_in_background,
+                shapes=self._shapes,
+                parent_datasets=self._parent_datasets,
+            )
 
-        self.ds.prepare(
-            snapshot=snapshot,
-            interdeps=self._interdependencies,
-            write_in_background=self._write_in_background,
-            shapes=self._shapes,
-            parent_datasets=self._parent_datasets,
-        )
+        # remember the communication statistics of the instruments that
+        # record them, so that those of this run can be added as metadata.
+        # The instrument module is imported here to keep importing the
+        # dataset independent of the instruments.
+        from qcodes.instrument import Instrument
+
+        self._io_stats_at_start = {
+            instrument: instrument._io_stats.totals()
+            for instrument in list(Instrument._all_instruments.values())
+            if instrument._io_stats is not None
+        }
 
         # register all subscribers
         if isinstance(self.ds, DataSet):
@@ -691,12 +735,13 @@ class Runner:
                 "dataset_class": self._dataset_class.name,
             }
         )
+        action = "Starting" if self._resume_guid is None else "Resuming"
         print(
-            f"Starting experimental run with id: {self.ds.captured_run_id}."
+            f"{action} experimental run with id: {self.ds.captured_run_id}."
             f" {self._extra_log_info}"
         )
         log.info(
-            f"Starting measurement with guid: {self.ds.guid}, "
+            f"{action} measurement with guid: {self.ds.guid}, "
             f'sample_name: "{self.ds.sample_name}", '
             f'exp_name: "{self.ds.exp_name}", '
             f'ds_name: "{self.ds.name}". '
@@ -709,6 +754,7 @@ class Runner:
             write_period=self.write_period,
             interdeps=self._interdependencies,
             span=self._span,
+            timing_profiler=self._timing_profiler,
         )
 
         return self.datasaver
@@ -720,12 +766,17 @@ class Runner:
         traceback: TracebackType | None,
     ) -> None:
         with DelayedKeyboardInterrupt():
+            flush_start = perf_counter()
             self.datasaver.flush_data_to_database(block=True)
+            writer_drain = perf_counter() - flush_start
 
             # perform the "teardown" events
             for func, args in self.exitactions:
                 func(*args)
 
+            self._add_io_stats_metadata()
+            self._add_timing_profile_metadata(writer_drain)
+
             if exception_type:
                 # if an exception happened during the measurement,
                 # log the exception
@@ -750,6 +801,8 @@ class Runner:
             # Note that the completion of a dataset entails waiting for the
             # write thread to terminate (iff the write thread has been started)
             self.ds.mark_completed()
+            if qc.config.dataset.decimation_pyramid_on_completion:
+                build_decimation_pyramid(self.ds)
             if get_data_export_automatic():
                 self.datasaver.export_data()
             log.info(
@@ -760,6 +813,47 @@ class Runner:
                 self.ds.unsubscribe_all()
             self._exit_stack.close()
 
+    def _resume_dataset(self, guid: str, conn: ConnectionPlus | None) -> DataSet:
+        if self._dataset_class is not DataSetType.DataSet:
+            raise RuntimeError("Only datasets stored in a database can be resumed.")
+        ds = load_by_guid(guid, conn=conn)
+        if not isinstance(ds, DataSet):
+            raise RuntimeError("Only datasets stored in a database can be resumed.")
+        if ds.description.interdeps != self._interdependencies:
+            raise ValueError(
+                f"Cannot resume the dataset with guid {guid} since its "
+                f"parameters differ from those of this measurement."
+            )
+        ds._in_memory_cache = self._in_memory_cache
+        ds._resume(start_bg_writer=self._write_in_background)
+        return ds
+
+    def _add_timing_profile_metadata(self, writer_drain: float) -> None:
+        if self._timing_profiler is None:
+            return
+        profile = self._timing_profiler.summary(
+            include_trace=self._store_timing_trace
+        )
+        # the time to write the data that was still queued at the end,
+        # i.e. how far the writing lagged behind the measurement
+        profile["writer_drain"] = writer_drain
+        self.ds.add_metadata(TIMING_PROFILE_KEY, json.dumps(profile))
+
+    def _add_io_stats_metadata(self) -> None:
+        from qcodes.instrument._io_stats import summarize_io_stats
+
+        io_stats = {}
+        for instrument, totals_at_start in self._io_stats_at_start.items():
+            if instrument._io_stats is None:
+                continue
+            stats = summarize_io_stats(
+                instrument._io_stats.totals(), since=totals_at_start
+            )
+            if stats:
+                io_stats[instrument.full_name] = stats
+        if io_stats:
+            self.ds.add_metadata("io_stats", json.dumps(io_stats))
+
 
 T = TypeVar("T", bound="Measurement")
 
@@ -1343,6 +1437,9 @@ class Measurement:
         in_memory_cache: bool | None = True,
         dataset_class: DataSetType = DataSetType.DataSet,
         parent_span: trace.Span | None = None,
+        resume_guid: str | None = None,
+        profile_timing: bool = False,
+        store_timing_trace: bool = False,
     ) -> Runner:
         """
         Returns the context manager for the experimental run
@@ -1360,6 +1457,17 @@ class Measurement:
                 with.
             parent_span: An optional opentelemetry span that this should be registered a
                 a child of if using opentelemetry.
+            resume_guid: The guid of a dataset of a previous run of this
+                measurement to add the results to, rather than creating a
+                new dataset. The dataset is reopened if it was completed.
+            profile_timing: If True, the time spent in each stage of every
+                point is recorded by the ``timing_profiler`` of the
+                :class:`DataSaver`, and statistics of the stages are stored
+                in the metadata of the dataset under ``timing_profile`` at
+                the end of the run. See :meth:`.DataSet.timing_report`.
+            store_timing_trace: If True and profiling, the durations of the
+                stages of each of the last 10000 points are stored in the
+                metadata as well.
         """
         if write_in_background is None:
             write_in_background = cast(bool, qc.config.dataset.write_in_background)
@@ -1379,6 +1487,9 @@ class Measurement:
             in_memory_cache=in_memory_cache,
             dataset_class=dataset_class,
             parent_span=parent_span,
+            resume_guid=resume_guid,
+            profile_timing=profile_timing,
+            store_timing_trace=store_timing_trace,
         )
 
 
@@ -36,6 +36,7 @@ from .data_export import (
     get_2D_plottype,
     reshape_2D_data,
 )
+from .decimation import _get_decimated_data_from_ds
 
 log = logging.getLogger(__name__)
 DB = qc.config["core"]["db_location"]
@@ -98,6 +99,7 @@ def plot_dataset(
     cutoff_percentile: tuple[float, float] | float | None = None,
     complex_plot_type: Literal["real_and_imag", "mag_and_phase"] = "real_and_imag",
     complex_plot_phase: Literal["radians", "degrees"] = "radians",
+    use_decimation: bool = True,
     **kwargs: Any,
 ) -> AxesTupleList:
     """
@@ -119,6 +121,12 @@ def plot_dataset(
     The plot has a title that comprises run id, experiment name, and sample
     name.
 
+    If a decimation pyramid has been stored for the dataset (see
+    :func:`~qcodes.dataset.decimation.build_decimation_pyramid`) the level
+    of the pyramid that matches the pixel resolution of the axes is plotted
+    instead of the full resolution data. For 1D data the range between the
+    minimum and maximum of the decimated data is shaded.
+
     ``**kwargs`` are passed to matplotlib's relevant plotting functions
     By default the data in any vector plot will be rasterized
     for scatter plots and heatmaps if more than 5000 points are supplied.
@@ -147,6 +155,9 @@ def plot_dataset(
         complex_plot_phase: Format of phase for plotting complex-valued data,
             either ``"radians"`` or ``"degrees"``. Applicable only for the
             cases where the dataset contains complex numbers
+        use_decimation: If True, plot the decimation pyramid of the dataset
+            when one is available and has a level that matches the
+            resolution of the axes.
         **kwargs: Keyword arguments passed to the plotting function.
 
     Returns:
@@ -198,17 +209,25 @@ def plot_dataset(
         f"Experiment {experiment_name} ({sample_name})"
     )
 
-    alldata: NamedData = _get_data_from_ds(dataset)
+    if isinstance(axes, matplotlib.axes.Axes):
+        axeslist = [axes]
+    else:
+        axeslist = cast(list[matplotlib.axes.Axes], axes)
+
+    decimated_data: NamedData | None = None
+    if use_decimation:
+        decimated_data = _get_decimated_data_from_ds(
+            dataset, _axes_size_in_pixels(axeslist, subplots_kwargs)
+        )
+    alldata: NamedData = (
+        decimated_data if decimated_data is not None else _get_data_from_ds(dataset)
+    )
     alldata = _complex_to_real_preparser(
         alldata, conversion=complex_plot_type, degrees=degrees
     )
 
     nplots = len(alldata)
 
-    if isinstance(axes, matplotlib.axes.Axes):
-        axeslist = [axes]
-    else:
-        axeslist = cast(list[matplotlib.axes.Axes], axes)
     if isinstance(colorbars, matplotlib.colorbar.Colorbar):
         colorbars = [colorbars]
 
@@ -253,7 +272,16 @@ def plot_dataset(
                 ypoints = ypoints[order]
 
                 with _appropriate_kwargs(plottype, colorbar is not None, **kwargs) as k:
-                    ax.plot(xpoints, ypoints, **k)
+                    (line,) = ax.plot(xpoints, ypoints, **k)
+                if "data_min" in data[1] and "data_max" in data[1]:
+                    ax.fill_between(
+                        xpoints,
+                        data[1]["data_min"][order],
+                        data[1]["data_max"][order],
+                        color=line.get_color(),
+                        alpha=0.3,
+                        linewidth=0,
+                    )
             elif plottype == "1D_point":
                 with _appropriate_kwargs(plottype, colorbar is not None, **kwargs) as k:
                     ax.scatter(xpoints, ypoints, **k)
@@ -376,6 +404,7 @@ def plot_by_id(
     cutoff_percentile: tuple[float, float] | float | None = None,
     complex_plot_type: Literal["real_and_imag", "mag_and_phase"] = "real_and_imag",
     complex_plot_phase: Literal["radians", "degrees"] = "radians",
+    use_decimation: bool = True,
     **kwargs: Any,
 ) -> AxesTupleList:
     """
@@ -396,10 +425,33 @@ def plot_by_id(
         cutoff_percentile,
         complex_plot_type,
         complex_plot_phase,
+        use_decimation=use_decimation,
         **kwargs,
     )
 
 
+def _axes_size_in_pixels(
+    axeslist: Sequence[Axes] | None, subplots_kwargs: dict[str, Any]
+) -> tuple[float, float]:
+    """
+    Return the smallest width and height in pixels of the given axes. If no
+    axes are given, the size of the axes that ``plt.subplots`` will create
+    for the given figure arguments is estimated from the rcParams.
+    """
+    import matplotlib as mpl
+
+    if axeslist is not None and len(axeslist) > 0:
+        extents = [ax.get_window_extent() for ax in axeslist]
+        return min(e.width for e in extents), min(e.height for e in extents)
+
+    rc_params = mpl.rcParams
+    fig_width, fig_height = subplots_kwargs.get("figsize") or rc_params["figure.figsize"]
+    dpi = subplots_kwargs.get("dpi") or rc_params["figure.dpi"]
+    width_fraction = rc_params["figure.subplot.right"] - rc_params["figure.subplot.left"]
+    height_fraction = rc_params["figure.subplot.top"] - rc_params["figure.subplot.bottom"]
+    return fig_width * dpi * width_fraction, fig_height * dpi * height_fraction
+
+
 def _complex_to_real_preparser(
     alldata: Sequence[Sequence[DSPlotData]],
     conversion: Literal["real_and_imag", "mag_and_phase"],
@@ -836,6 +836,57 @@ def mark_run_complete(
     atomic_transaction(conn, query, timestamp, True, run_id)
 
 
+def mark_run_incomplete(conn: ConnectionPlus, run_id: int) -> None:
+    """Mark a completed run as not completed such that it can be resumed
+
+    Args:
+        conn: database connection
+        run_id: id of the run to mark incomplete
+    """
+    query = """
+    UPDATE
+        runs
+    SET
+        completed_timestamp=NULL,
+        is_completed=?
+    WHERE run_id=?;
+    """
+    atomic_transaction(conn, query, False, run_id)
+
+
+def get_last_result_id(conn: ConnectionPlus, formatted_name: str) -> int:
+    """
+    Get the id of the last row of a results table, or 0 if the table is
+    empty.
+
+    Args:
+        conn: database connection
+        formatted_name: name of the results table
+    """
+    _validate_table_name(formatted_name)
+    cursor = atomic_transaction(conn, f'SELECT MAX(id) FROM "{formatted_name}"')
+    last_id = one(cursor, "MAX(id)")
+    return int(last_id) if last_id is not None else 0
+
+
+def delete_results_after(
+    conn: ConnectionPlus, formatted_name: str, result_id: int
+) -> None:
+    """
+    Delete the rows of a results table that come after the row with the
+    given id.
+
+    Args:
+        conn: database connection
+        formatted_name: name of the results table
+        result_id: id of the last row to keep
+    """
+    _validate_table_name(formatted_name)
+    atomic_transaction(
+        conn, f'DELETE FROM "{formatted_name}" WHERE id > ?', result_id
+    )
+
+
 def completed(conn: ConnectionPlus, run_id: int) -> bool:
     """ Check if the run is complete
 
@@ -4,18 +4,23 @@ from __future__ import annotations
 # we want to happen simultaneously within one process (namely getting
 # several parameters in parallel), we can parallelize them with threads.
 # That way the things we call need not be rewritten explicitly async.
+# Parameters that implement get_async can alternatively be gathered on an
+# asyncio event loop, see AsyncParamsCaller.
+import asyncio
 import concurrent
 import concurrent.futures
 import itertools
 import logging
+import threading
 from collections import defaultdict
+from contextlib import AbstractContextManager, nullcontext
 from functools import partial
 from typing import TYPE_CHECKING, Callable, Protocol, TypeVar, Union
 
 from qcodes.utils import RespondingThread
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Coroutine, Sequence
     from types import TracebackType
 
     from qcodes.dataset.data_set_protocol import values_type
@@ -33,11 +38,13 @@ class _ParamCaller:
     def __init__(self, *parameters: ParameterBase):
 
         self._parameters = parameters
+        self._batch = _batch_for(parameters)
 
     def __call__(self) -> tuple[tuple[ParameterBase, ParamDataType], ...]:
         output = []
-        for param in self._parameters:
-            output.append((param, param.get()))
+        with self._batch():
+            for param in self._parameters:
+                output.append((param, param.get()))
         return tuple(output)
 
     def __repr__(self) -> str:
@@ -45,6 +52,24 @@ class _ParamCaller:
         return f"ParamCaller of {','.join(names)}"
 
 
+def _batch_for(
+    parameters: Sequence[ParameterBase],
+) -> Callable[[], AbstractContextManager[None]]:
+    """
+    Return a context manager factory that batches the queries of the given
+    parameters if they belong to an instrument that supports compound
+    queries.
+    """
+    from qcodes.instrument import Instrument
+
+    instruments = {param.root_instrument for param in parameters}
+    if len(parameters) > 1 and len(instruments) == 1:
+        (instrument,) = instruments
+        if isinstance(instrument, Instrument) and instrument.batch_max_queries > 1:
+            return partial(instrument.batch, *parameters)
+    return nullcontext
+
+
 def _instrument_to_param(
     params: Sequence[ParamMeasT],
 ) -> dict[str | None, tuple[ParameterBase, ...]]:
@@ -222,3 +247,255 @@ class ThreadPoolParamsCaller(_ParamsCallerProtocol):
         exc_tb: TracebackType | None,
     ) -> None:
         self._thread_pool.__exit__(exc_type, exc_val, exc_tb)
+
+
+class _InstrumentWorker:
+    """
+    A long-lived thread that calls a parameter caller each time it is
+    requested to. The request and the completion are handed off through a
+    pair of semaphores, which is much cheaper than starting a thread or
+    submitting a future for every call.
+    """
+
+    def __init__(self, param_caller: _ParamCaller, name: str):
+        self._param_caller = param_caller
+        self._request = threading.Semaphore(0)
+        self._done = threading.Semaphore(0)
+        self._stopping = False
+        self._output: tuple[tuple[ParameterBase, ParamDataType], ...] = ()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping = True
+        self._request.release()
+        self._thread.join()
+
+    def request(self) -> None:
+        """Request the worker to call the parameters."""
+        self._request.release()
+
+    def wait(self) -> tuple[tuple[ParameterBase, ParamDataType], ...]:
+        """
+        Wait for the worker to complete the last request and return the
+        output, or raise the error of the call.
+        """
+        self._done.acquire()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+        return self._output
+
+    def _run(self) -> None:
+        while True:
+            self._request.acquire()
+            if self._stopping:
+                return
+            try:
+                self._output = self._param_caller()
+            except BaseException as error:
+                self._error = error
+            self._done.release()
+
+
+class InstrumentWorkersParamsCaller(_ParamsCallerProtocol):
+    """
+    Context manager for calling given parameters on long-lived worker
+    threads, one for each underlying instrument. The parameters of an
+    instrument are always called on the same thread, and the parameters
+    of the last instrument on the calling thread. Compared to
+    :class:`ThreadPoolParamsCaller` this avoids the overhead of
+    submitting futures at every call, which matters at high point rates.
+    The output is in the order of the instruments of the given parameters.
+
+    Usage:
+
+        .. code-block:: python
+
+           ...
+           with InstrumentWorkersParamsCaller(p1, p2, ...) as workers_caller:
+               ...
+               output = workers_caller()
+               ...
+               # Output can be passed directly into DataSaver.add_result:
+               # datasaver.add_result(*output)
+               ...
+           ...
+
+    Args:
+        param_meas: parameter or a callable without arguments
+    """
+
+    def __init__(self, *param_meas: ParamMeasT):
+        self._param_callers = tuple(
+            _ParamCaller(*param_list)
+            for param_list in _instrument_to_param(param_meas).values()
+        )
+        self._workers: tuple[_InstrumentWorker, ...] | None = None
+
+    def __call__(self) -> OutType:
+        """
+        Call the parameters on the worker threads and return
+        `(param, value)` tuples.
+        """
+        if self._workers is None:
+            raise RuntimeError(
+                "InstrumentWorkersParamsCaller must be entered before it can "
+                "be called."
+            )
+        if not self._param_callers:
+            return []
+        for worker in self._workers:
+            worker.request()
+        error: BaseException | None = None
+        last_output: tuple[tuple[ParameterBase, ParamDataType], ...] = ()
+        try:
+            last_output = self._param_callers[-1]()
+        except BaseException as caller_error:
+            error = caller_error
+        output: OutType = []
+        # wait for all workers even if one fails, such that none of them is
+        # still running when the next call is requested
+        for worker in self._workers:
+            try:
+                output.extend(worker.wait())
+            except BaseException as worker_error:
+                if error is None:
+                    error = worker_error
+        if error is not None:
+            raise error
+        output.extend(last_output)
+        return output
+
+    def __enter__(self) -> InstrumentWorkersParamsCaller:
+        self._workers = tuple(
+            _InstrumentWorker(
+                param_caller, f"{self.__class__.__name__}: {param_caller!r}"
+            )
+            for param_caller in self._param_callers[:-1]
+        )
+        for worker in self._workers:
+            worker.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        workers, self._workers = self._workers, None
+        for worker in workers or ():
+            worker.stop()
+
+
+class AsyncParamsCaller(_ParamsCallerProtocol):
+    """
+    Context manager for getting the given parameters concurrently with
+    their asyncio interface, see
+    :meth:`~qcodes.parameters.ParameterBase.get_async`.
+    The parameters are gathered on an event loop running in a background
+    thread. Parameters that have the same underlying instrument are got
+    one after the other, parameters of different instruments concurrently.
+    Callables are called in the order they are given, after all parameters
+    preceding them have been got.
+
+    Usage:
+
+        .. code-block:: python
+
+           ...
+           with AsyncParamsCaller(p1, p2, ...) as async_caller:
+               ...
+               output = async_caller()
+               ...
+               # Output can be passed directly into DataSaver.add_result:
+               # datasaver.add_result(*output)
+               ...
+           ...
+
+    Args:
+        param_meas: parameter or a callable without arguments
+    """
+
+    def __init__(self, *param_meas: ParamMeasT):
+        from qcodes.parameters import ParameterBase
+
+        # split the parameters into groups separated by callables
+        self._steps: list[
+            tuple[tuple[tuple[ParameterBase, ...], ...], Callable[[], None] | None]
+        ] = []
+        params: list[ParameterBase] = []
+        for param in param_meas:
+            if isinstance(param, ParameterBase):
+                params.append(param)
+            elif callable(param):
+                self._steps.append((self._group(params), param))
+                params = []
+        self._steps.append((self._group(params), None))
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _group(
+        params: Sequence[ParameterBase],
+    ) -> tuple[tuple[ParameterBase, ...], ...]:
+        return tuple(_instrument_to_param(params).values())
+
+    @staticmethod
+    async def _get_in_sequence(
+        params: Sequence[ParameterBase],
+    ) -> list[tuple[ParameterBase, ParamDataType]]:
+        return [(param, await param.get_async()) for param in params]
+
+    async def _call(self) -> OutType:
+        output: OutType = []
+        for groups, func in self._steps:
+            results = await asyncio.gather(
+                *(self._get_in_sequence(group) for group in groups)
+            )
+            output.extend(itertools.chain.from_iterable(results))
+            if func is not None:
+                func()
+        return output
+
+    def __call__(self) -> OutType:
+        """
+        Get the parameters on the event loop and return `(param, value)`
+        tuples.
+        """
+        if self._loop is None:
+            raise RuntimeError(
+                "AsyncParamsCaller must be entered before it can be called."
+            )
+        coro: Coroutine[None, None, OutType] = self._call()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def __enter__(self) -> AsyncParamsCaller:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name=self.__class__.__name__,
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        loop, thread = self._loop, self._thread
+        self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.run_until_complete(loop.shutdown_default_executor())
+        loop.close()
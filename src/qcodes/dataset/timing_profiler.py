@@ -0,0 +1,187 @@
+"""
+Low overhead profiling of the time spent in each stage of the points of a
+measurement: setting the parameters, waiting for their delays, getting the
+measured parameters, adding the results to the dataset and writing them to
+the database.
+
+The durations of the stages of each point are recorded in a row of a NumPy
+ring buffer, such that the memory used is bounded however many points are
+measured. Totals are kept over all points, the other statistics are over
+the points that are in the buffer.
+"""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+STAGES = ("set", "delay", "get", "add_result", "flush", "point")
+"""
+The stages that are profiled. ``point`` is the time between the ends of
+consecutive points, i.e. the total time per point including time that is
+not spent in any of the other stages.
+"""
+
+TIMING_PROFILE_KEY = "timing_profile"
+"""The metadata tag that the timing profile of a run is stored under."""
+
+_COLUMNS = {stage: column for column, stage in enumerate(STAGES)}
+_POINT = _COLUMNS["point"]
+
+
+class PointTimingProfiler:
+    """
+    Records the durations of the stages of each point of a measurement.
+
+    The durations recorded with :meth:`record` are added to the current
+    point, which is ended by :meth:`end_point`. The :class:`.DataSaver`
+    records the ``add_result`` and ``flush`` stages and, unless
+    :attr:`end_points_on_add_result` is False, ends a point at every call
+    of ``add_result``. Other stages may be recorded by the measurement
+    loop, as :func:`.dond` does:
+
+    .. code-block:: python
+
+        with meas.run(profile_timing=True) as datasaver:
+            profiler = datasaver.timing_profiler
+            for value in values:
+                with profiler.time("set"):
+                    gate(value)
+                with profiler.time("get"):
+                    measured = current()
+                datasaver.add_result((gate, value), (current, measured))
+
+    Args:
+        capacity: The number of points whose durations are kept.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        if capacity < 1:
+            raise ValueError("The capacity of the profiler must be at least 1.")
+        self._capacity = capacity
+        self._buffer = np.zeros((capacity, len(STAGES)))
+        self._current = np.zeros(len(STAGES))
+        self._totals = np.zeros(len(STAGES))
+        self._recorded = np.zeros(len(STAGES), dtype=bool)
+        self._recorded[_POINT] = True
+        self._n_points = 0
+        self._row = 0
+        self._last_end = time.perf_counter()
+        self.end_points_on_add_result = True
+        """
+        Whether :meth:`.DataSaver.add_result` ends the current point.
+        Measurement loops that add the results of a point later than it is
+        measured, e.g. :func:`.dond` with a sweep order other than raster,
+        set this to False and end the points themselves.
+        """
+
+    @property
+    def n_points(self) -> int:
+        """The number of points that have been ended."""
+        return self._n_points
+
+    def record(self, stage: str, duration: float) -> None:
+        """Add the duration in seconds of a stage to the current point."""
+        column = _COLUMNS[stage]
+        self._current[column] += duration
+        self._recorded[column] = True
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Record the time spent in the block as the duration of a stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def end_point(self) -> None:
+        """End the current point and start recording the next one."""
+        now = time.perf_counter()
+        current = self._current
+        current[_POINT] = now - self._last_end
+        self._last_end = now
+        self._buffer[self._row] = current
+        self._totals += current
+        current[:] = 0
+        self._n_points += 1
+        self._row = self._n_points % self._capacity
+
+    def trace(self) -> np.ndarray:
+        """
+        The durations of the stages of the points in the buffer, from the
+        oldest to the newest point, as an array of shape
+        ``(number of points, len(STAGES))``.
+        """
+        if self._n_points <= self._capacity:
+            return self._buffer[: self._n_points].copy()
+        return np.roll(self._buffer, -self._row, axis=0)
+
+    def summary(self, include_trace: bool = False) -> dict[str, Any]:
+        """
+        Return a JSON compatible summary of the recorded durations, with the
+        total over all points and the mean, median, 95th percentile and
+        maximum over the points in the buffer of each stage that has been
+        recorded.
+
+        Args:
+            include_trace: Whether to include the durations of every point
+                in the buffer.
+        """
+        trace = self.trace()
+        stages: dict[str, dict[str, float]] = {}
+        for stage, column in _COLUMNS.items():
+            if not self._recorded[column]:
+                continue
+            durations = trace[:, column]
+            stats = {"total": float(self._totals[column])}
+            if len(durations):
+                stats.update(
+                    mean=float(np.mean(durations)),
+                    median=float(np.median(durations)),
+                    p95=float(np.percentile(durations, 95)),
+                    max=float(np.max(durations)),
+                )
+            stages[stage] = stats
+        summary: dict[str, Any] = {
+            "n_points": self._n_points,
+            "n_buffered": len(trace),
+            "stages": stages,
+        }
+        if include_trace:
+            recorded = [stage for stage in STAGES if self._recorded[_COLUMNS[stage]]]
+            summary["trace"] = {
+                "stages": recorded,
+                "durations": trace[:, self._recorded].tolist(),
+            }
+        return summary
+
+
+def format_timing_report(profile: Mapping[str, Any]) -> str:
+    """
+    Format a timing profile as stored in the metadata of a dataset as a
+    table of the statistics of each stage.
+    """
+    lines = [
+        f"Timing of {profile['n_points']} points, statistics over the last "
+        f"{profile['n_buffered']} points:",
+        f"{'stage':<12}{'total (s)':>12}{'mean (ms)':>12}{'median (ms)':>13}"
+        f"{'p95 (ms)':>12}{'max (ms)':>12}",
+    ]
+    for stage, stats in profile["stages"].items():
+        line = f"{stage:<12}{stats['total']:>12.3f}"
+        for key, width in (("mean", 12), ("median", 13), ("p95", 12), ("max", 12)):
+            if key in stats:
+                line += f"{1e3 * stats[key]:>{width}.3f}"
+        lines.append(line)
+    if "writer_drain" in profile:
+        lines.append(
+            f"Writing the remaining data at the end took "
+            f"{profile['writer_drain']:.3f} s"
+        )
+    return "\n".join(lines)
@@ -19,6 +19,7 @@ from .channel import ChannelList, ChannelTuple, InstrumentChannel, InstrumentMod
 from .instrument import Instrument, find_or_create_instrument
 from .instrument_base import InstrumentBase
 from .ip import IPInstrument
+from .simulated_resource import SimulatedResource
 from .visa import VisaInstrument
 
 __all__ = [
@@ -29,6 +30,7 @@ __all__ = [
     "InstrumentBase",
     "InstrumentChannel",
     "InstrumentModule",
+    "SimulatedResource",
     "VisaInstrument",
     "find_or_create_instrument",
 ]
@@ -0,0 +1,70 @@
+"""
+Reading of IEEE 488.2 definite length arbitrary block responses, i.e.
+responses of the form ``#<n><length><data>`` where ``<n>`` is a single
+digit giving the number of digits of ``<length>``, which in turn is the
+number of bytes of ``<data>``.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+ByteOrder = Literal["<", ">", "="]
+
+
+def read_binary_block(
+    read_bytes: Callable[[int], bytes],
+    read_into: Callable[[memoryview], None],
+    dtype: npt.DTypeLike,
+    byte_order: ByteOrder,
+) -> np.ndarray:
+    """
+    Read a definite length arbitrary block into a new array.
+
+    Args:
+        read_bytes: Function that reads exactly the given number of bytes.
+            Used to read the header.
+        read_into: Function that fills the given buffer completely. Used to
+            read the data directly into the array.
+        dtype: The data type of the elements of the block.
+        byte_order: The byte order of the elements of the block.
+
+    Returns:
+        The elements of the block in native byte order.
+
+    Raises:
+        ValueError: If the header is not that of a definite length block
+            or the length of the block is not a multiple of the size of
+            the data type.
+    """
+    header = read_bytes(2)
+    if header[:1] != b"#" or not header[1:2].isdigit():
+        raise ValueError(f"Expected a binary block header but got {header!r}")
+    n_digits = int(header[1:2])
+    if n_digits == 0:
+        raise ValueError("Indefinite length binary blocks are not supported")
+    length_digits = read_bytes(n_digits)
+    if not length_digits.isdigit():
+        raise ValueError(
+            f"Expected the length of a binary block but got {length_digits!r}"
+        )
+    n_bytes = int(length_digits)
+
+    block_dtype = np.dtype(dtype).newbyteorder(byte_order)
+    if n_bytes % block_dtype.itemsize != 0:
+        raise ValueError(
+            f"A binary block of {n_bytes} bytes cannot contain elements "
+            f"of {block_dtype.itemsize} bytes"
+        )
+    data = np.empty(n_bytes // block_dtype.itemsize, dtype=block_dtype)
+    if n_bytes > 0:
+        read_into(memoryview(data.view(np.uint8)))
+
+    if not block_dtype.isnative:
+        native_dtype = block_dtype.newbyteorder("=")
+        data = data.byteswap(inplace=True).view(native_dtype)
+    return data
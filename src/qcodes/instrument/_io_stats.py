@@ -0,0 +1,223 @@
+"""
+Low overhead statistics of the communication of an instrument: the number
+of commands, the characters written and read, the errors and a histogram
+of the latencies for each command template.
+
+The statistics are recorded by every thread into a dictionary of its own,
+so recording takes no locks, and the dictionaries are only merged when the
+statistics are read. The dictionaries of threads that have finished are
+merged into a single dictionary, so that the memory used does not grow with
+the number of threads that have recorded statistics.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+N_BUCKETS = 32
+"""
+The number of buckets of the latency histograms. Bucket ``i > 0`` counts
+the latencies from ``2**(i-1)`` up to ``2**i`` microseconds, bucket 0 the
+latencies below a microsecond, and the last bucket everything above.
+"""
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def command_template(cmd: str) -> str:
+    """
+    Return the template of a command that the statistics of the command
+    are recorded under, which is the command with the numbers in its
+    arguments replaced by ``<n>``. The header is kept as is, so that
+    commands to different channels are told apart.
+
+    >>> command_template("SOUR2:VOLT 1.5e-3")
+    'SOUR2:VOLT <n>'
+    """
+    header, separator, arguments = cmd.partition(" ")
+    if not arguments:
+        return cmd
+    return header + separator + _NUMBER.sub("<n>", arguments)
+
+
+class CommandStats:
+    """The statistics of the commands of one template."""
+
+    __slots__ = (
+        "count",
+        "errors",
+        "total_time",
+        "bytes_written",
+        "bytes_read",
+        "histogram",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.bytes_written = 0
+        self.bytes_read = 0
+        self.histogram = [0] * N_BUCKETS
+
+    def add(self, other: CommandStats, sign: int = 1) -> None:
+        self.count += sign * other.count
+        self.errors += sign * other.errors
+        self.total_time += sign * other.total_time
+        self.bytes_written += sign * other.bytes_written
+        self.bytes_read += sign * other.bytes_read
+        for bucket, count in enumerate(other.histogram):
+            self.histogram[bucket] += sign * count
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile of the latency as the upper edge in seconds
+        of the bucket that contains it.
+        """
+        threshold = fraction * self.count
+        cumulative = 0
+        for bucket, count in enumerate(self.histogram):
+            cumulative += count
+            if count and cumulative >= threshold:
+                return _bucket_edge(bucket)
+        return float("nan")
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.count if self.count else 0.0,
+            "median_time": self.percentile(0.5),
+            "p99_time": self.percentile(0.99),
+            "histogram": [
+                [_bucket_edge(bucket), count]
+                for bucket, count in enumerate(self.histogram)
+                if count
+            ],
+        }
+
+
+def _bucket_edge(bucket: int) -> float:
+    return 2.0**bucket * 1e-6
+
+
+class IOStatistics:
+    """
+    The statistics of the communication of one instrument.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # guards the shards and the statistics of finished threads, it is
+        # only taken when a thread records its first command
+        self._lock = threading.Lock()
+        self._shards: dict[threading.Thread, dict[str, CommandStats]] = {}
+        self._finished: dict[str, CommandStats] = {}
+
+    def record(
+        self,
+        cmd: str,
+        elapsed: float,
+        bytes_written: int,
+        bytes_read: int,
+        failed: bool = False,
+    ) -> None:
+        """
+        Record a command.
+
+        Args:
+            cmd: The command that was sent.
+            elapsed: The time from sending the command until the response
+                was read, in seconds.
+            bytes_written: The number of characters written.
+            bytes_read: The number of characters read.
+            failed: Whether the command raised an error.
+        """
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._merge_finished_threads()
+                self._shards[threading.current_thread()] = shard
+        template = command_template(cmd)
+        stats = shard.get(template)
+        if stats is None:
+            stats = shard[template] = CommandStats()
+        stats.count += 1
+        stats.total_time += elapsed
+        stats.bytes_written += bytes_written
+        stats.bytes_read += bytes_read
+        if failed:
+            stats.errors += 1
+        stats.histogram[min(int(elapsed * 1e6).bit_length(), N_BUCKETS - 1)] += 1
+
+    def totals(self) -> dict[str, CommandStats]:
+        """
+        Return the statistics of each command template merged over all
+        threads.
+        """
+        totals: dict[str, CommandStats] = {}
+        with self._lock:
+            self._merge_finished_threads()
+            _merge_stats(totals, self._finished)
+            for shard in self._shards.values():
+                _merge_stats(totals, shard)
+        return totals
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        with self._lock:
+            self._local = threading.local()
+            self._shards = {}
+            self._finished = {}
+
+    def _merge_finished_threads(self) -> None:
+        finished = [thread for thread in self._shards if not thread.is_alive()]
+        for thread in finished:
+            _merge_stats(self._finished, self._shards.pop(thread))
+
+
+def _merge_stats(
+    totals: dict[str, CommandStats], shard: Mapping[str, CommandStats]
+) -> None:
+    # copying the items is atomic so the shard may be recorded into
+    # concurrently
+    for template, stats in list(shard.items()):
+        total = totals.get(template)
+        if total is None:
+            total = totals[template] = CommandStats()
+        total.add(stats)
+
+
+def summarize_io_stats(
+    totals: Mapping[str, CommandStats],
+    since: Mapping[str, CommandStats] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Convert statistics into a JSON compatible dictionary from command
+    template to the statistics of the template.
+
+    Args:
+        totals: The statistics as returned by :meth:`IOStatistics.totals`.
+        since: If given, earlier statistics that are subtracted, so that
+            only the commands recorded after them are summarized.
+    """
+    summary: dict[str, dict[str, Any]] = {}
+    for template, stats in totals.items():
+        earlier = since.get(template) if since is not None else None
+        if earlier is not None:
+            difference = CommandStats()
+            difference.add(stats)
+            difference.add(earlier, sign=-1)
+            stats = difference
+        if stats.count:
+            summary[template] = stats.summary()
+    return summary
@@ -70,6 +70,12 @@ class InstrumentModule(InstrumentBase):
     def ask_raw(self, cmd: str) -> str:
         return self._parent.ask_raw(cmd)
 
+    async def write_async(self, cmd: str) -> None:
+        await self._parent.write_async(cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        return await self._parent.ask_async(cmd)
+
     @property
     def parent(self) -> InstrumentBase:
         return self._parent
@@ -1040,6 +1046,20 @@ class AutoLoadableInstrumentChannel(InstrumentChannel):
         self._assert_existence()
         return super().ask(cmd)
 
+    async def write_async(self, cmd: str) -> None:
+        """
+        Write to the instrument only if the channel is present on the instrument
+        """
+        self._assert_existence()
+        await super().write_async(cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        """
+        Ask the instrument only if the channel is present on the instrument
+        """
+        self._assert_existence()
+        return await super().ask_async(cmd)
+
     @property
     def exists_on_instrument(self) -> bool:
         return self._exists_on_instrument
@@ -1,25 +1,40 @@
 """Instrument base class."""
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import threading
 import time
 import weakref
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar, overload
 
+from qcodes.parameters.command import Command
 from qcodes.utils import strip_attrs
 from qcodes.validators import Anything
 
+from ._io_stats import IOStatistics, summarize_io_stats
 from .instrument_base import InstrumentBase
 from .instrument_meta import InstrumentMeta
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Callable, Iterator, Mapping, Sequence
 
     from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
+    from qcodes.parameters import ParameterBase
 
 
 log = logging.getLogger(__name__)
 
+# responses to queries that have been fetched by ``Instrument.batch``, per
+# instrument, one dict for each nested ``batch`` context with the innermost
+# last. They are held in a context variable so that only the thread or task
+# that fetched them uses them.
+_batch_responses: contextvars.ContextVar[
+    dict[Instrument, tuple[dict[str, str], ...]] | None
+] = contextvars.ContextVar("_batch_responses", default=None)
+
 
 class InstrumentProtocol(Protocol):
     """Protocol that is useful for defining mixin classes for Instrument class"""
@@ -34,6 +49,7 @@ class InstrumentProtocol(Protocol):
 
 
 T = TypeVar("T", bound="Instrument")
+T_out = TypeVar("T_out")
 
 
 class Instrument(InstrumentBase, metaclass=InstrumentMeta):
@@ -56,6 +72,19 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
     _type = None
     _instances: weakref.WeakSet[Instrument] = weakref.WeakSet()
 
+    batch_max_queries: ClassVar[int] = 0
+    """
+    The maximum number of queries that the instrument accepts joined into a
+    single compound query. Drivers for instruments that support compound
+    queries can set this to enable :meth:`batch`. Batching is disabled if
+    this is less than 2.
+    """
+    batch_separator: ClassVar[str] = ";"
+    """
+    The separator used to join queries into a compound query, and to split
+    the response to a compound query into the responses to each query.
+    """
+
     def __init__(
         self,
         name: str,
@@ -64,6 +93,14 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
     ) -> None:
 
         self._t0 = time.time()
+        # serializes communication of the async interface that is run in
+        # executor threads. Drivers whose sync interface is not thread safe,
+        # such as ``VisaInstrument``, take it as well so that the sync and
+        # async interfaces can be mixed. Reentrant since the async interface
+        # runs the sync methods while holding it.
+        self._async_io_lock = threading.RLock()
+        # statistics of the communication, None while they are disabled
+        self._io_stats: IOStatistics | None = None
 
         super().__init__(name=name, metadata=metadata, label=label)
 
@@ -374,7 +411,18 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
                 including the command and the instrument.
         """
         try:
-            self.write_raw(cmd)
+            self._discard_batch_responses()
+            io_stats = self._io_stats
+            if io_stats is None:
+                self.write_raw(cmd)
+                return
+            start = time.perf_counter()
+            try:
+                self.write_raw(cmd)
+            except Exception:
+                io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0, True)
+                raise
+            io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0)
         except Exception as e:
             inst = repr(self)
             e.args = e.args + ("writing " + repr(cmd) + " to " + inst,)
@@ -414,8 +462,22 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
                 including the command and the instrument.
         """
         try:
-            answer = self.ask_raw(cmd)
-
+            batch_responses = self._current_batch_responses()
+            if batch_responses:
+                answer = batch_responses.pop(cmd, None)
+                if answer is not None:
+                    return answer
+
+            io_stats = self._io_stats
+            if io_stats is None:
+                return self.ask_raw(cmd)
+            start = time.perf_counter()
+            try:
+                answer = self.ask_raw(cmd)
+            except Exception:
+                io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0, True)
+                raise
+            io_stats.record(cmd, time.perf_counter() - start, len(cmd), len(answer))
             return answer
 
         except Exception as e:
@@ -438,6 +500,299 @@ class Instrument(InstrumentBase, metaclass=InstrumentMeta):
             f"Instrument {type(self).__name__} has not defined an ask method"
         )
 
+    # `write_async` and `ask_async` are the asyncio counterparts of `write`  #
+    # and `ask`. By default the sync methods are run in an executor.       #
+    #
+
+    async def write_async(self, cmd: str) -> None:
+        """
+        Write a command string with NO response to the hardware without
+        blocking the event loop.
+
+        By default :meth:`write` is run in an executor, one command at a time
+        per instrument. Subclasses with a native asyncio communication should
+        override :meth:`write_raw_async`.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+        """
+        if type(self).write is not Instrument.write:
+            # the subclass transforms the command so use its write
+            await self._run_in_executor(self.write, cmd)
+            return
+        try:
+            self._discard_batch_responses()
+            io_stats = self._io_stats
+            if io_stats is None:
+                await self.write_raw_async(cmd)
+                return
+            start = time.perf_counter()
+            try:
+                await self.write_raw_async(cmd)
+            except Exception:
+                io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0, True)
+                raise
+            io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0)
+        except Exception as e:
+            inst = repr(self)
+            e.args = e.args + ("writing " + repr(cmd) + " to " + inst,)
+            raise e
+
+    async def write_raw_async(self, cmd: str) -> None:
+        """
+        Low level method to write a command string to the hardware without
+        blocking the event loop. By default :meth:`write_raw` is run in an
+        executor.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        await self._run_in_executor(self.write_raw, cmd)
+
+    async def ask_async(self, cmd: str) -> str:
+        """
+        Write a command string to the hardware and return a response without
+        blocking the event loop.
+
+        By default :meth:`ask` is run in an executor, one command at a time
+        per instrument. Subclasses with a native asyncio communication should
+        override :meth:`ask_raw_async`.
+
+        Args:
+            cmd: The string to send to the instrument.
+
+        Returns:
+            response
+
+        Raises:
+            Exception: Wraps any underlying exception with extra context,
+                including the command and the instrument.
+        """
+        if type(self).ask is not Instrument.ask:
+            # the subclass transforms the command so use its ask
+            return await self._run_in_executor(self.ask, cmd)
+        try:
+            batch_responses = self._current_batch_responses()
+            if batch_responses:
+                answer = batch_responses.pop(cmd, None)
+                if answer is not None:
+                    return answer
+
+            io_stats = self._io_stats
+            if io_stats is None:
+                return await self.ask_raw_async(cmd)
+            start = time.perf_counter()
+            try:
+                answer = await self.ask_raw_async(cmd)
+            except Exception:
+                io_stats.record(cmd, time.perf_counter() - start, len(cmd), 0, True)
+                raise
+            io_stats.record(cmd, time.perf_counter() - start, len(cmd), len(answer))
+            return answer
+
+        except Exception as e:
+            inst = repr(self)
+            e.args = e.args + ("asking " + repr(cmd) + " to " + inst,)
+            raise e
+
+    async def ask_raw_async(self, cmd: str) -> str:
+        """
+        Low level method to write to the hardware and return a response
+        without blocking the event loop. By default :meth:`ask_raw` is run
+        in an executor.
+
+        Args:
+            cmd: The string to send to the instrument.
+        """
+        return await self._run_in_executor(self.ask_raw, cmd)
+
+    async def _run_in_executor(self, func: Callable[[str], T_out], cmd: str) -> T_out:
+        def locked_call() -> T_out:
+            with self._async_io_lock:
+                return func(cmd)
+
+        # run in a copy of the current context so that batched responses are
+        # visible to the executor thread
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            None, context.run, locked_call
+        )
+
+    @contextmanager
+    def batch(self, *parameters: ParameterBase) -> Iterator[None]:
+        """
+        Context manager that fetches the values of the given parameters in
+        as few round trips to the instrument as possible.
+
+        The get commands of the parameters are joined with
+        :attr:`batch_separator` into compound queries of at most
+        :attr:`batch_max_queries` queries each. Within the context, getting
+        one of the parameters returns the response to its query from the
+        compound query instead of querying the instrument again. Each
+        response is used at most once, so getting a parameter a second time
+        queries the instrument. The responses are only used by the thread or
+        asyncio task that entered the context, and they are all discarded
+        when a command is written to the instrument, e.g. by setting a
+        parameter, since they may be outdated after that.
+
+        Only parameters of this instrument, or its channels, whose
+        ``get_cmd`` is a plain command string are batched. Other parameters
+        are got as usual. If the instrument does not support compound
+        queries (see :attr:`batch_max_queries`), this does nothing.
+
+        Example:
+            >>> with instr.batch(instr.voltage, instr.current):
+            ...     voltage = instr.voltage()
+            ...     current = instr.current()
+
+        Args:
+            *parameters: The parameters to fetch.
+        """
+        all_responses = _batch_responses.get() or {}
+        outer_responses = all_responses.get(self, ())
+        responses = dict(outer_responses[-1]) if outer_responses else {}
+        if self.batch_max_queries > 1:
+            responses.update(self._fetch_batch(parameters))
+        token = _batch_responses.set(
+            {**all_responses, self: (*outer_responses, responses)}
+        )
+        try:
+            yield
+        finally:
+            _batch_responses.reset(token)
+
+    def _current_batch_responses(self) -> dict[str, str] | None:
+        """
+        Return the responses fetched by the innermost :meth:`batch` context
+        of the current thread or task that have not been used yet, if any
+        """
+        responses = (_batch_responses.get() or {}).get(self)
+        return responses[-1] if responses else None
+
+    def _discard_batch_responses(self) -> None:
+        """
+        Discard the responses fetched by all :meth:`batch` contexts of the
+        current thread or task
+        """
+        for responses in (_batch_responses.get() or {}).get(self, ()):
+            responses.clear()
+
+    def _fetch_batch(self, parameters: tuple[ParameterBase, ...]) -> dict[str, str]:
+        queries = list(
+            dict.fromkeys(
+                query
+                for query in (self._batch_query(param) for param in parameters)
+                if query is not None
+            )
+        )
+        if len(queries) < 2:
+            # nothing to be gained from a compound query
+            return {}
+
+        responses: dict[str, str] = {}
+        size = self.batch_max_queries
+        for start in range(0, len(queries), size):
+            chunk = queries[start : start + size]
+            answer = self.ask(self.batch_separator.join(chunk))
+            chunk_responses = answer.split(self.batch_separator)
+            if len(chunk_responses) != len(chunk):
+                # the responses cannot be assigned to the queries so they
+                # are queried individually instead
+                self.log.warning(
+                    f"Got {len(chunk_responses)} responses to a compound "
+                    f"query of {len(chunk)} queries: {answer!r}. Falling "
+                    f"back to individual queries."
+                )
+                continue
+            responses.update(
+                zip(chunk, (response.strip() for response in chunk_responses))
+            )
+        return responses
+
+    def _batch_query(self, parameter: ParameterBase) -> str | None:
+        """
+        Return the query that gets the raw value of the parameter, if it can
+        be part of a compound query of this instrument
+        """
+        if parameter.root_instrument is not self:
+            return None
+        get_raw = getattr(parameter, "get_raw", None)
+        if not isinstance(get_raw, Command) or get_raw.arg_count != 0:
+            return None
+        cmd_str = getattr(get_raw, "cmd_str", None)
+        # the command must be passed on unchanged to ``ask``
+        exec_str = getattr(get_raw, "exec_str", None)
+        if cmd_str is None or getattr(exec_str, "__name__", None) != "ask":
+            return None
+        return cmd_str.format()
+
+    def enable_io_stats(self) -> None:
+        """
+        Start recording statistics of the communication with the instrument
+        through :meth:`write` and :meth:`ask`, see :meth:`io_stats`.
+
+        While the statistics are enabled, they are also included in the
+        snapshot of the instrument and, for the duration of a measurement,
+        in the metadata of its dataset under ``io_stats``.
+        """
+        if self._io_stats is None:
+            self._io_stats = IOStatistics()
+
+    def disable_io_stats(self) -> None:
+        """Stop recording statistics of the communication and forget them."""
+        self._io_stats = None
+
+    def reset_io_stats(self) -> None:
+        """Forget the statistics of the communication recorded so far."""
+        if self._io_stats is not None:
+            self._io_stats.reset()
+
+    def io_stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Statistics of the communication with the instrument since they were
+        enabled with :meth:`enable_io_stats`.
+
+        Commands are grouped into templates by replacing the numbers in
+        their arguments by ``<n>``, so that e.g. ``VOLT 0.1`` and
+        ``VOLT 0.2`` are both counted as ``VOLT <n>``. For each template the
+        statistics contain the ``count`` of commands, the number of
+        ``errors``, the number of characters written and read
+        (``bytes_written`` and ``bytes_read``, without terminators), the
+        ``total_time``, ``mean_time``, ``median_time`` and ``p99_time`` in
+        seconds, and a ``histogram`` of the latencies as a list of pairs of
+        the upper edge of a bucket in seconds and the number of commands in
+        it. The buckets are powers of two of microseconds, and the
+        percentiles are estimated as the upper edge of their bucket.
+
+        Returns:
+            Dictionary from command template to its statistics. Empty if
+            the statistics are not enabled.
+        """
+        if self._io_stats is None:
+            return {}
+        return summarize_io_stats(self._io_stats.totals())
+
+    def snapshot_base(
+        self,
+        update: bool | None = False,
+        params_to_skip_update: Sequence[str] | None = None,
+    ) -> dict[Any, Any]:
+        """
+        State of the instrument as a JSON-compatible dict, including the
+        statistics of the communication under ``io_stats`` if they are
+        enabled. See :meth:`.InstrumentBase.snapshot_base`.
+        """
+        snap = super().snapshot_base(
+            update=update, params_to_skip_update=params_to_skip_update
+        )
+        if self._io_stats is not None:
+            snap["io_stats"] = self.io_stats()
+        return snap
+
 
 def find_or_create_instrument(
     instrument_class: type[T],
@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import logging
+import selectors
 import socket
+import threading
+import time
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any
 
+from ._binary_block import read_binary_block
 from .base import Instrument
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from types import TracebackType
 
+    import numpy as np
+    import numpy.typing as npt
+
+    from ._binary_block import ByteOrder
+
 log = logging.getLogger(__name__)
 
 
@@ -38,6 +48,16 @@ class IPInstrument(Instrument):
         write_confirmation: Whether the instrument acknowledges writes
             with some response we should read. Default True.
 
+        read_terminator: Character(s) that terminate each response.
+            If given, responses are read until the read terminator, which
+            is stripped from the response. If None, a response is whatever
+            a single read from the socket returns. Default None.
+
+        idle_timeout: Seconds to keep the socket open after a call if the
+            instrument is not persistent, such that consecutive calls reuse
+            the connection. If None, the socket is closed after each call.
+            Default None.
+
         kwargs: additional static metadata to add to this
             instrument's JSON snapshot.
 
@@ -54,6 +74,8 @@ class IPInstrument(Instrument):
         terminator: str = "\n",
         persistent: bool = True,
         write_confirmation: bool = True,
+        read_terminator: str | None = None,
+        idle_timeout: float | None = None,
         **kwargs: Any,
     ):
         super().__init__(name, **kwargs)
@@ -62,12 +84,21 @@ class IPInstrument(Instrument):
         self._port = port
         self._timeout = timeout
         self._terminator = terminator
+        self._read_terminator = read_terminator
         self._confirmation = write_confirmation
+        self._idle_timeout = idle_timeout
 
         self._ensure_connection = EnsureConnection(self)
         self._buffer_size = 1400
 
         self._socket: socket.socket | None = None
+        self._selector: selectors.BaseSelector | None = None
+        # bytes received after the end of the last response
+        self._read_buffer = bytearray()
+        # guards the socket against concurrent calls and the idle timer
+        self._socket_lock = threading.RLock()
+        self._idle_timer: threading.Timer | None = None
+        self._last_used = 0.0
 
         self.set_persistent(persistent)
 
@@ -100,14 +131,40 @@ class IPInstrument(Instrument):
         Args:
             persistent: Set True to keep the socket open all the time.
         """
-        self._persistent = persistent
-        if persistent:
-            self._connect()
-        else:
-            self._disconnect()
+        with self._socket_lock:
+            self._persistent = persistent
+            if persistent:
+                self._cancel_idle_timer()
+                self._connect()
+            else:
+                self._disconnect()
+
+    def set_idle_timeout(self, idle_timeout: float | None) -> None:
+        """
+        Change how long the socket is kept open after a call if the
+        instrument is not persistent.
+
+        Args:
+            idle_timeout: Seconds to keep the socket open, or None to close
+                it after each call.
+        """
+        self._idle_timeout = idle_timeout
 
     def flush_connection(self) -> None:
-        self._recv()
+        """
+        Discard any data that has been received but not read. Waits up to
+        the timeout for data to arrive.
+        """
+        if self._socket is None or self._selector is None:
+            raise RuntimeError(f'IPInstrument {self.name} is not connected')
+        self._read_buffer.clear()
+        timeout: float = self._timeout
+        while self._selector.select(timeout):
+            data = self._socket.recv(self._buffer_size)
+            log.debug(f"Flushed {data!r} from instrument {self.name}")
+            if data == b'':
+                break
+            timeout = 0
 
     def _connect(self) -> None:
         if self._socket is not None:
@@ -119,6 +176,8 @@ class IPInstrument(Instrument):
             log.info(f"Connecting socket to {self._address}:{self._port}")
             self._socket.connect((self._address, self._port))
             self.set_timeout(self._timeout)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._socket, selectors.EVENT_READ)
         except ConnectionRefusedError:
             log.warning("Socket connection failed")
             if self._socket is not None:
@@ -129,13 +188,52 @@ class IPInstrument(Instrument):
     def _disconnect(self) -> None:
         if self._socket is None:
             return
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        self._read_buffer.clear()
         log.info("Socket shutdown")
-        self._socket.shutdown(socket.SHUT_RDWR)
+        # the socket may already have been disconnected by the instrument
+        with suppress(OSError):
+            self._socket.shutdown(socket.SHUT_RDWR)
         log.info("Socket closing")
         self._socket.close()
         log.info("Socket closed")
         self._socket = None
 
+    def _schedule_idle_disconnect(self) -> None:
+        assert self._idle_timeout is not None
+        self._last_used = time.monotonic()
+        if self._idle_timer is None:
+            self._start_idle_timer(self._idle_timeout)
+
+    def _start_idle_timer(self, delay: float) -> None:
+        self._idle_timer = threading.Timer(delay, self._disconnect_if_idle)
+        self._idle_timer.daemon = True
+        self._idle_timer.start()
+
+    def _disconnect_if_idle(self) -> None:
+        with self._socket_lock:
+            if self._idle_timer is not threading.current_thread():
+                # the timer has been cancelled
+                return
+            self._idle_timer = None
+            if self._persistent or self._idle_timeout is None:
+                return
+            remaining = self._last_used + self._idle_timeout - time.monotonic()
+            if remaining > 0:
+                self._start_idle_timer(remaining)
+            else:
+                log.info("Closing idle socket")
+                self._disconnect()
+
+    def _cancel_idle_timer(self) -> threading.Timer | None:
+        timer = self._idle_timer
+        self._idle_timer = None
+        if timer is not None:
+            timer.cancel()
+        return timer
+
     def set_timeout(self, timeout: float) -> None:
         """
         Change the read timeout for the socket.
@@ -165,19 +263,139 @@ class IPInstrument(Instrument):
         log.debug(f"Writing {data} to instrument {self.name}")
         self._socket.sendall(data.encode())
 
+    def set_read_terminator(self, read_terminator: str | None) -> None:
+        r"""
+        Change the terminator of responses.
+
+        Args:
+            read_terminator: Character(s) that terminate each response.
+                If None, a response is whatever a single read from the
+                socket returns.
+        """
+        self._read_terminator = read_terminator
+
     def _recv(self) -> str:
         if self._socket is None:
             raise RuntimeError(f'IPInstrument {self.name} is not connected')
-        result = self._socket.recv(self._buffer_size)
+        if self._read_terminator:
+            result = self._read_until(self._read_terminator.encode())
+        elif self._read_buffer:
+            # data received after a response that was read until a terminator
+            result = bytes(self._read_buffer)
+            self._read_buffer.clear()
+        else:
+            result = self._socket.recv(self._buffer_size)
+            if result == b'':
+                log.warning("Got empty response from Socket recv() "
+                            "Connection broken.")
         log.debug(f"Got {result!r} from instrument {self.name}")
-        if result == b'':
-            log.warning("Got empty response from Socket recv() "
-                        "Connection broken.")
         return result.decode()
 
+    def _read_until(self, terminator: bytes) -> bytes:
+        """
+        Read from the socket until the terminator has been received and
+        return the data before the terminator. Data received after the
+        terminator is kept for the next read.
+        """
+        assert self._socket is not None and self._selector is not None
+        buffer = self._read_buffer
+        n_read = len(buffer)
+        end = buffer.find(terminator)
+        deadline = time.monotonic() + self._timeout
+        view = memoryview(buffer)
+        try:
+            while end < 0:
+                if n_read == len(buffer):
+                    # the buffer cannot be resized while it is viewed
+                    view.release()
+                    buffer.extend(bytes(max(n_read, self._buffer_size)))
+                    view = memoryview(buffer)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._selector.select(remaining):
+                    raise socket.timeout(
+                        f"Timed out waiting for a response from {self.name}"
+                    )
+                n_received = self._socket.recv_into(view[n_read:])
+                if n_received == 0:
+                    raise ConnectionResetError(
+                        f"Connection to {self.name} was closed by the instrument"
+                    )
+                # the terminator may be split between two reads
+                end = buffer.find(
+                    terminator,
+                    max(0, n_read - len(terminator) + 1),
+                    n_read + n_received,
+                )
+                n_read += n_received
+        finally:
+            view.release()
+            del buffer[n_read:]
+        result = bytes(buffer[:end])
+        del buffer[: end + len(terminator)]
+        return result
+
+    def _read_into(self, buffer: memoryview) -> None:
+        """
+        Fill the buffer with data from the socket, starting with any data
+        that has been received after the last response.
+        """
+        assert self._socket is not None and self._selector is not None
+        n_buffered = min(len(buffer), len(self._read_buffer))
+        buffer[:n_buffered] = self._read_buffer[:n_buffered]
+        del self._read_buffer[:n_buffered]
+        n_read = n_buffered
+        deadline = time.monotonic() + self._timeout
+        while n_read < len(buffer):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                raise socket.timeout(
+                    f"Timed out waiting for a response from {self.name}"
+                )
+            n_received = self._socket.recv_into(buffer[n_read:])
+            if n_received == 0:
+                raise ConnectionResetError(
+                    f"Connection to {self.name} was closed by the instrument"
+                )
+            n_read += n_received
+
+    def _read_exactly(self, n_bytes: int) -> bytes:
+        data = bytearray(n_bytes)
+        self._read_into(memoryview(data))
+        return bytes(data)
+
+    def _send_recv(self, cmd: str, read_response: bool, is_query: bool) -> str:
+        """
+        Send a command and optionally read the response. If the connection
+        turns out to be broken, reconnect and try again once. A command
+        whose response could not be read is only sent again if it is a
+        query, since the instrument may already have executed it.
+        """
+        try:
+            self._send(cmd)
+        except ConnectionError:
+            log.warning(f"Connection to {self.name} was lost, reconnecting")
+            self._connect()
+            self._send(cmd)
+        if not read_response:
+            return ""
+        try:
+            return self._recv()
+        except ConnectionError:
+            if not is_query:
+                self._disconnect()
+                raise
+            log.warning(f"Connection to {self.name} was lost, reconnecting")
+            self._connect()
+            self._send(cmd)
+            return self._recv()
+
     def close(self) -> None:
         """Disconnect and irreversibly tear down the instrument."""
-        self._disconnect()
+        with self._socket_lock:
+            timer = self._cancel_idle_timer()
+            self._disconnect()
+        if timer is not None:
+            timer.join()
         super().close()
 
     def write_raw(self, cmd: str) -> None:
@@ -189,9 +407,7 @@ class IPInstrument(Instrument):
         """
 
         with self._ensure_connection:
-            self._send(cmd)
-            if self._confirmation:
-                self._recv()
+            self._send_recv(cmd, read_response=self._confirmation, is_query=False)
 
     def ask_raw(self, cmd: str) -> str:
         """
@@ -203,9 +419,51 @@ class IPInstrument(Instrument):
         Returns:
             The instrument's string response.
         """
+        with self._ensure_connection:
+            return self._send_recv(cmd, read_response=True, is_query=True)
+
+    def ask_binary_block(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = "f4",
+        byte_order: ByteOrder = "<",
+        expect_termination: bool = True,
+    ) -> np.ndarray:
+        """
+        Query the instrument for an IEEE 488.2 definite length arbitrary
+        block, i.e. a response of the form ``#<n><length><data>``, and
+        return the data as an array.
+
+        This is considerably faster than transferring large traces as
+        ASCII. The data is received directly into a preallocated array.
+
+        Args:
+            cmd: The query to send to the instrument.
+            dtype: The data type of the elements of the block.
+            byte_order: The byte order of the elements of the block,
+                ``"<"`` for little endian and ``">"`` for big endian.
+            expect_termination: Whether a terminator is sent after the
+                block, in which case it is read and discarded. This is the
+                read terminator if set, else the write terminator.
+
+        Returns:
+            The elements of the block in native byte order.
+        """
         with self._ensure_connection:
             self._send(cmd)
-            return self._recv()
+            data = read_binary_block(
+                self._read_exactly, self._read_into, dtype, byte_order
+            )
+            terminator = self._read_terminator or self._terminator
+            if expect_termination and terminator:
+                trailing = self._read_until(terminator.encode())
+                if trailing:
+                    log.warning(
+                        f"Discarding {trailing!r} received after a binary "
+                        f"block from instrument {self.name}"
+                    )
+        log.debug(f"Got binary block of {data.nbytes} bytes from {self.name}")
+        return data
 
     def snapshot_base(
         self,
@@ -244,6 +502,8 @@ class IPInstrument(Instrument):
         snap['terminator'] = self._terminator
         snap['timeout'] = self._timeout
         snap['persistent'] = self._persistent
+        snap['read_terminator'] = self._read_terminator
+        snap['idle_timeout'] = self._idle_timeout
 
         return snap
 
@@ -253,8 +513,9 @@ class EnsureConnection:
     """
     Context manager to ensure an instrument is connected when needed.
 
-    Uses ``instrument._persistent`` to determine whether or not to close
-    the connection immediately on completion.
+    Uses ``instrument._persistent`` and ``instrument._idle_timeout`` to
+    determine whether to close the connection immediately on completion,
+    after it has been idle for a while, or not at all.
 
     Args:
         instrument: the instance to connect.
@@ -265,8 +526,13 @@ class EnsureConnection:
 
     def __enter__(self) -> None:
         """Make sure we connect when entering the context."""
-        if not self.instrument._persistent or self.instrument._socket is None:
-            self.instrument._connect()
+        self.instrument._socket_lock.acquire()
+        try:
+            if self.instrument._socket is None:
+                self.instrument._connect()
+        except BaseException:
+            self.instrument._socket_lock.release()
+            raise
 
     def __exit__(
         self,
@@ -275,5 +541,11 @@ class EnsureConnection:
         traceback: TracebackType | None,
     ) -> None:
         """Possibly disconnect on exiting the context."""
-        if not self.instrument._persistent:
-            self.instrument._disconnect()
+        try:
+            if not self.instrument._persistent:
+                if self.instrument._idle_timeout is None or exc_type is not None:
+                    self.instrument._disconnect()
+                else:
+                    self.instrument._schedule_idle_disconnect()
+        finally:
+            self.instrument._socket_lock.release()
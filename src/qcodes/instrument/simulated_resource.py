@@ -0,0 +1,335 @@
+"""
+An in-process simulation of a message based VISA resource. In contrast to
+the pyvisa-sim yaml simulations, which match every command against regular
+expressions and transfer responses byte by byte, commands are dispatched
+with a single dictionary lookup, which makes the simulation fast enough to
+load test QCoDeS at realistic data rates.
+"""
+from __future__ import annotations
+
+import random
+import time
+from typing import TYPE_CHECKING, Any, Callable, Literal
+
+import numpy as np
+from pyvisa.constants import StatusCode
+from pyvisa.errors import VisaIOError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+QueryHandler = Callable[[str], "str | bytes"]
+CommandHandler = Callable[[str], None]
+
+
+class SimulatedResource:
+    """
+    An in-process simulation of a message based VISA resource that can be
+    used in place of a ``pyvisa`` resource by :class:`.VisaInstrument`
+    by passing it as ``visalib``:
+
+    .. code-block:: python
+
+        resource = SimulatedResource(latency=1e-4)
+        resource.add_property("VOLT", 0.0)
+        instr = VisaInstrument(
+            "instr", "SIM::INSTR", visalib=resource, terminator="\\n"
+        )
+
+    A command is split into a header and arguments at the first space. A
+    header that ends with ``?`` is a query, the response of which is read
+    by the next read. Headers are matched case insensitively.
+
+    Args:
+        resource_name: The resource name reported by the resource.
+        latency: Seconds from a query until its response can be read.
+        jitter: Upper bound of a uniformly distributed random delay in
+            seconds that is added to the latency.
+        failure_rate: Probability that a read fails with a VISA timeout
+            error.
+        seed: Seed of the random number generator used for the jitter,
+            the failures and the generated traces.
+    """
+
+    def __init__(
+        self,
+        resource_name: str = "SIM::INSTR",
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.resource_name = resource_name
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.rng = np.random.default_rng(seed)
+        self._random = random.Random(seed)
+
+        self.read_termination: str | None = None
+        self.write_termination: str | None = None
+        self.timeout: float = 2000.0
+        self.session: int | None = 1
+        self.last_status = StatusCode.success
+
+        self.properties: dict[str, Any] = {}
+        """The current values of the properties of the resource."""
+        self._queries: dict[str, QueryHandler] = {}
+        self._commands: dict[str, CommandHandler] = {}
+        self._injected_failures: list[Exception] = []
+        # the unread part of the current response and when it can be read
+        self._output = b""
+        self._output_ready_at = 0.0
+
+        self.n_writes = 0
+        self.n_reads = 0
+
+        self.add_query("*IDN?", lambda _: "QCoDeS,SimulatedResource,1,1.0")
+        self.add_command("*RST", lambda _: None)
+        self.add_command("*CLS", lambda _: None)
+        self.add_query("*OPC?", lambda _: "1")
+
+    # methods to describe the simulated instrument
+
+    def add_query(self, header: str, handler: QueryHandler) -> None:
+        """
+        Add a query. The handler is called with the arguments of the query
+        and returns the response, which is either a string that is followed
+        by the read termination or bytes that are sent as given.
+
+        Args:
+            header: The header of the query, including the ``?``.
+            handler: Function from the arguments to the response.
+        """
+        self._queries[header.upper()] = handler
+
+    def add_command(self, header: str, handler: CommandHandler) -> None:
+        """
+        Add a command that does not give a response.
+
+        Args:
+            header: The header of the command.
+            handler: Function that is called with the arguments of the
+                command.
+        """
+        self._commands[header.upper()] = handler
+
+    def add_property(
+        self,
+        header: str,
+        initial_value: Any,
+        parser: Callable[[str], Any] = float,
+        formatter: Callable[[Any], str] = str,
+        vals: Sequence[Any] | None = None,
+    ) -> None:
+        """
+        Add a property that is set with ``<header> <value>`` and queried
+        with ``<header>?``. The current value is available as
+        ``resource.properties[header]``.
+
+        Args:
+            header: The header of the property.
+            initial_value: The value of the property before it is set.
+            parser: Function that converts the argument of the set command
+                to a value.
+            formatter: Function that converts the value to the response.
+            vals: If given, the allowed values of the property. Setting
+                another value is ignored as by most instruments.
+        """
+        self.properties[header] = initial_value
+
+        def set_value(argument: str) -> None:
+            value = parser(argument)
+            if vals is None or value in vals:
+                self.properties[header] = value
+
+        self.add_query(f"{header}?", lambda _: formatter(self.properties[header]))
+        self.add_command(header, set_value)
+
+    def add_trace(
+        self,
+        header: str,
+        generator: Callable[[np.random.Generator], np.ndarray],
+        byte_order: Literal["<", ">"] = "<",
+    ) -> None:
+        """
+        Add a query that is answered with a trace as an IEEE 488.2 definite
+        length binary block.
+
+        Args:
+            header: The header of the query, including the ``?``.
+            generator: Function that is called with the random number
+                generator of the resource and returns the trace.
+            byte_order: The byte order of the elements of the block.
+        """
+
+        def trace(_: str) -> bytes:
+            data = generator(self.rng)
+            data = data.astype(data.dtype.newbyteorder(byte_order), copy=False)
+            length = str(data.nbytes)
+            block = b"#%d%s%s" % (len(length), length.encode(), data.tobytes())
+            return block + (self.read_termination or "").encode()
+
+        self.add_query(header, trace)
+
+    def inject_failure(self, error: Exception | None = None, count: int = 1) -> None:
+        """
+        Make the next ``count`` reads or writes fail.
+
+        Args:
+            error: The error to raise. Defaults to a VISA timeout error.
+            count: The number of operations that fail.
+        """
+        if error is None:
+            error = VisaIOError(StatusCode.error_timeout)
+        self._injected_failures.extend([error] * count)
+
+    # the subset of the interface of pyvisa.resources.MessageBasedResource
+    # that is used by QCoDeS
+
+    def write(
+        self,
+        message: str,
+        termination: str | None = None,
+        encoding: str | None = None,
+    ) -> int:
+        self._check_open()
+        self._raise_injected_failure()
+        self.n_writes += 1
+        header, _, argument = message.partition(" ")
+        key = header.upper()
+        query = self._queries.get(key)
+        if query is not None:
+            response = query(argument)
+            if isinstance(response, str):
+                response = (response + (self.read_termination or "")).encode()
+            self._output = response
+            self._output_ready_at = time.perf_counter() + self._delay()
+        else:
+            command = self._commands.get(key)
+            if command is None:
+                raise ValueError(
+                    f"{self.resource_name} does not understand {message!r}"
+                )
+            command(argument)
+        return len(message) + len(self.write_termination or "")
+
+    def write_raw(self, message: bytes) -> int:
+        termination = (self.write_termination or "").encode()
+        if termination and message.endswith(termination):
+            message = message[: -len(termination)]
+        return self.write(message.decode())
+
+    def read_bytes(
+        self,
+        count: int,
+        chunk_size: int | None = None,
+        break_on_termchar: bool = False,
+    ) -> bytes:
+        self._start_read()
+        data = self._output[:count]
+        if break_on_termchar and self.read_termination:
+            end = data.find(self.read_termination[-1].encode())
+            if end >= 0:
+                data = data[: end + 1]
+        self._output = self._output[len(data) :]
+        if len(data) < count and not self._output and not break_on_termchar:
+            raise VisaIOError(StatusCode.error_timeout)
+        self._set_status(data)
+        return data
+
+    def read_raw(self, size: int | None = None) -> bytes:
+        self._start_read()
+        data = self._output
+        if self.read_termination:
+            end = data.find(self.read_termination[-1].encode())
+            if end >= 0:
+                data = data[: end + 1]
+        self._output = self._output[len(data) :]
+        self._set_status(data)
+        return data
+
+    def read(self, termination: str | None = None, encoding: str | None = None) -> str:
+        termination = self.read_termination if termination is None else termination
+        message = self.read_raw().decode()
+        if termination and message.endswith(termination):
+            message = message[: -len(termination)]
+        return message
+
+    def query(self, message: str, delay: float | None = None) -> str:
+        self.write(message)
+        if delay:
+            time.sleep(delay)
+        return self.read()
+
+    def clear(self) -> None:
+        self._output = b""
+
+    def close(self) -> None:
+        self.session = None
+
+    def set_visa_attribute(self, name: Any, state: Any) -> StatusCode:
+        return StatusCode.success
+
+    def get_visa_attribute(self, name: Any) -> Any:
+        return None
+
+    # resource manager interface used by VisaInstrument
+
+    def open_resource(self, resource_name: str) -> SimulatedResource:
+        self.resource_name = resource_name
+        self.session = 1
+        return self
+
+    def list_opened_resources(self) -> list[SimulatedResource]:
+        return [] if self.session is None else [self]
+
+    def _check_open(self) -> None:
+        if self.session is None:
+            raise VisaIOError(StatusCode.error_invalid_object)
+
+    def _raise_injected_failure(self) -> None:
+        if self._injected_failures:
+            raise self._injected_failures.pop(0)
+
+    def _delay(self) -> float:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        return delay
+
+    def _start_read(self) -> None:
+        self._check_open()
+        self._raise_injected_failure()
+        self.n_reads += 1
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            self._output = b""
+            raise VisaIOError(StatusCode.error_timeout)
+        if not self._output:
+            raise VisaIOError(StatusCode.error_timeout)
+        _wait_until(self._output_ready_at)
+
+    def _set_status(self, data: bytes) -> None:
+        if not self._output:
+            self.last_status = StatusCode.success
+        elif self.read_termination and data.endswith(
+            self.read_termination[-1].encode()
+        ):
+            self.last_status = StatusCode.success_termination_character_read
+        else:
+            self.last_status = StatusCode.success_max_count_read
+
+
+def _wait_until(deadline: float) -> None:
+    """
+    Wait until the ``perf_counter`` deadline. Sleeping is only accurate to
+    about a millisecond, so the last part of the wait is spent spinning.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining <= 0:
+        return
+    if remaining > 2e-3:
+        time.sleep(remaining - 1e-3)
+    while time.perf_counter() < deadline:
+        pass
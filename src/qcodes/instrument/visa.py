@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import warnings
 from importlib.resources import as_file, files
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 from weakref import finalize
 
 import pyvisa
@@ -16,12 +16,19 @@ import qcodes.validators as vals
 from qcodes.logger import get_instrument_logger
 from qcodes.utils import DelayedKeyboardInterrupt
 
+from ._binary_block import read_binary_block
 from .instrument import Instrument
 from .instrument_base import InstrumentBase
+from .simulated_resource import SimulatedResource
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy as np
+    import numpy.typing as npt
+
+    from ._binary_block import ByteOrder
+
 VISA_LOGGER = '.'.join((InstrumentBase.__module__, 'com', 'visa'))
 
 log = logging.getLogger(__name__)
@@ -66,6 +73,8 @@ class VisaInstrument(Instrument):
             ``pyvisa-py`` backend. Note that QCoDeS does not install (or even require)
             ANY backends, it is up to the user to do that. see eg:
             http://pyvisa.readthedocs.org/en/stable/names.html
+            Alternatively a :class:`.SimulatedResource` that is used as the
+            resource of the instrument.
         metadata: additional static metadata to add to this
             instrument's JSON snapshot.
         pyvisa_sim_file: Name of a pyvisa-sim yaml file used to simulate the instrument.
@@ -88,7 +97,7 @@ class VisaInstrument(Instrument):
         timeout: float = 5,
         terminator: str | None = None,
         device_clear: bool = True,
-        visalib: str | None = None,
+        visalib: str | SimulatedResource | None = None,
         pyvisa_sim_file: str | None = None,
         **kwargs: Any,
     ):
@@ -143,7 +152,7 @@ class VisaInstrument(Instrument):
         """
         The VISA resource manager used by this instrument.
         """
-        self.visalib: str | None = visalib
+        self.visalib: str | SimulatedResource | None = visalib
         self._address = address
 
         if device_clear:
@@ -153,7 +162,7 @@ class VisaInstrument(Instrument):
         self.timeout.set(timeout)
 
     def _connect_and_handle_error(
-        self, address: str, visalib: str | None
+        self, address: str, visalib: str | SimulatedResource | None
     ) -> tuple[pyvisa.resources.MessageBasedResource, str, pyvisa.ResourceManager]:
         try:
             visa_handle, visabackend, resource_manager = self._open_resource(
@@ -166,14 +175,24 @@ class VisaInstrument(Instrument):
         return visa_handle, visabackend, resource_manager
 
     def _open_resource(
-        self, address: str, visalib: str | None
+        self, address: str, visalib: str | SimulatedResource | None
     ) -> tuple[pyvisa.resources.MessageBasedResource, str, pyvisa.ResourceManager]:
 
         # in case we're changing the address - close the old handle first
         if getattr(self, "visa_handle", None):
             self.visa_handle.close()
 
-        if visalib is not None:
+        if isinstance(visalib, SimulatedResource):
+            self.visa_log.info("Opening simulated resource")
+            # the simulated resource implements the parts of the interface of
+            # both the resource and the resource manager that are used here
+            simulated_resource = visalib.open_resource(address)
+            return (
+                cast(pyvisa.resources.MessageBasedResource, simulated_resource),
+                "qcodes_sim",
+                cast(pyvisa.ResourceManager, visalib),
+            )
+        elif visalib is not None:
             self.visa_log.info(
                 f"Opening PyVISA Resource Manager with visalib: {visalib}"
             )
@@ -310,7 +329,7 @@ class VisaInstrument(Instrument):
         Args:
             cmd: The command to send to the instrument.
         """
-        with DelayedKeyboardInterrupt():
+        with self._async_io_lock, DelayedKeyboardInterrupt():
             self.visa_log.debug(f"Writing: {cmd}")
             self.visa_handle.write(cmd)
 
@@ -324,12 +343,64 @@ class VisaInstrument(Instrument):
         Returns:
             str: The instrument's response.
         """
-        with DelayedKeyboardInterrupt():
+        with self._async_io_lock, DelayedKeyboardInterrupt():
             self.visa_log.debug(f"Querying: {cmd}")
             response = self.visa_handle.query(cmd)
             self.visa_log.debug(f"Response: {response}")
         return response
 
+    def ask_binary_block(
+        self,
+        cmd: str,
+        dtype: npt.DTypeLike = "f4",
+        byte_order: ByteOrder = "<",
+        expect_termination: bool = True,
+    ) -> np.ndarray:
+        """
+        Query the instrument for an IEEE 488.2 definite length arbitrary
+        block, i.e. a response of the form ``#<n><length><data>``, and
+        return the data as an array.
+
+        This is considerably faster than transferring large traces as
+        ASCII. The data is read into a preallocated array without
+        intermediate conversions.
+
+        Args:
+            cmd: The query to send to the instrument.
+            dtype: The data type of the elements of the block.
+            byte_order: The byte order of the elements of the block,
+                ``"<"`` for little endian and ``">"`` for big endian.
+            expect_termination: Whether a terminator may be sent after the
+                block, in which case the rest of the message is read and
+                discarded.
+
+        Returns:
+            The elements of the block in native byte order.
+        """
+
+        def read_into(buffer: memoryview) -> None:
+            buffer[:] = self.visa_handle.read_bytes(len(buffer))
+
+        with self._async_io_lock, DelayedKeyboardInterrupt():
+            self.visa_log.debug(f"Querying binary block: {cmd}")
+            self.visa_handle.write(cmd)
+            data = read_binary_block(
+                self.visa_handle.read_bytes, read_into, dtype, byte_order
+            )
+            if (
+                expect_termination
+                and self.visa_handle.last_status != vi_const.StatusCode.success
+            ):
+                # the end of the message has not been read yet, discard the
+                # terminator that follows the block
+                trailing = self.visa_handle.read_raw()
+                if trailing.strip():
+                    self.visa_log.warning(
+                        f"Discarding {trailing!r} received after binary block"
+                    )
+            self.visa_log.debug(f"Response: binary block of {data.nbytes} bytes")
+        return data
+
     def snapshot_base(
         self,
         update: bool | None = True,
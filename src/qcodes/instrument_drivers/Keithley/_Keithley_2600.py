@@ -667,6 +667,32 @@ class Keithley2600Channel(InstrumentChannel):
                 'VIfourprobe' (current sweep four probe setup)
         """
 
+        return self._execute_lua(
+            self._sweep_script(start, stop, steps, mode), steps
+        )
+
+    def _sweep_script(
+        self,
+        start: float,
+        stop: float,
+        steps: int,
+        mode: Literal["IV", "VI", "VIfourprobe"],
+        delay: float = 0,
+    ) -> list[str]:
+        """
+        Form the Lua script of a fast sweep that prints the measured buffer.
+
+        Args:
+            start: starting voltage
+            stop: end voltage
+            steps: number of steps
+            mode: Type of sweep, either 'IV' (voltage sweep),
+                'VI' (current sweep two probe setup) or
+                'VIfourprobe' (current sweep four probe setup)
+            delay: Time in seconds to wait between setting the source and
+                measuring at each step.
+        """
+
         channel = self.channel
 
         # an extra visa query, a necessary precaution
@@ -674,7 +700,7 @@ class Keithley2600Channel(InstrumentChannel):
         # measurements
         nplc = self.nplc()
 
-        dV = (stop - start) / (steps - 1)
+        dV = (stop - start) / (steps - 1) if steps > 1 else 0
 
         if mode == "IV":
             meas = "i"
@@ -708,6 +734,7 @@ class Keithley2600Channel(InstrumentChannel):
             f"for index = 1, {steps} do",
             "  target = startX + (index-1)*dX",
             f"  {channel}.source.level{sour} = target",
+            *([f"  delay({delay:.12f})"] if delay > 0 else []),
             f"  {channel}.measure.{meas}({channel}.nvbuffer1)",
             "end",
             "format.data = format.REAL32",
@@ -715,7 +742,7 @@ class Keithley2600Channel(InstrumentChannel):
             f"printbuffer(1, {steps}, {channel}.nvbuffer1.readings)",
         ]
 
-        return self._execute_lua(script, steps)
+        return script
 
     def _execute_lua(self, _script: list[str], steps: int) -> np.ndarray:
         """
@@ -726,6 +753,16 @@ class Keithley2600Channel(InstrumentChannel):
             _script: The Lua script to be executed.
             steps: Number of points.
         """
+        self.write(self.root_instrument._scriptwrapper(program=_script, debug=True))
+        return self._read_lua_data(steps)
+
+    def _read_lua_data(self, steps: int) -> np.ndarray:
+        """
+        Read the data printed by a running Lua script from the buffer.
+
+        Args:
+            steps: Number of points.
+        """
         nplc = self.nplc()
         linefreq = self.linefreq()
         _time_trace_extra_visa_timeout = self._extra_visa_timeout
@@ -735,8 +772,6 @@ class Keithley2600Channel(InstrumentChannel):
             estimated_measurement_duration + _time_trace_extra_visa_timeout
         )
 
-        self.write(self.root_instrument._scriptwrapper(program=_script, debug=True))
-
         # now poll all the data
         # The problem is that a '\n' character might by chance be present in
         # the data
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+from qcodes.dataset.dond.sweeps import BufferedSweep
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from qcodes.parameters import Parameter, ParameterBase
+
+    from ._Keithley_2600 import Keithley2600Channel
+
+
+class Keithley2600BufferedSweep(BufferedSweep):
+    """
+    A linear sweep of the source of a Keithley 2600 channel that is run by
+    a Lua function on the instrument, for use as the last sweep of
+    :func:`.dond`. The function is defined on the instrument when the sweep
+    is armed, and each trigger calls it and reads the measured buffer, such
+    that a whole line is measured with a single command.
+
+    Args:
+        channel: The channel whose source is swept.
+        start: Sweep start value (V or A).
+        stop: Sweep end value (V or A).
+        num_points: Number of sweep points.
+        mode: Type of sweep, either 'IV' (voltage sweep measuring the
+            current), 'VI' (current sweep two probe setup measuring the
+            voltage) or 'VIfourprobe' (current sweep four probe setup
+            measuring the voltage).
+        delay: Time in seconds that the instrument waits between setting
+            the source and measuring at each point.
+    """
+
+    def __init__(
+        self,
+        channel: Keithley2600Channel,
+        start: float,
+        stop: float,
+        num_points: int,
+        mode: Literal["IV", "VI", "VIfourprobe"] = "IV",
+        delay: float = 0,
+    ):
+        if mode not in ["IV", "VI", "VIfourprobe"]:
+            raise ValueError('mode must be either "VI", "IV" or "VIfourprobe"')
+        self._channel = channel
+        self._start = start
+        self._stop = stop
+        self._num_points = num_points
+        self._mode = mode
+        self._delay = delay
+        if mode == "IV":
+            self._param: Parameter = channel.volt
+            self._measured: Parameter = channel.curr
+        else:
+            self._param = channel.curr
+            self._measured = channel.volt
+        self._function_name = f"qcodes_buffered_sweep_{channel.channel}"
+
+    def get_setpoints(self) -> np.ndarray:
+        return np.linspace(self._start, self._stop, self._num_points)
+
+    @property
+    def param(self) -> Parameter:
+        return self._param
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    @property
+    def num_points(self) -> int:
+        return self._num_points
+
+    @property
+    def measured_parameters(self) -> tuple[ParameterBase, ...]:
+        return (self._measured,)
+
+    def arm(self) -> None:
+        script = self._channel._sweep_script(
+            self._start, self._stop, self._num_points, self._mode, self._delay
+        )
+        self._channel.write(
+            self._channel.root_instrument._scriptwrapper(
+                program=[f"function {self._function_name}()", *script, "end"],
+                debug=True,
+            )
+        )
+
+    def trigger(self) -> Mapping[ParameterBase, np.ndarray]:
+        self._channel.write(f"{self._function_name}()")
+        return {self._measured: self._channel._read_lua_data(self._num_points)}
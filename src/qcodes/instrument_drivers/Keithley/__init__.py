@@ -1,4 +1,4 @@
-from typing import Union
+from typing import TYPE_CHECKING, Any, Union
 
 from ._Keithley_2600 import Keithley2600MeasurementStatus
 from .Keithley_2000 import Keithley2000
@@ -37,6 +37,9 @@ from .Keithley_s46 import (
     KeithleyS46RelayLock,
 )
 
+if TYPE_CHECKING:
+    from ._Keithley_2600_buffered_sweep import Keithley2600BufferedSweep
+
 Keithley26xx = Union[
     Keithley2601B,
     Keithley2602A,
@@ -60,6 +63,7 @@ __all__ = [
     "Keithley2450Buffer",
     "Keithley2450Sense",
     "Keithley2450Source",
+    "Keithley2600BufferedSweep",
     "Keithley2600MeasurementStatus",
     "Keithley26xx",
     "Keithley2601B",
@@ -85,3 +89,13 @@ __all__ = [
     "KeithleyS46LockAcquisitionError",
     "KeithleyS46RelayLock",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # the buffered sweep depends on the dataset layer which should not be
+    # imported together with the drivers, so it is only imported on access
+    if name == "Keithley2600BufferedSweep":
+        from ._Keithley_2600_buffered_sweep import Keithley2600BufferedSweep
+
+        return Keithley2600BufferedSweep
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
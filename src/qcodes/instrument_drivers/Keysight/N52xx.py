@@ -118,10 +118,9 @@ class FormattedSweep(ParameterWithSetpoints):
             prev_mode = self.instrument.run_sweep()
         # Ask for data, setting the format to the requested form
         self.instrument.format(self.sweep_format)
-        data = root_instr.visa_handle.query_binary_values('CALC:DATA? FDATA',
-                                                          datatype='f',
-                                                          is_big_endian=True)
-        data = np.array(data)
+        data = root_instr.ask_binary_block(
+            "CALC:DATA? FDATA", dtype=np.float32, byte_order=">"
+        ).astype(np.float64)
         # Restore previous state if it was changed
         if auto_sweep:
             root_instr.sweep_mode(prev_mode)
@@ -7,7 +7,15 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
-from qcodes.instrument import ChannelList, Instrument, InstrumentBase, InstrumentChannel
+from qcodes.dataset.dond.sweeps import BufferedSweep
+from qcodes.instrument import (
+    ChannelList,
+    Instrument,
+    InstrumentBase,
+    InstrumentChannel,
+    SimulatedResource,
+    VisaInstrument,
+)
 from qcodes.parameters import (
     ArrayParameter,
     MultiParameter,
@@ -15,11 +23,13 @@ from qcodes.parameters import (
     ParameterWithSetpoints,
     ParamRawDataType,
 )
-from qcodes.validators import Arrays, ComplexNumbers, Numbers, OnOff, Strings
+from qcodes.validators import Arrays, ComplexNumbers, Ints, Numbers, OnOff, Strings
 from qcodes.validators import Sequence as ValidatorSequence
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Callable, Generator, Mapping, Sequence
+
+    from qcodes.parameters import ParameterBase
 
 log = logging.getLogger(__name__)
 
@@ -1023,6 +1033,198 @@ class MockLockin(DummyBase):
                            get_cmd=None, set_cmd=None)
 
 
+class MockSimulatedScopeTrace(ParameterWithSetpoints):
+    """
+    The trace of a :class:`MockSimulatedScope`, transferred as a binary
+    block.
+    """
+
+    def get_raw(self) -> ParamRawDataType:
+        assert isinstance(self.root_instrument, MockSimulatedScope)
+        return self.root_instrument.ask_binary_block("TRAC?", dtype="<f4")
+
+
+class MockSimulatedScope(VisaInstrument):
+    """
+    A VISA instrument that communicates with an in-process
+    :class:`.SimulatedResource` rather than with hardware. Its latency,
+    jitter and failure rate can be programmed, which makes it useful for
+    benchmarking and stress testing the measurement stack.
+
+    Args:
+        name: The name of the instrument.
+        latency: Seconds from a query until its response can be read.
+        jitter: Upper bound of a random delay in seconds that is added to
+            the latency.
+        failure_rate: Probability that a read fails with a VISA timeout.
+        seed: Seed of the random numbers of the simulation.
+        **kwargs: Forwarded to the VisaInstrument base class.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int | None = None,
+        **kwargs: Any,
+    ):
+        resource = SimulatedResource(
+            latency=latency, jitter=jitter, failure_rate=failure_rate, seed=seed
+        )
+        resource.add_property("VOLT", 0.0)
+        resource.add_property("POIN", 1000, parser=int)
+
+        def generate_trace(rng: np.random.Generator) -> np.ndarray:
+            n_points = resource.properties["POIN"]
+            volt = resource.properties["VOLT"]
+            return (volt + rng.standard_normal(n_points)).astype("<f4")
+
+        resource.add_trace("TRAC?", generate_trace)
+        self.resource = resource
+
+        super().__init__(
+            name, "SIM::INSTR", visalib=resource, terminator="\n", **kwargs
+        )
+
+        self.add_parameter(
+            "voltage",
+            unit="V",
+            get_cmd="VOLT?",
+            set_cmd="VOLT {}",
+            get_parser=float,
+            vals=Numbers(-10, 10),
+        )
+        self.add_parameter(
+            "n_points",
+            get_cmd="POIN?",
+            set_cmd="POIN {}",
+            get_parser=int,
+            vals=Ints(1, 10**8),
+        )
+        self.add_parameter(
+            "time_axis",
+            unit="s",
+            get_cmd=lambda: np.arange(self.n_points.get_latest()) * 1e-6,
+            vals=Arrays(shape=(self.n_points.get_latest,)),
+        )
+        self.add_parameter(
+            "trace",
+            unit="V",
+            setpoints=(self.time_axis,),
+            parameter_class=MockSimulatedScopeTrace,
+            vals=Arrays(shape=(self.n_points.get_latest,)),
+        )
+
+    def get_idn(self) -> dict[str, str | None]:
+        return {
+            "vendor": "QCoDeS",
+            "model": str(self.__class__),
+            "serial": "NA",
+            "firmware": "NA",
+        }
+
+
+class MockBufferedSource(DummyBase):
+    """
+    A mock source that, like a source measure unit running a script, sweeps
+    its output over a buffer of setpoints by itself and records a signal at
+    each of them.
+
+    Args:
+        name: The name of the instrument.
+        response: Function of an array of outputs that returns the signal at
+            each of them. Defaults to the outputs themselves.
+        **kwargs: Forwarded to the Instrument base class.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        response: Callable[[np.ndarray], np.ndarray] | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__(name, **kwargs)
+        self._response = response if response is not None else np.array
+        self._buffer: np.ndarray | None = None
+        self.n_triggers = 0
+
+        self.add_parameter(
+            "output",
+            unit="V",
+            get_cmd=None,
+            set_cmd=None,
+            initial_value=0.0,
+            vals=Numbers(),
+        )
+        self.add_parameter(
+            "signal",
+            unit="A",
+            get_cmd=lambda: float(self._response(np.array([self.output()]))[0]),
+        )
+
+    def arm(self, outputs: Sequence[float] | np.ndarray) -> None:
+        """Load the buffer of outputs to sweep over."""
+        self._buffer = np.array(outputs, dtype=float)
+
+    def trigger(self) -> np.ndarray:
+        """Sweep over the buffer and return the signal at each output."""
+        if self._buffer is None:
+            raise RuntimeError("The buffered source has not been armed.")
+        self.n_triggers += 1
+        signal = np.asarray(self._response(self._buffer), dtype=float)
+        # the output remains at the last point of the sweep
+        self.output.cache.set(self._buffer[-1])
+        return signal
+
+
+class MockBufferedSweep(BufferedSweep):
+    """
+    A linear sweep of the output of a :class:`MockBufferedSource` that is
+    run by the source from its buffer, measuring its signal.
+
+    Args:
+        source: The source to sweep.
+        start: Sweep start value.
+        stop: Sweep end value.
+        num_points: Number of sweep points.
+    """
+
+    def __init__(
+        self, source: MockBufferedSource, start: float, stop: float, num_points: int
+    ):
+        self._source = source
+        self._start = start
+        self._stop = stop
+        self._num_points = num_points
+
+    def get_setpoints(self) -> np.ndarray:
+        return np.linspace(self._start, self._stop, self._num_points)
+
+    @property
+    def param(self) -> Parameter:
+        return self._source.output
+
+    @property
+    def delay(self) -> float:
+        return 0
+
+    @property
+    def num_points(self) -> int:
+        return self._num_points
+
+    @property
+    def measured_parameters(self) -> tuple[ParameterBase, ...]:
+        return (self._source.signal,)
+
+    def arm(self) -> None:
+        self._source.arm(self.get_setpoints())
+
+    def trigger(self) -> Mapping[ParameterBase, np.ndarray]:
+        return {self._source.signal: self._source.trigger()}
+
+
 class MockDACChannel(InstrumentChannel):
     """
     A single dummy channel implementation
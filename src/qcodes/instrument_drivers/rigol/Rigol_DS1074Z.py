@@ -54,10 +54,9 @@ class RigolDS1074ZChannel(InstrumentChannel):
         self.root_instrument.data_source(f"ch{self.channel}")
 
         # Obtain the trace
-        raw_trace_val = self.root_instrument.visa_handle.query_binary_values(
-            "WAV:DATA?", datatype="h", is_big_endian=False, expect_termination=False
+        return self.root_instrument.ask_binary_block(
+            "WAV:DATA?", dtype=np.int16, byte_order="<", expect_termination=False
         )
-        return np.array(raw_trace_val)
 
 
 class RigolDS1074Z(VisaInstrument):
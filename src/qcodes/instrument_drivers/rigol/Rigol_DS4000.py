@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import re
 import time
 import warnings
 from collections import namedtuple
@@ -82,7 +81,7 @@ class ScopeArray(ArrayParameter):
         # Set read channel
         self.instrument.write(f":WAVeform:SOURce CHAN{self.channel}")
 
-        data_bin = bytearray()
+        data_chunks: list[np.ndarray] = []
         if self.raw:
             log.info("Readout of raw waveform started, %g points", self.shape[0])
             # Ask for the right number of points
@@ -95,13 +94,11 @@ class ScopeArray(ArrayParameter):
             for i in range(self.max_read_step):
                 status = self.instrument.ask(":WAVeform:STATus?").split(",")[0]
 
-                # Ask and retrieve waveform data
-                # It uses .read_raw() to get a byte
-                # string since our data is binary
-                self.instrument.write(":WAVeform:DATA?")
-                data_chunk = self.root_instrument.visa_handle.read_raw()
-                data_chuck = self._validate_strip_block(data_chunk)
-                data_bin.extend(data_chuck)
+                # Ask and retrieve waveform data as a binary block
+                data_chunk = self.root_instrument.ask_binary_block(
+                    ":WAVeform:DATA?", dtype=np.uint8
+                )
+                data_chunks.append(data_chunk)
 
                 if status == "IDLE":
                     self.instrument.write(":WAVeform:END")
@@ -112,24 +109,25 @@ class ScopeArray(ArrayParameter):
                 log.info(
                     "chucks read: %d, last chuck points: %g, total read size: %g",
                     i,
-                    len(data_chuck),
-                    len(data_bin),
+                    len(data_chunk),
+                    sum(len(chunk) for chunk in data_chunks),
                 )
             else:
                 raise ValueError("Communication error")
         else:
-            # Ask and retrieve waveform data
-            # It uses .read_raw() to get a byte string since our data is binary
+            # Ask and retrieve waveform data as a binary block
             log.info("Readout of display waveform started, %d points", self.shape[0])
-            self.instrument.write(":WAVeform:DATA?")  # Query data
-            data_chunk = self.root_instrument.visa_handle.read_raw()
-            data_bin.extend(self._validate_strip_block(data_chunk))
+            data_chunks.append(
+                self.root_instrument.ask_binary_block(
+                    ":WAVeform:DATA?", dtype=np.uint8
+                )
+            )
 
-        log.info("Readout ended, total read size: %g", len(data_bin))
+        data_bytes = np.concatenate(data_chunks)
+        log.info("Readout ended, total read size: %g", len(data_bytes))
 
         log.info("Data conversion")
-        # Convert data to byte array
-        data_raw = np.frombuffer(data_bin, dtype=np.uint8).astype(float)
+        data_raw = data_bytes.astype(float)
 
         # Convert byte array to real data
         p = self.preamble
@@ -138,31 +136,6 @@ class ScopeArray(ArrayParameter):
 
         return data
 
-    @staticmethod
-    def _validate_strip_block(block: bytes) -> bytes:
-        """
-        Given a block of raw data from the instrument, validate and
-        then strip the header with
-        size information. Raise ValueError if the sizes don't match.
-
-        Args:
-            block: The data block
-        Returns:
-            The stripped data
-        """
-        # Validate header
-        header = block[:11].decode("ascii")
-        match = re.match(r"#9(\d{9})", header)
-        if match:
-            size = int(match[1])
-            block_nh = block[11:]  # Strip header
-            block_nh = block_nh.strip()  # Strip \n
-
-            if size == len(block_nh):
-                return block_nh
-
-        raise ValueError("Malformed data")
-
     def get_preamble(self) -> None:
         assert isinstance(self.instrument, RigolDS4000Channel)
         preamble_nt = namedtuple(
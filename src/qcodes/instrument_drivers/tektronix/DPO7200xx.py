@@ -336,11 +336,10 @@ class TektronixDPOWaveform(InstrumentChannel):
 
             is_big_endian = waveform.is_big_endian()
 
-            raw_data = self.root_instrument.visa_handle.query_binary_values(
+            raw_data = self.root_instrument.ask_binary_block(
                 "CURVE?",
-                datatype=data_type,
-                is_big_endian=is_big_endian,
-                container=np.array
+                dtype=data_type,
+                byte_order=">" if is_big_endian else "<",
             )
 
         return (raw_data - self.raw_data_offset()) * self.scale() \
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
@@ -78,6 +79,12 @@ class _Cache:
         self._parameter = parameter
         self._value: ParamDataType = None
         self._raw_value: ParamRawDataType = None
+        # the time of the last update is stored as a value of the monotonic
+        # clock, which is used to check the age of the value, and as seconds
+        # since the epoch. Both are cheap to read, the datetime in
+        # ``_timestamp`` is only created once it has been requested.
+        self._monotonic_timestamp: float | None = None
+        self._wall_clock_timestamp: float | None = None
         self._timestamp: datetime | None = None
         self._max_val_age = max_val_age
         self._marked_valid: bool = False
@@ -95,6 +102,8 @@ class _Cache:
         If ``None``, the cache hasn't been updated yet and shall be seen as
         "invalid".
         """
+        if self._timestamp is None and self._wall_clock_timestamp is not None:
+            self._timestamp = datetime.fromtimestamp(self._wall_clock_timestamp)
         return self._timestamp
 
     @property
@@ -170,22 +179,26 @@ class _Cache:
         self._value = value
         self._raw_value = raw_value
         if timestamp is None:
-            self._timestamp = datetime.now()
+            self._monotonic_timestamp = time.monotonic()
+            self._wall_clock_timestamp = time.time()
+            # the datetime is only created if requested
+            self._timestamp = None
         else:
+            self._wall_clock_timestamp = timestamp.timestamp()
+            self._monotonic_timestamp = time.monotonic() - (
+                time.time() - self._wall_clock_timestamp
+            )
             self._timestamp = timestamp
         self._marked_valid = True
 
     def _timestamp_expired(self) -> bool:
-        if self._timestamp is None:
+        if self._monotonic_timestamp is None:
             # parameter has never been captured
             return True
         if self._max_val_age is None:
             # parameter cannot expire
             return False
-        oldest_accepted_timestamp = datetime.now() - timedelta(
-            seconds=self._max_val_age
-        )
-        if self._timestamp < oldest_accepted_timestamp:
+        if time.monotonic() - self._monotonic_timestamp > self._max_val_age:
             # Time of last get exceeds max_val_age seconds, need to
             # perform new .get()
             return True
@@ -224,7 +237,7 @@ class _Cache:
             return self._value
 
     def _construct_error_msg(self) -> str:
-        if self._timestamp is None:
+        if self._monotonic_timestamp is None:
             error_msg = (
                 f"Value of parameter "
                 f"{self._parameter.full_name} "
@@ -244,6 +244,22 @@ class DelegateParameter(Parameter):
             )
         self.source(value)
 
+    async def get_raw_async(self) -> Any:
+        if self.source is None:
+            raise TypeError(
+                "Cannot get the value of a DelegateParameter "
+                "that delegates to a None source."
+            )
+        return await self.source.get_async()
+
+    async def set_raw_async(self, value: Any) -> None:
+        if self.source is None:
+            raise TypeError(
+                "Cannot set the value of a DelegateParameter "
+                "that delegates to a None source."
+            )
+        await self.source.set_async(value)
+
     def snapshot_base(
         self,
         update: bool | None = True,
@@ -6,13 +6,15 @@ from __future__ import annotations
 import logging
 import os
 from types import MethodType
-from typing import TYPE_CHECKING, Any, Callable, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 from .command import Command
 from .parameter_base import ParamDataType, ParameterBase, ParamRawDataType
 from .sweep_values import SweepFixedValues
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Coroutine
+
     from qcodes.instrument.base import InstrumentBase
     from qcodes.logger.instrument_logger import InstrumentLoggerAdapter
     from qcodes.validators import Validator
@@ -210,6 +212,33 @@ class Parameter(ParameterBase):
             self.cache._set_from_raw_value(x)
             return x
 
+        # manual parameters do not block, so there is no need to run them in
+        # an executor
+        async def _get_manual_parameter_async(self: Parameter) -> ParamRawDataType:
+            return self.get_raw()
+
+        async def _set_manual_parameter_async(
+            self: Parameter, x: ParamRawDataType
+        ) -> None:
+            self.set_raw(x)
+
+        def _ask_async_factory(
+            ask_async: Callable[[str], Awaitable[str]], cmd: str
+        ) -> Callable[[], Coroutine[Any, Any, ParamRawDataType]]:
+            async def _ask_async() -> ParamRawDataType:
+                # format the command as ``Command`` does for the sync get
+                return await ask_async(cmd.format())
+
+            return _ask_async
+
+        def _write_async_factory(
+            write_async: Callable[[str], Awaitable[None]], cmd: str
+        ) -> Callable[[ParamRawDataType], Coroutine[Any, Any, None]]:
+            async def _write_async(x: ParamRawDataType) -> None:
+                await write_async(cmd.format(x))
+
+            return _write_async
+
         if instrument is not None and bind_to_instrument:
             existing_parameter = instrument.parameters.get(name, None)
 
@@ -269,6 +298,7 @@ class Parameter(ParameterBase):
             if get_cmd is None:
                 # ignore typeerror since mypy does not allow setting a method dynamically
                 self.get_raw = MethodType(_get_manual_parameter, self)  # type: ignore[method-assign]
+                self.get_raw_async = MethodType(_get_manual_parameter_async, self)  # type: ignore[method-assign]
             else:
                 if isinstance(get_cmd, str) and instrument is None:
                     raise TypeError(
@@ -286,6 +316,12 @@ class Parameter(ParameterBase):
                     cmd=get_cmd,
                     exec_str=exec_str_ask,
                 )
+                exec_str_ask_async = getattr(instrument, "ask_async", None)
+                if isinstance(get_cmd, str) and exec_str_ask_async is not None:
+                    # query the instrument using its asyncio interface
+                    self.get_raw_async = _ask_async_factory(  # type: ignore[method-assign]
+                        exec_str_ask_async, get_cmd
+                    )
             self._gettable = True
             self.get = self._wrap_get()
 
@@ -299,6 +335,7 @@ class Parameter(ParameterBase):
             if set_cmd is None:
                 # ignore typeerror since mypy does not allow setting a method dynamically
                 self.set_raw = MethodType(_set_manual_parameter, self)  # type: ignore[method-assign]
+                self.set_raw_async = MethodType(_set_manual_parameter_async, self)  # type: ignore[method-assign]
             else:
                 if isinstance(set_cmd, str) and instrument is None:
                     raise TypeError(
@@ -316,6 +353,12 @@ class Parameter(ParameterBase):
                 self.set_raw = Command(  # type: ignore[method-assign]
                     arg_count=1, cmd=set_cmd, exec_str=exec_str_write
                 )
+                exec_str_write_async = getattr(instrument, "write_async", None)
+                if isinstance(set_cmd, str) and exec_str_write_async is not None:
+                    # write to the instrument using its asyncio interface
+                    self.set_raw_async = _write_async_factory(  # type: ignore[method-assign]
+                        exec_str_write_async, set_cmd
+                    )
             self._settable = True
             self.set = self._wrap_set()
 
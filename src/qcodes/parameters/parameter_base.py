@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import logging
 import time
@@ -226,6 +227,9 @@ class ParameterBase(MetadatableWithName):
         else:
             self._vals = []
 
+        self._step: float | None = None
+        self._inter_delay: float = 0
+        self._post_delay: float = 0
         self.step = step
         self.scale = scale
         self.offset = offset
@@ -353,6 +357,7 @@ class ParameterBase(MetadatableWithName):
         else:
             # setting the validator to None but the parameter already doesn't have a validator
             pass
+        self._update_set_path()
         self.__doc__ = self._build__doc__()
 
     def add_validator(self, vals: Validator) -> None:
@@ -363,6 +368,7 @@ class ParameterBase(MetadatableWithName):
             vals: Validator to add to the parameter.
         """
         self._vals.append(vals)
+        self._update_set_path()
         self.__doc__ = self._build__doc__()
 
     def remove_validator(self) -> Validator | None:
@@ -376,6 +382,7 @@ class ParameterBase(MetadatableWithName):
         """
         if len(self._vals) > 0:
             removed = self._vals.pop()
+            self._update_set_path()
             self.__doc__ = self._build__doc__()
             return removed
         else:
@@ -688,6 +695,17 @@ class ParameterBase(MetadatableWithName):
                     raise NotImplementedError(
                         f"Trying to set an abstract parameter: {self.full_name}"
                     )
+                if self._set_without_ramp:
+                    # no step or delays are configured so the value can be
+                    # set directly in a single call to set_raw
+                    if self._validate_on_set:
+                        self.validate(value)
+                    raw_value = self._from_value_to_raw_value(value)
+                    self.set_raw(raw_value, **kwargs)
+                    self._t_last_set = time.perf_counter()
+                    self.cache._update_with(value=value, raw_value=raw_value)
+                    return
+
                 self.validate(value)
 
                 # In some cases intermediate sweep values must be used.
@@ -731,6 +749,126 @@ class ParameterBase(MetadatableWithName):
 
         return set_wrapper
 
+    async def get_raw_async(self) -> ParamRawDataType:
+        """
+        Asyncio counterpart of ``get_raw`` that is awaited by
+        :meth:`get_async`. By default ``get_raw`` is run in an executor.
+        Subclasses that can communicate with the instrument using asyncio
+        should override this method.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, self.get_raw)
+
+    async def set_raw_async(self, value: ParamRawDataType) -> None:
+        """
+        Asyncio counterpart of ``set_raw`` that is awaited by
+        :meth:`set_async`. By default ``set_raw`` is run in an executor.
+        Subclasses that can communicate with the instrument using asyncio
+        should override this method.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.set_raw, value)
+
+    async def get_async(self) -> ParamDataType:
+        """
+        Get the value of the parameter without blocking the event loop.
+
+        The raw value is acquired with :meth:`get_raw_async` and is then
+        parsed, validated and stored in the cache exactly as by ``get``.
+        """
+        if not self.gettable:
+            raise TypeError("Trying to get a parameter that is not gettable.")
+        if self.abstract:
+            raise NotImplementedError(
+                f"Trying to get an abstract parameter: {self.full_name}"
+            )
+        try:
+            raw_value = await self.get_raw_async()
+
+            value = self._from_raw_value_to_value(raw_value)
+
+            if self._validate_on_get:
+                self.validate(value)
+
+            self.cache._update_with(value=value, raw_value=raw_value)
+
+            return value
+
+        except Exception as e:
+            e.args = e.args + (f"getting {self}",)
+            raise e
+
+    async def set_async(self, value: ParamDataType) -> None:
+        """
+        Set the value of the parameter without blocking the event loop.
+
+        The value is validated, ramped in steps and delayed exactly as by
+        ``set``, but each raw value is set with :meth:`set_raw_async` and
+        delays are awaited rather than slept.
+
+        Args:
+            value: The value to set.
+        """
+        try:
+            if not self.settable:
+                raise TypeError("Trying to set a parameter that is not settable.")
+            if self.abstract:
+                raise NotImplementedError(
+                    f"Trying to set an abstract parameter: {self.full_name}"
+                )
+            if self._set_without_ramp:
+                if self._validate_on_set:
+                    self.validate(value)
+                raw_value = self._from_value_to_raw_value(value)
+                await self.set_raw_async(raw_value)
+                self._t_last_set = time.perf_counter()
+                self.cache._update_with(value=value, raw_value=raw_value)
+                return
+
+            self.validate(value)
+            steps = self.get_ramp_values(value, step=self.step)
+
+            for val_step in steps:
+                self.validate(val_step)
+
+                raw_val_step = self._from_value_to_raw_value(val_step)
+
+                t_elapsed = time.perf_counter() - self._t_last_set
+                if t_elapsed < self.inter_delay:
+                    await asyncio.sleep(self.inter_delay - t_elapsed)
+
+                t0 = time.perf_counter()
+
+                await self.set_raw_async(raw_val_step)
+
+                self._t_last_set = time.perf_counter()
+
+                t_elapsed = self._t_last_set - t0
+                if t_elapsed < self.post_delay:
+                    await asyncio.sleep(self.post_delay - t_elapsed)
+
+                self.cache._update_with(value=val_step, raw_value=raw_val_step)
+
+        except Exception as e:
+            e.args = e.args + (f"setting {self} to {value}",)
+            raise e
+
+    def _update_set_path(self) -> None:
+        """
+        Choose the stages of ``set`` that are needed with the current
+        configuration of the parameter. This must be called whenever the
+        step, the delays or the validators of the parameter change.
+        """
+        get_ramp_values = getattr(self.get_ramp_values, "__func__", None)
+        self._set_without_ramp = (
+            self._step is None
+            and self._inter_delay == 0
+            and self._post_delay == 0
+            and get_ramp_values is ParameterBase.get_ramp_values
+        )
+        validate = getattr(self.validate, "__func__", None)
+        self._validate_on_set = (
+            len(self._vals) > 0 or validate is not ParameterBase.validate
+        )
+
     def get_ramp_values(
         self, value: float | Sized, step: float | None = None
     ) -> Sequence[float | Sized]:
@@ -831,7 +969,7 @@ class ParameterBase(MetadatableWithName):
     @step.setter
     def step(self, step: float | None) -> None:
         if step is None:
-            self._step: float | None = step
+            self._step = step
         elif not all(getattr(vals, "is_numeric", True) for vals in self._vals):
             raise TypeError("you can only step numeric parameters")
         elif not isinstance(step, (int, float)):
@@ -847,6 +985,7 @@ class ParameterBase(MetadatableWithName):
 
         else:
             self._step = step
+        self._update_set_path()
 
     @property
     def post_delay(self) -> float:
@@ -878,6 +1017,7 @@ class ParameterBase(MetadatableWithName):
         if post_delay < 0:
             raise ValueError(f"post_delay ({post_delay}) must not be negative")
         self._post_delay = post_delay
+        self._update_set_path()
 
     @property
     def inter_delay(self) -> float:
@@ -906,6 +1046,7 @@ class ParameterBase(MetadatableWithName):
         if inter_delay < 0:
             raise ValueError(f"inter_delay ({inter_delay}) must not be negative")
         self._inter_delay = inter_delay
+        self._update_set_path()
 
     @property
     def name(self) -> str:
@@ -11,8 +11,13 @@ import json
 import logging
 import os
 import pkgutil
+import threading
+import time
 import warnings
 from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import suppress
 from copy import copy, deepcopy
 from functools import partial
@@ -85,6 +90,14 @@ def get_config_use_monitor() -> str | None:
     return qcodes.config["station"]["use_monitor"]
 
 
+def get_config_parallel_snapshot() -> bool:
+    return qcodes.config["station"]["parallel_snapshot"]
+
+
+def get_config_snapshot_timeout() -> float | None:
+    return qcodes.config["station"]["snapshot_timeout"]
+
+
 ChannelOrInstrumentBase = Union[InstrumentBase, ChannelTuple]
 
 
@@ -121,6 +134,16 @@ class Station(Metadatable, DelegateAttributes):
         default: Is this station the default?
         update_snapshot: Immediately update the snapshot of each
             component as it is added to the Station.
+        parallel_snapshot: Should the snapshots of the instruments be
+            updated concurrently, with one thread per instrument. If None
+            the setting will be read from ``qcodesrc.json``.
+        snapshot_timeout: The time in seconds to wait for the snapshots of
+            the instruments to update when updating them concurrently. The
+            snapshot of an instrument that does not update in time falls
+            back to the values in memory and is marked with
+            ``"snapshot_timed_out": True``. Note that the update of such an
+            instrument continues in the background. If None the setting
+            will be read from ``qcodesrc.json``.
 
     """
 
@@ -145,10 +168,20 @@ class Station(Metadatable, DelegateAttributes):
         use_monitor: bool | None = None,
         default: bool = True,
         update_snapshot: bool = True,
+        parallel_snapshot: bool | None = None,
+        snapshot_timeout: float | None = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
 
+        self.parallel_snapshot = parallel_snapshot
+        self.snapshot_timeout = snapshot_timeout
+        self.snapshot_timings: dict[str, float] = {}
+        """
+        The time in seconds that the last snapshot of the station took for
+        each instrument.
+        """
+
         # when a new station is defined, store it in a class variable
         # so it becomes the globally accessible default station.
         # You can still have multiple stations defined, but to use
@@ -210,6 +243,7 @@ class Station(Metadatable, DelegateAttributes):
         }
 
         components_to_remove = []
+        instruments: dict[str, Instrument] = {}
 
         for name, itm in self.components.items():
             if isinstance(itm, Instrument):
@@ -217,7 +251,7 @@ class Station(Metadatable, DelegateAttributes):
                 # station object, hence this 'if' allows to avoid
                 # snapshotting instruments that are already closed
                 if Instrument.is_valid(itm):
-                    snap['instruments'][name] = itm.snapshot(update=update)
+                    instruments[name] = itm
                 else:
                     components_to_remove.append(name)
             elif isinstance(itm, (Parameter,
@@ -228,11 +262,71 @@ class Station(Metadatable, DelegateAttributes):
             else:
                 snap['components'][name] = itm.snapshot(update=update)
 
+        snap["instruments"] = self._snapshot_instruments(instruments, update)
+
         for c in components_to_remove:
             self.remove_component(c)
 
         return snap
 
+    def _snapshot_instruments(
+        self, instruments: Mapping[str, Instrument], update: bool | None
+    ) -> dict[str, Any]:
+        parallel = (
+            self.parallel_snapshot
+            if self.parallel_snapshot is not None
+            else get_config_parallel_snapshot()
+        )
+        snapshots: dict[str, Any] = {}
+        timings: dict[str, float] = {}
+        if update is False or not parallel or len(instruments) < 2:
+            for name, instrument in instruments.items():
+                snapshots[name], timings[name] = _timed_snapshot(instrument, update)
+        else:
+            timeout = (
+                self.snapshot_timeout
+                if self.snapshot_timeout is not None
+                else get_config_snapshot_timeout()
+            )
+            start = time.perf_counter()
+            executor = ThreadPoolExecutor(
+                max_workers=len(instruments), thread_name_prefix="station_snapshot"
+            )
+            try:
+                futures = {
+                    name: executor.submit(_timed_snapshot, instrument, update)
+                    for name, instrument in instruments.items()
+                }
+                for name, future in futures.items():
+                    remaining = (
+                        None
+                        if timeout is None
+                        else max(0.0, start + timeout - time.perf_counter())
+                    )
+                    try:
+                        snapshots[name], timings[name] = future.result(
+                            timeout=remaining
+                        )
+                    except FutureTimeoutError:
+                        log.warning(
+                            "The snapshot of %s did not update within %s s, "
+                            "using the values in memory instead.",
+                            name,
+                            timeout,
+                        )
+                        snapshot = instruments[name].snapshot(update=False)
+                        snapshot["snapshot_timed_out"] = True
+                        snapshots[name] = snapshot
+                        timings[name] = time.perf_counter() - start
+            finally:
+                # do not wait for the updates that timed out
+                executor.shutdown(wait=False)
+
+        for name, duration in timings.items():
+            log.debug("The snapshot of %s took %.3f s", name, duration)
+        self.snapshot_timings = timings
+        return snapshots
+
     def add_component(
         self,
         component: MetadatableWithName,
@@ -541,7 +635,17 @@ class Station(Metadatable, DelegateAttributes):
         # little slower but makes the overall workflow more convenient.
         self.load_config_files(*self.config_file)
 
+        instr = self._load_instrument(identifier, **kwargs)
+        self._update_monitor()
+        return instr
 
+    def _load_instrument(self, identifier: str, **kwargs: Any) -> Instrument:
+        """
+        Create an instrument as described by the loaded configuration
+        without reloading the configuration or restarting the monitor, such
+        that several instruments can be created concurrently.
+        """
+        start = time.perf_counter()
         # load from config
         if identifier not in self._instrument_config.keys():
             raise RuntimeError(f'Instrument {identifier} not found in '
@@ -579,6 +683,13 @@ class Station(Metadatable, DelegateAttributes):
         instr_class_name = instr_cfg["type"].split(".")[-1]
         module = importlib.import_module(module_name)
         instr_class = getattr(module, instr_class_name)
+        if (
+            "station" not in instr_kwargs
+            and "station" in inspect.signature(instr_class).parameters
+        ):
+            # delegate instruments look up their source parameters in the
+            # station
+            instr_kwargs["station"] = self
         instr = instr_class(name=name, **instr_kwargs)
 
         def resolve_instrument_identifier(
@@ -671,12 +782,6 @@ class Station(Metadatable, DelegateAttributes):
             instr.add_parameter(name, param_type, **kwargs)
             setup_parameter_from_dict(instr.parameters[name], options)
 
-        def update_monitor() -> None:
-            if ((self.use_monitor is None and get_config_use_monitor())
-                    or self.use_monitor):
-                # restart Monitor
-                Monitor(*self._monitor_parameters)
-
         for name, options in instr_cfg.get('parameters', {}).items():
             parameter = resolve_parameter_identifier(instr, name)
             setup_parameter_from_dict(parameter, options)
@@ -688,15 +793,27 @@ class Station(Metadatable, DelegateAttributes):
             if isinstance(local_instr, ChannelTuple):
                 raise RuntimeError("A parameter cannot be added to an ChannelTuple")
             add_parameter_from_dict(local_instr, parts[-1], options)
+        if isinstance(self.components.get(identifier), _LazyInstrument):
+            self.remove_component(identifier)
         self.add_component(instr)
-        update_monitor()
+        log.info(
+            "Loaded instrument %s in %.3f s", identifier, time.perf_counter() - start
+        )
         return instr
 
+    def _update_monitor(self) -> None:
+        if (self.use_monitor is None and get_config_use_monitor()) or self.use_monitor:
+            # restart Monitor
+            Monitor(*self._monitor_parameters)
+
     @overload
     def load_all_instruments(
         self,
         only_names: None,
         only_types: Iterable[str],
+        *,
+        max_workers: int = ...,
+        lazy: bool = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -705,6 +822,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str],
         only_types: None,
+        *,
+        max_workers: int = ...,
+        lazy: bool = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -713,6 +833,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: None,
         only_types: None,
+        *,
+        max_workers: int = ...,
+        lazy: bool = ...,
     ) -> tuple[str, ...]:
         ...
 
@@ -721,6 +844,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str],
         only_types: Iterable[str],
+        *,
+        max_workers: int = ...,
+        lazy: bool = ...,
     ) -> NoReturn:
         ...
 
@@ -728,6 +854,9 @@ class Station(Metadatable, DelegateAttributes):
         self,
         only_names: Iterable[str] | None = None,
         only_types: Iterable[str] | None = None,
+        *,
+        max_workers: int = 1,
+        lazy: bool = False,
     ) -> tuple[str, ...]:
         """
         Load all instruments specified in the loaded YAML station
@@ -738,12 +867,29 @@ class Station(Metadatable, DelegateAttributes):
         arguments for that. It is an error to supply both ``only_names``
         and ``only_types``.
 
+        Instruments whose ``init`` section refers to other instruments in
+        the configuration, such as delegate instruments, are loaded after
+        the instruments they refer to. Instruments whose ``__init__`` takes a
+        ``station`` argument are given this station. The time taken to load
+        each instrument is logged.
+
         Args:
             only_names: List of instrument names to load from the config.
                 If left as None, then all instruments are loaded.
             only_types: List of instrument types e.g. the class names
                 of the instruments to load. If left as None, then all
                 instruments are loaded.
+            max_workers: The number of threads to create instruments on
+                concurrently. Since creating an instrument mostly waits for
+                its communication, e.g. opening a VISA resource and
+                querying its ID, this may speed up loading many
+                instruments. Instrument drivers must then be safe to create
+                concurrently with other drivers.
+            lazy: If True, the instruments are not created yet, but placeholders
+                are added to the station that create them when one of their
+                attributes is accessed for the first time. Until then, the
+                snapshots of the placeholders record that the instruments
+                are not connected.
 
         Returns:
             The names of the loaded instruments
@@ -774,11 +920,149 @@ class Station(Metadatable, DelegateAttributes):
                 "and ``only_types`` arguments."
             )
 
-        for instrument in instrument_names_to_load:
-            self.load_instrument(instrument)
+        if lazy:
+            for instrument in instrument_names_to_load:
+                if instrument not in self.components:
+                    self.add_component(_LazyInstrument(self, instrument))
+        else:
+            self._load_instruments(instrument_names_to_load, max_workers)
 
         return tuple(instrument_names_to_load)
 
+    def _load_instruments(self, identifiers: set[str], max_workers: int) -> None:
+        """
+        Load instruments on a thread pool, each once all instruments it
+        depends on have been loaded.
+        """
+        self.load_config_files(*self.config_file)
+        dependencies = {
+            identifier: _instrument_dependencies(
+                identifier, self._instrument_config
+            )
+            & identifiers
+            for identifier in identifiers
+        }
+        pending = set(identifiers)
+        loaded: set[str] = set()
+        errors: list[BaseException] = []
+        running: dict[Future[Instrument], str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="load_instrument"
+        ) as executor:
+            while pending or running:
+                if not errors:
+                    ready = sorted(
+                        identifier
+                        for identifier in pending
+                        if dependencies[identifier] <= loaded
+                    )
+                    for identifier in ready:
+                        pending.remove(identifier)
+                        future = executor.submit(self._load_instrument, identifier)
+                        running[future] = identifier
+                if not running:
+                    if errors:
+                        break
+                    raise RuntimeError(
+                        f"The instruments {sorted(pending)} depend on each "
+                        f"other and cannot be loaded."
+                    )
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    identifier = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        errors.append(error)
+                    else:
+                        loaded.add(identifier)
+        self._update_monitor()
+        if errors:
+            raise errors[0]
+
+
+def _timed_snapshot(
+    instrument: Instrument, update: bool | None
+) -> tuple[dict[str, Any], float]:
+    start = time.perf_counter()
+    snapshot = instrument.snapshot(update=update)
+    return snapshot, time.perf_counter() - start
+
+
+def _instrument_dependencies(
+    identifier: str, instrument_config: Mapping[str, Any]
+) -> set[str]:
+    """
+    The other instruments of the configuration that the ``init`` section of
+    an instrument refers to, e.g. ``dac`` for a delegate parameter with the
+    source ``dac.ch01.voltage``.
+    """
+    dependencies = set()
+    values = deque([instrument_config[identifier].get("init")])
+    while values:
+        value = values.popleft()
+        if isinstance(value, str):
+            name = value.split(".")[0]
+            if name != identifier and name in instrument_config:
+                dependencies.add(name)
+        elif isinstance(value, Mapping):
+            values.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            values.extend(value)
+    return dependencies
+
+
+class _LazyInstrument(MetadatableWithName):
+    """
+    A placeholder for an instrument of the configuration of a station, that
+    loads the instrument when one of its attributes is accessed for the
+    first time and then forwards all attribute access to it.
+    """
+
+    def __init__(self, station: Station, identifier: str):
+        super().__init__()
+        self._station = station
+        self._identifier = identifier
+        self._instrument: Instrument | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def short_name(self) -> str:
+        return self._identifier
+
+    @property
+    def full_name(self) -> str:
+        return self._identifier
+
+    @property
+    def name(self) -> str:
+        return self._identifier
+
+    @property
+    def instrument(self) -> Instrument:
+        """The instrument, which is loaded if it has not been yet."""
+        with self._lock:
+            if self._instrument is None:
+                log.info("Connecting to instrument %s on first use", self._identifier)
+                self._instrument = self._station.load_instrument(self._identifier)
+            return self._instrument
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes that the placeholder does not have
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.instrument, name)
+
+    def snapshot_base(
+        self,
+        update: bool | None = False,
+        params_to_skip_update: Sequence[str] | None = None,
+    ) -> dict[Any, Any]:
+        if self._instrument is None:
+            return {"name": self._identifier, "connected": False}
+        return self._instrument.snapshot_base(
+            update=update, params_to_skip_update=params_to_skip_update
+        )
+
 
 def update_config_schema(
     additional_instrument_modules: list[ModuleType] | None = None,
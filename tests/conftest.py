@@ -58,6 +58,7 @@ def default_session_config(
     schema_env_file_name = Config.schema_env_file_name
     cwd_file_name = Config.cwd_file_name
     schema_cwd_file_name = Config.schema_cwd_file_name
+    cache_directory = Config.cache_directory
 
     old_config: DotDict | None = copy.deepcopy(qc.config.current_config)
     qc.config.current_config = copy.deepcopy(qc.config.defaults)
@@ -73,6 +74,8 @@ def default_session_config(
     qc.config.schema_env_file_name = ""
     qc.config.cwd_file_name = ""
     qc.config.schema_cwd_file_name = ""
+    # configs created by tests are never cached in the user's cache directory
+    Config.cache_directory = str(tmp_path / "config_cache")
 
     # set any config that we want to be different from the default
     # for the test session here
@@ -91,6 +94,7 @@ def default_session_config(
         qc.config.schema_env_file_name = schema_env_file_name
         qc.config.cwd_file_name = cwd_file_name
         qc.config.schema_cwd_file_name = schema_cwd_file_name
+        Config.cache_directory = cache_directory
 
         qc.config.current_config = old_config
 
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from qcodes.dataset import (
+    AdaptiveSweep1D,
+    AdaptiveSweep2D,
+    LinSweep,
+    Measurement,
+    dond,
+)
+from qcodes.dataset.data_set import DataSet
+from qcodes.parameters import ManualParameter, Parameter
+
+
+def _step(x: float) -> float:
+    return float(np.tanh((x - 0.3) / 0.01))
+
+
+def _ring(x: float, y: float) -> float:
+    return float(np.exp(-(((np.hypot(x, y) - 0.5) / 0.05) ** 2)))
+
+
+def test_adaptive_sweep_1d_refines_around_step() -> None:
+    x = ManualParameter("x")
+    sweep = AdaptiveSweep1D(x, 0, 1, num_points=100, initial_points=11)
+    for setpoints in sweep:
+        sweep.tell(setpoints, _step(*setpoints))
+
+    setpoints, values = sweep.setpoints_and_values()
+    assert setpoints.shape == (100, 1)
+    assert values.shape == (100,)
+    assert setpoints.min() == 0
+    assert setpoints.max() == 1
+    # the initial grid is measured first
+    np.testing.assert_allclose(setpoints[:11, 0], np.linspace(0, 1, 11))
+    assert len(np.unique(setpoints)) == 100
+    # most points are spent on the step, which a uniform grid of 100
+    # points would sample with 10 points
+    assert np.sum(np.abs(setpoints - 0.3) < 0.05) > 40
+
+
+def test_adaptive_sweep_2d_refines_around_feature() -> None:
+    x = ManualParameter("x")
+    y = ManualParameter("y")
+    sweep = AdaptiveSweep2D(x, -1, 1, y, -1, 1, num_points=1000)
+    for setpoints in sweep:
+        sweep.tell(setpoints, _ring(*setpoints))
+
+    setpoints, values = sweep.setpoints_and_values()
+    assert setpoints.shape == (1000, 2)
+    assert len({tuple(point) for point in setpoints}) == 1000
+    assert np.all(np.abs(setpoints) <= 1)
+    near_ring = np.abs(np.hypot(setpoints[:, 0], setpoints[:, 1]) - 0.5) < 0.1
+    # the ring covers about 16 % of the area
+    assert near_ring.mean() > 0.5
+
+
+def test_adaptive_sweep_featureless_is_refined_evenly() -> None:
+    x = ManualParameter("x")
+    sweep = AdaptiveSweep1D(x, 0, 1, num_points=17, initial_points=2)
+    for setpoints in sweep:
+        sweep.tell(setpoints, 1.0)
+
+    setpoints, _ = sweep.setpoints_and_values()
+    np.testing.assert_allclose(np.sort(setpoints[:, 0]), np.linspace(0, 1, 17))
+
+
+def test_adaptive_sweep_requires_values() -> None:
+    x = ManualParameter("x")
+    sweep = AdaptiveSweep1D(x, 0, 1, num_points=10, initial_points=2)
+    assert sweep.ask() == (0.0,)
+    assert sweep.ask() == (1.0,)
+    with pytest.raises(RuntimeError, match="must be told"):
+        sweep.ask()
+    with pytest.raises(ValueError, match="have not been asked for"):
+        sweep.tell((0.5,), 1.0)
+
+
+def test_adaptive_sweep_requires_initial_points() -> None:
+    x = ManualParameter("x")
+    with pytest.raises(ValueError, match="at least 2 initial points"):
+        AdaptiveSweep1D(x, 0, 1, num_points=10, initial_points=1)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_adaptive_sweep_with_measurement() -> None:
+    x = ManualParameter("x")
+    signal = Parameter("signal", get_cmd=lambda: _step(x()))
+    meas = Measurement()
+    meas.register_parameter(x)
+    meas.register_parameter(signal, setpoints=(x,))
+
+    sweep = AdaptiveSweep1D(x, 0, 1, num_points=30)
+    with meas.run() as datasaver:
+        for (value,) in sweep:
+            x(value)
+            measured = signal()
+            sweep.tell((value,), measured)
+            datasaver.add_result((x, value), (signal, measured))
+
+    data = datasaver.dataset.get_parameter_data()["signal"]
+    assert data["signal"].shape == (30,)
+    np.testing.assert_allclose(
+        np.sort(data["x"]), np.sort(sweep.setpoints_and_values()[0][:, 0])
+    )
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_adaptive_sweep(pipeline: bool) -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    constant = Parameter("constant", get_cmd=lambda: 1.0)
+    ring = Parameter("ring", get_cmd=lambda: _ring(x(), y()))
+
+    sweep = AdaptiveSweep2D(x, -1, 1, y, -1, 1, num_points=200, target=ring)
+    dataset, _, _ = dond(sweep, constant, ring, do_plot=False, pipeline=pipeline)
+    assert isinstance(dataset, DataSet)
+    assert dataset.description.shapes is None
+
+    data = dataset.get_parameter_data()["ring"]
+    assert data["ring"].shape == (200,)
+    setpoints, values = sweep.setpoints_and_values()
+    np.testing.assert_allclose(data["x"], setpoints[:, 0])
+    np.testing.assert_allclose(data["y"], setpoints[:, 1])
+    np.testing.assert_allclose(data["ring"], values)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_adaptive_sweep_cannot_be_combined() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 1.0)
+
+    with pytest.raises(ValueError, match="cannot be combined"):
+        dond(
+            LinSweep(x, 0, 1, 5),
+            AdaptiveSweep1D(y, 0, 1, 10),
+            signal,
+            do_plot=False,
+        )
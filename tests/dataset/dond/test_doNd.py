@@ -1,8 +1,13 @@
 """
 These are the basic black box tests for the doNd functions.
 """
+import itertools
+import json
 import logging
 import re
+import threading
+import time
+from functools import partial
 
 import hypothesis.strategies as hst
 import matplotlib
@@ -16,6 +21,7 @@ from pytest import FixtureRequest, LogCaptureFixture
 import qcodes as qc
 from qcodes import config, validators
 from qcodes.dataset import (
+    AdaptiveSweep1D,
     ArraySweep,
     DataSetProtocol,
     LinSweep,
@@ -24,10 +30,14 @@ from qcodes.dataset import (
     dond,
     new_experiment,
 )
-from qcodes.dataset.data_set import DataSet
+from qcodes.dataset.data_set import DataSet, load_by_guid
 from qcodes.dataset.dond.do_nd import _Sweeper
+from qcodes.dataset.measurements import DataSaver
 from qcodes.instrument_drivers.mock_instruments import (
     ArraySetPointParam,
+    DummyInstrument,
+    MockBufferedSource,
+    MockBufferedSweep,
     Multi2DSetPointParam,
     Multi2DSetPointParam2Sizes,
     MultiSetPointParam,
@@ -1678,6 +1688,771 @@ def test_dond_sweeper_combinations(_param_set, _param_set_2, _param) -> None:
         assert g in sweep_groups
 
 
+def test_sweeper_matches_product_of_setpoints() -> None:
+    a, b, c, d = (ManualParameter(name, initial_value=0) for name in "abcd")
+    sweeps = [
+        TogetherSweep(LinSweep(a, 0, 1, 4), LinSweep(b, 2, 3, 4)),
+        ArraySweep(c, [5, 5, 6]),
+        LinSweep(d, 0, 1, 2),
+    ]
+    sweeper = _Sweeper(sweeps, [])
+    assert sweeper.shape == (4, 3, 2)
+    assert len(sweeper) == 24
+
+    expected_points = [
+        (a_value, b_value, c_value, d_value)
+        for (a_value, b_value), c_value, d_value in itertools.product(
+            sweeps[0].get_setpoints(),
+            sweeps[1].get_setpoints(),
+            sweeps[2].get_setpoints(),
+        )
+    ]
+    assert sweeper.setpoints_dict == {
+        name: [point[i] for point in expected_points]
+        for i, name in enumerate("abcd")
+    }
+
+    assert len(list(_Sweeper(sweeps, []))) == len(expected_points)
+    previous_point: tuple[float, ...] | None = None
+    for point, events in zip(expected_points, sweeper):
+        assert tuple(event.new_value for event in events) == point
+        assert tuple(event.parameter for event in events) == (a, b, c, d)
+        # a parameter is only set when its value changes
+        assert [event.should_set for event in events] == [
+            previous_point is None or previous_point[i] != value
+            for i, value in enumerate(point)
+        ]
+        previous_point = point
+
+    assert tuple(event.new_value for event in sweeper[-1]) == expected_points[-1]
+    with pytest.raises(IndexError):
+        sweeper[24]
+
+
+def test_sweeper_does_not_build_all_setpoints() -> None:
+    params = [ManualParameter(name, initial_value=0) for name in "abcd"]
+    sweeper = _Sweeper([LinSweep(param, 0, 1, 100) for param in params], [])
+    assert len(sweeper) == 100**4
+
+    last_point = sweeper[100**4 - 1]
+    assert [event.new_value for event in last_point] == [1, 1, 1, 1]
+    # only the fastest axis changes except when an outer axis wraps around
+    assert [event.should_set for event in last_point] == [False] * 3 + [True]
+    point = sweeper[100**2]
+    assert [event.should_set for event in point] == [False, True, True, True]
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipeline_stores_same_data_as_sequential() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    offset = Parameter("offset", get_cmd=lambda: 10.0)
+    threads_setting_x = set()
+
+    def record_thread() -> None:
+        threads_setting_x.add(threading.current_thread())
+
+    def get_signal() -> float:
+        return x() + 2 * y()
+
+    signal = Parameter("signal", get_cmd=get_signal)
+    sweeps = (
+        LinSweep(x, 0, 1, 5, post_actions=(record_thread,)),
+        LinSweep(y, -1, 1, 4),
+    )
+
+    sequential, _, _ = dond(*sweeps, signal, offset, do_plot=False, pipeline=False)
+    assert threads_setting_x == {threading.main_thread()}
+    threads_setting_x.clear()
+    pipelined, _, _ = dond(
+        *sweeps,
+        signal,
+        offset,
+        do_plot=False,
+        pipeline=True,
+        setpoint_independent=[offset],
+        profile_timing=True,
+    )
+    assert isinstance(sequential, DataSet)
+    assert isinstance(pipelined, DataSet)
+    assert threading.main_thread() not in threads_setting_x
+
+    sequential_data = sequential.get_parameter_data()
+    pipelined_data = pipelined.get_parameter_data()
+    for name in ("signal", "offset"):
+        for param_name, values in sequential_data[name].items():
+            np.testing.assert_array_equal(pipelined_data[name][param_name], values)
+
+    # the stages run on the background thread are profiled as well
+    profile = json.loads(pipelined.metadata["timing_profile"])
+    assert profile["n_points"] == 20
+    assert {"set", "delay", "get", "add_result", "point"} <= set(profile["stages"])
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipeline_break_condition() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: x())
+
+    dataset, _, _ = dond(
+        LinSweep(x, 0, 9, 10),
+        signal,
+        do_plot=False,
+        pipeline=True,
+        break_condition=lambda: x() >= 3,
+    )
+    assert isinstance(dataset, DataSet)
+    np.testing.assert_array_equal(
+        dataset.get_parameter_data()["signal"]["signal"], [0, 1, 2, 3]
+    )
+    # the sweep stops before setting the point after the break
+    assert x() == 3
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_pipeline_raises_errors_of_set() -> None:
+    def fail(value: float) -> None:
+        if value > 0.5:
+            raise RuntimeError("Failed to set")
+
+    x = Parameter("x", set_cmd=fail)
+    signal = Parameter("signal", get_cmd=lambda: 1)
+
+    with pytest.raises(RuntimeError, match="Failed to set"):
+        dond(LinSweep(x, 0, 1, 5), signal, do_plot=False, pipeline=True)
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_pipeline_setpoint_independent_must_be_measured() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 1)
+    other = Parameter("other", get_cmd=lambda: 2)
+
+    with pytest.raises(ValueError, match="are not measured"):
+        dond(
+            LinSweep(x, 0, 1, 5),
+            signal,
+            do_plot=False,
+            pipeline=True,
+            setpoint_independent=[other],
+        )
+
+
+@pytest.fixture(name="buffered_source")
+def _make_buffered_source():
+    gate = ManualParameter("gate", initial_value=0.0)
+    source = MockBufferedSource(
+        "buffered_source", response=lambda outputs: outputs + 10 * gate()
+    )
+    source.gate = gate
+    try:
+        yield source
+    finally:
+        source.close()
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+@pytest.mark.parametrize("in_memory_cache", [False, True])
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_buffered_sweep(buffered_source, pipeline, in_memory_cache) -> None:
+    gate = buffered_source.gate
+    temperature = Parameter("temperature", get_cmd=lambda: 2 * gate())
+
+    dataset, _, _ = dond(
+        LinSweep(gate, 0, 1, 3),
+        MockBufferedSweep(buffered_source, -1, 1, 5),
+        buffered_source.signal,
+        temperature,
+        do_plot=False,
+        pipeline=pipeline,
+        in_memory_cache=in_memory_cache,
+    )
+    assert isinstance(dataset, DataSet)
+    # the source is triggered once per line
+    assert buffered_source.n_triggers == 3
+    assert dataset.description.shapes == {
+        "buffered_source_signal": (3, 5),
+        "temperature": (3, 5),
+    }
+
+    expected_gate, expected_output = np.meshgrid(
+        np.linspace(0, 1, 3), np.linspace(-1, 1, 5), indexing="ij"
+    )
+    for data in (dataset.get_parameter_data(), dataset.cache.data()):
+        signal_data = data["buffered_source_signal"]
+        np.testing.assert_allclose(
+            np.ravel(signal_data["gate"]), expected_gate.ravel()
+        )
+        np.testing.assert_allclose(
+            np.ravel(signal_data["buffered_source_output"]), expected_output.ravel()
+        )
+        np.testing.assert_allclose(
+            np.ravel(signal_data["buffered_source_signal"]),
+            (expected_output + 10 * expected_gate).ravel(),
+        )
+        # the other parameters are measured once per line
+        np.testing.assert_allclose(
+            np.ravel(data["temperature"]["temperature"]), 2 * expected_gate.ravel()
+        )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_buffered_sweep_only(buffered_source) -> None:
+    dataset, _, _ = dond(
+        MockBufferedSweep(buffered_source, 0, 1, 11),
+        buffered_source.signal,
+        do_plot=False,
+    )
+    assert isinstance(dataset, DataSet)
+    assert buffered_source.n_triggers == 1
+    data = dataset.get_parameter_data()["buffered_source_signal"]
+    np.testing.assert_allclose(
+        data["buffered_source_signal"], np.linspace(0, 1, 11)
+    )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_buffered_sweep_break_condition(buffered_source) -> None:
+    gate = buffered_source.gate
+    dataset, _, _ = dond(
+        LinSweep(gate, 0, 9, 10),
+        MockBufferedSweep(buffered_source, 0, 1, 4),
+        buffered_source.signal,
+        do_plot=False,
+        break_condition=lambda: gate() >= 2,
+    )
+    assert isinstance(dataset, DataSet)
+    assert buffered_source.n_triggers == 3
+    assert len(dataset.get_parameter_data()["buffered_source_signal"]["gate"]) == 12
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_buffered_sweep_must_be_last(buffered_source) -> None:
+    buffered_sweep = MockBufferedSweep(buffered_source, 0, 1, 4)
+    other = ManualParameter("other", initial_value=0.0)
+    with pytest.raises(ValueError, match="must be the last sweep"):
+        dond(
+            buffered_sweep,
+            LinSweep(buffered_source.gate, 0, 1, 3),
+            buffered_source.signal,
+            do_plot=False,
+        )
+    with pytest.raises(ValueError, match="must be the last sweep"):
+        dond(
+            TogetherSweep(buffered_sweep, LinSweep(other, 0, 1, 4)),
+            buffered_source.signal,
+            do_plot=False,
+        )
+    assert buffered_source.n_triggers == 0
+
+
+def test_sweeper_serpentine_order() -> None:
+    x = ManualParameter("x")
+    y = ManualParameter("y")
+    z = ManualParameter("z")
+    sweeper = _Sweeper(
+        [LinSweep(x, 0, 1, 2), LinSweep(y, 0, 2, 3), LinSweep(z, 0, 1, 2)],
+        (),
+        sweep_order="serpentine",
+    )
+    assert not sweeper.is_raster
+    setpoints = sweeper.setpoints_dict
+    assert list(zip(setpoints["x"], setpoints["y"], setpoints["z"])) == [
+        (0, 0, 0), (0, 0, 1), (0, 1, 1), (0, 1, 0), (0, 2, 0), (0, 2, 1),
+        (1, 2, 1), (1, 2, 0), (1, 1, 0), (1, 1, 1), (1, 0, 1), (1, 0, 0),
+    ]  # fmt: skip
+    assert [sweeper.logical_index(i) for i in range(len(sweeper))] == [
+        0, 1, 3, 2, 4, 5, 11, 10, 8, 9, 7, 6,
+    ]  # fmt: skip
+    # the parameters are not set at the turns of the serpentine
+    assert [event.should_set for event in sweeper[2]] == [False, True, False]
+    assert [event.should_set for event in sweeper[6]] == [True, False, False]
+
+
+def test_sweeper_min_ramp_order(caplog: LogCaptureFixture) -> None:
+    fast = ManualParameter("fast", initial_value=0.0)
+    ramped = ManualParameter("ramped", initial_value=0.0)
+    ramped.step = 0.1
+    ramped.inter_delay = 0.001
+
+    with caplog.at_level(logging.INFO):
+        sweeper = _Sweeper(
+            [LinSweep(fast, 0, 1, 3), LinSweep(ramped, 0, 10, 50)],
+            (),
+            sweep_order="min_ramp",
+        )
+    # the nesting is kept and ramping back the inner sweep is avoided
+    assert sweeper.traversal == {
+        "nesting": [["fast"], ["ramped"]],
+        "serpentine": True,
+    }
+    # but ramping the parameter with a step only once would be cheaper
+    assert "[['ramped'], ['fast']]" in caplog.text
+
+    # without any cost of ramping back the raster order is kept
+    sweeper = _Sweeper(
+        [LinSweep(fast, 0, 1, 3), LinSweep(fast, 0, 1, 3)],
+        (),
+        sweep_order="min_ramp",
+    )
+    assert sweeper.is_raster
+
+    raster = _Sweeper([LinSweep(fast, 0, 1, 3), LinSweep(fast, 0, 1, 3)], ())
+    assert raster.is_raster
+    assert raster.logical_index(5) == 5
+
+    with pytest.raises(ValueError, match="Unknown sweep order"):
+        _Sweeper([LinSweep(fast, 0, 1, 3)], (), sweep_order="spiral")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("sweep_order", ["serpentine", "min_ramp"])
+@pytest.mark.parametrize("pipeline", [False, True])
+@pytest.mark.parametrize("in_memory_cache", [False, True])
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_sweep_order_stores_raster_data(
+    sweep_order, pipeline, in_memory_cache
+) -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = TrackingParameter("y", initial_value=0.0)
+    y.step = 1
+    y.inter_delay = 1e-4
+    signal = Parameter("signal", get_cmd=lambda: 10 * x() + y())
+    sweeps = (LinSweep(x, 0, 1, 3), LinSweep(y, 0, 3, 4))
+
+    y(3)
+    y.reset_count()
+    raster, _, _ = dond(*sweeps, signal, do_plot=False)
+    raster_set_count = y.set_count
+    y(3)
+    y.reset_count()
+    reordered, _, _ = dond(
+        *sweeps,
+        signal,
+        do_plot=False,
+        sweep_order=sweep_order,
+        pipeline=pipeline,
+        in_memory_cache=in_memory_cache,
+    )
+    assert isinstance(raster, DataSet)
+    assert isinstance(reordered, DataSet)
+    assert "dond_sweep_order" not in raster.metadata
+    order = json.loads(reordered.metadata["dond_sweep_order"])
+    assert order == {"nesting": [["x"], ["y"]], "serpentine": True}
+    # y is not ramped back at the end of each line, which takes 3 steps
+    assert y.set_count == raster_set_count - 2 * 3
+
+    for data in (reordered.get_parameter_data(), reordered.cache.data()):
+        for name, values in raster.get_parameter_data()["signal"].items():
+            np.testing.assert_array_equal(
+                np.ravel(data["signal"][name]), np.ravel(values)
+            )
+
+
+@pytest.mark.usefixtures("plot_close", "experiment")
+def test_dond_sweep_order_interrupted_stores_held_back_points() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 10 * x() + y())
+    n_points = 0
+
+    def break_condition() -> bool:
+        nonlocal n_points
+        n_points += 1
+        return n_points == 6
+
+    dataset, _, _ = dond(
+        LinSweep(x, 0, 1, 2),
+        LinSweep(y, 0, 3, 4),
+        signal,
+        do_plot=False,
+        sweep_order="serpentine",
+        break_condition=break_condition,
+    )
+    assert isinstance(dataset, DataSet)
+    # the points of the reversed line are stored in raster order
+    np.testing.assert_array_equal(
+        dataset.get_parameter_data()["signal"]["signal"],
+        [0, 1, 2, 3, 12, 13],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_adaptive_sweep_order_cannot_be_changed() -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 1.0)
+    with pytest.raises(ValueError, match="cannot be changed"):
+        dond(
+            AdaptiveSweep1D(x, 0, 1, 10),
+            signal,
+            do_plot=False,
+            sweep_order="serpentine",
+        )
+
+
+@pytest.mark.parametrize("pipeline", [False, True])
+@pytest.mark.usefixtures("experiment")
+def test_dond_use_threads_keeps_instrument_threads(pipeline) -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    threads: dict[str, set[int]] = {"dmm_1": set(), "dmm_2": set()}
+    instruments = [DummyInstrument(name, gates=[]) for name in threads]
+
+    def get_on_thread(name: str) -> float:
+        threads[name].add(threading.get_ident())
+        return x()
+
+    try:
+        for instrument in instruments:
+            instrument.add_parameter(
+                "thread", get_cmd=partial(get_on_thread, instrument.name)
+            )
+        dataset, _, _ = dond(
+            LinSweep(x, 0, 1, 20),
+            *(instrument.thread for instrument in instruments),
+            do_plot=False,
+            use_threads=True,
+            pipeline=pipeline,
+        )
+    finally:
+        for instrument in instruments:
+            instrument.close()
+
+    # each instrument is got on the same thread at every point
+    assert all(len(idents) == 1 for idents in threads.values())
+    assert threads["dmm_1"] != threads["dmm_2"]
+    data = dataset.get_parameter_data()
+    for name in threads:
+        np.testing.assert_allclose(
+            data[f"{name}_thread"][f"{name}_thread"], np.linspace(0, 1, 20)
+        )
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+@pytest.mark.usefixtures("experiment")
+def test_dond_profile_timing(buffered, buffered_source) -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 1.0)
+    params = [LinSweep(x, 0, 1, 3, delay=0.01), signal]
+    if buffered:
+        params += [MockBufferedSweep(buffered_source, 0, 1, 4), buffered_source.signal]
+
+    dataset, _, _ = dond(*params, do_plot=False, profile_timing=True)
+
+    profile = json.loads(dataset.metadata["timing_profile"])
+    # a line of a buffered sweep is one point
+    assert profile["n_points"] == 3
+    stages = profile["stages"]
+    assert {"set", "delay", "get", "add_result", "point"} <= set(stages)
+    assert stages["delay"]["total"] >= 0.03
+    assert "Timing of 3 points" in dataset.timing_report()
+
+
+@pytest.mark.parametrize("sweep_order", ["raster", "serpentine"])
+@pytest.mark.usefixtures("experiment")
+def test_dond_profile_timing_per_measured_point(sweep_order) -> None:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+
+    def get_signal() -> float:
+        time.sleep(0.005)
+        return x() + y()
+
+    signal = Parameter("signal", get_cmd=get_signal)
+    dataset, _, _ = dond(
+        LinSweep(x, 0, 1, 3),
+        LinSweep(y, 0, 1, 4),
+        signal,
+        do_plot=False,
+        sweep_order=sweep_order,
+        profile_timing=True,
+        store_timing_trace=True,
+    )
+
+    profile = json.loads(dataset.metadata["timing_profile"])
+    assert profile["n_points"] == 12
+    trace = profile["trace"]
+    get_column = trace["stages"].index("get")
+    # the time of each get is recorded on the point it was measured for,
+    # even if the results of the point are added later
+    assert all(row[get_column] >= 0.005 for row in trace["durations"])
+    assert profile["stages"]["add_result"]["total"] > 0
+
+
+def _resume_signals() -> tuple[ManualParameter, ManualParameter, Parameter, Parameter]:
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    signal = Parameter("signal", get_cmd=lambda: 10 * x() + y())
+    other = Parameter("other", get_cmd=lambda: -y())
+    return x, y, signal, other
+
+
+@pytest.mark.parametrize("sweep_order", ["raster", "serpentine"])
+@pytest.mark.parametrize("cache", [False, True])
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume(sweep_order, cache) -> None:
+    x, y, signal, other = _resume_signals()
+    sweeps = (LinSweep(x, 0, 2, 3), LinSweep(y, 0, 3, 4))
+    n_points = 0
+
+    def break_condition() -> bool:
+        nonlocal n_points
+        n_points += 1
+        return n_points == 6
+
+    (interrupted, _), _, _ = dond(
+        *sweeps,
+        [signal],
+        [other],
+        do_plot=False,
+        sweep_order=sweep_order,
+        in_memory_cache=cache,
+        break_condition=break_condition,
+    )
+    checkpoint = json.loads(interrupted.metadata["dond_checkpoint"])
+    assert checkpoint["points"] == (6 if sweep_order == "raster" else 4)
+    assert checkpoint["num_points"] == 12
+
+    n_points = -100
+    (resumed, resumed_other), _, _ = dond(
+        *sweeps,
+        [signal],
+        [other],
+        do_plot=False,
+        sweep_order=sweep_order,
+        in_memory_cache=cache,
+        break_condition=break_condition,
+        resume_guid=interrupted.guid,
+    )
+    # only the points that were not stored are measured again
+    assert n_points == -100 + (6 if sweep_order == "raster" else 8)
+    assert resumed.guid == interrupted.guid
+    assert resumed.completed
+
+    (full, full_other), _, _ = dond(*sweeps, [signal], [other], do_plot=False)
+    for ds, expected, name in (
+        (resumed, full, "signal"),
+        (resumed_other, full_other, "other"),
+    ):
+        expected_data = expected.get_parameter_data()[name]
+        stored = load_by_guid(ds.guid).get_parameter_data()[name]
+        for data in (stored, ds.cache.data()[name]):
+            for param_name, values in expected_data.items():
+                np.testing.assert_allclose(
+                    np.ravel(data[param_name]), np.ravel(values)
+                )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume_pipelined() -> None:
+    x, y, signal, _ = _resume_signals()
+    sweeps = (LinSweep(x, 0, 2, 3), LinSweep(y, 0, 3, 4))
+    n_points = 0
+
+    def break_condition() -> bool:
+        nonlocal n_points
+        n_points += 1
+        return n_points == 2
+
+    interrupted, _, _ = dond(
+        *sweeps, signal, do_plot=False, break_condition=break_condition
+    )
+    assert isinstance(interrupted, DataSet)
+
+    n_points = -100
+    resumed, _, _ = dond(
+        *sweeps,
+        signal,
+        do_plot=False,
+        pipeline=True,
+        break_condition=break_condition,
+        resume_guid=interrupted.guid,
+    )
+    assert isinstance(resumed, DataSet)
+    assert n_points == -100 + 10
+    np.testing.assert_array_equal(
+        load_by_guid(resumed.guid).get_parameter_data()["signal"]["signal"].ravel(),
+        [0, 1, 2, 3, 10, 11, 12, 13, 20, 21, 22, 23],
+    )
+    checkpoint = json.loads(resumed.metadata["dond_checkpoint"])
+    assert checkpoint["points"] == 12
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume_in_other_database(empty_temp_db_connection) -> None:
+    x, y, signal, _ = _resume_signals()
+    sweeps = (LinSweep(x, 0, 1, 2), LinSweep(y, 0, 3, 4))
+    exp = new_experiment(
+        "other_db", sample_name="no sample", conn=empty_temp_db_connection
+    )
+    n_points = 0
+
+    def break_condition() -> bool:
+        nonlocal n_points
+        n_points += 1
+        return n_points == 3
+
+    interrupted, _, _ = dond(
+        *sweeps, signal, exp=exp, do_plot=False, break_condition=break_condition
+    )
+    assert isinstance(interrupted, DataSet)
+    with pytest.raises(NameError):
+        load_by_guid(interrupted.guid)
+
+    n_points = -100
+    resumed, _, _ = dond(
+        *sweeps,
+        signal,
+        exp=exp,
+        do_plot=False,
+        break_condition=break_condition,
+        resume_guid=interrupted.guid,
+    )
+    assert n_points == -100 + 5
+    np.testing.assert_array_equal(
+        load_by_guid(resumed.guid, conn=empty_temp_db_connection)
+        .get_parameter_data()["signal"]["signal"]
+        .ravel(),
+        [0, 1, 2, 3, 10, 11, 12, 13],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_checkpoint_does_not_block_background_writer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    x, y, signal, _ = _resume_signals()
+    sweeps = (LinSweep(x, 0, 1, 2), LinSweep(y, 0, 3, 4))
+    qc.config.dataset.write_in_background = True
+    flush = DataSaver.flush_data_to_database
+    blocking_flushes = 0
+
+    def flush_data_to_database(self: DataSaver, block: bool = False) -> None:
+        nonlocal blocking_flushes
+        blocking_flushes += block
+        flush(self, block=block)
+
+    monkeypatch.setattr(DataSaver, "flush_data_to_database", flush_data_to_database)
+    n_points = 0
+
+    def break_condition() -> bool:
+        nonlocal n_points
+        # only the exit of the measurement waits for the writer
+        assert blocking_flushes == 0
+        n_points += 1
+        return n_points == 3
+
+    interrupted, _, _ = dond(
+        *sweeps, signal, do_plot=False, break_condition=break_condition
+    )
+    assert isinstance(interrupted, DataSet)
+    assert n_points == 3
+    checkpoint = json.loads(interrupted.metadata["dond_checkpoint"])
+    assert checkpoint["points"] == 3
+    assert checkpoint["last_result_id"] == 3
+    assert json.loads(
+        load_by_guid(interrupted.guid).metadata["dond_checkpoint"]
+    ) == checkpoint
+
+    resumed, _, _ = dond(
+        *sweeps, signal, do_plot=False, resume_guid=interrupted.guid
+    )
+    np.testing.assert_array_equal(
+        load_by_guid(resumed.guid).get_parameter_data()["signal"]["signal"].ravel(),
+        [0, 1, 2, 3, 10, 11, 12, 13],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume_after_exception() -> None:
+    x, y, _, _ = _resume_signals()
+    n_gets = 0
+
+    def get_signal() -> float:
+        nonlocal n_gets
+        n_gets += 1
+        if n_gets == 5:
+            raise RuntimeError("Instrument stopped responding")
+        return 10 * x() + y()
+
+    signal = Parameter("signal", get_cmd=get_signal)
+    sweeps = (LinSweep(x, 0, 1, 2), LinSweep(y, 0, 3, 4))
+    with pytest.raises(RuntimeError, match="stopped responding"):
+        dond(*sweeps, signal, do_plot=False)
+    dataset = qc.dataset.load_last_experiment().last_data_set()
+
+    resumed, _, _ = dond(*sweeps, signal, do_plot=False, resume_guid=dataset.guid)
+    assert isinstance(resumed, DataSet)
+    assert n_gets == 9
+    np.testing.assert_array_equal(
+        resumed.get_parameter_data()["signal"]["signal"].ravel(),
+        [0, 1, 2, 3, 10, 11, 12, 13],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume_discards_results_after_checkpoint() -> None:
+    x, y, signal, _ = _resume_signals()
+    sweeps = (LinSweep(x, 0, 1, 2), LinSweep(y, 0, 3, 4))
+    dataset, _, _ = dond(*sweeps, signal, do_plot=False)
+    assert isinstance(dataset, DataSet)
+    checkpoint = json.loads(dataset.metadata["dond_checkpoint"])
+    assert checkpoint["points"] == 8
+    # pretend that the dond stopped before the last checkpoint
+    dataset.add_metadata(
+        "dond_checkpoint",
+        json.dumps(
+            {
+                **checkpoint,
+                "points": 5,
+                "last_result_id": 5,
+                "previous": {"points": 0, "last_result_id": 0},
+            }
+        ),
+    )
+    resumed, _, _ = dond(*sweeps, signal, do_plot=False, resume_guid=dataset.guid)
+    np.testing.assert_array_equal(
+        resumed.get_parameter_data()["signal"]["signal"].ravel(),
+        [0, 1, 2, 3, 10, 11, 12, 13],
+    )
+
+
+@pytest.mark.usefixtures("experiment")
+def test_dond_resume_requires_matching_run() -> None:
+    x, y, signal, other = _resume_signals()
+    dataset, _, _ = dond(LinSweep(x, 0, 1, 2), signal, do_plot=False)
+
+    with pytest.raises(ValueError, match="with 3 points from a dond with 2 points"):
+        dond(LinSweep(x, 0, 1, 3), signal, do_plot=False, resume_guid=dataset.guid)
+    with pytest.raises(ValueError, match="with 2 datasets from a dond with 1"):
+        dond(
+            LinSweep(x, 0, 1, 2),
+            [signal],
+            [other],
+            do_plot=False,
+            resume_guid=dataset.guid,
+        )
+    with pytest.raises(ValueError, match="parameters differ"):
+        dond(LinSweep(y, 0, 1, 2), signal, do_plot=False, resume_guid=dataset.guid)
+    with pytest.raises(ValueError, match="cannot be resumed"):
+        dond(
+            AdaptiveSweep1D(x, 0, 1, 10),
+            signal,
+            do_plot=False,
+            resume_guid=dataset.guid,
+        )
+
+    meas = qc.dataset.Measurement()
+    meas.register_parameter(x)
+    with meas.run() as datasaver:
+        datasaver.add_result((x, 1))
+    with pytest.raises(ValueError, match="no checkpoint"):
+        dond(
+            LinSweep(x, 0, 1, 2),
+            signal,
+            do_plot=False,
+            resume_guid=datasaver.dataset.guid,
+        )
+
+
 @pytest.mark.usefixtures("plot_close", "experiment")
 def test_sweep_int_vs_float() -> None:
     float_param = ManualParameter("float_param", initial_value=0.0)
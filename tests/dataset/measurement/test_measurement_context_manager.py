@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import random
@@ -24,6 +25,7 @@ from qcodes.dataset.experiment_container import new_experiment
 from qcodes.dataset.export_config import DataExportType
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.sqlite.connection import atomic_transaction
+from qcodes.instrument_drivers.mock_instruments import MockSimulatedScope
 from qcodes.parameters import ManualParameter, Parameter, expand_setpoints_helper
 from qcodes.station import Station
 from tests.common import retry_until_does_not_throw
@@ -696,6 +698,35 @@ def test_exception_happened_during_measurement_is_stored_in_dataset_metadata(
     assert exception_string == expected_exception_string
 
 
+def test_io_stats_of_run_are_stored_in_dataset_metadata(experiment) -> None:
+    scope = MockSimulatedScope("scope")
+    try:
+        scope.enable_io_stats()
+        # commands before the run are not part of its statistics
+        scope.voltage(0)
+        meas = Measurement()
+        meas.register_parameter(scope.voltage)
+        with meas.run() as datasaver:
+            for set_v in range(5):
+                scope.voltage(set_v)
+                datasaver.add_result((scope.voltage, scope.voltage()))
+    finally:
+        scope.close()
+
+    io_stats = json.loads(datasaver.dataset.metadata["io_stats"])
+    assert set(io_stats) == {"scope"}
+    assert io_stats["scope"]["VOLT <n>"]["count"] == 5
+    assert io_stats["scope"]["VOLT?"]["count"] == 5
+
+
+def test_io_stats_not_stored_in_metadata_when_disabled(experiment) -> None:
+    meas = Measurement()
+    meas.register_custom_parameter(name="nodata")
+    with meas.run() as datasaver:
+        pass
+    assert "io_stats" not in datasaver.dataset.metadata
+
+
 @pytest.mark.parametrize("bg_writing", [True, False])
 @settings(max_examples=10, deadline=None)
 @given(N=hst.integers(min_value=2, max_value=500))
@@ -6,6 +6,7 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import h5py
 import numpy as np
 import pandas as pd
 import pytest
@@ -26,10 +27,18 @@ from qcodes.dataset import (
     load_from_netcdf,
     new_data_set,
 )
+from qcodes.dataset.data_set_cache import DataSetCacheDeferred
+from qcodes.dataset.data_set_in_memory import DataSetInMem
 from qcodes.dataset.descriptions.dependencies import InterDependencies_
 from qcodes.dataset.descriptions.param_spec import ParamSpecBase
 from qcodes.dataset.descriptions.versioning import serialization as serial
 from qcodes.dataset.export_config import DataExportType
+from qcodes.dataset.exporters.export_to_csv import (
+    DataLengthException,
+    dataframe_to_csv,
+    dataset_to_csv_streaming,
+)
+from qcodes.dataset.exporters.export_to_h5netcdf import dataset_to_h5netcdf_direct
 from qcodes.dataset.exporters.export_to_pandas import _generate_pandas_index
 from qcodes.dataset.exporters.export_to_xarray import _calculate_index_shape
 from qcodes.dataset.linked_datasets.links import links_to_str
@@ -507,6 +516,82 @@ def test_export_csv(tmp_path_factory, mock_dataset, caplog: LogCaptureFixture) -
         assert f.readlines() == ['0.0\t1.0\t2.0\n']
 
 
+@pytest.mark.parametrize(
+    "dataset_fixture",
+    [
+        "mock_dataset",
+        "mock_dataset_complex",
+        "mock_dataset_grid",
+        "mock_dataset_in_mem_grid",
+        "mock_dataset_grid_with_shapes",
+        "mock_dataset_grid_incomplete_with_shapes",
+        "mock_dataset_numpy",
+        "mock_dataset_non_grid",
+        "mock_dataset_inverted_coords",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_export_csv_streaming_matches_dataframe_export(
+    tmp_path: Path, request: pytest.FixtureRequest, dataset_fixture: str, chunk_size: int
+) -> None:
+    dataset = request.getfixturevalue(dataset_fixture)
+
+    dataframe_to_csv(
+        dfdict=dataset.to_pandas_dataframe_dict(),
+        path=tmp_path,
+        single_file=True,
+        single_file_name="dataframe.csv",
+    )
+    dataset_to_csv_streaming(
+        dataset, tmp_path, "streamed.csv", chunk_size=chunk_size
+    )
+
+    expected = (tmp_path / "dataframe.csv").read_text()
+    assert len(expected) > 0
+    assert (tmp_path / "streamed.csv").read_text() == expected
+
+
+def test_export_csv_streaming_float_format(tmp_path: Path, mock_dataset_grid) -> None:
+    dataset_to_csv_streaming(
+        mock_dataset_grid, tmp_path, "streamed", chunk_size=7, float_format="%.2e"
+    )
+
+    with open(tmp_path / "streamed.dat") as f:
+        lines = f.readlines()
+    assert len(lines) == 50
+    assert lines[0] == "0.00e+00\t2.00e+01\t2.00e+01\n"
+
+
+def test_export_csv_options_from_config(tmp_path: Path, mock_dataset_grid) -> None:
+    qcodes.config.dataset.export_csv_chunk_size = 7
+    qcodes.config.dataset.export_csv_float_format = "%.2e"
+
+    mock_dataset_grid.export(export_type="csv", path=tmp_path, prefix="qcodes_")
+
+    with open(mock_dataset_grid.export_info.export_paths["csv"]) as f:
+        lines = f.readlines()
+    assert len(lines) == 50
+    assert lines[0] == "0.00e+00\t2.00e+01\t2.00e+01\n"
+
+
+def test_export_csv_streaming_different_length_raises(
+    tmp_path: Path, experiment
+) -> None:
+    dataset = new_data_set("dataset")
+    xparam = ParamSpecBase("x", "numeric")
+    yparam = ParamSpecBase("y", "numeric")
+    zparam = ParamSpecBase("z", "numeric")
+    idps = InterDependencies_(dependencies={yparam: (xparam,), zparam: (xparam,)})
+    dataset.set_interdependencies(idps)
+    dataset.mark_started()
+    dataset.add_results([{"x": x, "y": x} for x in range(5)])
+    dataset.add_results([{"x": x, "z": x} for x in range(3)])
+    dataset.mark_completed()
+
+    with pytest.raises(DataLengthException):
+        dataset_to_csv_streaming(dataset, tmp_path, "streamed.csv", chunk_size=2)
+
+
 def test_export_netcdf(
     tmp_path_factory, mock_dataset, caplog: LogCaptureFixture
 ) -> None:
@@ -1492,3 +1577,203 @@ def test_export_lazy_load_in_mem_dataset(
     getattr(dataset_loaded_by_guid, function_name)()
 
     assert dataset_loaded_by_guid.cache._data != {}
+
+
+def _export_and_load_from_netcdf(
+    dataset: DataSetProtocol, tmp_path: Path
+) -> tuple[DataSetProtocol, Path]:
+    dataset.export(export_type="netcdf", path=tmp_path, prefix="qcodes_")
+    file_path = Path(dataset.export_info.export_paths["nc"])
+    return load_from_netcdf(file_path), file_path
+
+
+def test_deferred_cache_loads_parameter_trees_on_demand(
+    tmp_path: Path, mock_dataset_inverted_coords: DataSet
+) -> None:
+    ds, file_path = _export_and_load_from_netcdf(mock_dataset_inverted_coords, tmp_path)
+    assert isinstance(ds.cache, DataSetCacheDeferred)
+
+    data = ds.cache.lazy_data()
+    assert list(data) == ["z1", "z2"]
+    assert "z1" in data
+    assert len(data) == 2
+    assert ds.cache._data == {}
+
+    z1_data = data["z1"]
+    assert list(ds.cache._data) == ["z1"]
+    assert list(z1_data) == ["z1", "x", "y"]
+
+    expected = DataSetInMem._from_xarray_dataset_to_qcodes_raw_data(
+        xr.load_dataset(file_path, engine="h5netcdf")
+    )
+    np.testing.assert_equal(dict(data.items()), expected)
+    assert list(ds.cache._data) == ["z1", "z2"]
+
+    with pytest.raises(KeyError):
+        data["x"]
+
+    # the lazy data is not a dict, such that it cannot be mistaken for an
+    # empty one, while data() loads all parameter trees into a dict
+    assert not isinstance(data, dict)
+    for parameter_data in (ds.cache.data(), ds.get_parameter_data()):
+        assert isinstance(parameter_data, dict)
+        np.testing.assert_equal(parameter_data, expected)
+
+
+def test_deferred_cache_load_sliced_parameter_data(
+    tmp_path: Path, mock_dataset_inverted_coords: DataSet
+) -> None:
+    ds, _ = _export_and_load_from_netcdf(mock_dataset_inverted_coords, tmp_path)
+    assert isinstance(ds.cache, DataSetCacheDeferred)
+
+    sliced = ds.cache.load_parameter_data("z2", isel={"x": slice(2, 4)})
+    assert ds.cache._data == {}
+    assert sliced["z2"].shape == (5, 2)
+    full = ds.cache.data()["z2"]
+    for name, array in sliced.items():
+        np.testing.assert_equal(array, full[name][:, 2:4])
+
+
+def test_deferred_cache_memory_limit(
+    tmp_path: Path, mock_dataset_inverted_coords: DataSet
+) -> None:
+    ds, _ = _export_and_load_from_netcdf(mock_dataset_inverted_coords, tmp_path)
+    # each parameter tree is 3 arrays of 50 float64 values
+    qcodes.config.dataset.deferred_cache_memory_limit = 1200 / 1024 / 1024
+
+    assert isinstance(ds.cache, DataSetCacheDeferred)
+    data = ds.cache.lazy_data()
+    z1_data = data["z1"]
+    assert list(ds.cache._data) == ["z1"]
+    data["z2"]
+    assert list(ds.cache._data) == ["z2"]
+    np.testing.assert_equal(data["z1"], z1_data)
+    assert list(ds.cache._data) == ["z1"]
+
+    qcodes.config.dataset.deferred_cache_memory_limit = None
+    data["z2"]
+    assert list(ds.cache._data) == ["z1", "z2"]
+
+
+def test_deferred_cache_data_ignores_memory_limit(
+    tmp_path: Path, mock_dataset_inverted_coords: DataSet
+) -> None:
+    ds, _ = _export_and_load_from_netcdf(mock_dataset_inverted_coords, tmp_path)
+    qcodes.config.dataset.deferred_cache_memory_limit = 1200 / 1024 / 1024
+    assert isinstance(ds.cache, DataSetCacheDeferred)
+
+    data = ds.cache.data()
+    # all trees are held by the returned dict so they are kept in the cache
+    assert list(ds.cache._data) == ["z1", "z2"]
+    assert all(data[name] is ds.cache._data[name] for name in data)
+    assert all(ds.cache.data()[name] is data[name] for name in data)
+
+    # lazily accessing a tree releases the others down to the limit
+    ds.cache.lazy_data()["z1"]
+    assert list(ds.cache._data) == ["z1"]
+
+
+def test_export_direct_h5netcdf_grid_with_shapes(
+    tmp_path_factory: TempPathFactory, mock_dataset_grid_with_shapes: DataSet
+) -> None:
+    tmp_path = tmp_path_factory.mktemp("export_netcdf")
+    file_path = tmp_path / "direct.nc"
+
+    dataset_to_h5netcdf_direct(mock_dataset_grid_with_shapes, file_path)
+
+    xr_ds = mock_dataset_grid_with_shapes.to_xarray_dataset()
+    with xr.open_dataset(file_path, engine="h5netcdf") as xr_ds_direct:
+        assert xr_ds_direct.identical(xr_ds)
+    with h5py.File(file_path, "r") as h5_file:
+        assert h5_file["z"].compression == "gzip"
+        assert h5_file["z"].shuffle
+        assert h5_file["z"].chunks is not None
+
+    ds = load_from_netcdf(file_path)
+    assert ds.guid == mock_dataset_grid_with_shapes.guid
+    assert ds.description == mock_dataset_grid_with_shapes.description
+    assert ds.to_xarray_dataset()["z"].identical(xr_ds["z"])
+    assert_allclose(
+        ds.cache.data()["z"]["z"].reshape(10, 5),
+        mock_dataset_grid_with_shapes.cache.data()["z"]["z"],
+    )
+
+
+def test_export_direct_h5netcdf_sorts_inverted_coords(
+    tmp_path_factory: TempPathFactory, experiment
+) -> None:
+    dataset = new_data_set("dataset")
+    xparam = ParamSpecBase("x", "numeric")
+    yparam = ParamSpecBase("y", "numeric")
+    zparam = ParamSpecBase("z", "complex")
+    idps = InterDependencies_(dependencies={zparam: (xparam, yparam)})
+    dataset.set_interdependencies(idps, shapes={"z": (3, 4)})
+
+    dataset.mark_started()
+    for x in range(3, 0, -1):
+        for y in range(4):
+            dataset.add_results([{"x": x, "y": y, "z": x + 1j * y}])
+    dataset.mark_completed()
+
+    file_path = tmp_path_factory.mktemp("export_netcdf") / "direct.nc"
+    dataset_to_h5netcdf_direct(dataset, file_path)
+
+    with xr.open_dataset(file_path, engine="h5netcdf") as xr_ds_direct:
+        assert xr_ds_direct.x.values.tolist() == [1, 2, 3]
+        assert xr_ds_direct.identical(dataset.to_xarray_dataset())
+
+
+def test_export_direct_h5netcdf_falls_back_without_shapes(
+    tmp_path_factory: TempPathFactory, mock_dataset_grid: DataSet
+) -> None:
+    file_path = tmp_path_factory.mktemp("export_netcdf") / "direct.nc"
+
+    dataset_to_h5netcdf_direct(mock_dataset_grid, file_path)
+
+    with xr.open_dataset(file_path, engine="h5netcdf") as xr_ds_direct:
+        assert xr_ds_direct.identical(mock_dataset_grid.to_xarray_dataset())
+    with h5py.File(file_path, "r") as h5_file:
+        assert h5_file["z"].compression is None
+
+
+def test_export_direct_h5netcdf_from_config(
+    tmp_path_factory: TempPathFactory, mock_dataset_grid_with_shapes: DataSet
+) -> None:
+    tmp_path = tmp_path_factory.mktemp("export_netcdf")
+    qcodes.config.dataset.export_direct_h5netcdf_enabled = True
+
+    mock_dataset_grid_with_shapes.export(
+        export_type="netcdf", path=tmp_path, prefix="qcodes_"
+    )
+
+    file_path = mock_dataset_grid_with_shapes.export_info.export_paths["nc"]
+    with h5py.File(file_path, "r") as h5_file:
+        assert h5_file["z"].compression == "gzip"
+        assert h5_file["z"].shape == (10, 5)
+
+
+def test_export_direct_h5netcdf_falls_back_to_chunked_export(
+    tmp_path_factory: TempPathFactory,
+    mock_dataset_grid: DataSet,
+    caplog: LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tmp_path = tmp_path_factory.mktemp("export_netcdf")
+    qcodes.config.dataset.export_direct_h5netcdf_enabled = True
+    qcodes.config.dataset.export_chunked_export_of_large_files_enabled = True
+    qcodes.config.dataset.export_chunked_threshold = 0
+
+    def _fail_to_load() -> None:
+        raise AssertionError("The data of a dataset without shapes was loaded")
+
+    # the dataset has no shapes so its data should never be loaded as a whole
+    monkeypatch.setattr(mock_dataset_grid.cache, "data", _fail_to_load)
+    with caplog.at_level(logging.INFO):
+        mock_dataset_grid.export(export_type="netcdf", path=tmp_path, prefix="qcodes_")
+
+    assert (
+        "Dataset is expected to be larger that threshold. Using distributed export."
+        in caplog.records[0].msg
+    )
+    loaded_ds = xr.load_dataset(mock_dataset_grid.export_info.export_paths["nc"])
+    assert loaded_ds.z.shape == (10, 5)
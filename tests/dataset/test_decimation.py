@@ -0,0 +1,191 @@
+import json
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import PolyCollection
+
+import qcodes as qc
+from qcodes.dataset.decimation import (
+    DECIMATION_PYRAMID_METADATA_TAG,
+    build_decimation_pyramid,
+    load_decimation_pyramid,
+    select_decimation_level,
+)
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.plotting import plot_dataset
+
+
+@pytest.fixture(name="dataset_1d")
+def _make_dataset_1d(experiment):
+    meas = Measurement()
+    meas.register_custom_parameter("x", unit="V")
+    meas.register_custom_parameter("y", unit="A", setpoints=("x",))
+
+    rng = np.random.default_rng(seed=1)
+    x = rng.permutation(np.arange(20_000, dtype=np.float64))
+    y = np.sin(x / 1000) + rng.normal(scale=0.1, size=x.shape)
+    with meas.run() as datasaver:
+        datasaver.add_result(("x", x), ("y", y))
+    return datasaver.dataset
+
+
+@pytest.fixture(name="dataset_2d")
+def _make_dataset_2d(experiment):
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    meas.register_custom_parameter("y")
+    meas.register_custom_parameter("z", setpoints=("x", "y"))
+    meas.set_shapes({"z": (200, 160)})
+
+    x, y = np.meshgrid(np.arange(200.0), np.arange(160.0), indexing="ij")
+    z = x * 1000 + y
+    with meas.run() as datasaver:
+        datasaver.add_result(("x", x.ravel()), ("y", y.ravel()), ("z", z.ravel()))
+    return datasaver.dataset
+
+
+def test_decimation_pyramid_1d(dataset_1d) -> None:
+    pyramid = build_decimation_pyramid(dataset_1d, min_points=100)
+
+    data = dataset_1d.get_parameter_data()["y"]
+    order = np.argsort(data["x"])
+    x_sorted = data["x"][order]
+    y_sorted = data["y"][order]
+
+    levels = pyramid["y"]
+    assert [level["block_size"] for level in levels] == [4, 16, 64]
+    for level in levels:
+        block = level["block_size"]
+        n_blocks = len(y_sorted) // block
+        y_blocks = y_sorted[: n_blocks * block].reshape(n_blocks, block)
+        x_blocks = x_sorted[: n_blocks * block].reshape(n_blocks, block)
+        np.testing.assert_allclose(level["min"][:n_blocks], y_blocks.min(axis=1))
+        np.testing.assert_allclose(level["max"][:n_blocks], y_blocks.max(axis=1))
+        np.testing.assert_allclose(level["mean"][:n_blocks], y_blocks.mean(axis=1))
+        np.testing.assert_allclose(
+            level["setpoints"][0][:n_blocks], x_blocks.mean(axis=1)
+        )
+
+    # the pyramid is stored in a file next to the database, not in it
+    db_file = Path(dataset_1d.path_to_db)
+    assert (db_file.parent / f"{db_file.stem}_decimation").is_dir()
+
+    loaded = load_decimation_pyramid(dataset_1d)
+    assert loaded is not None
+    assert list(loaded) == ["y"]
+    for built_level, loaded_level in zip(levels, loaded["y"]):
+        assert built_level["block_size"] == loaded_level["block_size"]
+        for key in ("min", "max", "mean"):
+            np.testing.assert_array_equal(built_level[key], loaded_level[key])
+        np.testing.assert_array_equal(
+            built_level["setpoints"][0], loaded_level["setpoints"][0]
+        )
+
+
+def test_decimation_pyramid_2d_shaped(dataset_2d) -> None:
+    pyramid = build_decimation_pyramid(dataset_2d, factor=2, store=False)
+
+    z = dataset_2d.cache.data()["z"]["z"]
+    levels = pyramid["z"]
+    assert levels[0]["mean"].shape == (100, 80)
+    assert levels[-1]["mean"].shape == (13, 10)
+    for level in levels:
+        block = level["block_size"]
+        # only compare the blocks that are not truncated at the edge
+        nx, ny = z.shape[0] // block, z.shape[1] // block
+        blocks = z[: nx * block, : ny * block].reshape(nx, block, ny, block)
+        for key, reduction in (("mean", np.mean), ("min", np.min), ("max", np.max)):
+            np.testing.assert_allclose(
+                level[key][:nx, :ny], reduction(blocks, axis=(1, 3))
+            )
+
+    assert select_decimation_level(levels, 40) is levels[1]
+    assert select_decimation_level(levels, 80) is levels[0]
+    assert select_decimation_level(levels, 81) is None
+    assert load_decimation_pyramid(dataset_2d) is None
+
+
+def test_decimation_pyramid_requires_completed_dataset(experiment) -> None:
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    meas.register_custom_parameter("y", setpoints=("x",))
+    with meas.run() as datasaver:
+        datasaver.add_result(("x", np.arange(10)), ("y", np.arange(10)))
+        with pytest.raises(RuntimeError, match="completed dataset"):
+            build_decimation_pyramid(datasaver.dataset)
+
+
+def test_plot_dataset_uses_decimation_pyramid(dataset_1d) -> None:
+    build_decimation_pyramid(dataset_1d)
+
+    fig, ax = plt.subplots(figsize=(6.4, 4.8), dpi=100)
+    axes, _ = plot_dataset(dataset_1d, axes=ax)
+    (line,) = axes[0].get_lines()
+    n_pixels = axes[0].get_window_extent().width
+    assert n_pixels <= len(line.get_xdata()) < 4 * n_pixels
+    assert any(isinstance(child, PolyCollection) for child in axes[0].get_children())
+
+    fig, ax = plt.subplots()
+    axes, _ = plot_dataset(dataset_1d, axes=ax, use_decimation=False)
+    (line,) = axes[0].get_lines()
+    assert len(line.get_xdata()) == 20_000
+    assert not any(
+        isinstance(child, PolyCollection) for child in axes[0].get_children()
+    )
+    plt.close("all")
+
+
+def test_plot_dataset_falls_back_to_full_data(dataset_2d) -> None:
+    build_decimation_pyramid(dataset_2d)
+
+    # no level of the pyramid has enough points for the axes
+    axes, _ = plot_dataset(dataset_2d)
+    (mesh,) = axes[0].collections
+    assert mesh.get_array().size == 200 * 160
+    plt.close("all")
+
+
+def test_plot_dataset_falls_back_to_full_data_per_parameter(experiment) -> None:
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    meas.register_custom_parameter("y", setpoints=("x",))
+    meas.register_custom_parameter("label", paramtype="text", setpoints=("x",))
+
+    x = np.arange(20_000.0)
+    with meas.run() as datasaver:
+        datasaver.add_result(
+            ("x", x), ("y", np.sin(x / 1000)), ("label", np.full(x.shape, "a"))
+        )
+    dataset = datasaver.dataset
+    # text data is not decimated
+    assert list(build_decimation_pyramid(dataset)) == ["y"]
+
+    axes, _ = plot_dataset(dataset)
+    assert len(axes) == 2
+    (decimated_line,) = axes[0].get_lines()
+    assert len(decimated_line.get_xdata()) < 20_000
+    assert axes[1].get_ylabel().startswith("label")
+    plt.close("all")
+
+
+def test_decimation_pyramid_on_completion(experiment) -> None:
+    qc.config.dataset.decimation_pyramid_on_completion = True
+
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    meas.register_custom_parameter("y", setpoints=("x",))
+    with meas.run() as datasaver:
+        datasaver.add_result(("x", np.arange(1000)), ("y", np.arange(1000)))
+
+    assert DECIMATION_PYRAMID_METADATA_TAG in datasaver.dataset.metadata
+    # only a small reference is stored in the metadata
+    reference = json.loads(datasaver.dataset.metadata[DECIMATION_PYRAMID_METADATA_TAG])
+    assert set(reference) == {"n_bytes"}
+    assert DECIMATION_PYRAMID_METADATA_TAG not in (
+        datasaver.dataset.to_xarray_dataset().attrs
+    )
+    pyramid = load_decimation_pyramid(datasaver.dataset)
+    assert pyramid is not None
+    assert [level["block_size"] for level in pyramid["y"]] == [4]
@@ -8,6 +8,7 @@ from matplotlib.collections import QuadMesh
 from pytest import FixtureRequest
 
 import qcodes as qc
+from qcodes.dataset.data_export import datatype_from_setpoints_2d, reshape_2D_data
 from qcodes.dataset.descriptions.detect_shapes import detect_shape_of_measurement
 from qcodes.dataset.measurements import Measurement
 from qcodes.dataset.plotting import (
@@ -362,3 +363,43 @@ def test__complex_to_real_preparser_complex_setpoint() -> None:
     assert measured_param['label'] == 'measured voltage'
     assert measured_param['unit'] == 'V'
     assert all(measured_param['data'] == np.array([0, 1, 2]))
+
+
+@pytest.mark.parametrize(
+    "x, y, expected",
+    [
+        (np.repeat([0.0, 1.0, 3.0], 4), np.tile([0.0, 2.0, 5.0, 6.0], 3), "2D_grid"),
+        # interrupted sweep
+        (
+            np.repeat([0.0, 1.0, 3.0], 4)[:-2],
+            np.tile([0.0, 2.0, 5.0, 6.0], 3)[:-2],
+            "2D_grid",
+        ),
+        # equidistant grid with several holes
+        (
+            np.array([0.0, 0.0, 1.0, 1.0, 2.0, 2.0, 3.0]),
+            np.array([0.0, 1.0, 1.0, 2.0, 0.0, 2.0, 1.0]),
+            "2D_equidistant",
+        ),
+        (np.array([0.0, 0.3, 1.0, 1.1]), np.array([0.0, 0.7, 0.2, 1.0]), "2D_unknown"),
+        (np.zeros(4), np.arange(4.0), "2D_point"),
+    ],
+)
+def test_datatype_from_setpoints_2d(x, y, expected) -> None:
+    assert datatype_from_setpoints_2d(x, y) == expected
+    assert datatype_from_setpoints_2d(x[::-1], y[::-1]) == expected
+
+
+def test_reshape_2D_data_interrupted_sweep() -> None:
+    x = np.repeat([3.0, 1.0, 0.0], 4)[:-2]
+    y = np.tile([6.0, 2.0, 5.0, 0.0], 3)[:-2]
+    z = np.arange(10.0)
+
+    xrow, yrow, z_to_plot = reshape_2D_data(x, y, z)
+
+    np.testing.assert_array_equal(xrow, [0.0, 1.0, 3.0])
+    np.testing.assert_array_equal(yrow, [0.0, 2.0, 5.0, 6.0])
+    expected = np.array(
+        [[np.nan, 7.0, 3.0], [9.0, 5.0, 1.0], [np.nan, 6.0, 2.0], [8.0, 4.0, 0.0]]
+    )
+    np.testing.assert_array_equal(z_to_plot, expected)
@@ -0,0 +1,106 @@
+import json
+
+import numpy as np
+import pytest
+
+from qcodes.dataset.measurements import Measurement
+from qcodes.dataset.timing_profiler import STAGES, PointTimingProfiler
+
+
+def test_profiler_accumulates_stages_of_point() -> None:
+    profiler = PointTimingProfiler(capacity=4)
+    profiler.record("set", 1.0)
+    profiler.record("set", 0.5)
+    profiler.record("get", 2.0)
+    profiler.end_point()
+    profiler.record("get", 3.0)
+    profiler.end_point()
+
+    assert profiler.n_points == 2
+    trace = profiler.trace()
+    assert trace.shape == (2, len(STAGES))
+    np.testing.assert_array_equal(trace[:, STAGES.index("set")], [1.5, 0])
+    np.testing.assert_array_equal(trace[:, STAGES.index("get")], [2, 3])
+
+    summary = profiler.summary()
+    assert summary["n_points"] == 2
+    assert set(summary["stages"]) == {"set", "get", "point"}
+    assert summary["stages"]["get"]["total"] == 5
+    assert summary["stages"]["get"]["mean"] == 2.5
+    assert summary["stages"]["get"]["max"] == 3
+    assert "trace" not in summary
+
+
+def test_profiler_ring_buffer_keeps_last_points() -> None:
+    profiler = PointTimingProfiler(capacity=3)
+    for duration in range(1, 8):
+        profiler.record("get", duration)
+        profiler.end_point()
+
+    np.testing.assert_array_equal(
+        profiler.trace()[:, STAGES.index("get")], [5, 6, 7]
+    )
+    summary = profiler.summary(include_trace=True)
+    assert summary["n_points"] == 7
+    assert summary["n_buffered"] == 3
+    # the totals are over all points, the other statistics over the buffer
+    assert summary["stages"]["get"]["total"] == 28
+    assert summary["stages"]["get"]["median"] == 6
+    assert summary["trace"]["stages"] == ["get", "point"]
+    assert [row[0] for row in summary["trace"]["durations"]] == [5, 6, 7]
+
+
+def test_profiler_time_context_manager() -> None:
+    profiler = PointTimingProfiler()
+    with profiler.time("delay"):
+        pass
+    profiler.end_point()
+    delay = profiler.trace()[0, STAGES.index("delay")]
+    assert 0 <= delay <= profiler.trace()[0, STAGES.index("point")]
+
+    with pytest.raises(KeyError):
+        profiler.record("unknown", 1.0)
+
+
+@pytest.mark.parametrize("store_timing_trace", [False, True])
+@pytest.mark.usefixtures("experiment")
+def test_measurement_profile_timing(store_timing_trace) -> None:
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    meas.register_custom_parameter("y", setpoints=("x",))
+
+    with meas.run(
+        profile_timing=True, store_timing_trace=store_timing_trace
+    ) as datasaver:
+        profiler = datasaver.timing_profiler
+        assert profiler is not None
+        for x in range(10):
+            with profiler.time("get"):
+                y = x**2
+            datasaver.add_result(("x", x), ("y", y))
+
+    dataset = datasaver.dataset
+    profile = json.loads(dataset.metadata["timing_profile"])
+    assert profile["n_points"] == 10
+    assert set(profile["stages"]) >= {"get", "add_result", "point"}
+    assert profile["writer_drain"] >= 0
+    assert ("trace" in profile) == store_timing_trace
+    if store_timing_trace:
+        assert len(profile["trace"]["durations"]) == 10
+
+    report = dataset.timing_report()
+    assert report.startswith("Timing of 10 points")
+    assert "add_result" in report
+
+
+@pytest.mark.usefixtures("experiment")
+def test_measurement_timing_not_profiled_by_default() -> None:
+    meas = Measurement()
+    meas.register_custom_parameter("x")
+    with meas.run() as datasaver:
+        assert datasaver.timing_profiler is None
+        datasaver.add_result(("x", 1))
+
+    assert "timing_profile" not in datasaver.dataset.metadata
+    with pytest.raises(RuntimeError, match="was not profiled"):
+        datasaver.dataset.timing_report()
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from qcodes.instrument_drivers.Keithley import (
+    Keithley2600BufferedSweep,
     Keithley2600MeasurementStatus,
     Keithley2614B,
 )
@@ -175,3 +176,39 @@ def test_setting_measure_current_range_disables_autorange(smus) -> None:
         some_valid_measurerange_i = smu.root_instrument._iranges[smu.model][2]
         smu.measurerange_i(some_valid_measurerange_i)
         assert smu.measure_autorange_i_enabled() is False
+
+
+def test_buffered_sweep_defines_and_calls_lua_function(driver, monkeypatch) -> None:
+    smu = driver.smua
+    writes = []
+    monkeypatch.setattr(smu, "write", writes.append)
+    monkeypatch.setattr(smu, "_read_lua_data", lambda steps: np.arange(steps))
+
+    sweep = Keithley2600BufferedSweep(smu, 0, 1, 5, mode="IV", delay=0.01)
+    assert sweep.param is smu.volt
+    assert sweep.measured_parameters == (smu.curr,)
+    np.testing.assert_allclose(sweep.get_setpoints(), np.linspace(0, 1, 5))
+
+    sweep.arm()
+    assert len(writes) == 1
+    script = writes[0].split("\r\n")
+    assert script[0] == "loadandrunscript"
+    assert script[1] == "function qcodes_buffered_sweep_smua()"
+    assert "  smua.source.levelv = target" in script
+    assert "  delay(0.010000000000)" in script
+    assert "  smua.measure.i(smua.nvbuffer1)" in script
+    assert script[-2:] == ["end", "endscript"]
+
+    for _ in range(2):
+        data = sweep.trigger()
+        np.testing.assert_array_equal(data[smu.curr], np.arange(5))
+    assert writes[1:] == ["qcodes_buffered_sweep_smua()"] * 2
+
+
+def test_buffered_sweep_of_current(driver) -> None:
+    sweep = Keithley2600BufferedSweep(driver.smub, 0, 1e-6, 3, mode="VIfourprobe")
+    assert sweep.param is driver.smub.curr
+    assert sweep.measured_parameters == (driver.smub.volt,)
+
+    with pytest.raises(ValueError, match="mode must be"):
+        Keithley2600BufferedSweep(driver.smub, 0, 1, 3, mode="II")  # type: ignore[arg-type]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from qcodes.instrument import Instrument
+from qcodes.parameters import DelegateParameter, ManualParameter, Parameter
+from qcodes.validators import Numbers
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class AsyncMemoryInstrument(Instrument):
+    """An instrument with a native asyncio interface that records commands"""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.commands: list[str] = []
+        self.value = "0"
+        self.add_parameter(
+            "volt",
+            get_cmd="VOLT?",
+            set_cmd="VOLT {}",
+            get_parser=float,
+            vals=Numbers(-10, 10),
+        )
+
+    def write_raw(self, cmd: str) -> None:
+        raise RuntimeError("Only the async interface should be used")
+
+    def ask_raw(self, cmd: str) -> str:
+        raise RuntimeError("Only the async interface should be used")
+
+    async def write_raw_async(self, cmd: str) -> None:
+        await asyncio.sleep(0)
+        self.commands.append(cmd)
+        self.value = cmd.split(" ")[1]
+
+    async def ask_raw_async(self, cmd: str) -> str:
+        await asyncio.sleep(0)
+        self.commands.append(cmd)
+        return self.value
+
+
+@pytest.fixture(name="async_instr")
+def _make_async_instr() -> Iterator[AsyncMemoryInstrument]:
+    instr = AsyncMemoryInstrument("async_instr")
+    try:
+        yield instr
+    finally:
+        instr.close()
+
+
+@pytest.mark.asyncio
+async def test_get_set_async_cmd_uses_async_interface(
+    async_instr: AsyncMemoryInstrument,
+) -> None:
+    await async_instr.volt.set_async(1.5)
+    assert await async_instr.volt.get_async() == 1.5
+    assert async_instr.commands == ["VOLT 1.5", "VOLT?"]
+    assert async_instr.volt.cache.get(get_if_invalid=False) == 1.5
+
+
+@pytest.mark.asyncio
+async def test_get_async_formats_cmd_as_get(
+    async_instr: AsyncMemoryInstrument,
+) -> None:
+    async_instr.add_parameter("status", get_cmd="STAT{{1}}?")
+    await async_instr.status.get_async()
+    assert async_instr.commands == ["STAT{1}?"]
+
+
+@pytest.mark.asyncio
+async def test_set_async_validates(async_instr: AsyncMemoryInstrument) -> None:
+    with pytest.raises(ValueError, match="setting async_instr_volt to 20"):
+        await async_instr.volt.set_async(20)
+    assert async_instr.commands == []
+
+
+@pytest.mark.asyncio
+async def test_get_set_async_runs_sync_functions_in_executor() -> None:
+    values: list[float] = []
+    param = Parameter(
+        "p", get_cmd=lambda: values[-1], set_cmd=values.append, scale=2
+    )
+    await param.set_async(3)
+    assert values == [6]
+    assert await param.get_async() == 3
+    assert param.cache.raw_value == 6
+
+
+@pytest.mark.asyncio
+async def test_set_async_ramps() -> None:
+    param = ManualParameter("p", initial_value=0)
+    param.step = 1
+    param.inter_delay = 0.001
+    raw_values: list[float] = []
+
+    async def record(value: float) -> None:
+        raw_values.append(value)
+
+    param.set_raw_async = record  # type: ignore[method-assign]
+    await param.set_async(3)
+    assert raw_values == [1, 2, 3]
+    assert param.cache.get(get_if_invalid=False) == 3
+
+
+@pytest.mark.asyncio
+async def test_delegate_parameter_get_set_async(
+    async_instr: AsyncMemoryInstrument,
+) -> None:
+    delegate = DelegateParameter("delegate", source=async_instr.volt, scale=2)
+    await delegate.set_async(2)
+    assert async_instr.commands == ["VOLT 4"]
+    assert await delegate.get_async() == 2
+    assert async_instr.commands == ["VOLT 4", "VOLT?"]
+
+
+@pytest.mark.asyncio
+async def test_get_async_of_non_gettable_raises() -> None:
+    param = Parameter("p", set_cmd=None, get_cmd=False)
+    with pytest.raises(TypeError, match="not gettable"):
+        await param.get_async()
@@ -5,6 +5,7 @@ from typing import Any, Callable, Literal
 import pytest
 
 from qcodes.parameters import Parameter, ParameterBase
+from qcodes.validators import Numbers
 
 from .conftest import (
     GetSetRawParameter,
@@ -168,3 +169,61 @@ def test_gettable() -> None:
     assert mem.get() == 21
     assert p() == 21
     assert p.get_latest() == 21
+
+
+def test_set_path_follows_configuration() -> None:
+    p = Parameter("p", set_cmd=None, get_cmd=None)
+    assert p._set_without_ramp
+    assert not p._validate_on_set
+
+    p.step = 1
+    assert not p._set_without_ramp
+    p.step = None
+    assert p._set_without_ramp
+
+    p.inter_delay = 0.1
+    assert not p._set_without_ramp
+    p.inter_delay = 0
+    p.post_delay = 0.1
+    assert not p._set_without_ramp
+    p.post_delay = 0
+    assert p._set_without_ramp
+
+    p.vals = Numbers(0, 10)
+    assert p._validate_on_set
+    with pytest.raises(ValueError):
+        p.set(11)
+    p.vals = None
+    assert not p._validate_on_set
+    p.set(11)
+    assert p.get() == 11
+
+    with p.extra_validator(Numbers(0, 1)):
+        assert p._validate_on_set
+        with pytest.raises(ValueError):
+            p.set(2)
+    assert not p._validate_on_set
+
+
+def test_set_without_ramp_updates_cache_and_scales() -> None:
+    set_values = []
+    p = Parameter("p", set_cmd=set_values.append, scale=2, offset=1)
+    assert p._set_without_ramp
+
+    p.set(3)
+    assert set_values == [7]
+    assert p.cache.get() == 3
+    assert p.cache.raw_value == 7
+
+
+def test_overridden_get_ramp_values_is_used() -> None:
+    class RampingParameter(Parameter):
+        def get_ramp_values(self, value, step=None):
+            return [value - 1, value]
+
+    set_values = []
+    p = RampingParameter("p", set_cmd=set_values.append)
+    assert not p._set_without_ramp
+
+    p.set(3)
+    assert set_values == [2, 3]
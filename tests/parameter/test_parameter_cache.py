@@ -205,6 +205,45 @@ def test_max_val_age() -> None:
     assert timestamp >= start
 
 
+def test_max_val_age_not_affected_by_wall_clock(monkeypatch) -> None:
+    local_parameter = BetterGettableParam(
+        "test_param", set_cmd=None, max_val_age=1, initial_value=1
+    )
+    # expiry is based on the monotonic clock so changes of the
+    # wall clock do not invalidate the cache
+    monkeypatch.setattr(time, "time", lambda: 0.0)
+    assert local_parameter.cache.valid
+    assert local_parameter.cache.get() == 1
+    assert local_parameter._get_count == 0
+
+
+def test_timestamp_is_converted_once() -> None:
+    local_parameter = BetterGettableParam("test_param", set_cmd=None)
+    before = datetime.now()
+    local_parameter.set(1)
+    after = datetime.now()
+    timestamp = local_parameter.cache.timestamp
+    assert timestamp is not None
+    assert before <= timestamp <= after
+    # the wall clock time is computed when first requested
+    # and then reused
+    assert local_parameter.cache.timestamp is timestamp
+
+
+def test_timestamp_is_wall_clock_time_of_update(monkeypatch) -> None:
+    local_parameter = BetterGettableParam("test_param", set_cmd=None)
+    before = datetime.now()
+    local_parameter.set(1)
+    after = datetime.now()
+    # a step of the wall clock between the update and reading the
+    # timestamp, e.g. by ntp, does not change the timestamp
+    wall_clock = time.time
+    monkeypatch.setattr(time, "time", lambda: wall_clock() + 3600)
+    timestamp = local_parameter.cache.timestamp
+    assert timestamp is not None
+    assert before <= timestamp <= after
+
+
 def test_no_get_max_val_age() -> None:
     """
     Test that cache.get on a parameter with max_val_age set and
@@ -9,7 +9,8 @@ import jsonschema.exceptions
 import pytest
 
 import qcodes
-from qcodes.configuration import Config
+from qcodes.configuration import Config, FrozenDotDict
+from qcodes.configuration import config as config_module
 
 VALID_JSON = "{}"
 ENV_KEY = "/dev/random"
@@ -183,6 +184,8 @@ def _make_mock_config(mocker):
         new_callable=PropertyMock
     )
     load_config = mocker.patch.object(Config, 'load_config')
+    # the mocked files must not be cached or be read from the cache
+    mocker.patch.object(Config, "cache_directory", None)
     isfile = mocker.patch('os.path.isfile')
     schema.return_value = copy.deepcopy(SCHEMA)
     env.return_value = ENV_KEY
@@ -323,3 +326,120 @@ def test_add_and_describe() -> None:
     )
 
     assert desc == expected_desc
+
+
+def test_freeze() -> None:
+    cfg = qcodes.config
+    frozen = cfg.freeze()
+
+    assert frozen.dataset.use_threads == cfg.dataset.use_threads
+    assert frozen["core.db_location"] == cfg["core.db_location"]
+    assert "core.db_location" in frozen
+    assert isinstance(frozen.dataset, FrozenDotDict)
+    assert set(frozen) == set(cfg.current_config)
+
+    with pytest.raises(AttributeError, match="immutable"):
+        frozen.dataset.use_threads = True
+
+    # the snapshot is not affected by later changes to the config
+    use_threads = cfg.dataset.use_threads
+    try:
+        cfg.dataset.use_threads = not use_threads
+        assert frozen.dataset.use_threads == use_threads
+        assert cfg.freeze().dataset.use_threads == (not use_threads)
+    finally:
+        cfg.dataset.use_threads = use_threads
+
+
+def test_load_config_reloads_changed_file(tmp_path) -> None:
+    path = tmp_path / "qcodesrc.json"
+    path.write_text(json.dumps({"a": 1}))
+    first = Config.load_config(str(path))
+    assert first == {"a": 1}
+
+    # mutating a loaded config does not affect later loads
+    first["a"] = 3
+    assert Config.load_config(str(path)) == {"a": 1}
+
+    path.write_text(json.dumps({"a": 22}))
+    os.utime(path, ns=(0, 0))
+    assert Config.load_config(str(path)) == {"a": 22}
+
+
+def test_validation_is_cached(config) -> None:
+    config.validate({"z": 1}, SCHEMA)
+    n_validators = len(config_module._VALIDATOR_CACHE)
+    # a validator is compiled once per distinct schema
+    config.validate({"z": 2}, SCHEMA)
+    assert len(config_module._VALIDATOR_CACHE) == n_validators
+    assert (
+        config_module._hash_json({"z": 2}),
+        config_module._hash_json(SCHEMA),
+    ) in config_module._VALIDATED
+
+    bad_schema = copy.deepcopy(SCHEMA)
+    bad_schema["required"] = ["z", "not_there"]
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        config.validate({"z": 1}, bad_schema)
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        config.validate({"z": "1"}, SCHEMA)
+
+
+def test_validated_config_is_cached_on_disk(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(Config, "cache_directory", str(tmp_path / "cache"))
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    config_file = config_dir / "qcodesrc.json"
+    config_file.write_text(json.dumps({"core": {"db_debug": True}}))
+
+    first = Config(path=str(config_dir))
+    assert first["core.db_debug"] is True
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+    def fail_validation(*args, **kwargs):
+        raise AssertionError("The cached config should not be validated")
+
+    monkeypatch.setattr(config_module, "_validate_cached", fail_validation)
+    # a new process loads the config from the cache without validating it
+    second = Config(path=str(config_dir))
+    assert second.current_config == first.current_config
+    assert second.current_schema == first.current_schema
+    assert second.current_config_path == str(config_file)
+
+    # a file that is touched but not changed is still cached
+    os.utime(config_file, ns=(0, 0))
+    assert Config(path=str(config_dir))["core.db_debug"] is True
+
+    # a changed file is loaded and validated again
+    config_file.write_text(json.dumps({"core": {"db_debug": False}}))
+    with pytest.raises(AssertionError, match="should not be validated"):
+        Config(path=str(config_dir))
+    monkeypatch.undo()
+    monkeypatch.setattr(Config, "cache_directory", str(tmp_path / "cache"))
+    assert Config(path=str(config_dir))["core.db_debug"] is False
+
+
+def test_config_cache_is_pruned(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(Config, "cache_directory", str(cache_dir))
+    monkeypatch.setattr(Config, "cache_max_files", 2)
+
+    cache_files = []
+    for i in range(4):
+        config_dir = tmp_path / f"config_{i}"
+        config_dir.mkdir()
+        Config(path=str(config_dir))
+        (cache_file,) = set(cache_dir.iterdir()) - set(cache_files)
+        # make the order in which the files were written unambiguous
+        os.utime(cache_file, ns=(i, i))
+        cache_files.append(cache_file)
+
+    assert set(cache_dir.iterdir()) == set(cache_files[-2:])
+
+
+def test_frozen_dot_dict_getattr_fallback() -> None:
+    frozen = config_module.freeze({"not an identifier": 1, "a": {"b": 2}})
+    assert getattr(frozen, "not an identifier") == 1
+    assert frozen.a.b == 2
+    with pytest.raises(AttributeError, match="no attribute 'c'"):
+        frozen.a.c
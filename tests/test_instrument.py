@@ -7,12 +7,14 @@ import contextlib
 import gc
 import io
 import re
+import threading
 import weakref
 from typing import TYPE_CHECKING
 from weakref import WeakValueDictionary
 
 import pytest
 from pytest import FixtureRequest
+from pyvisa.errors import VisaIOError
 
 from qcodes.instrument import (
     Instrument,
@@ -20,12 +22,14 @@ from qcodes.instrument import (
     InstrumentModule,
     find_or_create_instrument,
 )
+from qcodes.instrument._io_stats import command_template
 from qcodes.instrument_drivers.mock_instruments import (
     DummyChannelInstrument,
     DummyFailingInstrument,
     DummyInstrument,
     MockMetaParabola,
     MockParabola,
+    MockSimulatedScope,
 )
 from qcodes.metadatable import Metadatable
 from qcodes.parameters import Function, Parameter
@@ -532,3 +536,205 @@ def test_snapshot_and_meta_attrs2() -> None:
 
     assert "test_attribute" in snapshot
     assert {"sample_key": 12} == snapshot["test_attribute"]
+
+
+class CompoundQueryInstrument(Instrument):
+    batch_max_queries = 2
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.queries: list[str] = []
+        self.values = {"A?": "1", "B?": "2", "C?": "3"}
+        for name in ("A", "B", "C"):
+            self.add_parameter(
+                name.lower(),
+                get_cmd=f"{name}?",
+                set_cmd=f"{name} {{}}",
+                get_parser=int,
+            )
+        self.add_parameter("d", get_cmd=lambda: 4)
+
+    def ask_raw(self, cmd: str) -> str:
+        self.queries.append(cmd)
+        return ";".join(self.values[query] for query in cmd.split(";"))
+
+    def write_raw(self, cmd: str) -> None:
+        name, value = cmd.split(" ")
+        self.values[f"{name}?"] = value
+
+
+@pytest.fixture(name="compound_instr")
+def _compound_instr() -> Iterator[CompoundQueryInstrument]:
+    instrument = CompoundQueryInstrument("compound")
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_batch_joins_queries(compound_instr: CompoundQueryInstrument) -> None:
+    instr = compound_instr
+    with instr.batch(instr.a, instr.b, instr.c, instr.d):
+        assert instr.queries == ["A?;B?", "C?"]
+        assert instr.a() == 1
+        assert instr.b() == 2
+        assert instr.d() == 4
+        # the cache is updated as for a regular get
+        assert instr.a.cache.get(get_if_invalid=False) == 1
+        assert instr.queries == ["A?;B?", "C?"]
+        # each response is only used once
+        assert instr.a() == 1
+        assert instr.queries == ["A?;B?", "C?", "A?"]
+    # responses that were not used are discarded at exit
+    assert instr.c() == 3
+    assert instr.queries == ["A?;B?", "C?", "A?", "C?"]
+
+
+def test_batch_falls_back_on_bad_response(
+    compound_instr: CompoundQueryInstrument, caplog: pytest.LogCaptureFixture
+) -> None:
+    instr = compound_instr
+    instr.values["A?"] = "1;5"
+    with instr.batch(instr.a, instr.b):
+        assert instr.b() == 2
+    assert "Falling back to individual queries" in caplog.text
+    assert instr.queries == ["A?;B?", "B?"]
+
+
+def test_batch_requires_support(compound_instr: CompoundQueryInstrument) -> None:
+    instr = compound_instr
+    instr.batch_max_queries = 0
+    with instr.batch(instr.a, instr.b):
+        assert instr.a() == 1
+    assert instr.queries == ["A?"]
+
+
+def test_batch_responses_are_discarded_on_write(
+    compound_instr: CompoundQueryInstrument,
+) -> None:
+    instr = compound_instr
+    with instr.batch(instr.a, instr.b):
+        with instr.batch(instr.a, instr.c):
+            instr.a(5)
+            assert instr.a() == 5
+        # the responses of the outer context are outdated as well
+        assert instr.b() == 2
+    assert instr.queries == ["A?;B?", "A?;C?", "A?", "B?"]
+
+
+def test_batch_responses_are_not_used_by_other_threads(
+    compound_instr: CompoundQueryInstrument,
+) -> None:
+    instr = compound_instr
+    values = []
+    with instr.batch(instr.a, instr.b):
+        thread = threading.Thread(target=lambda: values.append(instr.a()))
+        thread.start()
+        thread.join()
+        assert instr.queries == ["A?;B?", "A?"]
+        assert instr.a() == 1
+    assert values == [1]
+    assert instr.queries == ["A?;B?", "A?"]
+
+
+@pytest.mark.asyncio
+async def test_ask_async_uses_batch_responses(
+    compound_instr: CompoundQueryInstrument,
+) -> None:
+    instr = compound_instr
+    assert await instr.ask_async("C?") == "3"
+    with instr.batch(instr.a, instr.b):
+        assert await instr.a.get_async() == 1
+        assert await instr.b.get_async() == 2
+    assert instr.queries == ["C?", "A?;B?"]
+
+
+@pytest.fixture(name="scope")
+def _make_scope() -> Iterator[MockSimulatedScope]:
+    instrument = MockSimulatedScope("scope")
+    try:
+        yield instrument
+    finally:
+        instrument.close()
+
+
+def test_io_stats_disabled_by_default(scope: MockSimulatedScope) -> None:
+    scope.voltage(1)
+    assert scope.voltage() == 1
+    assert scope.io_stats() == {}
+    assert "io_stats" not in scope.snapshot()
+
+
+def test_io_stats(scope: MockSimulatedScope) -> None:
+    scope.enable_io_stats()
+    scope.voltage(1)
+    scope.voltage(2.5)
+    assert scope.voltage() == 2.5
+    scope.resource.inject_failure()
+    with pytest.raises(VisaIOError):
+        scope.voltage()
+
+    stats = scope.io_stats()
+    assert set(stats) == {"VOLT <n>", "VOLT?"}
+    assert stats["VOLT <n>"]["count"] == 2
+    assert stats["VOLT <n>"]["errors"] == 0
+    assert stats["VOLT <n>"]["bytes_written"] == len("VOLT 1") + len("VOLT 2.5")
+    assert stats["VOLT <n>"]["bytes_read"] == 0
+    assert stats["VOLT?"]["count"] == 2
+    assert stats["VOLT?"]["errors"] == 1
+    assert stats["VOLT?"]["bytes_read"] == len("2.5")
+    for template_stats in stats.values():
+        histogram = template_stats["histogram"]
+        assert sum(count for _, count in histogram) == template_stats["count"]
+        assert template_stats["median_time"] <= template_stats["p99_time"]
+        assert template_stats["p99_time"] in [edge for edge, _ in histogram]
+    assert scope.snapshot()["io_stats"] == stats
+
+    scope.reset_io_stats()
+    assert scope.io_stats() == {}
+    scope.voltage()
+    assert scope.io_stats()["VOLT?"]["count"] == 1
+
+    scope.disable_io_stats()
+    scope.voltage()
+    assert scope.io_stats() == {}
+
+
+def test_io_stats_of_threads_are_merged(scope: MockSimulatedScope) -> None:
+    scope.enable_io_stats()
+    threads = [
+        threading.Thread(target=lambda: [scope.voltage() for _ in range(10)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert scope.io_stats()["VOLT?"]["count"] == 40
+
+    # the statistics of finished threads are merged and their shards dropped
+    assert scope._io_stats is not None
+    assert len(scope._io_stats._shards) == 0
+    scope.voltage()
+    assert len(scope._io_stats._shards) == 1
+    assert scope.io_stats()["VOLT?"]["count"] == 41
+
+
+@pytest.mark.asyncio
+async def test_io_stats_async(compound_instr: CompoundQueryInstrument) -> None:
+    compound_instr.enable_io_stats()
+    assert await compound_instr.ask_async("A?") == "1"
+    assert compound_instr.io_stats()["A?"]["count"] == 1
+
+
+@pytest.mark.parametrize(
+    "cmd, template",
+    [
+        ("VOLT?", "VOLT?"),
+        ("SOUR2:VOLT 1.5e-3", "SOUR2:VOLT <n>"),
+        ("FREQ -10,+.5", "FREQ <n>,<n>"),
+        ("OUTP ON", "OUTP ON"),
+    ],
+)
+def test_command_template(cmd: str, template: str) -> None:
+    assert command_template(cmd) == template
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import socketserver
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from qcodes.instrument import IPInstrument
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _EchoServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _EchoHandler)
+        self.connections: list[socket.socket] = []
+        self.commands: list[bytes] = []
+
+
+class _EchoHandler(socketserver.StreamRequestHandler):
+    """
+    Answers each line with the echoed line. A query for ``BIG?`` is
+    answered with a large response that is sent in several parts, and a
+    query for ``BLOCK?`` with a binary block of little endian 16 bit
+    integers. ``CLOSE`` closes the connection without answering.
+    """
+
+    server: _EchoServer
+
+    def handle(self) -> None:
+        self.server.connections.append(self.connection)
+        for line in self.rfile:
+            cmd = line.strip()
+            self.server.commands.append(cmd)
+            if cmd == b"CLOSE":
+                return
+            if cmd == b"BIG?":
+                for _ in range(10):
+                    self.wfile.write(b"x" * 100_000)
+                    self.wfile.flush()
+                self.wfile.write(b"\n")
+            elif cmd == b"BLOCK?":
+                data = np.arange(100_000, dtype="<i4").astype("<i2").tobytes()
+                self.wfile.write(b"#6200000" + data + b"\n")
+            else:
+                self.wfile.write(b"echo " + cmd + b"\n")
+
+
+@pytest.fixture(name="echo_server")
+def _make_echo_server() -> Iterator[_EchoServer]:
+    server = _EchoServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _make_instrument(
+    server: _EchoServer,
+    persistent: bool,
+    idle_timeout: float | None = None,
+    read_terminator: str | None = "\n",
+) -> IPInstrument:
+    address, port = server.server_address[:2]
+    return IPInstrument(
+        "ip_instr",
+        address=str(address),
+        port=port,
+        terminator="\n",
+        read_terminator=read_terminator,
+        persistent=persistent,
+        timeout=2,
+        idle_timeout=idle_timeout,
+    )
+
+
+@pytest.mark.parametrize("persistent", [True, False])
+def test_ask_reads_until_terminator(
+    echo_server: _EchoServer, persistent: bool
+) -> None:
+    instr = _make_instrument(echo_server, persistent)
+    try:
+        assert instr.ask("A?") == "echo A?"
+        assert instr.ask("BIG?") == "x" * 1_000_000
+        assert instr.ask("B?") == "echo B?"
+    finally:
+        instr.close()
+    assert len(echo_server.connections) == (1 if persistent else 3)
+
+
+def test_ask_reads_once_without_read_terminator(echo_server: _EchoServer) -> None:
+    instr = _make_instrument(echo_server, persistent=True, read_terminator=None)
+    try:
+        assert instr.ask("A?") == "echo A?\n"
+    finally:
+        instr.close()
+
+
+def test_ask_keeps_data_after_terminator(echo_server: _EchoServer) -> None:
+    instr = _make_instrument(echo_server, persistent=True)
+    try:
+        # two commands in one send are answered with two responses that
+        # may arrive in a single read
+        assert instr.ask("A?\nB?") == "echo A?"
+        assert instr.ask("C?") == "echo B?"
+        instr.flush_connection()
+    finally:
+        instr.close()
+
+
+def test_ask_reconnects_to_closed_connection(echo_server: _EchoServer) -> None:
+    instr = _make_instrument(echo_server, persistent=True)
+    try:
+        assert instr.ask("A?") == "echo A?"
+        echo_server.connections[0].shutdown(socket.SHUT_RDWR)
+        assert instr.ask("B?") == "echo B?"
+    finally:
+        instr.close()
+    assert len(echo_server.connections) == 2
+
+
+def test_write_is_not_repeated_if_response_is_lost(
+    echo_server: _EchoServer,
+) -> None:
+    instr = _make_instrument(echo_server, persistent=True)
+    try:
+        with pytest.raises(ConnectionError):
+            instr.write("CLOSE")
+        assert echo_server.commands == [b"CLOSE"]
+        # the next call reconnects
+        assert instr.ask("A?") == "echo A?"
+    finally:
+        instr.close()
+
+
+def test_idle_timeout_reuses_connection(echo_server: _EchoServer) -> None:
+    instr = _make_instrument(echo_server, persistent=False, idle_timeout=0.2)
+    try:
+        for cmd in ("A?", "B?", "C?"):
+            assert instr.ask(cmd) == f"echo {cmd}"
+        assert len(echo_server.connections) == 1
+
+        deadline = time.monotonic() + 5
+        while instr._socket is not None and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert instr._socket is None
+
+        assert instr.ask("D?") == "echo D?"
+        assert len(echo_server.connections) == 2
+    finally:
+        instr.close()
+
+
+@pytest.mark.parametrize("persistent", [True, False])
+def test_ask_async(echo_server: _EchoServer, persistent: bool) -> None:
+    instr = _make_instrument(echo_server, persistent)
+    try:
+
+        async def ask_twice() -> list[str]:
+            return [await instr.ask_async("A?"), await instr.ask_async("BIG?")]
+
+        assert asyncio.run(ask_twice()) == ["echo A?", "x" * 1_000_000]
+        assert asyncio.run(instr.ask_async("C?")) == "echo C?"
+        # the sync and async interface share the connection
+        assert instr.ask("D?") == "echo D?"
+    finally:
+        instr.close()
+    expected_connections = 1 if persistent else 4
+    assert len(echo_server.connections) == expected_connections
+
+
+def test_ask_binary_block(echo_server: _EchoServer) -> None:
+    instr = _make_instrument(echo_server, persistent=True)
+    try:
+        data = instr.ask_binary_block("BLOCK?", dtype=np.int16, byte_order="<")
+        np.testing.assert_array_equal(
+            data, np.arange(100_000, dtype=np.int32).astype(np.int16)
+        )
+        # the terminator after the block has been consumed
+        assert instr.ask("A?") == "echo A?"
+
+        with pytest.raises(ValueError, match="Expected a binary block header"):
+            instr.ask_binary_block("A?")
+    finally:
+        instr.close()
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+import qcodes
+import qcodes.dataset
+
+
+def _modules_imported_by(statement: str) -> set[str]:
+    code = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.splitlines())
+
+
+def test_import_qcodes_does_not_import_submodules() -> None:
+    modules = _modules_imported_by("import qcodes")
+    assert "qcodes.configuration" in modules
+    for module in (
+        "qcodes.dataset",
+        "qcodes.instrument",
+        "qcodes.monitor",
+        "qcodes.parameters",
+        "qcodes.station",
+        "websockets",
+        "pandas",
+    ):
+        assert module not in modules
+
+
+def test_import_from_dataset_only_imports_needed_submodules() -> None:
+    modules = _modules_imported_by("from qcodes.dataset import load_by_id")
+    assert "qcodes.dataset.data_set" in modules
+    assert "qcodes.dataset.plotting" not in modules
+    assert "qcodes.dataset.dond.do_nd" not in modules
+
+
+@pytest.mark.parametrize("module", [qcodes, qcodes.dataset])
+def test_lazy_attributes_are_accessible(module) -> None:
+    for name in module._LAZY_ATTRIBUTES:
+        value = getattr(module, name)
+        # the value is cached in the module after the first access
+        assert vars(module)[name] is value
+        assert name in dir(module)
+
+
+def test_submodules_accessible_as_attributes() -> None:
+    assert qcodes.validators.Numbers is not None
+    assert qcodes.dataset.sqlite.database is not None
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_name'"):
+        qcodes.not_a_name
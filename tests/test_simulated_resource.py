@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+from pyvisa.errors import VisaIOError
+
+from qcodes.instrument import SimulatedResource, VisaInstrument
+from qcodes.instrument_drivers.mock_instruments import MockSimulatedScope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(name="scope")
+def _make_scope() -> Iterator[MockSimulatedScope]:
+    scope = MockSimulatedScope("scope", seed=1)
+    try:
+        yield scope
+    finally:
+        scope.close()
+
+
+def test_properties(scope: MockSimulatedScope) -> None:
+    scope.voltage(1.5)
+    assert scope.resource.properties["VOLT"] == 1.5
+    assert scope.voltage() == 1.5
+    assert scope.IDN()["vendor"] == "QCoDeS"
+
+
+def test_binary_trace(scope: MockSimulatedScope) -> None:
+    scope.voltage(5)
+    scope.n_points(10_000)
+    trace = scope.trace()
+    assert trace.shape == (10_000,)
+    assert trace.dtype == np.float32
+    assert abs(trace.mean() - 5) < 0.1
+    # the terminator after the block has been read
+    assert scope.voltage() == 5
+
+
+def test_unknown_command_raises(scope: MockSimulatedScope) -> None:
+    with pytest.raises(ValueError, match="does not understand 'FOO 1'"):
+        scope.write("FOO 1")
+
+
+def test_injected_failure(scope: MockSimulatedScope) -> None:
+    scope.resource.inject_failure(count=2)
+    for _ in range(2):
+        with pytest.raises(VisaIOError):
+            scope.voltage()
+    assert scope.voltage() == 0
+
+
+def test_failure_rate() -> None:
+    scope = MockSimulatedScope("scope", failure_rate=0.5, seed=2)
+    try:
+        n_failures = 0
+        for _ in range(200):
+            try:
+                scope.voltage()
+            except VisaIOError:
+                n_failures += 1
+        assert 50 < n_failures < 150
+    finally:
+        scope.close()
+
+
+def test_latency() -> None:
+    resource = SimulatedResource(latency=0.01, jitter=0.01)
+    resource.add_property("VOLT", 0.0)
+    instr = VisaInstrument("instr", "SIM::INSTR", visalib=resource, terminator="\n")
+    try:
+        t_start = time.perf_counter()
+        for _ in range(5):
+            instr.ask("VOLT?")
+        assert time.perf_counter() - t_start >= 0.05
+        assert resource.n_writes == 5
+        assert resource.n_reads == 5
+    finally:
+        instr.close()
+    assert resource.session is None
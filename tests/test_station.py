@@ -1,6 +1,8 @@
 import json
+import logging
 import os
 import tempfile
+import threading
 import warnings
 from contextlib import contextmanager
 from io import StringIO
@@ -243,6 +245,71 @@ def test_station_after_instrument_is_closed() -> None:
         station.remove_component("bob")
 
 
+def test_parallel_snapshot_matches_serial_snapshot() -> None:
+    bob = DummyInstrument("bob", gates=["one", "two"])
+    alice = DummyInstrument("alice", gates=["three"])
+    bob.one(1.5)
+    alice.three(-2)
+
+    serial = Station(bob, alice, parallel_snapshot=False).snapshot(update=True)
+    parallel = Station(bob, alice, parallel_snapshot=True).snapshot(update=True)
+
+    assert list(parallel["instruments"]) == ["bob", "alice"]
+    for name, snapshot in serial["instruments"].items():
+        assert parallel["instruments"][name].keys() == snapshot.keys()
+        for param, param_snapshot in snapshot["parameters"].items():
+            assert (
+                parallel["instruments"][name]["parameters"][param]["value"]
+                == param_snapshot["value"]
+            )
+    assert "snapshot_timed_out" not in parallel["instruments"]["bob"]
+
+
+def test_parallel_snapshot_times_out_to_values_in_memory(caplog) -> None:
+    release = threading.Event()
+    bob = DummyInstrument("bob", gates=["one"])
+    alice = DummyInstrument("alice", gates=["two"])
+    bob.add_parameter(
+        "slow", get_cmd=lambda: release.wait(10) and 1, set_cmd=False
+    )
+    bob.slow.cache.set(0)
+    alice.two(3)
+
+    station = Station(
+        bob,
+        alice,
+        update_snapshot=False,
+        parallel_snapshot=True,
+        snapshot_timeout=0.2,
+    )
+    try:
+        with caplog.at_level(logging.WARNING):
+            snapshot = station.snapshot(update=True)
+    finally:
+        release.set()
+
+    assert snapshot["instruments"]["bob"]["snapshot_timed_out"] is True
+    assert snapshot["instruments"]["bob"]["parameters"]["slow"]["value"] == 0
+    assert "snapshot_timed_out" not in snapshot["instruments"]["alice"]
+    assert snapshot["instruments"]["alice"]["parameters"]["two"]["value"] == 3
+    assert "The snapshot of bob did not update within 0.2 s" in caplog.text
+
+    assert set(station.snapshot_timings) == {"bob", "alice"}
+    assert station.snapshot_timings["bob"] >= 0.2
+    assert station.snapshot_timings["alice"] < station.snapshot_timings["bob"]
+
+
+def test_parallel_snapshot_from_config() -> None:
+    bob = DummyInstrument("bob", gates=["one"])
+    alice = DummyInstrument("alice", gates=["two"])
+    station = Station(bob, alice)
+    assert station.parallel_snapshot is None
+    qcodes.config["station"]["parallel_snapshot"] = True
+    snapshot = station.snapshot(update=True)
+    assert list(snapshot["instruments"]) == ["bob", "alice"]
+    assert set(station.snapshot_timings) == {"bob", "alice"}
+
+
 def test_update_config_schema() -> None:
     update_config_schema()
     with open(SCHEMA_PATH) as f:
@@ -868,6 +935,85 @@ def test_load_all_instruments_without_config_raises() -> None:
         station.load_all_instruments()  # type: ignore[call-overload]
 
 
+def test_load_all_instruments_in_parallel(example_station, caplog) -> None:
+    all_instruments_in_config = {"lakeshore", "mock_dac", "mock_dac2"}
+
+    with caplog.at_level(logging.INFO, logger="qcodes.station"):
+        loaded_instruments = example_station.load_all_instruments(max_workers=3)
+
+    assert set(loaded_instruments) == all_instruments_in_config
+    for instrument in all_instruments_in_config:
+        assert instrument in example_station.components
+        assert Instrument.exist(instrument)
+        assert f"Loaded instrument {instrument} in" in caplog.text
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_load_all_instruments_loads_dependencies_first(max_workers) -> None:
+    st = station_from_config_str(
+        """
+instruments:
+  delegate:
+    type: qcodes.instrument.delegate.DelegateInstrument
+    init:
+      parameters:
+        gate: dac.ch1
+  dac:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      gates: ["ch1"]
+"""
+    )
+    st.load_all_instruments(max_workers=max_workers)
+
+    dac = st.components["dac"]
+    delegate = st.components["delegate"]
+    dac.ch1(0.5)
+    assert delegate.gate() == 0.5
+
+
+def test_load_all_instruments_with_circular_dependencies_raises() -> None:
+    st = station_from_config_str(
+        """
+instruments:
+  mock_a:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      metadata:
+        peer: mock_b
+  mock_b:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+    init:
+      metadata:
+        peer: mock_a
+  mock_c:
+    type: qcodes.instrument_drivers.mock_instruments.DummyInstrument
+"""
+    )
+    with pytest.raises(RuntimeError, match=r"\['mock_a', 'mock_b'\] depend on"):
+        st.load_all_instruments(max_workers=2)
+    assert Instrument.exist("mock_c")
+
+
+def test_load_all_instruments_lazy(example_station) -> None:
+    example_station.load_all_instruments(only_names=("mock_dac",), lazy=True)
+
+    assert not Instrument.exist("mock_dac")
+    snapshot = example_station.snapshot()
+    assert snapshot["components"]["mock_dac"] == {
+        "name": "mock_dac",
+        "connected": False,
+    }
+
+    # the instrument is created on first use
+    example_station.mock_dac.ch1(1.0)
+    assert Instrument.exist("mock_dac")
+    mock_dac = Instrument.find_instrument("mock_dac")
+    assert example_station.components["mock_dac"] is mock_dac
+    assert mock_dac.ch1() == 1.0
+    assert "mock_dac" in example_station.snapshot()["instruments"]
+
+
 def test_station_config_created_with_multiple_config_files() -> None:
     test_config1 = """
         instruments:
@@ -1,6 +1,7 @@
 """
 Test suite for utils.threading.*
 """
+import asyncio
 import threading
 import time
 from collections import defaultdict
@@ -8,7 +9,12 @@ from typing import Any
 
 import pytest
 
-from qcodes.dataset.threading import ThreadPoolParamsCaller, call_params_threaded
+from qcodes.dataset.threading import (
+    AsyncParamsCaller,
+    InstrumentWorkersParamsCaller,
+    ThreadPoolParamsCaller,
+    call_params_threaded,
+)
 from qcodes.instrument_drivers.mock_instruments import DummyInstrument
 from qcodes.parameters import Parameter, ParamRawDataType
 
@@ -103,3 +109,138 @@ def test_thread_pool_params_caller(dummy_1, dummy_2) -> None:
         assert {
             frozenset(value) for value in params_per_thread_id.values()
         } == expected_params_per_thread
+
+
+def test_instrument_workers_params_caller(dummy_1, dummy_2) -> None:
+    params = (
+        dummy_1.voltage_1,
+        dummy_2.voltage_1,
+        dummy_1.voltage_2,
+        dummy_2.voltage_2,
+    )
+
+    with InstrumentWorkersParamsCaller(*params) as workers_caller:
+        output1 = workers_caller()
+        output2 = workers_caller()
+        worker_threads = {
+            thread.ident
+            for thread in threading.enumerate()
+            if thread.name.startswith("InstrumentWorkersParamsCaller")
+        }
+
+    # the output is in the order of the instruments
+    assert [param for param, _ in output1] == [
+        dummy_1.voltage_1,
+        dummy_1.voltage_2,
+        dummy_2.voltage_1,
+        dummy_2.voltage_2,
+    ]
+    # each instrument is called on the same thread at every call, the last
+    # instrument on the calling thread
+    assert output1 == output2
+    assert output1[0][1] == output1[1][1]
+    assert output1[2][1] == output1[3][1] == threading.get_ident()
+    assert worker_threads == {output1[0][1]}
+    assert not any(
+        thread.name.startswith("InstrumentWorkersParamsCaller")
+        for thread in threading.enumerate()
+    )
+
+
+def test_instrument_workers_params_caller_raises(dummy_1, dummy_2) -> None:
+    n_calls = 0
+
+    def get_failing() -> int:
+        nonlocal n_calls
+        n_calls += 1
+        if n_calls == 1:
+            raise RuntimeError("Failed to get")
+        return n_calls
+
+    dummy_1.add_parameter("failing", get_cmd=get_failing)
+
+    with InstrumentWorkersParamsCaller(
+        dummy_1.failing, dummy_2.voltage_1
+    ) as workers_caller:
+        with pytest.raises(RuntimeError, match="Failed to get"):
+            workers_caller()
+        # the workers can be called again after a failure
+        output = workers_caller()
+    assert output[0] == (dummy_1.failing, 2)
+    assert output[1][0] is dummy_2.voltage_1
+
+    with pytest.raises(RuntimeError, match="must be entered"):
+        workers_caller()
+
+
+def test_thread_pool_params_caller_batches_queries() -> None:
+    class CompoundQueryInstrument(DummyInstrument):
+        batch_max_queries = 10
+
+        def ask_raw(self, cmd: str) -> str:
+            self.queries.append(cmd)
+            return ";".join(query.strip("?") for query in cmd.split(";"))
+
+    instr = CompoundQueryInstrument("compound", gates=[])
+    instr.queries = []
+    try:
+        for i in range(3):
+            instr.add_parameter(f"p{i}", get_cmd=f"{i}?", get_parser=int)
+        params = [instr.parameters[f"p{i}"] for i in range(3)]
+        with ThreadPoolParamsCaller(*params) as pool_caller:
+            output = pool_caller()
+        assert dict(output) == dict(zip(params, range(3)))
+        assert instr.queries == ["0?;1?;2?"]
+    finally:
+        instr.close()
+
+
+def test_async_params_caller(dummy_1, dummy_2) -> None:
+    events: list[tuple[str, str]] = []
+
+    def add_async_parameter(instrument: DummyInstrument, name: str) -> Parameter:
+        instrument.add_parameter(name, set_cmd=None)
+        param = instrument.parameters[name]
+        assert isinstance(param, Parameter)
+
+        async def get_raw_async() -> str:
+            events.append(("start", param.full_name))
+            await asyncio.sleep(0.01)
+            events.append(("end", param.full_name))
+            return param.full_name
+
+        param.get_raw_async = get_raw_async  # type: ignore[method-assign]
+        return param
+
+    p1 = add_async_parameter(dummy_1, "async_1")
+    p2 = add_async_parameter(dummy_1, "async_2")
+    p3 = add_async_parameter(dummy_2, "async_1")
+
+    with AsyncParamsCaller(
+        p1, p2, p3, lambda: events.append(("call", "")), dummy_2.voltage_1
+    ) as async_caller:
+        output = async_caller()
+
+    assert output[:3] == [
+        (p1, "dummy_1_async_1"),
+        (p2, "dummy_1_async_2"),
+        (p3, "dummy_2_async_1"),
+    ]
+    assert output[3][0] is dummy_2.voltage_1
+    # parameters of different instruments are got concurrently, those of
+    # the same instrument one after the other
+    assert events == [
+        ("start", "dummy_1_async_1"),
+        ("start", "dummy_2_async_1"),
+        ("end", "dummy_1_async_1"),
+        ("start", "dummy_1_async_2"),
+        ("end", "dummy_2_async_1"),
+        ("end", "dummy_1_async_2"),
+        ("call", ""),
+    ]
+
+
+def test_async_params_caller_must_be_entered(dummy_1) -> None:
+    caller = AsyncParamsCaller(dummy_1.voltage_1)
+    with pytest.raises(RuntimeError, match="must be entered"):
+        caller()
@@ -1,8 +1,10 @@
 import gc
 import logging
 import re
+import threading
 from pathlib import Path
 
+import numpy as np
 import pytest
 import pyvisa
 import pyvisa.constants
@@ -82,6 +84,54 @@ class MockVisaHandle(pyvisa.resources.MessageBasedResource):
         pass
 
 
+class BinaryBlockVisaHandle(MockVisaHandle):
+    """
+    A visa handle that answers any query with a binary block of the
+    elements 0, 1, 2, 3 as big endian 32 bit floats followed by a newline.
+    The block is read with the given VISA status at the end of each read
+    """
+
+    def __init__(self, end_status: pyvisa.constants.StatusCode):
+        super().__init__()
+        self.end_status = end_status
+        self.response = b""
+        self._last_status = pyvisa.constants.StatusCode.success
+
+    def write(self, cmd):
+        self.response = b"#216" + np.arange(4, dtype=">f4").tobytes() + b"\n"
+        return len(cmd)
+
+    def read_bytes(self, count, chunk_size=None, break_on_termchar=False):
+        data, self.response = self.response[:count], self.response[count:]
+        self._last_status = (
+            self.end_status
+            if self.response == b"\n"
+            else pyvisa.constants.StatusCode.success_max_count_read
+        )
+        return data
+
+    def read_raw(self, size=None):
+        data, self.response = self.response, b""
+        return data
+
+    @property
+    def last_status(self):
+        return self._last_status
+
+
+class BinaryBlockMockVisa(MockVisa):
+    def __init__(self, *args, end_status: pyvisa.constants.StatusCode, **kwargs):
+        self.end_status = end_status
+        super().__init__(*args, **kwargs)
+
+    def _open_resource(self, address: str, visalib):
+        return (
+            BinaryBlockVisaHandle(self.end_status),
+            visalib,
+            pyvisa.ResourceManager("@sim"),
+        )
+
+
  # error args for set(-10)
 args1 = [
     'be more positive!',
@@ -171,6 +221,33 @@ def test_ask_write_local(mock_visa) -> None:
         assert arg in str(eee.value)
 
 
+def test_sync_io_waits_for_async_io(mock_visa) -> None:
+    # the async interface holds the lock while it talks to the instrument
+    # in an executor thread
+    locked = threading.Event()
+    release = threading.Event()
+
+    def hold_lock() -> None:
+        with mock_visa._async_io_lock:
+            locked.set()
+            release.wait()
+
+    holder = threading.Thread(target=hold_lock)
+    holder.start()
+    locked.wait()
+    writer = threading.Thread(target=mock_visa.state.set, args=(2,))
+    try:
+        writer.start()
+        writer.join(0.1)
+        assert writer.is_alive()
+        assert mock_visa.visa_handle.state == 0
+    finally:
+        release.set()
+        writer.join()
+        holder.join()
+    assert mock_visa.visa_handle.state == 2
+
+
 def test_visa_backend(mocker, request: FixtureRequest) -> None:
 
     rm_mock = mocker.patch("qcodes.instrument.visa.pyvisa.ResourceManager")
@@ -292,3 +369,27 @@ def test_load_pyvisa_sim_file_invalid_module_raises(request: FixtureRequest) ->
             address="GPIB::1::INSTR",
             pyvisa_sim_file="qcodes.instrument.not_a_module:AimTTi_PL601P.yaml",
         )
+
+
+@pytest.mark.parametrize(
+    "end_status",
+    [
+        pyvisa.constants.StatusCode.success_max_count_read,
+        pyvisa.constants.StatusCode.success_termination_character_read,
+    ],
+)
+def test_ask_binary_block(
+    end_status: pyvisa.constants.StatusCode, request: FixtureRequest
+) -> None:
+    instr = BinaryBlockMockVisa(
+        "binary_block", "none_address", end_status=end_status
+    )
+    request.addfinalizer(instr.close)
+
+    data = instr.ask_binary_block("CURV?", dtype="f4", byte_order=">")
+
+    np.testing.assert_array_equal(data, [0, 1, 2, 3])
+    assert data.dtype == np.float32
+    assert data.dtype.isnative
+    # the terminator after the block has been read
+    assert instr.visa_handle.response == b""